@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-call overhead of the hottest binding entry points.
+
+Run once against the old build with --save, then against the new build
+with --compare to get a before/after table:
+
+    python3 benchmarks/call_overhead.py --save before.json
+    python3 benchmarks/call_overhead.py --compare before.json
+
+Plane methods need a terminal; pass --no-plane to only time the
+channel functions.
+"""
+
+from __future__ import annotations
+
+import json
+from argparse import ArgumentParser
+from importlib import import_module
+from timeit import Timer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_c = import_module("notcurses.notcurses")
+
+Case = Tuple[str, Callable[[], object]]
+
+
+def channel_cases() -> List[Case]:
+    channel = 0x40102030
+    channels = 0x4010203040506070
+
+    return [
+        ("ncchannel_r", lambda: _c.ncchannel_r(channel)),
+        ("ncchannel_rgb8", lambda: _c.ncchannel_rgb8(channel)),
+        ("ncchannels_fg_rgb", lambda: _c.ncchannels_fg_rgb(channels)),
+        ("ncchannels_bg_alpha", lambda: _c.ncchannels_bg_alpha(channels)),
+        ("ncchannels_set_fg_rgb8",
+         lambda: _c.ncchannels_set_fg_rgb8(channels, 1, 2, 3)),
+        ("ncchannels_set_bg_rgb8",
+         lambda: _c.ncchannels_set_bg_rgb8(channels, 1, 2, 3)),
+        ("ncchannels_combine", lambda: _c.ncchannels_combine(channel, channel)),
+    ]
+
+
+def plane_cases(plane: Any) -> List[Case]:
+    # Bound methods are looked up once so only the call itself is timed.
+    putstr = plane.putstr
+    putstr_yx = plane.putstr_yx
+    set_fg_rgb8 = plane.set_fg_rgb8
+    set_bg_rgb8 = plane.set_bg_rgb8
+    cursor_move_yx = plane.cursor_move_yx
+
+    def putstr_case() -> object:
+        cursor_move_yx(0, 0)
+        return putstr("x")
+
+    return [
+        ("NcPlane.putstr", putstr_case),
+        ("NcPlane.putstr_yx", lambda: putstr_yx(0, 0, "x")),
+        ("NcPlane.set_fg_rgb8", lambda: set_fg_rgb8(1, 2, 3)),
+        ("NcPlane.set_bg_rgb8", lambda: set_bg_rgb8(1, 2, 3)),
+        ("NcPlane.cursor_move_yx", lambda: cursor_move_yx(0, 0)),
+    ]
+
+
+def time_case(func: Callable[[], object], number: int, repeat: int) -> float:
+    """Best time of 'repeat' runs, in nanoseconds per call."""
+    timings = Timer(func).repeat(repeat=repeat, number=number)
+    return min(timings) / number * 1e9
+
+
+def run(number: int, repeat: int, with_plane: bool) -> Dict[str, float]:
+    cases = channel_cases()
+
+    if with_plane:
+        # The context is stopped when it is garbage collected.
+        nc = _c.Notcurses(flags=_c.NCOPTION_SUPPRESS_BANNERS)
+        cases += plane_cases(nc.stdplane())
+
+    return {name: time_case(func, number, repeat) for name, func in cases}
+
+
+def print_results(results: Dict[str, float],
+                  baseline: Optional[Dict[str, float]]) -> None:
+    if baseline is None:
+        print(f"{'entry point':<28}{'ns/call':>10}")
+        for name, ns in results.items():
+            print(f"{name:<28}{ns:>10.1f}")
+        return
+
+    print(f"{'entry point':<28}{'before':>10}{'after':>10}{'speedup':>10}")
+    for name, ns in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<28}{'-':>10}{ns:>10.1f}{'-':>10}")
+        else:
+            print(f"{name:<28}{before:>10.1f}{ns:>10.1f}{before / ns:>9.2f}x")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200_000,
+                        help="Calls per timing run.")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Timing runs per entry point, best is kept.")
+    parser.add_argument('--no-plane', action='store_true',
+                        help="Skip methods that need a terminal.")
+    parser.add_argument('--save', metavar='FILE',
+                        help="Write results as JSON to FILE.")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="Compare against results saved with --save.")
+    args = parser.parse_args()
+
+    results = run(args.number, args.repeat, not args.no_plane)
+
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print_results(results, baseline)
+
+    if args.save is not None:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare two saved benchmark runs.
+
+Takes the JSON written with --save by any script in benchmarks/ and
+reports the change of every value present in both. Values ending in
+'_per_s' or '_share' are higher-is-better, all others lower-is-better.
+Exits with status 1 if any value regressed by more than --threshold
+percent, so it can gate CI:
+
+    python3 benchmarks/compare.py 3.0.15.json 3.0.16.json --threshold 10
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from argparse import ArgumentParser
+from typing import Dict
+
+HIGHER_IS_BETTER = ('_per_s', '_share')
+
+
+def load(path: str) -> Dict[str, float]:
+    with open(path) as f:
+        data = json.load(f)
+    # suite.py nests the values next to run metadata.
+    return data.get('results', data)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('before', help="Baseline results.")
+    parser.add_argument('after', help="New results.")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="Percent change counted as a regression.")
+    args = parser.parse_args()
+
+    before = load(args.before)
+    after = load(args.after)
+
+    regressions = []
+    print(f"{'name':<40}{'before':>14}{'after':>14}{'change':>10}")
+    for name, new in after.items():
+        old = before.get(name)
+        if old is None or old == 0:
+            continue
+
+        change = (new - old) / old * 100
+        worse = -change if name.endswith(HIGHER_IS_BETTER) else change
+        mark = ''
+        if worse > args.threshold:
+            regressions.append(name)
+            mark = '  REGRESSION'
+        print(f"{name:<40}{old:>14.1f}{new:>14.1f}{change:>+9.1f}%{mark}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold}%")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
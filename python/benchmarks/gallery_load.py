@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Main thread stalls while a gallery of images loads.
+
+The main thread ticks every millisecond, standing in for an input loop,
+while the images of data/ are decoded and scaled to a thumbnail plane.
+Loading them inline stalls the loop for every image, loading them with
+NcVisualLoader should keep the longest gap close to the tick.
+
+    setsid python3 benchmarks/gallery_load.py --save before.json
+    setsid python3 benchmarks/gallery_load.py --compare before.json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from argparse import ArgumentParser
+from glob import glob
+from importlib import import_module
+from time import monotonic, sleep
+from typing import Any, Dict, List
+
+_c = import_module("notcurses.notcurses")
+NcVisualLoader = import_module("notcurses.visualloader").NcVisualLoader
+
+DATA = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+
+
+def gallery(count: int) -> List[str]:
+    paths = sorted(glob(os.path.join(DATA, '*.png'))
+                   + glob(os.path.join(DATA, '*.jpg')))
+    return (paths * (count // max(len(paths), 1) + 1))[:count]
+
+
+def load_inline(paths: List[str], plane: Any) -> Dict[str, float]:
+    start = monotonic()
+    longest = 0.0
+    for path in paths:
+        tick = monotonic()
+        _c.NcVisual.from_file(path).prescale(plane)
+        longest = max(longest, monotonic() - tick)
+    return {'total_s': monotonic() - start, 'longest_gap_ms': longest * 1e3}
+
+
+def load_pooled(paths: List[str], plane: Any,
+                workers: int) -> Dict[str, float]:
+    start = monotonic()
+    longest = 0.0
+    with NcVisualLoader(workers) as loader:
+        futures = loader.load_many(paths, plane)
+        last = monotonic()
+        while not all(future.done() for future in futures):
+            sleep(0.001)
+            loader.drain()
+            now = monotonic()
+            longest = max(longest, now - last)
+            last = now
+        for future in futures:
+            future.result()
+    return {'total_s': monotonic() - start, 'longest_gap_ms': longest * 1e3}
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=50,
+                        help="Images in the gallery.")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Loader threads.")
+    parser.add_argument('--save', metavar='FILE',
+                        help="Write results as JSON to FILE.")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="Compare against results saved with --save.")
+    args = parser.parse_args()
+
+    nc = _c.Notcurses.headless(rows=50, cols=160)
+    plane = nc.stdplane().create(rows=12, cols=40)
+    paths = gallery(args.count)
+
+    inline = load_inline(paths, plane)
+    pooled = load_pooled(paths, plane, args.workers)
+    del plane, nc
+
+    results = {
+        'inline_total_s': inline['total_s'],
+        'inline_longest_gap_ms': inline['longest_gap_ms'],
+        'pooled_total_s': pooled['total_s'],
+        'pooled_longest_gap_ms': pooled['longest_gap_ms'],
+    }
+
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    for name, value in results.items():
+        if baseline is None or name not in baseline:
+            print(f"{name:<36}{value:>14.2f}")
+        else:
+            print(f"{name:<36}{baseline[name]:>14.2f} -> {value:>14.2f}")
+
+    if args.save is not None:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sample ingestion of a dashboard of plots.
+
+Every frame, each panel of the dashboard receives a batch of samples
+spread over a few seconds of x. The loop path calls add_sample() per
+sample, redrawing the plot each time, the batch path hands the whole
+batch to add_samples().
+
+    setsid python3 benchmarks/plot_ingest.py --save before.json
+    setsid python3 benchmarks/plot_ingest.py --compare before.json
+"""
+
+from __future__ import annotations
+
+import json
+from argparse import ArgumentParser
+from array import array
+from importlib import import_module
+from random import Random
+from time import perf_counter
+from typing import Any, List, Tuple
+
+_c = import_module("notcurses.notcurses")
+
+Batch = Tuple[array, array]
+
+
+def batches(frames: int, samples: int, seed: int) -> List[Batch]:
+    rng = Random(seed)
+    result = []
+    for frame in range(frames):
+        xs = array('Q', sorted(frame + rng.randrange(4)
+                               for _ in range(samples)))
+        ys = array('Q', (rng.randrange(1000) for _ in range(samples)))
+        result.append((xs, ys))
+    return result
+
+
+def dashboard(nc: Any, panels: int) -> List[Any]:
+    std = nc.stdplane()
+    return [std.create(rows=6, cols=30,
+                       y_pos=(i // 4) * 7, x_pos=(i % 4) * 32).uplot_create()
+            for i in range(panels)]
+
+
+def ingest_loop(plots: List[Any], data: List[Batch]) -> float:
+    start = perf_counter()
+    for xs, ys in data:
+        for plot in plots:
+            for x, y in zip(xs, ys):
+                plot.add_sample(x, y)
+    return perf_counter() - start
+
+
+def ingest_batch(plots: List[Any], data: List[Batch]) -> float:
+    start = perf_counter()
+    for xs, ys in data:
+        for plot in plots:
+            plot.add_samples(xs, ys)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--panels', type=int, default=20,
+                        help="Plots in the dashboard.")
+    parser.add_argument('--frames', type=int, default=60,
+                        help="Batches fed to every plot.")
+    parser.add_argument('--samples', type=int, default=1000,
+                        help="Samples per batch.")
+    parser.add_argument('--save', metavar='FILE',
+                        help="Write results as JSON to FILE.")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="Compare against results saved with --save.")
+    args = parser.parse_args()
+
+    nc = _c.Notcurses.headless(rows=40, cols=130)
+    data = batches(args.frames, args.samples, seed=1)
+    total = args.panels * args.frames * args.samples
+
+    loop_s = ingest_loop(dashboard(nc, args.panels), data)
+    batch_s = ingest_batch(dashboard(nc, args.panels), data)
+    del nc
+
+    results = {
+        'loop_samples_per_s': total / loop_s,
+        'batch_samples_per_s': total / batch_s,
+    }
+
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    for name, value in results.items():
+        if baseline is None or name not in baseline:
+            print(f"{name:<36}{value:>14.0f}")
+        else:
+            print(f"{name:<36}{baseline[name]:>14.0f} -> {value:>14.0f}")
+
+    if args.save is not None:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming frames with bytes versus a reused NcRenderBuffer.
+
+Every frame redraws the whole screen, renders it off-terminal and writes
+it to /dev/null. The bytes path allocates a new object per frame, the
+NcRenderBuffer path writes the same buffer every time. Peak traced memory
+shows whether memory stays flat.
+
+    python3 benchmarks/render_buffer.py --save before.json
+    python3 benchmarks/render_buffer.py --compare before.json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tracemalloc
+from argparse import ArgumentParser
+from importlib import import_module
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+_c = import_module("notcurses.notcurses")
+
+
+def draw(plane: Any, frame: int) -> None:
+    rows, cols = plane.dim_yx()
+    plane.set_fg_rgb8(frame % 256, 255 - frame % 256, 128)
+    line = "#" * cols
+    for y in range(rows):
+        plane.putstr_yx(y, 0, line)
+
+
+def run(plane: Any, frames: int,
+        render: Callable[[], object]) -> Dict[str, float]:
+    fd = os.open(os.devnull, os.O_WRONLY)
+    tracemalloc.start()
+    start = perf_counter()
+    try:
+        for frame in range(frames):
+            draw(plane, frame)
+            os.write(fd, render())
+        elapsed = perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        os.close(fd)
+
+    return {'frames_per_s': frames / elapsed, 'peak_traced_bytes': peak}
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=500,
+                        help="Frames per run.")
+    parser.add_argument('--save', metavar='FILE',
+                        help="Write results as JSON to FILE.")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="Compare against results saved with --save.")
+    args = parser.parse_args()
+
+    # The context is stopped when it is garbage collected.
+    nc = _c.Notcurses(flags=_c.NCOPTION_SUPPRESS_BANNERS)
+    plane = nc.stdplane()
+    buffer = _c.NcRenderBuffer()
+
+    as_bytes = run(plane, args.frames, plane.pile_render_to_buffer)
+    reused = run(plane, args.frames,
+                 lambda: plane.pile_render_to_buffer(into=buffer))
+    del plane, nc
+
+    results = {
+        'bytes_frames_per_s': as_bytes['frames_per_s'],
+        'bytes_peak_traced_bytes': as_bytes['peak_traced_bytes'],
+        'buffer_frames_per_s': reused['frames_per_s'],
+        'buffer_peak_traced_bytes': reused['peak_traced_bytes'],
+    }
+
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    for name, value in results.items():
+        if baseline is None or name not in baseline:
+            print(f"{name:<28}{value:>14.2f}")
+        else:
+            print(f"{name:<28}{baseline[name]:>14.2f} -> {value:>14.2f}")
+
+    if args.save is not None:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Background thread throughput while the UI thread renders.
+
+Worker threads count loop iterations of plain Python code. They run once
+alone, then again while the main thread redraws and renders the whole
+screen as fast as it can. If render keeps the GIL, the workers stall for
+every frame and lose most of their throughput.
+
+    python3 benchmarks/render_threads.py --save before.json
+    python3 benchmarks/render_threads.py --compare before.json
+"""
+
+from __future__ import annotations
+
+import json
+from argparse import ArgumentParser
+from importlib import import_module
+from threading import Event, Thread
+from time import monotonic, sleep
+from typing import Any, Dict, List, Optional
+
+_c = import_module("notcurses.notcurses")
+
+
+def worker(stop: Event, counts: List[int], index: int) -> None:
+    count = 0
+    while not stop.is_set():
+        for _ in range(1000):
+            pass
+        count += 1
+    counts[index] = count
+
+
+def run_workers(workers: int, duration: float,
+                ui: Optional[Any] = None) -> Dict[str, float]:
+    """Run 'workers' threads for 'duration' seconds.
+
+    If 'ui' is a plane, the calling thread renders its pile meanwhile.
+    """
+    stop = Event()
+    counts = [0] * workers
+    threads = [Thread(target=worker, args=(stop, counts, i))
+               for i in range(workers)]
+    frames = 0
+
+    for thread in threads:
+        thread.start()
+
+    start = monotonic()
+    if ui is None:
+        sleep(duration)
+    else:
+        rows, cols = ui.dim_yx()
+        line = "#" * cols
+        while monotonic() - start < duration:
+            # Change every cell so each frame has to be fully rasterized.
+            ui.set_fg_rgb8(frames % 256, 255 - frames % 256, 128)
+            for y in range(rows):
+                ui.putstr_yx(y, 0, line)
+            ui.pile_render()
+            ui.pile_rasterize()
+            frames += 1
+    elapsed = monotonic() - start
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        'worker_iterations_per_s': sum(counts) / elapsed,
+        'frames_per_s': frames / elapsed,
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=2,
+                        help="Background threads.")
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help="Seconds per run.")
+    parser.add_argument('--save', metavar='FILE',
+                        help="Write results as JSON to FILE.")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="Compare against results saved with --save.")
+    args = parser.parse_args()
+
+    idle = run_workers(args.workers, args.duration)
+
+    # The context is stopped when it is garbage collected.
+    nc = _c.Notcurses(flags=_c.NCOPTION_SUPPRESS_BANNERS)
+    rendering = run_workers(args.workers, args.duration, nc.stdplane())
+    del nc
+
+    results = {
+        'idle_worker_iterations_per_s': idle['worker_iterations_per_s'],
+        'rendering_worker_iterations_per_s':
+            rendering['worker_iterations_per_s'],
+        'rendering_frames_per_s': rendering['frames_per_s'],
+        'worker_share': (rendering['worker_iterations_per_s']
+                         / idle['worker_iterations_per_s']),
+    }
+
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    for name, value in results.items():
+        if baseline is None or name not in baseline:
+            print(f"{name:<36}{value:>14.2f}")
+        else:
+            print(f"{name:<36}{baseline[name]:>14.2f} -> {value:>14.2f}")
+
+    if args.save is not None:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
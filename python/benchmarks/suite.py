@@ -0,0 +1,255 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark suite for the Python bindings.
+
+Runs against headless contexts by default, so results do not depend on
+the terminal and can be taken on build machines. Run it under setsid(1)
+if the shell has a terminal. --terminal uses the terminal the process
+runs in instead (for example a pty from script(1)); input decoding is
+only measured headless.
+
+    setsid python3 benchmarks/suite.py --save 3.0.16.json
+    setsid python3 benchmarks/suite.py --compare 3.0.16.json
+
+Results are a flat dict: '_per_s' values are rates (higher is better),
+'_ns' values are per-call or per-frame costs (lower is better).
+benchmarks/compare.py compares two saved runs.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+from argparse import ArgumentParser
+from importlib import import_module
+from threading import Thread
+from time import perf_counter
+from timeit import Timer
+from typing import Any, Callable, Dict, List, Tuple
+
+from call_overhead import channel_cases
+
+_c = import_module("notcurses.notcurses")
+
+Results = Dict[str, float]
+
+SIZES = [(24, 80), (50, 160), (100, 300)]
+
+
+def best_ns(func: Callable[[], object], number: int, repeat: int) -> float:
+    """Best time of 'repeat' runs, in nanoseconds per call."""
+    timings = Timer(func).repeat(repeat=repeat, number=number)
+    return min(timings) / number * 1e9
+
+
+def new_context(args: Any, rows: int, cols: int) -> Any:
+    # Only one context may exist at a time, drop the previous one first.
+    gc.collect()
+    if args.terminal:
+        return _c.Notcurses(flags=_c.NCOPTION_SUPPRESS_BANNERS)
+    return _c.Notcurses.headless(rows=rows, cols=cols)
+
+
+def bench_output(plane: Any, args: Any) -> Results:
+    rows, cols = plane.dim_yx()
+    line = "x" * cols
+    putstr_yx = plane.putstr_yx
+    putegc_yx = plane.putegc_yx
+
+    def putstr_frame() -> None:
+        for y in range(rows):
+            putstr_yx(y, 0, line)
+
+    def putegc_row() -> None:
+        for x in range(cols):
+            putegc_yx(0, x, "█")
+
+    putstr_ns = best_ns(putstr_frame, max(1, args.number // 1000),
+                        args.repeat)
+    putegc_ns = best_ns(putegc_row, max(1, args.number // 1000),
+                        args.repeat)
+
+    return {
+        'putstr_cells_per_s': rows * cols / putstr_ns * 1e9,
+        'putegc_cells_per_s': cols / putegc_ns * 1e9,
+    }
+
+
+def bench_channels(args: Any) -> Results:
+    return {f'{name}_ns': best_ns(func, args.number, args.repeat)
+            for name, func in channel_cases()}
+
+
+def bench_frames(plane: Any, args: Any, prefix: str) -> Results:
+    rows, cols = plane.dim_yx()
+    line = "#" * cols
+    frames = args.frames
+    render_ns = rasterize_ns = to_buffer_ns = 0.0
+
+    for frame in range(frames):
+        # Change every cell so each frame is a full redraw.
+        plane.set_fg_rgb8(frame % 256, 255 - frame % 256, 128)
+        for y in range(rows):
+            plane.putstr_yx(y, 0, line)
+        start = perf_counter()
+        plane.pile_render()
+        rendered = perf_counter()
+        plane.pile_rasterize()
+        render_ns += (rendered - start) * 1e9
+        rasterize_ns += (perf_counter() - rendered) * 1e9
+
+    buffer = _c.NcRenderBuffer()
+    for frame in range(frames):
+        plane.set_fg_rgb8(128, frame % 256, 255 - frame % 256)
+        for y in range(rows):
+            plane.putstr_yx(y, 0, line)
+        start = perf_counter()
+        buffer.render(plane)
+        to_buffer_ns += (perf_counter() - start) * 1e9
+
+    return {
+        f'{prefix}_render_ns': render_ns / frames,
+        f'{prefix}_rasterize_ns': rasterize_ns / frames,
+        f'{prefix}_render_to_buffer_ns': to_buffer_ns / frames,
+        f'{prefix}_frame_bytes': float(len(buffer)),
+    }
+
+
+def bench_churn(plane: Any, args: Any) -> Results:
+    create = plane.create
+
+    def churn() -> None:
+        create(rows=4, cols=10, y_pos=1, x_pos=1).destroy()
+
+    return {'plane_create_destroy_ns': best_ns(churn, args.number // 10,
+                                               args.repeat)}
+
+
+def bench_input(args: Any) -> Results:
+    """Decode rate of keys written to stdin, replaced by a pipe."""
+    keys = [b"a", b"Z", b"\x1b[A", b"\x1b[B", b"\x1b[1;5C", b"\xc3\xa9"]
+    payload = b"".join(keys[i % len(keys)] for i in range(args.events))
+
+    read_fd, write_fd = os.pipe()
+    saved_stdin = os.dup(0)
+    os.dup2(read_fd, 0)
+    os.close(read_fd)
+    try:
+        nc = new_context(args, 24, 80)
+
+        def writer() -> None:
+            view = memoryview(payload)
+            while view:
+                written = os.write(write_fd, view[:65536])
+                view = view[written:]
+
+        thread = Thread(target=writer)
+        start = perf_counter()
+        thread.start()
+        received = 0
+        while received < args.events:
+            events = nc.get_many(1024, 1.0)
+            if not events:
+                break
+            received += len(events)
+        elapsed = perf_counter() - start
+        thread.join()
+        del nc
+        gc.collect()
+    finally:
+        os.close(write_fd)
+        os.dup2(saved_stdin, 0)
+        os.close(saved_stdin)
+
+    return {'input_events_per_s': received / elapsed}
+
+
+def run(args: Any) -> Results:
+    results: Results = {}
+    results.update(bench_channels(args))
+
+    # The terminal has a single size, whatever it is.
+    sizes: List[Tuple[int, int]] = SIZES if not args.terminal else [(0, 0)]
+    for index, (rows, cols) in enumerate(sizes):
+        nc = new_context(args, rows, cols)
+        plane = nc.stdplane()
+        rows, cols = plane.dim_yx()
+        results.update(bench_frames(plane, args, f'frame_{rows}x{cols}'))
+        if 0 == index:
+            results.update(bench_output(plane, args))
+            results.update(bench_churn(plane, args))
+        del plane, nc
+
+    if not args.terminal:
+        results.update(bench_input(args))
+
+    return results
+
+
+def print_results(results: Results, baseline: Results) -> None:
+    for name, value in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<40}{value:>16.1f}")
+        else:
+            print(f"{name:<40}{before:>16.1f} -> {value:>16.1f}")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--terminal', action='store_true',
+                        help="Use the terminal instead of headless contexts.")
+    parser.add_argument('--number', type=int, default=100_000,
+                        help="Calls per timing run of cheap calls.")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Timing runs per case, best is kept.")
+    parser.add_argument('--frames', type=int, default=100,
+                        help="Frames per terminal size.")
+    parser.add_argument('--events', type=int, default=100_000,
+                        help="Input events to decode.")
+    parser.add_argument('--save', metavar='FILE',
+                        help="Write results as JSON to FILE.")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="Compare against results saved with --save.")
+    args = parser.parse_args()
+
+    results = run(args)
+
+    baseline: Results = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    print_results(results, baseline)
+
+    if args.save is not None:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'meta': {
+                    'notcurses': _c.notcurses_version(),
+                    'python': platform.python_version(),
+                    'machine': platform.machine(),
+                    'headless': not args.terminal,
+                },
+                'results': results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -21,8 +21,8 @@ from notcurses import NcChannels, NcDirect
 nc_direct = NcDirect()
 nc_direct.cursor_enabled = False
 channels = NcChannels()
-channels.set_background_rgb(255, 0, 0)
-channels.set_foreground_rgb(0, 0, 0)
+channels.set_bg_rgb8(255, 0, 0)
+channels.set_fg_rgb8(0, 0, 0)
 
 # Get x dimensions, ignore y
 _, x_dimension = nc_direct.dimensions_yx
@@ -57,16 +57,18 @@ mem_percent_used = 1.0 - mem_avalible / mem_total  # Calculate percent used
 
 mem_sting = f"Memory used: {round(100.0 * mem_percent_used)}% "
 
-nc_direct.putstr(mem_sting)  # Put the used memory
+# Collect the line in a batch, it is written at once when the block ends
+with nc_direct.batch() as batch:
+    batch.putstr(mem_sting)  # Put the used memory
 
-for red_shift in red_line_gen(len(mem_sting), mem_percent_used):
-    # Get the red shift from the function and use it in red channel
-    # and subtract it from green
-    channels.set_background_rgb(red_shift, 255-red_shift, 0)
-    channels.set_foreground_rgb(red_shift, 255-red_shift, 0)
-    nc_direct.putstr('X', channels)
+    for red_shift in red_line_gen(len(mem_sting), mem_percent_used):
+        # Get the red shift from the function and use it in red channel
+        # and subtract it from green
+        channels.set_bg_rgb8(red_shift, 255-red_shift, 0)
+        channels.set_fg_rgb8(red_shift, 255-red_shift, 0)
+        batch.putstr('X', channels)
 
-nc_direct.putstr('\n')  # Finish line
+    batch.putstr('\n')  # Finish line
 
 swap_total = int(meminfo_lines[14].split()[1])  # Get swap total
 swap_avalible = int(meminfo_lines[15].split()[1])  # Get swap used
@@ -79,11 +81,12 @@ swap_string = f"Swap used:   {round(100.0 * swap_percent_used)}% "
 if len(swap_string) < len(mem_sting):
     swap_string += ' '
 
-nc_direct.putstr(swap_string)
+with nc_direct.batch() as batch:
+    batch.putstr(swap_string)
 
-for red_shift in red_line_gen(len(swap_string), swap_percent_used):
-    channels.set_background_rgb(red_shift, 255-red_shift, 0)
-    channels.set_foreground_rgb(red_shift, 255-red_shift, 0)
-    nc_direct.putstr('X', channels)
+    for red_shift in red_line_gen(len(swap_string), swap_percent_used):
+        channels.set_bg_rgb8(red_shift, 255-red_shift, 0)
+        channels.set_fg_rgb8(red_shift, 255-red_shift, 0)
+        batch.putstr('X', channels)
 
-nc_direct.putstr('\n')
+    batch.putstr('\n')
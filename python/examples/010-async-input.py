@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from asyncio import ensure_future, run, sleep
+
+from notcurses import Notcurses
+
+nc = Notcurses()
+std_plane = nc.stdplane()
+
+
+async def clock() -> None:
+    # Keeps running while the input loop waits for keys
+    ticks = 0
+    while True:
+        std_plane.putstr_yx(0, 4, f"Ticks: {ticks}")
+        nc.render()
+        ticks += 1
+        await sleep(0.5)
+
+
+async def main() -> None:
+    nc.mice_enable()
+    clock_task = ensure_future(clock())
+
+    async for inp in nc.events():
+        std_plane.putstr_yx(2, 4, f"Code point: {hex(inp.id)}    ")
+        std_plane.putstr_yx(3, 4, f"UTF-8: {inp.utf8!r}    ")
+        std_plane.putstr_yx(5, 4, "Press q to exit.")
+        nc.render()
+        if inp.utf8 == 'q':
+            break
+
+    clock_task.cancel()
+
+
+run(main())
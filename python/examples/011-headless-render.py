@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Run with setsid(1) if the shell has a terminal:
+#     setsid python3 examples/011-headless-render.py
+
+from time import perf_counter
+
+from notcurses import NcRenderBuffer, Notcurses
+
+nc = Notcurses.headless(rows=40, cols=120)
+
+stdplane = nc.stdplane()
+rows, cols = stdplane.dim_yx()
+buffer = NcRenderBuffer()
+
+frames = 200
+start = perf_counter()
+for frame in range(frames):
+    stdplane.set_fg_rgb8(frame % 256, 128, 255 - frame % 256)
+    for y in range(rows):
+        stdplane.putstr_yx(y, 0, "#" * cols)
+    stdplane.pile_render_to_buffer(into=buffer)
+elapsed = perf_counter() - start
+
+print(f"{rows}x{cols}: {frames / elapsed:.1f} frames/s, "
+      f"last frame {len(buffer)} bytes")
@@ -14,13 +14,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .aio import NcEventStream, NcRenderClock
+from .metrics import NcStatsSampler, prometheus_text, textfile_writer
+from .trace import chrome_trace, dump_chrome_trace, trace_span
+from .visualcache import NcVisualCache
+from .visualloader import NcVisualLoader
 from .notcurses import (
     NcPlane, Notcurses, NcInput, NotcursesOptions, NcPlaneOptions,
+    NcDisplayList, NcRenderBuffer, NcRenderSink, NcStats, NcFadeCtx, NcFader,
+    NcVisual, NcVideoPlayer, NcDirect, NcDirectBatch, NcChannels,
+    NcChannelsArray, NcCell, NcUplot, NcDplot,
     NCOPTION_INHIBIT_SETLOCALE, NCOPTION_NO_CLEAR_BITMAPS,
     NCOPTION_NO_WINCH_SIGHANDLER, NCOPTION_NO_QUIT_SIGHANDLERS,
     NCOPTION_PRESERVE_CURSOR, NCOPTION_SUPPRESS_BANNERS,
     NCOPTION_NO_ALTERNATE_SCREEN, NCOPTION_NO_FONT_CHANGES,
     NCOPTION_DRAIN_INPUT, NCOPTION_SCROLLING, NCOPTION_CLI_MODE,
+    NCDIRECT_OPTION_INHIBIT_SETLOCALE, NCDIRECT_OPTION_INHIBIT_CBREAK,
+    NCDIRECT_OPTION_DRAIN_INPUT, NCDIRECT_OPTION_NO_QUIT_SIGHANDLERS,
+    NCDIRECT_OPTION_VERBOSE, NCDIRECT_OPTION_VERY_VERBOSE,
+    NCPLOT_OPTION_LABELTICKSD, NCPLOT_OPTION_EXPONENTIALD,
+    NCPLOT_OPTION_VERTICALI, NCPLOT_OPTION_NODEGRADE,
+    NCPLOT_OPTION_DETECTMAXONLY, NCPLOT_OPTION_PRINTSAMPLE,
+    NCBLIT_DEFAULT, NCBLIT_1x1, NCBLIT_2x1, NCBLIT_2x2, NCBLIT_3x2, NCBLIT_4x2,
+    NCBLIT_BRAILLE, NCBLIT_PIXEL, NCBLIT_4x1, NCBLIT_8x1,
+    NCSCALE_NONE, NCSCALE_SCALE, NCSCALE_STRETCH, NCSCALE_NONE_HIRES,
+    NCSCALE_SCALE_HIRES,
+    NCVISUAL_OPTION_NODEGRADE, NCVISUAL_OPTION_BLEND,
+    NCVISUAL_OPTION_HORALIGNED, NCVISUAL_OPTION_VERALIGNED,
+    NCVISUAL_OPTION_ADDALPHA, NCVISUAL_OPTION_CHILDPLANE,
+    NCVISUAL_OPTION_NOINTERPOLATE,
     NCKEY_INVALID, NCKEY_RESIZE, NCKEY_UP, NCKEY_RIGHT, NCKEY_DOWN, NCKEY_LEFT,
     NCKEY_INS, NCKEY_DEL, NCKEY_BACKSPACE, NCKEY_PGDOWN, NCKEY_PGUP, NCKEY_HOME,
     NCKEY_END, NCKEY_F00, NCKEY_F01, NCKEY_F02, NCKEY_F03, NCKEY_F04, NCKEY_F05,
@@ -68,12 +90,22 @@ from .notcurses import (
     ncchannels_set_fg_rgb, ncchannels_set_fg_rgb8,
     ncchannels_set_fg_rgb8_clipped, ncstrwidth, notcurses_version,
     notcurses_version_components,
+    instrument_enable, instrument_disable, instrument_enabled,
+    instrument_snapshot, instrument_reset,
     NCBOXASCII, NCBOXDOUBLE, NCBOXHEAVY, NCBOXLIGHT, NCBOXOUTER, NCBOXROUND,
+    NCPLANE_SNAPSHOT_CLUSTER,
     box, rgb,
+    channels,
 )
 
 __all__ = (
     'NcPlane', 'Notcurses', 'NcInput', 'NotcursesOptions', 'NcPlaneOptions',
+    'NcDisplayList', 'NcRenderBuffer', 'NcRenderSink', 'NcEventStream',
+    'NcRenderClock', 'NcStats', 'NcStatsSampler', 'prometheus_text',
+    'NcFadeCtx', 'NcFader', 'NcVisual', 'NcVisualCache', 'NcVisualLoader',
+    'NcVideoPlayer', 'NcDirect', 'NcDirectBatch', 'NcChannels',
+    'NcChannelsArray', 'NcCell', 'NcUplot', 'NcDplot',
+    'textfile_writer', 'trace_span', 'chrome_trace', 'dump_chrome_trace',
 
     'NCOPTION_INHIBIT_SETLOCALE', 'NCOPTION_NO_CLEAR_BITMAPS',
     'NCOPTION_NO_WINCH_SIGHANDLER', 'NCOPTION_NO_QUIT_SIGHANDLERS',
@@ -81,6 +113,24 @@ __all__ = (
     'NCOPTION_NO_ALTERNATE_SCREEN', 'NCOPTION_NO_FONT_CHANGES',
     'NCOPTION_DRAIN_INPUT', 'NCOPTION_SCROLLING', 'NCOPTION_CLI_MODE',
 
+    'NCDIRECT_OPTION_INHIBIT_SETLOCALE', 'NCDIRECT_OPTION_INHIBIT_CBREAK',
+    'NCDIRECT_OPTION_DRAIN_INPUT', 'NCDIRECT_OPTION_NO_QUIT_SIGHANDLERS',
+    'NCDIRECT_OPTION_VERBOSE', 'NCDIRECT_OPTION_VERY_VERBOSE',
+
+    'NCPLOT_OPTION_LABELTICKSD', 'NCPLOT_OPTION_EXPONENTIALD',
+    'NCPLOT_OPTION_VERTICALI', 'NCPLOT_OPTION_NODEGRADE',
+    'NCPLOT_OPTION_DETECTMAXONLY', 'NCPLOT_OPTION_PRINTSAMPLE',
+
+    'NCBLIT_DEFAULT', 'NCBLIT_1x1', 'NCBLIT_2x1', 'NCBLIT_2x2', 'NCBLIT_3x2',
+    'NCBLIT_4x2', 'NCBLIT_BRAILLE', 'NCBLIT_PIXEL', 'NCBLIT_4x1',
+    'NCBLIT_8x1',
+    'NCSCALE_NONE', 'NCSCALE_SCALE', 'NCSCALE_STRETCH', 'NCSCALE_NONE_HIRES',
+    'NCSCALE_SCALE_HIRES',
+    'NCVISUAL_OPTION_NODEGRADE', 'NCVISUAL_OPTION_BLEND',
+    'NCVISUAL_OPTION_HORALIGNED', 'NCVISUAL_OPTION_VERALIGNED',
+    'NCVISUAL_OPTION_ADDALPHA', 'NCVISUAL_OPTION_CHILDPLANE',
+    'NCVISUAL_OPTION_NOINTERPOLATE',
+
     'NCKEY_INVALID', 'NCKEY_RESIZE', 'NCKEY_UP', 'NCKEY_RIGHT', 'NCKEY_DOWN',
     'NCKEY_LEFT', 'NCKEY_INS', 'NCKEY_DEL', 'NCKEY_BACKSPACE', 'NCKEY_PGDOWN',
     'NCKEY_PGUP', 'NCKEY_HOME', 'NCKEY_END', 'NCKEY_F00', 'NCKEY_F01',
@@ -139,8 +189,15 @@ __all__ = (
 
     'ncstrwidth', 'notcurses_version', 'notcurses_version_components',
 
+    'instrument_enable', 'instrument_disable', 'instrument_enabled',
+    'instrument_snapshot', 'instrument_reset',
+
     'NCBOXASCII', 'NCBOXDOUBLE', 'NCBOXHEAVY', 'NCBOXLIGHT', 'NCBOXOUTER',
     'NCBOXROUND',
 
+    'NCPLANE_SNAPSHOT_CLUSTER',
+
     'box', 'rgb',
+
+    'channels',
 )
@@ -0,0 +1,213 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""asyncio integration for Notcurses input and rendering."""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, Future, TimerHandle, get_running_loop
+from collections import deque
+from types import TracebackType
+from typing import TYPE_CHECKING, Deque, Optional, Type
+
+if TYPE_CHECKING:
+    from .notcurses import NcInput, Notcurses
+
+
+class NcEventStream:
+    """Asynchronous iterator over input events.
+
+    The input ready file descriptor is watched with loop.add_reader(),
+    so nothing runs while there is no input. Every wake-up drains all
+    pending events with get_many().
+
+    If 'max_pending' is positive, the descriptor stops being watched
+    once that many events wait to be consumed, and is watched again
+    as soon as the consumer catches up.
+
+    Only one task should iterate over a stream at a time, and no other
+    code should read input from the same Notcurses object meanwhile.
+    """
+
+    _DRAIN_BATCH = 64
+
+    def __init__(self, nc: Notcurses, max_pending: int = 0):
+        self._nc = nc
+        self._fd = nc.inputready_fd()
+        self._max_pending = max_pending
+        self._pending: Deque[NcInput] = deque()
+        self._loop: Optional[AbstractEventLoop] = None
+        self._waiter: Optional[Future[None]] = None
+        self._error: Optional[BaseException] = None
+        self._reading = False
+        self._closed = False
+
+    def _start_reading(self) -> None:
+        if self._reading or self._closed or self._loop is None:
+            return
+
+        self._loop.add_reader(self._fd, self._on_readable)
+        self._reading = True
+        # Every read empties the descriptor, so events still queued
+        # inside Notcurses would not make it readable again.
+        self._loop.call_soon(self._on_readable)
+
+    def _stop_reading(self) -> None:
+        if not self._reading or self._loop is None:
+            return
+
+        self._loop.remove_reader(self._fd)
+        self._reading = False
+
+    def _wake_waiter(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _on_readable(self) -> None:
+        if not self._reading:
+            return
+
+        get_many = self._nc.get_many
+        pending = self._pending
+        max_pending = self._max_pending
+
+        try:
+            while True:
+                room = (max_pending - len(pending) if max_pending
+                        else self._DRAIN_BATCH)
+                if room <= 0:
+                    self._stop_reading()
+                    break
+                events = get_many(room, 0)
+                pending.extend(events)
+                if len(events) < room:
+                    break
+        except Exception as e:
+            self._error = e
+            self._stop_reading()
+
+        if pending or self._error is not None:
+            self._wake_waiter()
+
+    def __aiter__(self) -> NcEventStream:
+        return self
+
+    async def __anext__(self) -> NcInput:
+        if self._closed:
+            raise StopAsyncIteration
+
+        if self._loop is None:
+            self._loop = get_running_loop()
+
+        while not self._pending:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+
+            self._start_reading()
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+            if self._closed:
+                raise StopAsyncIteration
+
+        event = self._pending.popleft()
+        self._start_reading()
+        return event
+
+    def close(self) -> None:
+        """Stop watching the descriptor and end the iteration."""
+        self._closed = True
+        self._stop_reading()
+        self._wake_waiter()
+
+    async def __aenter__(self) -> NcEventStream:
+        return self
+
+    async def __aexit__(self,
+                        exc_type: Optional[Type[BaseException]],
+                        exc_value: Optional[BaseException],
+                        traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+
+class NcRenderClock:
+    """Drives the render scheduler of a Notcurses object from asyncio.
+
+    Producers call nc.request_render() after changing planes, from the
+    loop thread or any other thread. The clock renders once the frame
+    is due, so every request made before that shares a single render:
+
+        nc.set_max_fps(60)
+        async with NcRenderClock(nc):
+            ...
+
+    Only one clock should drive a Notcurses object at a time.
+    """
+
+    def __init__(self, nc: Notcurses):
+        self._nc = nc
+        self._loop: Optional[AbstractEventLoop] = None
+        self._timer: Optional[TimerHandle] = None
+
+    def start(self) -> None:
+        """Start rendering requested frames on the running loop."""
+        self._loop = get_running_loop()
+        self._nc.set_render_waker(self._wake)
+        self._arm()
+
+    def _wake(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._arm)
+
+    def _arm(self) -> None:
+        if self._timer is not None or self._loop is None:
+            return
+
+        delay = self._nc.render_due()
+        if delay is not None:
+            self._timer = self._loop.call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        try:
+            self._nc.render_if_due()
+        finally:
+            # Requests made while rendering, from other threads, leave
+            # the screen dirty again and are rendered by the next frame.
+            # A failed render stays dirty without waking the clock.
+            self._arm()
+
+    def close(self) -> None:
+        """Stop rendering. Pending requests stay pending."""
+        self._nc.set_render_waker(None)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._loop = None
+
+    async def __aenter__(self) -> NcRenderClock:
+        self.start()
+        return self
+
+    async def __aexit__(self,
+                        exc_type: Optional[Type[BaseException]],
+                        exc_value: Optional[BaseException],
+                        traceback: Optional[TracebackType]) -> None:
+        self.close()
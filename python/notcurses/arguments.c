@@ -0,0 +1,116 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+// Match METH_FASTCALL | METH_KEYWORDS arguments to 'keywords'.
+// Borrowed references are stored in 'parsed', NULL for arguments not passed.
+// The first 'required' keywords must be passed, either way.
+int pync_parse_fastcall(const char *func_name,
+                        PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames,
+                        char *const keywords[], Py_ssize_t required,
+                        PyObject **parsed)
+{
+    Py_ssize_t keywords_len = 0;
+    while (NULL != keywords[keywords_len])
+    {
+        parsed[keywords_len] = NULL;
+        keywords_len++;
+    }
+
+    if (nargs > keywords_len)
+    {
+        PyErr_Format(PyExc_TypeError, "%s() takes at most %zd arguments (%zd given)",
+                     func_name, keywords_len, nargs);
+        return -1;
+    }
+
+    for (Py_ssize_t i = 0; i < nargs; i++)
+    {
+        parsed[i] = args[i];
+    }
+
+    Py_ssize_t kwnames_len = NULL == kwnames ? 0 : PyTuple_GET_SIZE(kwnames);
+    for (Py_ssize_t i = 0; i < kwnames_len; i++)
+    {
+        PyObject *kwname = PyTuple_GET_ITEM(kwnames, i);
+        Py_ssize_t keyword_index = 0;
+
+        while (keyword_index < keywords_len && 0 != PyUnicode_CompareWithASCIIString(kwname, keywords[keyword_index]))
+        {
+            keyword_index++;
+        }
+
+        if (keyword_index == keywords_len)
+        {
+            PyErr_Format(PyExc_TypeError, "%s() got an unexpected keyword argument '%U'", func_name, kwname);
+            return -1;
+        }
+        if (NULL != parsed[keyword_index])
+        {
+            PyErr_Format(PyExc_TypeError, "%s() got multiple values for argument '%s'", func_name, keywords[keyword_index]);
+            return -1;
+        }
+
+        parsed[keyword_index] = args[nargs + i];
+    }
+
+    for (Py_ssize_t i = 0; i < required; i++)
+    {
+        if (NULL == parsed[i])
+        {
+            PyErr_Format(PyExc_TypeError, "%s() missing required argument '%s' (pos %zd)", func_name, keywords[i], i + 1);
+            return -1;
+        }
+    }
+
+    return 0;
+}
+
+// Check that a buffer format describes a single native item of wanted_itemsize
+// bytes, whose type code is one of 'codes'.
+bool pync_buffer_format_p(const char *format, Py_ssize_t itemsize, Py_ssize_t wanted_itemsize, const char *codes)
+{
+    if (NULL == format)
+    {
+        format = "B";
+    }
+
+    switch (format[0])
+    {
+    case '@':
+    case '=':
+#if PY_LITTLE_ENDIAN
+    case '<':
+#else
+    case '>':
+    case '!':
+#endif
+        format++;
+        break;
+    default:
+        break;
+    }
+
+    return itemsize == wanted_itemsize && '\0' != format[0] && '\0' == format[1] && NULL != strchr(codes, format[0]);
+}
+
+// Check that a buffer format describes a native integer of wanted_itemsize bytes.
+bool pync_buffer_integer_format_p(const char *format, Py_ssize_t itemsize, Py_ssize_t wanted_itemsize)
+{
+    return pync_buffer_format_p(format, itemsize, wanted_itemsize, "bBhHiIlLqQ");
+}
@@ -0,0 +1,391 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+// A cell loaded with nccell_load() keeps long EGCs in the egcpool of its
+// plane, which is dumped by ncplane_erase() and resizes. NcCell keeps its EGC
+// itself instead, inline in the gcluster like the library does for up to four
+// bytes, and in a shared bytes object above that. Putting a cell writes the
+// EGC straight into the destination, so the egcpool sees a single store per
+// cell and no load/release of temporary cells.
+
+static inline const char *
+cell_egc(const NcCellObject *cell)
+{
+    if (NULL != cell->egc)
+    {
+        return PyBytes_AS_STRING(cell->egc);
+    }
+    // An inline gcluster is NUL terminated by gcluster_backstop.
+    return (const char *)&cell->nccell.gcluster;
+}
+
+// Set the EGC of 'cell' to the UTF-8 'egc' of 'len' bytes.
+static int
+cell_set_egc(NcCellObject *cell, const char *egc, Py_ssize_t len)
+{
+    for (Py_ssize_t i = 0; i < len; i++)
+    {
+        unsigned char const byte = (unsigned char)egc[i];
+        if (byte < 0x20 || 0x7f == byte)
+        {
+            PyErr_SetString(PyExc_ValueError, "EGC must not contain control characters");
+            return -1;
+        }
+    }
+
+    int width = 0;
+    if (len > 0)
+    {
+        int valid_bytes = 0, valid_width = 0;
+        width = ncstrwidth(egc, &valid_bytes, &valid_width);
+        if (width < 0 || valid_bytes != len)
+        {
+            PyErr_SetString(PyExc_ValueError, "Invalid EGC");
+            return -1;
+        }
+    }
+
+    PyObject *new_egc = NULL;
+    if (len > (Py_ssize_t)sizeof(cell->nccell.gcluster))
+    {
+        new_egc = GNU_PY_CHECK_RET_NEG1(PyBytes_FromStringAndSize(egc, len));
+    }
+
+    Py_XSETREF(cell->egc, new_egc);
+    cell->nccell.gcluster = 0;
+    cell->nccell.gcluster_backstop = 0;
+    if (NULL == new_egc)
+    {
+        memcpy(&cell->nccell.gcluster, egc, (size_t)len);
+    }
+    cell->nccell.width = (uint8_t)(width < 1 ? 1 : width);
+    return 0;
+}
+
+static NcCellObject *
+cell_alloc(void)
+{
+    NcCellObject *cell = PyObject_New(NcCellObject, &NcCell_Type);
+    if (NULL != cell)
+    {
+        nccell_init(&cell->nccell);
+        cell->nccell.width = 1;
+        cell->egc = NULL;
+    }
+    return cell;
+}
+
+PyObject *
+NcCell_from_plane(struct ncplane *n, nccell *c)
+{
+    NcCellObject *cell = cell_alloc();
+    if (NULL == cell)
+    {
+        nccell_release(n, c);
+        return NULL;
+    }
+
+    const char *egc = nccell_extended_gcluster(n, c);
+    size_t const len = NULL == egc ? 0 : strlen(egc);
+    cell->nccell = *c;
+    if (len > sizeof(c->gcluster))
+    {
+        cell->nccell.gcluster = 0;
+        cell->egc = PyBytes_FromStringAndSize(egc, (Py_ssize_t)len);
+    }
+    nccell_release(n, c);
+
+    if (len > sizeof(c->gcluster) && NULL == cell->egc)
+    {
+        Py_DECREF(cell);
+        return NULL;
+    }
+    return (PyObject *)cell;
+}
+
+int NcCell_load(const NcCellObject *cell, struct ncplane *n, nccell *out)
+{
+    *out = cell->nccell;
+    if (NULL == cell->egc)
+    {
+        return 0;
+    }
+
+    out->gcluster = 0;
+    if (nccell_load(n, out, PyBytes_AS_STRING(cell->egc)) < 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to load EGC into the plane");
+        return -1;
+    }
+    return 0;
+}
+
+void NcCell_snapshot(const NcCellObject *cell, NcCellSnapshot *out)
+{
+    out->nccell = cell->nccell;
+    out->egc = cell->egc;
+    Py_XINCREF(out->egc);
+}
+
+void NcCellSnapshot_release(NcCellSnapshot *snapshot)
+{
+    Py_CLEAR(snapshot->egc);
+}
+
+int NcCellSnapshot_put(const NcCellSnapshot *snapshot, struct ncplane *n, int y, int x)
+{
+    if (NULL == snapshot->egc)
+    {
+        // Inline EGCs are not looked up in the plane's egcpool.
+        return ncplane_putc_yx(n, y, x, &snapshot->nccell);
+    }
+
+    uint64_t const channels = ncplane_channels(n);
+    uint16_t const styles = ncplane_styles(n);
+    ncplane_set_channels(n, snapshot->nccell.channels);
+    ncplane_set_styles(n, snapshot->nccell.stylemask);
+    int const ret = ncplane_putegc_yx(n, y, x, PyBytes_AS_STRING(snapshot->egc), NULL);
+    ncplane_set_channels(n, channels);
+    ncplane_set_styles(n, styles);
+    return ret;
+}
+
+int NcCell_put(const NcCellObject *cell, struct ncplane *n, int y, int x)
+{
+    // Borrows the EGC, the caller holds the GIL.
+    NcCellSnapshot const snapshot = {cell->nccell, cell->egc};
+    return NcCellSnapshot_put(&snapshot, n, y, x);
+}
+
+static PyObject *
+NcCell_new(PyTypeObject *Py_UNUSED(subtype), PyObject *args, PyObject *kwds)
+{
+    const char *egc = "";
+    Py_ssize_t egc_len = 0;
+    unsigned short styles = 0;
+    unsigned long long channels = 0;
+
+    char *keywords[] = {"egc", "styles", "channels", NULL};
+
+    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "|s#HK", keywords, &egc, &egc_len, &styles, &channels));
+
+    NcCellObject *cell = (NcCellObject *)GNU_PY_CHECK((PyObject *)cell_alloc());
+    if (cell_set_egc(cell, egc, egc_len) < 0)
+    {
+        Py_DECREF(cell);
+        return NULL;
+    }
+    cell->nccell.stylemask = styles;
+    cell->nccell.channels = (uint64_t)channels;
+
+    return (PyObject *)cell;
+}
+
+static void
+NcCell_dealloc(NcCellObject *self)
+{
+    Py_XDECREF(self->egc);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcCell_get_egc(NcCellObject *self, void *Py_UNUSED(closure))
+{
+    return PyUnicode_FromString(cell_egc(self));
+}
+
+static int
+NcCell_set_egc(NcCellObject *self, PyObject *value, void *Py_UNUSED(closure))
+{
+    if (NULL == value)
+    {
+        PyErr_SetString(PyExc_TypeError, "Can't delete egc");
+        return -1;
+    }
+    if (!PyUnicode_Check(value))
+    {
+        PyErr_Format(PyExc_TypeError, "egc must be str, not %.50s", Py_TYPE(value)->tp_name);
+        return -1;
+    }
+
+    Py_ssize_t len = 0;
+    const char *egc = PyUnicode_AsUTF8AndSize(value, &len);
+    if (NULL == egc)
+    {
+        return -1;
+    }
+    return cell_set_egc(self, egc, len);
+}
+
+typedef enum
+{
+    CELL_FIELD_STYLES,
+    CELL_FIELD_CHANNELS,
+    CELL_FIELD_FG_RGB,
+    CELL_FIELD_BG_RGB,
+    CELL_FIELD_FG_ALPHA,
+    CELL_FIELD_BG_ALPHA,
+} CellField;
+
+static PyObject *
+NcCell_get_field(NcCellObject *self, void *closure)
+{
+    const nccell *c = &self->nccell;
+
+    switch ((CellField)(intptr_t)closure)
+    {
+    case CELL_FIELD_STYLES:
+        return PyLong_FromUnsignedLong(nccell_styles(c));
+    case CELL_FIELD_CHANNELS:
+        return PyLong_FromUnsignedLongLong(nccell_channels(c));
+    case CELL_FIELD_FG_RGB:
+        return PyLong_FromUnsignedLong(nccell_fg_rgb(c));
+    case CELL_FIELD_BG_RGB:
+        return PyLong_FromUnsignedLong(nccell_bg_rgb(c));
+    case CELL_FIELD_FG_ALPHA:
+        return PyLong_FromUnsignedLong(nccell_fg_alpha(c));
+    case CELL_FIELD_BG_ALPHA:
+        return PyLong_FromUnsignedLong(nccell_bg_alpha(c));
+    default:
+        PyErr_SetString(PyExc_SystemError, "Unknown NcCell field");
+        return NULL;
+    }
+}
+
+static int
+NcCell_set_field(NcCellObject *self, PyObject *value, void *closure)
+{
+    if (NULL == value)
+    {
+        PyErr_SetString(PyExc_TypeError, "Can't delete NcCell attributes");
+        return -1;
+    }
+
+    nccell *c = &self->nccell;
+    unsigned long long ull_value = 0;
+    GNU_PY_CHECK_INT_RET_NEG1(pync_as_ull(value, &ull_value));
+    int ret = 0;
+
+    switch ((CellField)(intptr_t)closure)
+    {
+    case CELL_FIELD_STYLES:
+        nccell_set_styles(c, (unsigned)(ull_value & NCSTYLE_MASK));
+        break;
+    case CELL_FIELD_CHANNELS:
+        nccell_set_channels(c, (uint64_t)ull_value);
+        break;
+    case CELL_FIELD_FG_RGB:
+        ret = ull_value > 0xffffffu ? -1 : nccell_set_fg_rgb(c, (uint32_t)ull_value);
+        break;
+    case CELL_FIELD_BG_RGB:
+        ret = ull_value > 0xffffffu ? -1 : nccell_set_bg_rgb(c, (uint32_t)ull_value);
+        break;
+    case CELL_FIELD_FG_ALPHA:
+        ret = ull_value > NC_BG_ALPHA_MASK ? -1 : nccell_set_fg_alpha(c, (unsigned)ull_value);
+        break;
+    case CELL_FIELD_BG_ALPHA:
+        ret = ull_value > NC_BG_ALPHA_MASK ? -1 : nccell_set_bg_alpha(c, (unsigned)ull_value);
+        break;
+    default:
+        ret = -1;
+        break;
+    }
+
+    if (ret < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "Invalid value 0x%llx", ull_value);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+NcCell_get_cols(NcCellObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromLong((long)nccell_cols(&self->nccell));
+}
+
+static PyObject *
+NcCell_copy(NcCellObject *self, PyObject *Py_UNUSED(args))
+{
+    NcCellObject *copy = (NcCellObject *)GNU_PY_CHECK((PyObject *)cell_alloc());
+    copy->nccell = self->nccell;
+    // The EGC bytes are immutable, copies share them.
+    Py_XINCREF(self->egc);
+    copy->egc = self->egc;
+    return (PyObject *)copy;
+}
+
+static PyObject *
+NcCell_repr(NcCellObject *self)
+{
+    PyObject *egc CLEANUP_PY_OBJ = GNU_PY_CHECK(NcCell_get_egc(self, NULL));
+    return PyUnicode_FromFormat("notcurses.NcCell(%R, styles=%u, channels=%llu)",
+                                egc, (unsigned)self->nccell.stylemask, (unsigned long long)self->nccell.channels);
+}
+
+static PyObject *
+NcCell_richcompare(NcCellObject *self, PyObject *other, int op)
+{
+    if (!PyObject_TypeCheck(other, &NcCell_Type) || (op != Py_EQ && op != Py_NE))
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    const NcCellObject *o = (const NcCellObject *)other;
+    bool equal = self->nccell.stylemask == o->nccell.stylemask &&
+                 self->nccell.channels == o->nccell.channels &&
+                 0 == strcmp(cell_egc(self), cell_egc(o));
+
+    return PyBool_FromLong((long)(equal == (op == Py_EQ)));
+}
+
+static PyMethodDef NcCell_methods[] = {
+    {"copy", (PyCFunction)NcCell_copy, METH_NOARGS, PyDoc_STR("Return a new NcCell with the same EGC, styles and channels.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcCell_getset[] = {
+    {"egc", (getter)NcCell_get_egc, (setter)NcCell_set_egc, PyDoc_STR("The extended grapheme cluster, '' for a blank cell."), NULL},
+    {"cols", (getter)NcCell_get_cols, NULL, PyDoc_STR("Number of columns the EGC occupies."), NULL},
+    {"styles", (getter)NcCell_get_field, (setter)NcCell_set_field, PyDoc_STR("NCSTYLE_* styles mask."), (void *)CELL_FIELD_STYLES},
+    {"channels", (getter)NcCell_get_field, (setter)NcCell_set_field, PyDoc_STR("The 64-bit channel pair."), (void *)CELL_FIELD_CHANNELS},
+    {"fg_rgb", (getter)NcCell_get_field, (setter)NcCell_set_field, PyDoc_STR("Foreground 24-bit RGB. Setting it marks the foreground not default."), (void *)CELL_FIELD_FG_RGB},
+    {"bg_rgb", (getter)NcCell_get_field, (setter)NcCell_set_field, PyDoc_STR("Background 24-bit RGB. Setting it marks the background not default."), (void *)CELL_FIELD_BG_RGB},
+    {"fg_alpha", (getter)NcCell_get_field, (setter)NcCell_set_field, PyDoc_STR("Foreground NCALPHA_* value."), (void *)CELL_FIELD_FG_ALPHA},
+    {"bg_alpha", (getter)NcCell_get_field, (setter)NcCell_set_field, PyDoc_STR("Background NCALPHA_* value."), (void *)CELL_FIELD_BG_ALPHA},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcCell_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcCell",
+    .tp_doc = "Cell made of an EGC, styles and channels. Not bound to a plane, so it stays valid when planes are erased or resized.",
+    .tp_basicsize = sizeof(NcCellObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcCell_new,
+    .tp_dealloc = (destructor)NcCell_dealloc,
+    .tp_repr = (reprfunc)NcCell_repr,
+    .tp_richcompare = (richcmpfunc)NcCell_richcompare,
+    .tp_hash = PyObject_HashNotImplemented,
+    .tp_methods = NcCell_methods,
+    .tp_getset = NcCell_getset,
+};
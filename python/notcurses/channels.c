@@ -18,72 +18,81 @@ limitations under the License.
 #include "notcurses-python.h"
 
 static PyObject *
-python_ncchannels_rgb_initializer(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_rgb_initializer(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long fr, fg, fb, br, bg, bb = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "KKKKKK", &fr, &fg, &fb, &br, &bg, &bb));
+    GNU_PY_CHECK_NARGS("ncchannels_rgb_initializer", nargs, 6, 6);
+    fr = GNU_PY_ARG_ULL(args[0]);
+    fg = GNU_PY_ARG_ULL(args[1]);
+    fb = GNU_PY_ARG_ULL(args[2]);
+    br = GNU_PY_ARG_ULL(args[3]);
+    bg = GNU_PY_ARG_ULL(args[4]);
+    bb = GNU_PY_ARG_ULL(args[5]);
 
     unsigned long long ncchannels = NCCHANNELS_INITIALIZER(fr, fg, fb, br, bg, bb);
 
-    return Py_BuildValue("K", ncchannels);
+    return PyLong_FromUnsignedLongLong(ncchannels);
 }
 
 static PyObject *
-python_ncchannel_rgb_initializer(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_rgb_initializer(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "kkk", &r, &g, &b));
+    GNU_PY_CHECK_NARGS("ncchannel_rgb_initializer", nargs, 3, 3);
+    r = GNU_PY_ARG_ULONG(args[0]);
+    g = GNU_PY_ARG_ULONG(args[1]);
+    b = GNU_PY_ARG_ULONG(args[2]);
 
     unsigned long ncchannel = NCCHANNEL_INITIALIZER(r, g, b);
 
-    return Py_BuildValue("k", ncchannel);
+    return PyLong_FromUnsignedLong(ncchannel);
 }
 
 static PyObject *
-python_ncchannel_r(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_r(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &ncchannel));
+    ncchannel = GNU_PY_ARG_ULONG(arg);
 
     unsigned long r = ncchannel_r((uint32_t)ncchannel);
 
-    return Py_BuildValue("k", r);
+    return PyLong_FromUnsignedLong(r);
 }
 
 static PyObject *
-python_ncchannel_g(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_g(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &ncchannel));
+    ncchannel = GNU_PY_ARG_ULONG(arg);
 
-    unsigned long g = ncchannel_r((uint32_t)ncchannel);
+    unsigned long g = ncchannel_g((uint32_t)ncchannel);
 
-    return Py_BuildValue("k", g);
+    return PyLong_FromUnsignedLong(g);
 }
 
 static PyObject *
-python_ncchannel_b(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_b(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &ncchannel));
+    ncchannel = GNU_PY_ARG_ULONG(arg);
 
     unsigned long b = ncchannel_b((uint32_t)ncchannel);
 
-    return Py_BuildValue("k", b);
+    return PyLong_FromUnsignedLong(b);
 }
 
 static PyObject *
-python_ncchannel_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_rgb8(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long ncchannel = {0};
     unsigned int r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &ncchannel));
+    ncchannel = GNU_PY_ARG_ULONG(arg);
 
     ncchannel_rgb8((uint32_t)ncchannel, &r, &g, &b);
 
@@ -91,245 +100,265 @@ python_ncchannel_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
 }
 
 static PyObject *
-python_ncchannel_set_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_set_rgb8(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long ncchannel = {0};
     unsigned r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "kkkk", &ncchannel, &r, &g, &b));
+    GNU_PY_CHECK_NARGS("ncchannel_set_rgb8", nargs, 4, 4);
+    ncchannel = GNU_PY_ARG_ULONG(args[0]);
+    r = GNU_PY_ARG_UINT(args[1]);
+    g = GNU_PY_ARG_UINT(args[2]);
+    b = GNU_PY_ARG_UINT(args[3]);
 
     uint32_t ncchannel_fixed_size = (uint32_t)ncchannel;
 
     CHECK_NOTCURSES(ncchannel_set_rgb8(&ncchannel_fixed_size, r, g, b));
 
-    return Py_BuildValue("k", (unsigned long)ncchannel_fixed_size);
+    return PyLong_FromUnsignedLong((unsigned long)ncchannel_fixed_size);
 }
 
 static PyObject *
-python_ncchannel_set_rgb8_clipped(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_set_rgb8_clipped(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned int ncchannel = {0};
     int r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "Iiii", &ncchannel, &r, &g, &b));
+    GNU_PY_CHECK_NARGS("ncchannel_set_rgb8_clipped", nargs, 4, 4);
+    ncchannel = GNU_PY_ARG_UINT(args[0]);
+    r = GNU_PY_ARG_INT(args[1]);
+    g = GNU_PY_ARG_INT(args[2]);
+    b = GNU_PY_ARG_INT(args[3]);
 
     ncchannel_set_rgb8_clipped(&ncchannel, r, g, b);
 
-    return Py_BuildValue("k", ncchannel);
+    return PyLong_FromUnsignedLong(ncchannel);
 }
 
 static PyObject *
-python_ncchannel_set(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_set(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned int ncchannel, rgb = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "II", &ncchannel, &rgb));
+    GNU_PY_CHECK_NARGS("ncchannel_set", nargs, 2, 2);
+    ncchannel = GNU_PY_ARG_UINT(args[0]);
+    rgb = GNU_PY_ARG_UINT(args[1]);
 
     CHECK_NOTCURSES(ncchannel_set(&ncchannel, rgb));
 
-    return Py_BuildValue("I", ncchannel);
+    return PyLong_FromUnsignedLong(ncchannel);
 }
 
 static PyObject *
-python_ncchannel_alpha(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_alpha(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned int ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &ncchannel));
+    ncchannel = GNU_PY_ARG_UINT(arg);
 
-    return Py_BuildValue("I", ncchannel_alpha(ncchannel));
+    return PyLong_FromUnsignedLong(ncchannel_alpha(ncchannel));
 }
 
 static PyObject *
-python_ncchannel_palindex(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_palindex(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &ncchannel));
+    ncchannel = GNU_PY_ARG_ULONG(arg);
 
-    return Py_BuildValue("I", ncchannel_palindex((uint32_t)ncchannel));
+    return PyLong_FromUnsignedLong(ncchannel_palindex((uint32_t)ncchannel));
 }
 
 static PyObject *
-python_ncchannel_set_alpha(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_set_alpha(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned int ncchannel, alpha = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "II", &ncchannel, &alpha));
+    GNU_PY_CHECK_NARGS("ncchannel_set_alpha", nargs, 2, 2);
+    ncchannel = GNU_PY_ARG_UINT(args[0]);
+    alpha = GNU_PY_ARG_UINT(args[1]);
 
     CHECK_NOTCURSES(ncchannel_set_alpha(&ncchannel, alpha));
 
-    return Py_BuildValue("I", ncchannel);
+    return PyLong_FromUnsignedLong(ncchannel);
 }
 
 static PyObject *
-python_ncchannel_set_palindex(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_set_palindex(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long ncchannel = {0};
     unsigned int idx = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "kI", &ncchannel, &idx));
+    GNU_PY_CHECK_NARGS("ncchannel_set_palindex", nargs, 2, 2);
+    ncchannel = GNU_PY_ARG_ULONG(args[0]);
+    idx = GNU_PY_ARG_UINT(args[1]);
 
     uint32_t ncchannel_fixed_size = (uint32_t)ncchannel;
 
     CHECK_NOTCURSES(ncchannel_set_palindex(&ncchannel_fixed_size, idx));
 
-    return Py_BuildValue("k", (unsigned long)ncchannel_fixed_size);
+    return PyLong_FromUnsignedLong((unsigned long)ncchannel_fixed_size);
 }
 
 static PyObject *
-python_ncchannel_default_p(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_default_p(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned int ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &ncchannel));
+    ncchannel = GNU_PY_ARG_UINT(arg);
 
     return PyBool_FromLong((long)ncchannel_default_p(ncchannel));
 }
 
 static PyObject *
-python_ncchannel_palindex_p(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_palindex_p(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned int ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &ncchannel));
+    ncchannel = GNU_PY_ARG_UINT(arg);
 
     return PyBool_FromLong((long)ncchannel_palindex_p(ncchannel));
 }
 
 static PyObject *
-python_ncchannel_set_default(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannel_set_default(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned int ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &ncchannel));
+    ncchannel = GNU_PY_ARG_UINT(arg);
 
-    return Py_BuildValue("I", ncchannel_set_default(&ncchannel));
+    return PyLong_FromUnsignedLong(ncchannel_set_default(&ncchannel));
 }
 
 static PyObject *
-python_ncchannels_bchannel(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_bchannel(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
-    return Py_BuildValue("k", (unsigned long)ncchannels_bchannel((uint64_t)ncchannels));
+    return PyLong_FromUnsignedLong((unsigned long)ncchannels_bchannel((uint64_t)ncchannels));
 }
 
 static PyObject *
-python_ncchannels_fchannel(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_fchannel(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
-    return Py_BuildValue("k", (unsigned long)ncchannels_fchannel((uint64_t)ncchannels));
+    return PyLong_FromUnsignedLong((unsigned long)ncchannels_fchannel((uint64_t)ncchannels));
 }
 
 static PyObject *
-python_ncchannels_set_bchannel(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_bchannel(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned long ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "Kk", &ncchannels, &ncchannel));
+    GNU_PY_CHECK_NARGS("ncchannels_set_bchannel", nargs, 2, 2);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    ncchannel = GNU_PY_ARG_ULONG(args[1]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_set_bchannel(&ncchannels_fixed_size, (uint32_t)ncchannel));
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_set_bchannel(&ncchannels_fixed_size, (uint32_t)ncchannel));
 }
 
 static PyObject *
-python_ncchannels_set_fchannel(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_fchannel(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned long ncchannel = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "Kk", &ncchannels, &ncchannel));
+    GNU_PY_CHECK_NARGS("ncchannels_set_fchannel", nargs, 2, 2);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    ncchannel = GNU_PY_ARG_ULONG(args[1]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_set_fchannel(&ncchannels_fixed_size, (uint32_t)ncchannel));
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_set_fchannel(&ncchannels_fixed_size, (uint32_t)ncchannel));
 }
 
 static PyObject *
-python_ncchannels_combine(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_combine(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long fchan, bchan = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "kk", &fchan, &bchan));
+    GNU_PY_CHECK_NARGS("ncchannels_combine", nargs, 2, 2);
+    fchan = GNU_PY_ARG_ULONG(args[0]);
+    bchan = GNU_PY_ARG_ULONG(args[1]);
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_combine((uint32_t)fchan, (uint32_t)bchan));
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_combine((uint32_t)fchan, (uint32_t)bchan));
 }
 
 static PyObject *
-python_ncchannels_fg_palindex(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_fg_palindex(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
-    return Py_BuildValue("k", (unsigned long)ncchannels_fg_palindex((uint64_t)ncchannels));
+    return PyLong_FromUnsignedLong((unsigned long)ncchannels_fg_palindex((uint64_t)ncchannels));
 }
 
 static PyObject *
-python_ncchannels_bg_palindex(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_bg_palindex(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
-    return Py_BuildValue("k", (unsigned long)ncchannels_bg_palindex((uint64_t)ncchannels));
+    return PyLong_FromUnsignedLong((unsigned long)ncchannels_bg_palindex((uint64_t)ncchannels));
 }
 
 static PyObject *
-python_ncchannels_fg_rgb(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_fg_rgb(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
-    return Py_BuildValue("I", ncchannels_fg_rgb(ncchannels));
+    return PyLong_FromUnsignedLong(ncchannels_fg_rgb(ncchannels));
 }
 
 static PyObject *
-python_ncchannels_bg_rgb(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_bg_rgb(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
-    return Py_BuildValue("I", ncchannels_bg_rgb(ncchannels));
+    return PyLong_FromUnsignedLong(ncchannels_bg_rgb(ncchannels));
 }
 
 static PyObject *
-python_ncchannels_fg_alpha(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_fg_alpha(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
-    return Py_BuildValue("I", ncchannels_fg_alpha(ncchannels));
+    return PyLong_FromUnsignedLong(ncchannels_fg_alpha(ncchannels));
 }
 
 static PyObject *
-python_ncchannels_bg_alpha(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_bg_alpha(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
-    return Py_BuildValue("I", ncchannels_bg_alpha(ncchannels));
+    return PyLong_FromUnsignedLong(ncchannels_bg_alpha(ncchannels));
 }
 
 static PyObject *
-python_ncchannels_fg_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_fg_rgb8(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
     unsigned int r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
     ncchannels_fg_rgb8((uint64_t)ncchannels, &r, &g, &b);
 
@@ -337,12 +366,12 @@ python_ncchannels_fg_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
 }
 
 static PyObject *
-python_ncchannels_bg_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_bg_rgb8(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
     unsigned int r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
     ncchannels_bg_rgb8((uint64_t)ncchannels, &r, &g, &b);
 
@@ -350,265 +379,293 @@ python_ncchannels_bg_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
 }
 
 static PyObject *
-python_ncchannels_set_fg_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_fg_rgb8(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "Kkkk", &ncchannels, &r, &g, &b));
+    GNU_PY_CHECK_NARGS("ncchannels_set_fg_rgb8", nargs, 4, 4);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    r = GNU_PY_ARG_UINT(args[1]);
+    g = GNU_PY_ARG_UINT(args[2]);
+    b = GNU_PY_ARG_UINT(args[3]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     CHECK_NOTCURSES(ncchannels_set_fg_rgb8(&ncchannels_fixed_size, r, g, b));
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_fg_rgb8_clipped(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_fg_rgb8_clipped(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     int r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "Kiii", &ncchannels, &r, &g, &b));
+    GNU_PY_CHECK_NARGS("ncchannels_set_fg_rgb8_clipped", nargs, 4, 4);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    r = GNU_PY_ARG_INT(args[1]);
+    g = GNU_PY_ARG_INT(args[2]);
+    b = GNU_PY_ARG_INT(args[3]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     ncchannels_set_fg_rgb8_clipped(&ncchannels_fixed_size, r, g, b);
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_fg_alpha(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_fg_alpha(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned int alpha = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "KI", &ncchannels, &alpha));
+    GNU_PY_CHECK_NARGS("ncchannels_set_fg_alpha", nargs, 2, 2);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    alpha = GNU_PY_ARG_UINT(args[1]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     CHECK_NOTCURSES(ncchannels_set_fg_alpha(&ncchannels_fixed_size, alpha));
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_fg_palindex(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_fg_palindex(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned int idx = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "KI", &ncchannels, &idx));
+    GNU_PY_CHECK_NARGS("ncchannels_set_fg_palindex", nargs, 2, 2);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    idx = GNU_PY_ARG_UINT(args[1]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     CHECK_NOTCURSES(ncchannels_set_fg_palindex(&ncchannels_fixed_size, idx));
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_fg_rgb(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_fg_rgb(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned int rgb = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "KI", &ncchannels, &rgb));
+    GNU_PY_CHECK_NARGS("ncchannels_set_fg_rgb", nargs, 2, 2);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    rgb = GNU_PY_ARG_UINT(args[1]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     CHECK_NOTCURSES(ncchannels_set_fg_rgb(&ncchannels_fixed_size, rgb));
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_bg_rgb8(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_bg_rgb8(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "Kkkk", &ncchannels, &r, &g, &b));
+    GNU_PY_CHECK_NARGS("ncchannels_set_bg_rgb8", nargs, 4, 4);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    r = GNU_PY_ARG_UINT(args[1]);
+    g = GNU_PY_ARG_UINT(args[2]);
+    b = GNU_PY_ARG_UINT(args[3]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     CHECK_NOTCURSES(ncchannels_set_bg_rgb8(&ncchannels_fixed_size, r, g, b));
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_bg_rgb8_clipped(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_bg_rgb8_clipped(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     int r, g, b = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "Kiii", &ncchannels, &r, &g, &b));
+    GNU_PY_CHECK_NARGS("ncchannels_set_bg_rgb8_clipped", nargs, 4, 4);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    r = GNU_PY_ARG_INT(args[1]);
+    g = GNU_PY_ARG_INT(args[2]);
+    b = GNU_PY_ARG_INT(args[3]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     ncchannels_set_bg_rgb8_clipped(&ncchannels_fixed_size, r, g, b);
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_bg_alpha(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_bg_alpha(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned int alpha = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "KI", &ncchannels, &alpha));
+    GNU_PY_CHECK_NARGS("ncchannels_set_bg_alpha", nargs, 2, 2);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    alpha = GNU_PY_ARG_UINT(args[1]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     CHECK_NOTCURSES(ncchannels_set_bg_alpha(&ncchannels_fixed_size, alpha));
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_bg_palindex(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_bg_palindex(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned int idx = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "KI", &ncchannels, &idx));
+    GNU_PY_CHECK_NARGS("ncchannels_set_bg_palindex", nargs, 2, 2);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    idx = GNU_PY_ARG_UINT(args[1]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     CHECK_NOTCURSES(ncchannels_set_bg_palindex(&ncchannels_fixed_size, idx));
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_set_bg_rgb(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_bg_rgb(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
 {
     unsigned long long ncchannels = {0};
     unsigned int rgb = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "KI", &ncchannels, &rgb));
+    GNU_PY_CHECK_NARGS("ncchannels_set_bg_rgb", nargs, 2, 2);
+    ncchannels = GNU_PY_ARG_ULL(args[0]);
+    rgb = GNU_PY_ARG_UINT(args[1]);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
     CHECK_NOTCURSES(ncchannels_set_bg_rgb(&ncchannels_fixed_size, rgb));
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_fixed_size);
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_fixed_size);
 }
 
 static PyObject *
-python_ncchannels_fg_default_p(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_fg_default_p(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
     return PyBool_FromLong((long)ncchannels_fg_default_p((uint64_t)ncchannels));
 }
 
 static PyObject *
-python_ncchannels_fg_palindex_p(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_fg_palindex_p(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
     return PyBool_FromLong((long)ncchannels_fg_palindex_p((uint64_t)ncchannels));
 }
 
 static PyObject *
-python_ncchannels_bg_default_p(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_bg_default_p(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
     return PyBool_FromLong((long)ncchannels_bg_default_p((uint64_t)ncchannels));
 }
 
 static PyObject *
-python_ncchannels_bg_palindex_p(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_bg_palindex_p(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
     return PyBool_FromLong((long)ncchannels_bg_palindex_p((uint64_t)ncchannels));
 }
 
 static PyObject *
-python_ncchannels_set_fg_default(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_fg_default(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_set_fg_default(&ncchannels_fixed_size));
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_set_fg_default(&ncchannels_fixed_size));
 }
 
 static PyObject *
-python_ncchannels_set_bg_default(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncchannels_set_bg_default(PyObject *Py_UNUSED(self), PyObject *arg)
 {
     unsigned long long ncchannels = {0};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &ncchannels));
+    ncchannels = GNU_PY_ARG_ULL(arg);
 
     uint64_t ncchannels_fixed_size = (uint64_t)ncchannels;
 
-    return Py_BuildValue("K", (unsigned long long)ncchannels_set_bg_default(&ncchannels_fixed_size));
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncchannels_set_bg_default(&ncchannels_fixed_size));
 }
 
 PyMethodDef ChannelsFunctions[] = {
-    {"ncchannels_rgb_initializer", (PyCFunction)python_ncchannels_rgb_initializer, METH_VARARGS, "Initialize a 64-bit ncchannel pair with specified RGB fg/bg."},
-    {"ncchannel_rgb_initializer", (PyCFunction)python_ncchannel_rgb_initializer, METH_VARARGS, "Initialize a 32-bit single ncchannel with specified RGB."},
-    {"ncchannel_r", (PyCFunction)python_ncchannel_r, METH_VARARGS, "Extract the 8-bit red component from a 32-bit ncchannel."},
-    {"ncchannel_g", (PyCFunction)python_ncchannel_g, METH_VARARGS, "Extract the 8-bit green component from a 32-bit ncchannel."},
-    {"ncchannel_b", (PyCFunction)python_ncchannel_b, METH_VARARGS, "Extract the 8-bit blue component from a 32-bit ncchannel."},
-    {"ncchannel_rgb8", (PyCFunction)python_ncchannel_rgb8, METH_VARARGS, "Extract the three 8-bit R/G/B components from a 32-bit ncchannel."},
-    {"ncchannel_set_rgb8", (PyCFunction)python_ncchannel_set_rgb8, METH_VARARGS, "Set the three 8-bit components of a 32-bit ncchannel, and mark it as not using the default color. Retain the other bits unchanged."},
-    {"ncchannel_set_rgb8_clipped", (PyCFunction)python_ncchannel_set_rgb8_clipped, METH_VARARGS, "Set the three 8-bit components of a 32-bit ncchannel, and mark it as not using the default color. Retain the other bits unchanged. r, g, and b will be clipped to the range [0..255]."},
-    {"ncchannel_set", (PyCFunction)python_ncchannel_set, METH_VARARGS, "Set the three 8-bit components of a 32-bit ncchannel from a provide an assembled, packed 24 bits of rgb."},
-    {"ncchannel_alpha", (PyCFunction)python_ncchannel_alpha, METH_VARARGS, "Extract 2 bits of foreground alpha from 'ncchannels', shifted to LSBs."},
-    {"ncchannel_palindex", (PyCFunction)python_ncchannel_palindex, METH_VARARGS, NULL},
-    {"ncchannel_set_alpha", (PyCFunction)python_ncchannel_set_alpha, METH_VARARGS, "Set the 2-bit alpha component of the 32-bit ncchannel."},
-    {"ncchannel_set_palindex", (PyCFunction)python_ncchannel_set_palindex, METH_VARARGS, NULL},
-    {"ncchannel_default_p", (PyCFunction)python_ncchannel_default_p, METH_VARARGS, "Is this ncchannel using the \"default color\" rather than RGB/palette-indexed?"},
-    {"ncchannel_palindex_p", (PyCFunction)python_ncchannel_palindex_p, METH_VARARGS, "Is this ncchannel using palette-indexed color rather than RGB?"},
-    {"ncchannel_set_palindex", (PyCFunction)python_ncchannel_set_palindex, METH_VARARGS, "Is this ncchannel using palette-indexed color rather than RGB?"},
-    {"ncchannel_set_default", (PyCFunction)python_ncchannel_set_default, METH_VARARGS, "Mark the ncchannel as using its default color, which also marks it opaque."},
-    {"ncchannels_bchannel", (PyCFunction)python_ncchannels_bchannel, METH_VARARGS, "Extract the 32-bit background ncchannel from a ncchannel pair."},
-    {"ncchannels_fchannel", (PyCFunction)python_ncchannels_fchannel, METH_VARARGS, "Extract the 32-bit foreground ncchannel from a ncchannel pair."},
-    {"ncchannels_set_bchannel", (PyCFunction)python_ncchannels_set_bchannel, METH_VARARGS, "Set the 32-bit background ncchannel of a ncchannel pair."},
-    {"ncchannels_set_fchannel", (PyCFunction)python_ncchannels_set_fchannel, METH_VARARGS, "Set the 32-bit foreground ncchannel of a ncchannel pair."},
-    {"ncchannels_combine", (PyCFunction)python_ncchannels_combine, METH_VARARGS, NULL},
-    {"ncchannels_fg_palindex", (PyCFunction)python_ncchannels_fg_palindex, METH_VARARGS, NULL},
-    {"ncchannels_bg_palindex", (PyCFunction)python_ncchannels_bg_palindex, METH_VARARGS, NULL},
-    {"ncchannels_fg_rgb", (PyCFunction)python_ncchannels_fg_rgb, METH_VARARGS, "Extract 24 bits of foreground RGB from 'ncchannels', shifted to LSBs."},
-    {"ncchannels_bg_rgb", (PyCFunction)python_ncchannels_bg_rgb, METH_VARARGS, "Extract 24 bits of background RGB from 'ncchannels', shifted to LSBs."},
-    {"ncchannels_fg_alpha", (PyCFunction)python_ncchannels_fg_alpha, METH_VARARGS, "Extract 2 bits of foreground alpha from 'ncchannels', shifted to LSBs."},
-    {"ncchannels_bg_alpha", (PyCFunction)python_ncchannels_bg_alpha, METH_VARARGS, "Extract 2 bits of background alpha from 'ncchannels', shifted to LSBs."},
-    {"ncchannels_fg_rgb8", (PyCFunction)python_ncchannels_fg_rgb8, METH_VARARGS, "Extract 24 bits of foreground RGB from 'ncchannels', split into subncchannels."},
-    {"ncchannels_bg_rgb8", (PyCFunction)python_ncchannels_bg_rgb8, METH_VARARGS, "Extract 24 bits of background RGB from 'ncchannels', split into subncchannels."},
-    {"ncchannels_set_fg_rgb8", (PyCFunction)python_ncchannels_set_fg_rgb8, METH_VARARGS, "Set the r, g, and b ncchannels for the foreground component of this 64-bit 'ncchannels' variable, and mark it as not using the default color."},
-    {"ncchannels_set_fg_rgb8_clipped", (PyCFunction)python_ncchannels_set_fg_rgb8_clipped, METH_VARARGS, "Set the r, g, and b ncchannels for the foreground component of this 64-bit 'ncchannels' variable but clips to [0..255]."},
-    {"ncchannels_set_fg_alpha", (PyCFunction)python_ncchannels_set_fg_alpha, METH_VARARGS, "Set the 2-bit alpha component of the foreground ncchannel."},
-    {"ncchannels_set_fg_palindex", (PyCFunction)python_ncchannels_set_fg_palindex, METH_VARARGS, NULL},
-    {"ncchannels_set_fg_rgb", (PyCFunction)python_ncchannels_set_fg_rgb, METH_VARARGS, "Set the r, g, and b ncchannels for the foreground component of this 64-bit 'ncchannels' variable but set an assembled 24 bit ncchannel at once."},
-    {"ncchannels_set_bg_rgb8", (PyCFunction)python_ncchannels_set_bg_rgb8, METH_VARARGS, "Set the r, g, and b ncchannels for the background component of this 64-bit 'ncchannels' variable, and mark it as not using the default color."},
-    {"ncchannels_set_bg_rgb8_clipped", (PyCFunction)python_ncchannels_set_bg_rgb8_clipped, METH_VARARGS, "Set the r, g, and b ncchannels for the background component of this 64-bit 'ncchannels' variable but clips to [0..255]."},
-    {"ncchannels_set_bg_alpha", (PyCFunction)python_ncchannels_set_bg_alpha, METH_VARARGS, "Set the 2-bit alpha component of the background ncchannel."},
-    {"ncchannels_set_bg_palindex", (PyCFunction)python_ncchannels_set_bg_palindex, METH_VARARGS, NULL},
-    {"ncchannels_set_bg_rgb", (PyCFunction)python_ncchannels_set_bg_rgb, METH_VARARGS, "Set the r, g, and b ncchannels for the background component of this 64-bit 'ncchannels' variable but set an assembled 24 bit ncchannel at once."},
-    {"ncchannels_fg_default_p", (PyCFunction)python_ncchannels_fg_default_p, METH_VARARGS, "Is the foreground using the \"default foreground color\"?"},
-    {"ncchannels_fg_palindex_p", (PyCFunction)python_ncchannels_fg_palindex_p, METH_VARARGS, "Is the foreground using indexed palette color?"},
-    {"ncchannels_bg_default_p", (PyCFunction)python_ncchannels_bg_default_p, METH_VARARGS, "Is the background using the \"default background color\"? The \"defaultbackground color\" must generally be used to take advantage of terminal-effected transparency."},
-    {"ncchannels_bg_palindex_p", (PyCFunction)python_ncchannels_bg_palindex_p, METH_VARARGS, "Is the background using indexed palette color?"},
-    {"ncchannels_set_fg_default", (PyCFunction)python_ncchannels_set_fg_default, METH_VARARGS, "Mark the foreground ncchannel as using its default color."},
-    {"ncchannels_set_bg_default", (PyCFunction)python_ncchannels_set_bg_default, METH_VARARGS, "Mark the background ncchannel as using its default color."},
+    {"ncchannels_rgb_initializer", (void *)python_ncchannels_rgb_initializer, METH_FASTCALL, "Initialize a 64-bit ncchannel pair with specified RGB fg/bg."},
+    {"ncchannel_rgb_initializer", (void *)python_ncchannel_rgb_initializer, METH_FASTCALL, "Initialize a 32-bit single ncchannel with specified RGB."},
+    {"ncchannel_r", (PyCFunction)python_ncchannel_r, METH_O, "Extract the 8-bit red component from a 32-bit ncchannel."},
+    {"ncchannel_g", (PyCFunction)python_ncchannel_g, METH_O, "Extract the 8-bit green component from a 32-bit ncchannel."},
+    {"ncchannel_b", (PyCFunction)python_ncchannel_b, METH_O, "Extract the 8-bit blue component from a 32-bit ncchannel."},
+    {"ncchannel_rgb8", (PyCFunction)python_ncchannel_rgb8, METH_O, "Extract the three 8-bit R/G/B components from a 32-bit ncchannel."},
+    {"ncchannel_set_rgb8", (void *)python_ncchannel_set_rgb8, METH_FASTCALL, "Set the three 8-bit components of a 32-bit ncchannel, and mark it as not using the default color. Retain the other bits unchanged."},
+    {"ncchannel_set_rgb8_clipped", (void *)python_ncchannel_set_rgb8_clipped, METH_FASTCALL, "Set the three 8-bit components of a 32-bit ncchannel, and mark it as not using the default color. Retain the other bits unchanged. r, g, and b will be clipped to the range [0..255]."},
+    {"ncchannel_set", (void *)python_ncchannel_set, METH_FASTCALL, "Set the three 8-bit components of a 32-bit ncchannel from a provide an assembled, packed 24 bits of rgb."},
+    {"ncchannel_alpha", (PyCFunction)python_ncchannel_alpha, METH_O, "Extract 2 bits of foreground alpha from 'ncchannels', shifted to LSBs."},
+    {"ncchannel_palindex", (PyCFunction)python_ncchannel_palindex, METH_O, NULL},
+    {"ncchannel_set_alpha", (void *)python_ncchannel_set_alpha, METH_FASTCALL, "Set the 2-bit alpha component of the 32-bit ncchannel."},
+    {"ncchannel_set_palindex", (void *)python_ncchannel_set_palindex, METH_FASTCALL, NULL},
+    {"ncchannel_default_p", (PyCFunction)python_ncchannel_default_p, METH_O, "Is this ncchannel using the \"default color\" rather than RGB/palette-indexed?"},
+    {"ncchannel_palindex_p", (PyCFunction)python_ncchannel_palindex_p, METH_O, "Is this ncchannel using palette-indexed color rather than RGB?"},
+    {"ncchannel_set_palindex", (void *)python_ncchannel_set_palindex, METH_FASTCALL, "Is this ncchannel using palette-indexed color rather than RGB?"},
+    {"ncchannel_set_default", (PyCFunction)python_ncchannel_set_default, METH_O, "Mark the ncchannel as using its default color, which also marks it opaque."},
+    {"ncchannels_bchannel", (PyCFunction)python_ncchannels_bchannel, METH_O, "Extract the 32-bit background ncchannel from a ncchannel pair."},
+    {"ncchannels_fchannel", (PyCFunction)python_ncchannels_fchannel, METH_O, "Extract the 32-bit foreground ncchannel from a ncchannel pair."},
+    {"ncchannels_set_bchannel", (void *)python_ncchannels_set_bchannel, METH_FASTCALL, "Set the 32-bit background ncchannel of a ncchannel pair."},
+    {"ncchannels_set_fchannel", (void *)python_ncchannels_set_fchannel, METH_FASTCALL, "Set the 32-bit foreground ncchannel of a ncchannel pair."},
+    {"ncchannels_combine", (void *)python_ncchannels_combine, METH_FASTCALL, NULL},
+    {"ncchannels_fg_palindex", (PyCFunction)python_ncchannels_fg_palindex, METH_O, NULL},
+    {"ncchannels_bg_palindex", (PyCFunction)python_ncchannels_bg_palindex, METH_O, NULL},
+    {"ncchannels_fg_rgb", (PyCFunction)python_ncchannels_fg_rgb, METH_O, "Extract 24 bits of foreground RGB from 'ncchannels', shifted to LSBs."},
+    {"ncchannels_bg_rgb", (PyCFunction)python_ncchannels_bg_rgb, METH_O, "Extract 24 bits of background RGB from 'ncchannels', shifted to LSBs."},
+    {"ncchannels_fg_alpha", (PyCFunction)python_ncchannels_fg_alpha, METH_O, "Extract 2 bits of foreground alpha from 'ncchannels', shifted to LSBs."},
+    {"ncchannels_bg_alpha", (PyCFunction)python_ncchannels_bg_alpha, METH_O, "Extract 2 bits of background alpha from 'ncchannels', shifted to LSBs."},
+    {"ncchannels_fg_rgb8", (PyCFunction)python_ncchannels_fg_rgb8, METH_O, "Extract 24 bits of foreground RGB from 'ncchannels', split into subncchannels."},
+    {"ncchannels_bg_rgb8", (PyCFunction)python_ncchannels_bg_rgb8, METH_O, "Extract 24 bits of background RGB from 'ncchannels', split into subncchannels."},
+    {"ncchannels_set_fg_rgb8", (void *)python_ncchannels_set_fg_rgb8, METH_FASTCALL, "Set the r, g, and b ncchannels for the foreground component of this 64-bit 'ncchannels' variable, and mark it as not using the default color."},
+    {"ncchannels_set_fg_rgb8_clipped", (void *)python_ncchannels_set_fg_rgb8_clipped, METH_FASTCALL, "Set the r, g, and b ncchannels for the foreground component of this 64-bit 'ncchannels' variable but clips to [0..255]."},
+    {"ncchannels_set_fg_alpha", (void *)python_ncchannels_set_fg_alpha, METH_FASTCALL, "Set the 2-bit alpha component of the foreground ncchannel."},
+    {"ncchannels_set_fg_palindex", (void *)python_ncchannels_set_fg_palindex, METH_FASTCALL, NULL},
+    {"ncchannels_set_fg_rgb", (void *)python_ncchannels_set_fg_rgb, METH_FASTCALL, "Set the r, g, and b ncchannels for the foreground component of this 64-bit 'ncchannels' variable but set an assembled 24 bit ncchannel at once."},
+    {"ncchannels_set_bg_rgb8", (void *)python_ncchannels_set_bg_rgb8, METH_FASTCALL, "Set the r, g, and b ncchannels for the background component of this 64-bit 'ncchannels' variable, and mark it as not using the default color."},
+    {"ncchannels_set_bg_rgb8_clipped", (void *)python_ncchannels_set_bg_rgb8_clipped, METH_FASTCALL, "Set the r, g, and b ncchannels for the background component of this 64-bit 'ncchannels' variable but clips to [0..255]."},
+    {"ncchannels_set_bg_alpha", (void *)python_ncchannels_set_bg_alpha, METH_FASTCALL, "Set the 2-bit alpha component of the background ncchannel."},
+    {"ncchannels_set_bg_palindex", (void *)python_ncchannels_set_bg_palindex, METH_FASTCALL, NULL},
+    {"ncchannels_set_bg_rgb", (void *)python_ncchannels_set_bg_rgb, METH_FASTCALL, "Set the r, g, and b ncchannels for the background component of this 64-bit 'ncchannels' variable but set an assembled 24 bit ncchannel at once."},
+    {"ncchannels_fg_default_p", (PyCFunction)python_ncchannels_fg_default_p, METH_O, "Is the foreground using the \"default foreground color\"?"},
+    {"ncchannels_fg_palindex_p", (PyCFunction)python_ncchannels_fg_palindex_p, METH_O, "Is the foreground using indexed palette color?"},
+    {"ncchannels_bg_default_p", (PyCFunction)python_ncchannels_bg_default_p, METH_O, "Is the background using the \"default background color\"? The \"defaultbackground color\" must generally be used to take advantage of terminal-effected transparency."},
+    {"ncchannels_bg_palindex_p", (PyCFunction)python_ncchannels_bg_palindex_p, METH_O, "Is the background using indexed palette color?"},
+    {"ncchannels_set_fg_default", (PyCFunction)python_ncchannels_set_fg_default, METH_O, "Mark the foreground ncchannel as using its default color."},
+    {"ncchannels_set_bg_default", (PyCFunction)python_ncchannels_set_bg_default, METH_O, "Mark the background ncchannel as using its default color."},
     {NULL, NULL, 0, NULL},
 };
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Array versions of the ncchannel_* and ncchannels_* functions.
+
+Every argument is either an int, which is broadcast, or a one dimensional
+buffer of native integers (array.array, memoryview, numpy arrays...).
+All buffers must have the same length. A ValueError names the first
+index that the scalar function would have rejected.
+
+Channel pairs are returned as NcChannelsArray, channels and components
+as array.array.
+"""
+
+from array import array
+from typing import Tuple, Union
+
+from typing_extensions import Buffer
+
+from .notcurses import NcChannelsArray
+
+_Operand = Union[int, Buffer]
+
+
+def ncchannel_rgb_initializer(
+        r: _Operand, g: _Operand, b: _Operand,
+        /) -> array[int]:
+    """Array version of notcurses.ncchannel_rgb_initializer()."""
+    ...
+
+
+def ncchannels_rgb_initializer(
+        fr: _Operand, fg: _Operand, fb: _Operand,
+        br: _Operand, bg: _Operand, bb: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_rgb_initializer()."""
+    ...
+
+
+def ncchannel_r(channel: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannel_r()."""
+    ...
+
+
+def ncchannel_g(channel: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannel_g()."""
+    ...
+
+
+def ncchannel_b(channel: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannel_b()."""
+    ...
+
+
+def ncchannel_rgb8(
+        channel: _Operand,
+        /) -> Tuple[array[int], array[int], array[int]]:
+    """Array version of notcurses.ncchannel_rgb8()."""
+    ...
+
+
+def ncchannel_set_rgb8(
+        channel: _Operand, r: _Operand, g: _Operand, b: _Operand,
+        /) -> array[int]:
+    """Array version of notcurses.ncchannel_set_rgb8()."""
+    ...
+
+
+def ncchannel_set_rgb8_clipped(
+        channel: _Operand, r: _Operand, g: _Operand, b: _Operand,
+        /) -> array[int]:
+    """Array version of notcurses.ncchannel_set_rgb8_clipped()."""
+    ...
+
+
+def ncchannel_set(channel: _Operand, rgb: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannel_set()."""
+    ...
+
+
+def ncchannel_alpha(channel: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannel_alpha()."""
+    ...
+
+
+def ncchannel_set_alpha(channel: _Operand, alpha: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannel_set_alpha()."""
+    ...
+
+
+def ncchannel_default_p(channel: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannel_default_p()."""
+    ...
+
+
+def ncchannel_set_default(channel: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannel_set_default()."""
+    ...
+
+
+def ncchannels_fchannel(channels: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannels_fchannel()."""
+    ...
+
+
+def ncchannels_bchannel(channels: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannels_bchannel()."""
+    ...
+
+
+def ncchannels_combine(fchan: _Operand, bchan: _Operand, /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_combine()."""
+    ...
+
+
+def ncchannels_fg_rgb(channels: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannels_fg_rgb()."""
+    ...
+
+
+def ncchannels_bg_rgb(channels: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannels_bg_rgb()."""
+    ...
+
+
+def ncchannels_fg_alpha(channels: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannels_fg_alpha()."""
+    ...
+
+
+def ncchannels_bg_alpha(channels: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannels_bg_alpha()."""
+    ...
+
+
+def ncchannels_set_fg_rgb8(
+        channels: _Operand, r: _Operand, g: _Operand, b: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_fg_rgb8()."""
+    ...
+
+
+def ncchannels_set_bg_rgb8(
+        channels: _Operand, r: _Operand, g: _Operand, b: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_bg_rgb8()."""
+    ...
+
+
+def ncchannels_set_fg_rgb8_clipped(
+        channels: _Operand, r: _Operand, g: _Operand, b: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_fg_rgb8_clipped()."""
+    ...
+
+
+def ncchannels_set_bg_rgb8_clipped(
+        channels: _Operand, r: _Operand, g: _Operand, b: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_bg_rgb8_clipped()."""
+    ...
+
+
+def ncchannels_set_fg_rgb(
+        channels: _Operand, rgb: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_fg_rgb()."""
+    ...
+
+
+def ncchannels_set_bg_rgb(
+        channels: _Operand, rgb: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_bg_rgb()."""
+    ...
+
+
+def ncchannels_set_fg_alpha(
+        channels: _Operand, alpha: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_fg_alpha()."""
+    ...
+
+
+def ncchannels_set_bg_alpha(
+        channels: _Operand, alpha: _Operand,
+        /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_bg_alpha()."""
+    ...
+
+
+def ncchannels_fg_default_p(channels: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannels_fg_default_p()."""
+    ...
+
+
+def ncchannels_bg_default_p(channels: _Operand, /) -> array[int]:
+    """Array version of notcurses.ncchannels_bg_default_p()."""
+    ...
+
+
+def ncchannels_set_fg_default(channels: _Operand, /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_fg_default()."""
+    ...
+
+
+def ncchannels_set_bg_default(channels: _Operand, /) -> NcChannelsArray:
+    """Array version of notcurses.ncchannels_set_bg_default()."""
+    ...
+
+
+def ncchannels_ramp(from_channels: int, to_channels: int, count: int,
+                    /) -> NcChannelsArray:
+    """Linear gradient of 'count' channel pairs from 'from_channels' to
+    'to_channels'. Foreground and background RGB are interpolated, the other
+    bits are taken from 'from_channels'."""
+    ...
@@ -0,0 +1,727 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+// Array versions of the ncchannel_* and ncchannels_* functions.
+//
+// Every argument is either an int, which is broadcast, or a one dimensional
+// buffer of native integers. All buffers must have the same length. Results
+// of that length are NcChannelsArray for channel pairs and array.array for
+// channels and components, written in place without an intermediate copy.
+
+#define CHANNELS_ARRAY_MAX_IN 6
+#define CHANNELS_ARRAY_MAX_OUT 3
+
+typedef int (*ChannelsArrayKernel)(const uint64_t *in, uint64_t *out);
+
+typedef struct
+{
+    const char *name;
+    Py_ssize_t in_count;
+    // One typecode per result, "B" for components, "I" for channel and "Q"
+    // for channels, which are returned as NcChannelsArray.
+    const char *out_typecodes;
+    ChannelsArrayKernel kernel;
+} ChannelsArraySpec;
+
+typedef struct
+{
+    Py_buffer view;
+    // NULL for a broadcast int.
+    const char *data;
+    Py_ssize_t len;
+    Py_ssize_t stride;
+    Py_ssize_t itemsize;
+    bool is_signed;
+    uint64_t scalar;
+} ChannelsArrayOperand;
+
+static void
+ChannelsArrayOperand_release(ChannelsArrayOperand *operand)
+{
+    if (NULL != operand->data)
+    {
+        PyBuffer_Release(&operand->view);
+        operand->data = NULL;
+    }
+}
+
+static int
+ChannelsArrayOperand_acquire(ChannelsArrayOperand *operand, PyObject *object, Py_ssize_t index)
+{
+    // Ints and int-like objects such as NcChannels are broadcast.
+    if (PyLong_Check(object) || (PyIndex_Check(object) && !PyObject_CheckBuffer(object)))
+    {
+        unsigned long long scalar = 0;
+        if (pync_as_ull(object, &scalar) < 0)
+        {
+            return -1;
+        }
+        operand->scalar = (uint64_t)scalar;
+        return 0;
+    }
+
+    if (PyObject_GetBuffer(object, &operand->view, PyBUF_STRIDED_RO | PyBUF_FORMAT) < 0)
+    {
+        return -1;
+    }
+    operand->data = operand->view.buf;
+
+    const char *format = NULL == operand->view.format ? "B" : operand->view.format;
+    Py_ssize_t itemsize = operand->view.itemsize;
+
+    if ((1 != itemsize && 2 != itemsize && 4 != itemsize && 8 != itemsize) ||
+        !pync_buffer_integer_format_p(format, itemsize, itemsize))
+    {
+        PyErr_Format(PyExc_TypeError, "argument %zd must be an int or an array of integers, not format '%s'",
+                     index + 1, format);
+        return -1;
+    }
+    if (1 != operand->view.ndim)
+    {
+        PyErr_Format(PyExc_ValueError, "argument %zd must be one dimensional, got %d dimensions",
+                     index + 1, operand->view.ndim);
+        return -1;
+    }
+
+    operand->len = operand->view.shape[0];
+    operand->stride = operand->view.strides[0];
+    operand->itemsize = itemsize;
+    operand->is_signed = 'a' <= format[strlen(format) - 1];
+    return 0;
+}
+
+static inline uint64_t
+ChannelsArrayOperand_load(const ChannelsArrayOperand *operand, Py_ssize_t index)
+{
+    if (NULL == operand->data)
+    {
+        return operand->scalar;
+    }
+
+    const char *item = operand->data + index * operand->stride;
+
+    // Signed values are sign extended, so they wrap the same way a negative
+    // int passed to the scalar functions does.
+    switch (operand->itemsize)
+    {
+    case 1:
+    {
+        uint8_t value;
+        memcpy(&value, item, sizeof(value));
+        return operand->is_signed ? (uint64_t)(int64_t)(int8_t)value : value;
+    }
+    case 2:
+    {
+        uint16_t value;
+        memcpy(&value, item, sizeof(value));
+        return operand->is_signed ? (uint64_t)(int64_t)(int16_t)value : value;
+    }
+    case 4:
+    {
+        uint32_t value;
+        memcpy(&value, item, sizeof(value));
+        return operand->is_signed ? (uint64_t)(int64_t)(int32_t)value : value;
+    }
+    default:
+    {
+        uint64_t value;
+        memcpy(&value, item, sizeof(value));
+        return value;
+    }
+    }
+}
+
+static inline void
+channels_array_store(char *out, Py_ssize_t index, char typecode, uint64_t value)
+{
+    switch (typecode)
+    {
+    case 'B':
+        ((uint8_t *)out)[index] = (uint8_t)value;
+        break;
+    case 'I':
+        ((uint32_t *)out)[index] = (uint32_t)value;
+        break;
+    default:
+        ((uint64_t *)out)[index] = value;
+        break;
+    }
+}
+
+// Called without the GIL held. Returns the failing index, or -1.
+static Py_ssize_t
+channels_array_run(const ChannelsArraySpec *spec, const ChannelsArrayOperand *operands,
+                   Py_ssize_t len, char **outs)
+{
+    uint64_t in[CHANNELS_ARRAY_MAX_IN];
+    uint64_t out[CHANNELS_ARRAY_MAX_OUT];
+
+    for (Py_ssize_t i = 0; i < len; i++)
+    {
+        for (Py_ssize_t j = 0; j < spec->in_count; j++)
+        {
+            in[j] = ChannelsArrayOperand_load(&operands[j], i);
+        }
+        if (spec->kernel(in, out) < 0)
+        {
+            return i;
+        }
+        for (Py_ssize_t j = 0; '\0' != spec->out_typecodes[j]; j++)
+        {
+            channels_array_store(outs[j], i, spec->out_typecodes[j], out[j]);
+        }
+    }
+
+    return -1;
+}
+
+// One item array.array per typecode, repeated to allocate the results so the
+// array module is only imported once.
+static PyObject *channels_array_byte_template = NULL;
+static PyObject *channels_array_channel_template = NULL;
+
+static PyObject *
+channels_array_template(char typecode)
+{
+    PyObject **template = 'B' == typecode ? &channels_array_byte_template : &channels_array_channel_template;
+
+    if (NULL == *template)
+    {
+        PyObject *array_module CLEANUP_PY_OBJ = GNU_PY_CHECK(PyImport_ImportModule("array"));
+        char typecode_str[2] = {typecode, '\0'};
+        *template = GNU_PY_CHECK(PyObject_CallMethod(array_module, "array", "s(i)", typecode_str, 0));
+    }
+    return *template;
+}
+
+// New result of 'len' items, its storage being returned in 'out'. 'view' is
+// filled for array.array results and must be released once they are written.
+static PyObject *
+channels_array_result_new(char typecode, Py_ssize_t len, Py_buffer *view, char **out)
+{
+    if ('Q' == typecode)
+    {
+        uint64_t *data = NULL;
+        PyObject *result = GNU_PY_CHECK(NcChannelsArray_alloc(len, &data));
+        *out = (char *)data;
+        return result;
+    }
+
+    PyObject *result = GNU_PY_CHECK(PySequence_Repeat(GNU_PY_CHECK(channels_array_template(typecode)), len));
+    if (PyObject_GetBuffer(result, view, PyBUF_WRITABLE) < 0)
+    {
+        Py_DECREF(result);
+        return NULL;
+    }
+    *out = view->buf;
+    return result;
+}
+
+static PyObject *
+channels_array_apply(const ChannelsArraySpec *spec, PyObject *const *args, Py_ssize_t nargs)
+{
+    GNU_PY_CHECK_NARGS(spec->name, nargs, spec->in_count, spec->in_count);
+
+    ChannelsArrayOperand operands[CHANNELS_ARRAY_MAX_IN] = {0};
+    Py_ssize_t out_count = (Py_ssize_t)strlen(spec->out_typecodes);
+    PyObject *out_arrays[CHANNELS_ARRAY_MAX_OUT] = {0};
+    Py_buffer out_views[CHANNELS_ARRAY_MAX_OUT] = {0};
+    char *outs[CHANNELS_ARRAY_MAX_OUT] = {0};
+    PyObject *result = NULL;
+    Py_ssize_t len = 1;
+    bool have_array = false;
+    Py_ssize_t failed_index = -1;
+
+    for (Py_ssize_t i = 0; i < nargs; i++)
+    {
+        if (ChannelsArrayOperand_acquire(&operands[i], args[i], i) < 0)
+        {
+            goto cleanup;
+        }
+        if (NULL == operands[i].data)
+        {
+            continue;
+        }
+        if (have_array && operands[i].len != len)
+        {
+            PyErr_Format(PyExc_ValueError, "argument %zd has length %zd, expected %zd",
+                         i + 1, operands[i].len, len);
+            goto cleanup;
+        }
+        len = operands[i].len;
+        have_array = true;
+    }
+
+    for (Py_ssize_t j = 0; j < out_count; j++)
+    {
+        out_arrays[j] = channels_array_result_new(spec->out_typecodes[j], len, &out_views[j], &outs[j]);
+        if (NULL == out_arrays[j])
+        {
+            goto cleanup;
+        }
+    }
+
+    Py_BEGIN_ALLOW_THREADS;
+    failed_index = channels_array_run(spec, operands, len, outs);
+    Py_END_ALLOW_THREADS;
+
+    if (failed_index >= 0)
+    {
+        PyErr_Format(PyExc_ValueError, "%s() failed at index %zd", spec->name, failed_index);
+        goto cleanup;
+    }
+
+    if (1 == out_count)
+    {
+        result = out_arrays[0];
+        Py_INCREF(result);
+        goto cleanup;
+    }
+
+    result = PyTuple_New(out_count);
+    for (Py_ssize_t j = 0; NULL != result && j < out_count; j++)
+    {
+        Py_INCREF(out_arrays[j]);
+        PyTuple_SET_ITEM(result, j, out_arrays[j]);
+    }
+
+cleanup:
+    for (Py_ssize_t j = 0; j < out_count; j++)
+    {
+        PyBuffer_Release(&out_views[j]);
+        Py_XDECREF(out_arrays[j]);
+    }
+    for (Py_ssize_t i = 0; i < nargs; i++)
+    {
+        ChannelsArrayOperand_release(&operands[i]);
+    }
+    return result;
+}
+
+static inline bool
+rgb8_p(uint64_t r, uint64_t g, uint64_t b)
+{
+    return r < 256 && g < 256 && b < 256;
+}
+
+// Clamp to the range ncchannel_set_rgb8_clipped() treats specially before
+// narrowing, so huge values still clip instead of wrapping.
+static inline int
+clip_int(uint64_t value)
+{
+    int64_t signed_value = (int64_t)value;
+
+    if (signed_value < 0)
+    {
+        return -1;
+    }
+    if (signed_value > 256)
+    {
+        return 256;
+    }
+    return (int)signed_value;
+}
+
+#define CHANNELS_ARRAY_FUNCTION(func_name, in_count, out_typecodes)                      \
+    static int func_name##_kernel(const uint64_t *in, uint64_t *out);                    \
+    static const ChannelsArraySpec func_name##_spec = {                                  \
+        #func_name, in_count, out_typecodes, func_name##_kernel};                        \
+    static PyObject *                                                                    \
+    array_##func_name(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs) \
+    {                                                                                    \
+        return channels_array_apply(&func_name##_spec, args, nargs);                    \
+    }                                                                                    \
+    static int func_name##_kernel(const uint64_t *in, uint64_t *out)
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_rgb_initializer, 3, "I")
+{
+    if (!rgb8_p(in[0], in[1], in[2]))
+    {
+        return -1;
+    }
+    out[0] = NCCHANNEL_INITIALIZER(in[0], in[1], in[2]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_rgb_initializer, 6, "Q")
+{
+    if (!rgb8_p(in[0], in[1], in[2]) || !rgb8_p(in[3], in[4], in[5]))
+    {
+        return -1;
+    }
+    out[0] = NCCHANNELS_INITIALIZER(in[0], in[1], in[2], in[3], in[4], in[5]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_r, 1, "B")
+{
+    out[0] = ncchannel_r((uint32_t)in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_g, 1, "B")
+{
+    out[0] = ncchannel_g((uint32_t)in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_b, 1, "B")
+{
+    out[0] = ncchannel_b((uint32_t)in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_rgb8, 1, "BBB")
+{
+    unsigned r, g, b;
+
+    ncchannel_rgb8((uint32_t)in[0], &r, &g, &b);
+    out[0] = r;
+    out[1] = g;
+    out[2] = b;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_set_rgb8, 4, "I")
+{
+    uint32_t channel = (uint32_t)in[0];
+
+    if (!rgb8_p(in[1], in[2], in[3]))
+    {
+        return -1;
+    }
+    ncchannel_set_rgb8(&channel, (unsigned)in[1], (unsigned)in[2], (unsigned)in[3]);
+    out[0] = channel;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_set_rgb8_clipped, 4, "I")
+{
+    uint32_t channel = (uint32_t)in[0];
+
+    ncchannel_set_rgb8_clipped(&channel, clip_int(in[1]), clip_int(in[2]), clip_int(in[3]));
+    out[0] = channel;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_set, 2, "I")
+{
+    uint32_t channel = (uint32_t)in[0];
+
+    if (in[1] > 0xffffffu || ncchannel_set(&channel, (uint32_t)in[1]) < 0)
+    {
+        return -1;
+    }
+    out[0] = channel;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_alpha, 1, "I")
+{
+    out[0] = ncchannel_alpha((uint32_t)in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_set_alpha, 2, "I")
+{
+    uint32_t channel = (uint32_t)in[0];
+
+    if (in[1] > UINT_MAX || ncchannel_set_alpha(&channel, (unsigned)in[1]) < 0)
+    {
+        return -1;
+    }
+    out[0] = channel;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_default_p, 1, "B")
+{
+    out[0] = ncchannel_default_p((uint32_t)in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannel_set_default, 1, "I")
+{
+    uint32_t channel = (uint32_t)in[0];
+
+    ncchannel_set_default(&channel);
+    out[0] = channel;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_fchannel, 1, "I")
+{
+    out[0] = ncchannels_fchannel(in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_bchannel, 1, "I")
+{
+    out[0] = ncchannels_bchannel(in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_combine, 2, "Q")
+{
+    out[0] = ncchannels_combine((uint32_t)in[0], (uint32_t)in[1]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_fg_rgb, 1, "I")
+{
+    out[0] = ncchannels_fg_rgb(in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_bg_rgb, 1, "I")
+{
+    out[0] = ncchannels_bg_rgb(in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_fg_alpha, 1, "I")
+{
+    out[0] = ncchannels_fg_alpha(in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_bg_alpha, 1, "I")
+{
+    out[0] = ncchannels_bg_alpha(in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_fg_rgb8, 4, "Q")
+{
+    uint64_t channels = in[0];
+
+    if (!rgb8_p(in[1], in[2], in[3]))
+    {
+        return -1;
+    }
+    ncchannels_set_fg_rgb8(&channels, (unsigned)in[1], (unsigned)in[2], (unsigned)in[3]);
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_bg_rgb8, 4, "Q")
+{
+    uint64_t channels = in[0];
+
+    if (!rgb8_p(in[1], in[2], in[3]))
+    {
+        return -1;
+    }
+    ncchannels_set_bg_rgb8(&channels, (unsigned)in[1], (unsigned)in[2], (unsigned)in[3]);
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_fg_rgb8_clipped, 4, "Q")
+{
+    uint64_t channels = in[0];
+
+    ncchannels_set_fg_rgb8_clipped(&channels, clip_int(in[1]), clip_int(in[2]), clip_int(in[3]));
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_bg_rgb8_clipped, 4, "Q")
+{
+    uint64_t channels = in[0];
+
+    ncchannels_set_bg_rgb8_clipped(&channels, clip_int(in[1]), clip_int(in[2]), clip_int(in[3]));
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_fg_rgb, 2, "Q")
+{
+    uint64_t channels = in[0];
+
+    if (in[1] > 0xffffffu || ncchannels_set_fg_rgb(&channels, (unsigned)in[1]) < 0)
+    {
+        return -1;
+    }
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_bg_rgb, 2, "Q")
+{
+    uint64_t channels = in[0];
+
+    if (in[1] > 0xffffffu || ncchannels_set_bg_rgb(&channels, (unsigned)in[1]) < 0)
+    {
+        return -1;
+    }
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_fg_alpha, 2, "Q")
+{
+    uint64_t channels = in[0];
+
+    if (in[1] > UINT_MAX || ncchannels_set_fg_alpha(&channels, (unsigned)in[1]) < 0)
+    {
+        return -1;
+    }
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_bg_alpha, 2, "Q")
+{
+    uint64_t channels = in[0];
+
+    if (in[1] > UINT_MAX || ncchannels_set_bg_alpha(&channels, (unsigned)in[1]) < 0)
+    {
+        return -1;
+    }
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_fg_default_p, 1, "B")
+{
+    out[0] = ncchannels_fg_default_p(in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_bg_default_p, 1, "B")
+{
+    out[0] = ncchannels_bg_default_p(in[0]);
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_fg_default, 1, "Q")
+{
+    uint64_t channels = in[0];
+
+    ncchannels_set_fg_default(&channels);
+    out[0] = channels;
+    return 0;
+}
+
+CHANNELS_ARRAY_FUNCTION(ncchannels_set_bg_default, 1, "Q")
+{
+    uint64_t channels = in[0];
+
+    ncchannels_set_bg_default(&channels);
+    out[0] = channels;
+    return 0;
+}
+
+static inline uint32_t
+channel_lerp(uint32_t from, uint32_t to, uint64_t step, uint64_t steps)
+{
+    uint32_t rgb = 0;
+
+    for (unsigned shift = 0; shift < 24; shift += 8)
+    {
+        int64_t a = (from >> shift) & 0xff;
+        int64_t b = (to >> shift) & 0xff;
+        int64_t c = a + (b - a) * (int64_t)step / (int64_t)steps;
+        rgb |= (uint32_t)c << shift;
+    }
+
+    return rgb;
+}
+
+static PyObject *
+array_ncchannels_ramp(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
+{
+    GNU_PY_CHECK_NARGS("ncchannels_ramp", nargs, 3, 3);
+    uint64_t from = GNU_PY_ARG_ULL(args[0]);
+    uint64_t to = GNU_PY_ARG_ULL(args[1]);
+    Py_ssize_t count = GNU_PY_ARG_SSIZE(args[2]);
+
+    if (count < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "count must not be negative, got %zd", count);
+        return NULL;
+    }
+
+    uint64_t *out = NULL;
+    PyObject *result = GNU_PY_CHECK(NcChannelsArray_alloc(count, &out));
+    uint64_t steps = count > 1 ? (uint64_t)(count - 1) : 1;
+
+    Py_BEGIN_ALLOW_THREADS;
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        uint64_t channels = from;
+        ncchannels_set_fg_rgb(&channels, channel_lerp(ncchannels_fg_rgb(from), ncchannels_fg_rgb(to), (uint64_t)i, steps));
+        ncchannels_set_bg_rgb(&channels, channel_lerp(ncchannels_bg_rgb(from), ncchannels_bg_rgb(to), (uint64_t)i, steps));
+        out[i] = channels;
+    }
+    Py_END_ALLOW_THREADS;
+
+    return result;
+}
+
+#define CHANNELS_ARRAY_METHOD(func_name, doc) \
+    {#func_name, (void *)array_##func_name, METH_FASTCALL, PyDoc_STR(doc)}
+
+static PyMethodDef ChannelsArrayFunctions[] = {
+    CHANNELS_ARRAY_METHOD(ncchannel_rgb_initializer, "Array version of ncchannel_rgb_initializer(r, g, b). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_rgb_initializer, "Array version of ncchannels_rgb_initializer(fr, fg, fb, br, bg, bb). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannel_r, "Array version of ncchannel_r(channel). Returns array('B')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_g, "Array version of ncchannel_g(channel). Returns array('B')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_b, "Array version of ncchannel_b(channel). Returns array('B')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_rgb8, "Array version of ncchannel_rgb8(channel). Returns a tuple of three array('B')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_set_rgb8, "Array version of ncchannel_set_rgb8(channel, r, g, b). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_set_rgb8_clipped, "Array version of ncchannel_set_rgb8_clipped(channel, r, g, b). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_set, "Array version of ncchannel_set(channel, rgb). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_alpha, "Array version of ncchannel_alpha(channel). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_set_alpha, "Array version of ncchannel_set_alpha(channel, alpha). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_default_p, "Array version of ncchannel_default_p(channel). Returns array('B')."),
+    CHANNELS_ARRAY_METHOD(ncchannel_set_default, "Array version of ncchannel_set_default(channel). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_fchannel, "Array version of ncchannels_fchannel(channels). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_bchannel, "Array version of ncchannels_bchannel(channels). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_combine, "Array version of ncchannels_combine(fchan, bchan). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_fg_rgb, "Array version of ncchannels_fg_rgb(channels). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_bg_rgb, "Array version of ncchannels_bg_rgb(channels). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_fg_alpha, "Array version of ncchannels_fg_alpha(channels). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_bg_alpha, "Array version of ncchannels_bg_alpha(channels). Returns array('I')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_fg_rgb8, "Array version of ncchannels_set_fg_rgb8(channels, r, g, b). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_bg_rgb8, "Array version of ncchannels_set_bg_rgb8(channels, r, g, b). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_fg_rgb8_clipped, "Array version of ncchannels_set_fg_rgb8_clipped(channels, r, g, b). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_bg_rgb8_clipped, "Array version of ncchannels_set_bg_rgb8_clipped(channels, r, g, b). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_fg_rgb, "Array version of ncchannels_set_fg_rgb(channels, rgb). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_bg_rgb, "Array version of ncchannels_set_bg_rgb(channels, rgb). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_fg_alpha, "Array version of ncchannels_set_fg_alpha(channels, alpha). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_bg_alpha, "Array version of ncchannels_set_bg_alpha(channels, alpha). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_fg_default_p, "Array version of ncchannels_fg_default_p(channels). Returns array('B')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_bg_default_p, "Array version of ncchannels_bg_default_p(channels). Returns array('B')."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_fg_default, "Array version of ncchannels_set_fg_default(channels). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_set_bg_default, "Array version of ncchannels_set_bg_default(channels). Returns NcChannelsArray."),
+    CHANNELS_ARRAY_METHOD(ncchannels_ramp, "Linear gradient of 'count' channel pairs from 'from_channels' to 'to_channels'. Foreground and background RGB are interpolated, the other bits are taken from 'from_channels'. Returns NcChannelsArray."),
+    {NULL, NULL, 0, NULL},
+};
+
+struct PyModuleDef ChannelsArrayModule = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "notcurses.channels",
+    .m_doc = "Array versions of the ncchannel_* and ncchannels_* functions. "
+             "Every argument is either an int, which is broadcast, or a one dimensional "
+             "buffer of native integers; all buffers must have the same length.",
+    .m_size = -1,
+    .m_methods = ChannelsArrayFunctions,
+};
@@ -0,0 +1,689 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+// NcChannels keeps a channel pair inline and edits it in place, instead of
+// rebinding the int returned by the ncchannels_* functions. It converts to
+// int through __index__, so it is accepted wherever channels are.
+//
+// NcChannelsArray keeps many pairs contiguously as native uint64 values and
+// exports them through the buffer protocol, for NcPlane.blit_cells() and the
+// functions of notcurses.channels.
+
+typedef struct
+{
+    PyObject_HEAD;
+    uint64_t channels;
+} NcChannelsObject;
+
+typedef struct
+{
+    PyObject_HEAD;
+    uint64_t *data;
+    Py_ssize_t len;
+} NcChannelsArrayObject;
+
+typedef enum
+{
+    CHANNELS_FIELD_CHANNELS,
+    CHANNELS_FIELD_FCHANNEL,
+    CHANNELS_FIELD_BCHANNEL,
+    CHANNELS_FIELD_FG_RGB,
+    CHANNELS_FIELD_BG_RGB,
+    CHANNELS_FIELD_FG_ALPHA,
+    CHANNELS_FIELD_BG_ALPHA,
+    CHANNELS_FIELD_FG_PALINDEX,
+    CHANNELS_FIELD_BG_PALINDEX,
+    CHANNELS_FIELD_FG_DEFAULT,
+    CHANNELS_FIELD_BG_DEFAULT,
+} ChannelsField;
+
+static const char *const channels_field_names[] = {
+    [CHANNELS_FIELD_CHANNELS] = "channels",
+    [CHANNELS_FIELD_FCHANNEL] = "fchannel",
+    [CHANNELS_FIELD_BCHANNEL] = "bchannel",
+    [CHANNELS_FIELD_FG_RGB] = "fg_rgb",
+    [CHANNELS_FIELD_BG_RGB] = "bg_rgb",
+    [CHANNELS_FIELD_FG_ALPHA] = "fg_alpha",
+    [CHANNELS_FIELD_BG_ALPHA] = "bg_alpha",
+    [CHANNELS_FIELD_FG_PALINDEX] = "fg_palindex",
+    [CHANNELS_FIELD_BG_PALINDEX] = "bg_palindex",
+    [CHANNELS_FIELD_FG_DEFAULT] = "fg_default",
+    [CHANNELS_FIELD_BG_DEFAULT] = "bg_default",
+};
+
+// Set 'field' of 'channels' to 'value'. Returns -1 if the value is invalid
+// for the field, leaving 'channels' unchanged. Does not touch Python objects.
+static inline int
+channels_set_field(uint64_t *channels, ChannelsField field, uint64_t value)
+{
+    switch (field)
+    {
+    case CHANNELS_FIELD_CHANNELS:
+        *channels = value;
+        return 0;
+    case CHANNELS_FIELD_FCHANNEL:
+        if (value > UINT32_MAX)
+        {
+            return -1;
+        }
+        ncchannels_set_fchannel(channels, (uint32_t)value);
+        return 0;
+    case CHANNELS_FIELD_BCHANNEL:
+        if (value > UINT32_MAX)
+        {
+            return -1;
+        }
+        ncchannels_set_bchannel(channels, (uint32_t)value);
+        return 0;
+    case CHANNELS_FIELD_FG_RGB:
+        return value > 0xffffffu ? -1 : ncchannels_set_fg_rgb(channels, (unsigned)value);
+    case CHANNELS_FIELD_BG_RGB:
+        return value > 0xffffffu ? -1 : ncchannels_set_bg_rgb(channels, (unsigned)value);
+    case CHANNELS_FIELD_FG_ALPHA:
+        return value > NC_BG_ALPHA_MASK ? -1 : ncchannels_set_fg_alpha(channels, (unsigned)value);
+    case CHANNELS_FIELD_BG_ALPHA:
+        return value > NC_BG_ALPHA_MASK ? -1 : ncchannels_set_bg_alpha(channels, (unsigned)value);
+    case CHANNELS_FIELD_FG_PALINDEX:
+        return value >= NCPALETTESIZE ? -1 : ncchannels_set_fg_palindex(channels, (unsigned)value);
+    case CHANNELS_FIELD_BG_PALINDEX:
+        return value >= NCPALETTESIZE ? -1 : ncchannels_set_bg_palindex(channels, (unsigned)value);
+    case CHANNELS_FIELD_FG_DEFAULT:
+        if (value)
+        {
+            ncchannels_set_fg_default(channels);
+            return 0;
+        }
+        return ncchannels_set_fg_rgb(channels, ncchannels_fg_rgb(*channels));
+    case CHANNELS_FIELD_BG_DEFAULT:
+        if (value)
+        {
+            ncchannels_set_bg_default(channels);
+            return 0;
+        }
+        return ncchannels_set_bg_rgb(channels, ncchannels_bg_rgb(*channels));
+    default:
+        return -1;
+    }
+}
+
+static int
+channels_value_parse(PyObject *object, ChannelsField field, uint64_t *value)
+{
+    if (NULL == object)
+    {
+        PyErr_Format(PyExc_TypeError, "Can't delete %s", channels_field_names[field]);
+        return -1;
+    }
+
+    if (CHANNELS_FIELD_FG_DEFAULT == field || CHANNELS_FIELD_BG_DEFAULT == field)
+    {
+        int is_default = 0;
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_bool(object, &is_default));
+        *value = (uint64_t)is_default;
+        return 0;
+    }
+
+    unsigned long long ull_value = 0;
+    GNU_PY_CHECK_INT_RET_NEG1(pync_as_ull(object, &ull_value));
+    *value = (uint64_t)ull_value;
+
+    // Validate once on a scratch pair, so bulk updates can't fail midway.
+    uint64_t scratch = 0;
+    if (channels_set_field(&scratch, field, *value) < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "Invalid %s 0x%llx", channels_field_names[field], ull_value);
+        return -1;
+    }
+    return 0;
+}
+
+// NcChannels
+
+static PyObject *
+NcChannels_new(PyTypeObject *subtype, PyObject *args, PyObject *kwds)
+{
+    PyObject *channels_arg = NULL;
+
+    char *keywords[] = {"channels", NULL};
+
+    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "|O", keywords, &channels_arg));
+
+    unsigned long long channels = 0;
+    if (NULL != channels_arg)
+    {
+        channels = GNU_PY_ARG_ULL(channels_arg);
+    }
+
+    NcChannelsObject *self = (NcChannelsObject *)subtype->tp_alloc(subtype, 0);
+    if (NULL == self)
+    {
+        return NULL;
+    }
+    self->channels = (uint64_t)channels;
+
+    return (PyObject *)self;
+}
+
+static PyObject *
+NcChannels_get_field(NcChannelsObject *self, void *closure)
+{
+    uint64_t const channels = self->channels;
+
+    switch ((ChannelsField)(intptr_t)closure)
+    {
+    case CHANNELS_FIELD_CHANNELS:
+        return PyLong_FromUnsignedLongLong(channels);
+    case CHANNELS_FIELD_FCHANNEL:
+        return PyLong_FromUnsignedLong(ncchannels_fchannel(channels));
+    case CHANNELS_FIELD_BCHANNEL:
+        return PyLong_FromUnsignedLong(ncchannels_bchannel(channels));
+    case CHANNELS_FIELD_FG_RGB:
+        return PyLong_FromUnsignedLong(ncchannels_fg_rgb(channels));
+    case CHANNELS_FIELD_BG_RGB:
+        return PyLong_FromUnsignedLong(ncchannels_bg_rgb(channels));
+    case CHANNELS_FIELD_FG_ALPHA:
+        return PyLong_FromUnsignedLong(ncchannels_fg_alpha(channels));
+    case CHANNELS_FIELD_BG_ALPHA:
+        return PyLong_FromUnsignedLong(ncchannels_bg_alpha(channels));
+    case CHANNELS_FIELD_FG_PALINDEX:
+        if (!ncchannels_fg_palindex_p(channels))
+        {
+            Py_RETURN_NONE;
+        }
+        return PyLong_FromUnsignedLong(ncchannels_fg_palindex(channels));
+    case CHANNELS_FIELD_BG_PALINDEX:
+        if (!ncchannels_bg_palindex_p(channels))
+        {
+            Py_RETURN_NONE;
+        }
+        return PyLong_FromUnsignedLong(ncchannels_bg_palindex(channels));
+    case CHANNELS_FIELD_FG_DEFAULT:
+        return PyBool_FromLong((long)ncchannels_fg_default_p(channels));
+    case CHANNELS_FIELD_BG_DEFAULT:
+        return PyBool_FromLong((long)ncchannels_bg_default_p(channels));
+    default:
+        PyErr_SetString(PyExc_SystemError, "Unknown NcChannels field");
+        return NULL;
+    }
+}
+
+static int
+NcChannels_set_field(NcChannelsObject *self, PyObject *value_arg, void *closure)
+{
+    ChannelsField const field = (ChannelsField)(intptr_t)closure;
+    uint64_t value = 0;
+    GNU_PY_CHECK_INT_RET_NEG1(channels_value_parse(value_arg, field, &value));
+    channels_set_field(&self->channels, field, value);
+    return 0;
+}
+
+static PyObject *
+NcChannels_rgb8_set(NcChannelsObject *self, PyObject *const *args, Py_ssize_t nargs, bool foreground)
+{
+    GNU_PY_CHECK_NARGS(foreground ? "set_fg_rgb8" : "set_bg_rgb8", nargs, 3, 3);
+    unsigned const r = GNU_PY_ARG_UINT(args[0]);
+    unsigned const g = GNU_PY_ARG_UINT(args[1]);
+    unsigned const b = GNU_PY_ARG_UINT(args[2]);
+
+    int const ret = foreground ? ncchannels_set_fg_rgb8(&self->channels, r, g, b)
+                               : ncchannels_set_bg_rgb8(&self->channels, r, g, b);
+    if (ret < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "Invalid RGB %u, %u, %u", r, g, b);
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcChannels_set_fg_rgb8(NcChannelsObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    return NcChannels_rgb8_set(self, args, nargs, true);
+}
+
+static PyObject *
+NcChannels_set_bg_rgb8(NcChannelsObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    return NcChannels_rgb8_set(self, args, nargs, false);
+}
+
+static PyObject *
+NcChannels_fg_rgb8(NcChannelsObject *self, PyObject *Py_UNUSED(args))
+{
+    unsigned r = 0, g = 0, b = 0;
+    ncchannels_fg_rgb8(self->channels, &r, &g, &b);
+    return Py_BuildValue("III", r, g, b);
+}
+
+static PyObject *
+NcChannels_bg_rgb8(NcChannelsObject *self, PyObject *Py_UNUSED(args))
+{
+    unsigned r = 0, g = 0, b = 0;
+    ncchannels_bg_rgb8(self->channels, &r, &g, &b);
+    return Py_BuildValue("III", r, g, b);
+}
+
+static PyObject *
+NcChannels_reverse(NcChannelsObject *self, PyObject *Py_UNUSED(args))
+{
+    self->channels = ncchannels_reverse(self->channels);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcChannels_copy(NcChannelsObject *self, PyObject *Py_UNUSED(args))
+{
+    NcChannelsObject *copy = PyObject_New(NcChannelsObject, &NcChannels_Type);
+    if (NULL == copy)
+    {
+        return NULL;
+    }
+    copy->channels = self->channels;
+    return (PyObject *)copy;
+}
+
+static PyObject *
+NcChannels_index(NcChannelsObject *self)
+{
+    return PyLong_FromUnsignedLongLong(self->channels);
+}
+
+static PyObject *
+NcChannels_repr(NcChannelsObject *self)
+{
+    char hex[19];
+    snprintf(hex, sizeof(hex), "0x%016llx", (unsigned long long)self->channels);
+    return PyUnicode_FromFormat("notcurses.NcChannels(%s)", hex);
+}
+
+static PyObject *
+NcChannels_richcompare(NcChannelsObject *self, PyObject *other, int op)
+{
+    uint64_t other_channels = 0;
+
+    if (PyObject_TypeCheck(other, &NcChannels_Type))
+    {
+        other_channels = ((NcChannelsObject *)other)->channels;
+    }
+    else if (PyLong_Check(other))
+    {
+        unsigned long long value = PyLong_AsUnsignedLongLong(other);
+        if (PyErr_Occurred())
+        {
+            // Negative or too large, can't be equal.
+            PyErr_Clear();
+            return PyBool_FromLong((long)(op == Py_NE));
+        }
+        other_channels = (uint64_t)value;
+    }
+    else
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    if (op != Py_EQ && op != Py_NE)
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    return PyBool_FromLong((long)((self->channels == other_channels) == (op == Py_EQ)));
+}
+
+static PyMethodDef NcChannels_methods[] = {
+    {"set_fg_rgb8", (void *)NcChannels_set_fg_rgb8, METH_FASTCALL, PyDoc_STR("Set the foreground to the 8-bit components 'r', 'g', 'b', marking it not default.")},
+    {"set_bg_rgb8", (void *)NcChannels_set_bg_rgb8, METH_FASTCALL, PyDoc_STR("Set the background to the 8-bit components 'r', 'g', 'b', marking it not default.")},
+    {"fg_rgb8", (PyCFunction)NcChannels_fg_rgb8, METH_NOARGS, PyDoc_STR("Foreground as a tuple (r, g, b).")},
+    {"bg_rgb8", (PyCFunction)NcChannels_bg_rgb8, METH_NOARGS, PyDoc_STR("Background as a tuple (r, g, b).")},
+    {"reverse", (PyCFunction)NcChannels_reverse, METH_NOARGS, PyDoc_STR("Swap the foreground and background colours in place.")},
+    {"copy", (PyCFunction)NcChannels_copy, METH_NOARGS, PyDoc_STR("Return a new NcChannels with the same value.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcChannels_getset[] = {
+    {"channels", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("The 64-bit channel pair."), (void *)CHANNELS_FIELD_CHANNELS},
+    {"fchannel", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("The 32-bit foreground channel."), (void *)CHANNELS_FIELD_FCHANNEL},
+    {"bchannel", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("The 32-bit background channel."), (void *)CHANNELS_FIELD_BCHANNEL},
+    {"fg_rgb", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("Foreground 24-bit RGB. Setting it marks the foreground not default."), (void *)CHANNELS_FIELD_FG_RGB},
+    {"bg_rgb", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("Background 24-bit RGB. Setting it marks the background not default."), (void *)CHANNELS_FIELD_BG_RGB},
+    {"fg_alpha", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("Foreground NCALPHA_* value."), (void *)CHANNELS_FIELD_FG_ALPHA},
+    {"bg_alpha", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("Background NCALPHA_* value, NCALPHA_HIGHCONTRAST is invalid."), (void *)CHANNELS_FIELD_BG_ALPHA},
+    {"fg_palindex", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("Foreground palette index, None if the foreground is not indexed."), (void *)CHANNELS_FIELD_FG_PALINDEX},
+    {"bg_palindex", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("Background palette index, None if the background is not indexed."), (void *)CHANNELS_FIELD_BG_PALINDEX},
+    {"fg_default", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("Whether the terminal's default foreground is used."), (void *)CHANNELS_FIELD_FG_DEFAULT},
+    {"bg_default", (getter)NcChannels_get_field, (setter)NcChannels_set_field, PyDoc_STR("Whether the terminal's default background is used."), (void *)CHANNELS_FIELD_BG_DEFAULT},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+static PyNumberMethods NcChannels_as_number = {
+    .nb_index = (unaryfunc)NcChannels_index,
+    .nb_int = (unaryfunc)NcChannels_index,
+};
+
+PyTypeObject NcChannels_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcChannels",
+    .tp_doc = "Mutable foreground and background channel pair, usable wherever channels are expected as an int.",
+    .tp_basicsize = sizeof(NcChannelsObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcChannels_new,
+    .tp_repr = (reprfunc)NcChannels_repr,
+    .tp_richcompare = (richcmpfunc)NcChannels_richcompare,
+    .tp_hash = PyObject_HashNotImplemented,
+    .tp_methods = NcChannels_methods,
+    .tp_getset = NcChannels_getset,
+    .tp_as_number = &NcChannels_as_number,
+};
+
+// NcChannelsArray
+
+static int
+channels_array_fill_from(NcChannelsArrayObject *self, PyObject *source)
+{
+    // Native 64-bit integer buffers are copied without boxing.
+    if (PyObject_CheckBuffer(source))
+    {
+        Py_buffer view __attribute__((cleanup(PyBuffer_Release))) = {0};
+        GNU_PY_CHECK_INT_RET_NEG1(PyObject_GetBuffer(source, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT));
+        if (1 != view.ndim || !pync_buffer_integer_format_p(view.format, view.itemsize, sizeof(uint64_t)))
+        {
+            PyErr_Format(PyExc_TypeError, "buffer must be a one dimensional array of 8-byte integers, not format '%s'",
+                         NULL == view.format ? "B" : view.format);
+            return -1;
+        }
+
+        self->len = view.shape[0];
+        self->data = PyMem_Calloc((size_t)self->len + 1, sizeof(uint64_t));
+        if (NULL == self->data)
+        {
+            PyErr_NoMemory();
+            return -1;
+        }
+        memcpy(self->data, view.buf, (size_t)view.len);
+        return 0;
+    }
+
+    PyObject *items CLEANUP_PY_OBJ = GNU_PY_CHECK_RET_NEG1(PySequence_Fast(source, "NcChannelsArray() argument must be a length, a buffer or an iterable"));
+    self->len = PySequence_Fast_GET_SIZE(items);
+    self->data = PyMem_Calloc((size_t)self->len + 1, sizeof(uint64_t));
+    if (NULL == self->data)
+    {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    PyObject **item_array = PySequence_Fast_ITEMS(items);
+    for (Py_ssize_t i = 0; i < self->len; i++)
+    {
+        unsigned long long channels = 0;
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_ull(item_array[i], &channels));
+        self->data[i] = (uint64_t)channels;
+    }
+    return 0;
+}
+
+static PyObject *
+NcChannelsArray_new(PyTypeObject *subtype, PyObject *args, PyObject *kwds)
+{
+    PyObject *init = NULL;
+    PyObject *fill_arg = NULL;
+
+    char *keywords[] = {"init", "fill", NULL};
+
+    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "|OO", keywords, &init, &fill_arg));
+
+    unsigned long long fill = 0;
+    if (NULL != fill_arg)
+    {
+        fill = GNU_PY_ARG_ULL(fill_arg);
+    }
+
+    PyObject *self_obj CLEANUP_PY_OBJ = GNU_PY_CHECK(subtype->tp_alloc(subtype, 0));
+    NcChannelsArrayObject *self = (NcChannelsArrayObject *)self_obj;
+
+    if (NULL == init || PyLong_Check(init))
+    {
+        Py_ssize_t len = 0;
+        if (NULL != init)
+        {
+            len = GNU_PY_ARG_SSIZE(init);
+        }
+        if (len < 0)
+        {
+            PyErr_SetString(PyExc_ValueError, "NcChannelsArray length must not be negative");
+            return NULL;
+        }
+
+        self->len = len;
+        // One spare item keeps the pointer valid for empty arrays.
+        self->data = PyMem_Malloc(((size_t)len + 1) * sizeof(uint64_t));
+        if (NULL == self->data)
+        {
+            return PyErr_NoMemory();
+        }
+        for (Py_ssize_t i = 0; i < len; i++)
+        {
+            self->data[i] = (uint64_t)fill;
+        }
+    }
+    else
+    {
+        GNU_PY_CHECK_INT(channels_array_fill_from(self, init));
+    }
+
+    Py_INCREF(self_obj);
+    return self_obj;
+}
+
+PyObject *
+NcChannelsArray_alloc(Py_ssize_t len, uint64_t **data)
+{
+    PyObject *self_obj CLEANUP_PY_OBJ = GNU_PY_CHECK(NcChannelsArray_Type.tp_alloc(&NcChannelsArray_Type, 0));
+    NcChannelsArrayObject *self = (NcChannelsArrayObject *)self_obj;
+
+    self->len = len;
+    self->data = PyMem_Malloc(((size_t)len + 1) * sizeof(uint64_t));
+    if (NULL == self->data)
+    {
+        return PyErr_NoMemory();
+    }
+    *data = self->data;
+
+    Py_INCREF(self_obj);
+    return self_obj;
+}
+
+static void
+NcChannelsArray_dealloc(NcChannelsArrayObject *self)
+{
+    PyMem_Free(self->data);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static Py_ssize_t
+NcChannelsArray_length(NcChannelsArrayObject *self)
+{
+    return self->len;
+}
+
+static int
+channels_array_index_check(NcChannelsArrayObject *self, Py_ssize_t index)
+{
+    if (index < 0 || index >= self->len)
+    {
+        PyErr_SetString(PyExc_IndexError, "NcChannelsArray index out of range");
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+NcChannelsArray_item(NcChannelsArrayObject *self, Py_ssize_t index)
+{
+    GNU_PY_CHECK_INT(channels_array_index_check(self, index));
+    return PyLong_FromUnsignedLongLong(self->data[index]);
+}
+
+static int
+NcChannelsArray_ass_item(NcChannelsArrayObject *self, Py_ssize_t index, PyObject *value)
+{
+    if (NULL == value)
+    {
+        PyErr_SetString(PyExc_TypeError, "NcChannelsArray items can't be deleted");
+        return -1;
+    }
+    GNU_PY_CHECK_INT_RET_NEG1(channels_array_index_check(self, index));
+
+    unsigned long long channels = 0;
+    GNU_PY_CHECK_INT_RET_NEG1(pync_as_ull(value, &channels));
+    self->data[index] = (uint64_t)channels;
+    return 0;
+}
+
+static Py_ssize_t channels_array_strides[1] = {sizeof(uint64_t)};
+
+static int
+NcChannelsArray_getbuffer(NcChannelsArrayObject *self, Py_buffer *view, int flags)
+{
+    if (PyBuffer_FillInfo(view, (PyObject *)self, self->data, self->len * (Py_ssize_t)sizeof(uint64_t), 0, flags) < 0)
+    {
+        return -1;
+    }
+
+    view->itemsize = sizeof(uint64_t);
+    if (flags & PyBUF_FORMAT)
+    {
+        view->format = "Q";
+    }
+    if (PyBUF_ND == (flags & PyBUF_ND))
+    {
+        view->shape = &self->len;
+    }
+    if (PyBUF_STRIDES == (flags & PyBUF_STRIDES))
+    {
+        view->strides = channels_array_strides;
+    }
+    return 0;
+}
+
+// Applies 'field' = value to the items in [start, stop), arguments being
+// (value, start=0, stop=None), or (start=0, stop=None) for the default flags.
+static PyObject *
+NcChannelsArray_update(NcChannelsArrayObject *self, const char *name, ChannelsField field,
+                       PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    bool const has_value = CHANNELS_FIELD_FG_DEFAULT != field && CHANNELS_FIELD_BG_DEFAULT != field;
+    char *value_keywords[] = {"value", "start", "stop", NULL};
+    char **keywords = has_value ? value_keywords : value_keywords + 1;
+    PyObject *parsed[3] = {NULL, NULL, NULL};
+    PyObject **range = has_value ? parsed + 1 : parsed;
+    GNU_PY_CHECK_INT(pync_parse_fastcall(name, args, nargs, kwnames, keywords, has_value ? 1 : 0, parsed));
+
+    uint64_t value = 1;
+    if (has_value)
+    {
+        GNU_PY_CHECK_INT(channels_value_parse(parsed[0], field, &value));
+    }
+
+    Py_ssize_t start = 0, stop = self->len;
+    if (NULL != range[0])
+    {
+        start = GNU_PY_ARG_SSIZE(range[0]);
+    }
+    if (NULL != range[1] && Py_None != range[1])
+    {
+        stop = GNU_PY_ARG_SSIZE(range[1]);
+    }
+    PySlice_AdjustIndices(self->len, &start, &stop, 1);
+
+    for (Py_ssize_t i = start; i < stop; i++)
+    {
+        channels_set_field(&self->data[i], field, value);
+    }
+
+    Py_RETURN_NONE;
+}
+
+#define CHANNELS_ARRAY_UPDATE(method, field)                                                                      \
+    static PyObject *                                                                                             \
+        NcChannelsArray_##method(NcChannelsArrayObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) \
+    {                                                                                                             \
+        return NcChannelsArray_update(self, #method, field, args, nargs, kwnames);                                         \
+    }
+
+CHANNELS_ARRAY_UPDATE(fill, CHANNELS_FIELD_CHANNELS)
+CHANNELS_ARRAY_UPDATE(set_fg_rgb, CHANNELS_FIELD_FG_RGB)
+CHANNELS_ARRAY_UPDATE(set_bg_rgb, CHANNELS_FIELD_BG_RGB)
+CHANNELS_ARRAY_UPDATE(set_fg_alpha, CHANNELS_FIELD_FG_ALPHA)
+CHANNELS_ARRAY_UPDATE(set_bg_alpha, CHANNELS_FIELD_BG_ALPHA)
+CHANNELS_ARRAY_UPDATE(set_fg_palindex, CHANNELS_FIELD_FG_PALINDEX)
+CHANNELS_ARRAY_UPDATE(set_bg_palindex, CHANNELS_FIELD_BG_PALINDEX)
+CHANNELS_ARRAY_UPDATE(set_fg_default, CHANNELS_FIELD_FG_DEFAULT)
+CHANNELS_ARRAY_UPDATE(set_bg_default, CHANNELS_FIELD_BG_DEFAULT)
+
+static PyObject *
+NcChannelsArray_get_nbytes(NcChannelsArrayObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromSsize_t(self->len * (Py_ssize_t)sizeof(uint64_t));
+}
+
+static PyMethodDef NcChannelsArray_methods[] = {
+    {"fill", (void *)NcChannelsArray_fill, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the items in [start, stop) to the channel pair 'value'.")},
+    {"set_fg_rgb", (void *)NcChannelsArray_set_fg_rgb, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the foreground RGB of the items in [start, stop).")},
+    {"set_bg_rgb", (void *)NcChannelsArray_set_bg_rgb, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the background RGB of the items in [start, stop).")},
+    {"set_fg_alpha", (void *)NcChannelsArray_set_fg_alpha, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the foreground alpha of the items in [start, stop).")},
+    {"set_bg_alpha", (void *)NcChannelsArray_set_bg_alpha, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the background alpha of the items in [start, stop).")},
+    {"set_fg_palindex", (void *)NcChannelsArray_set_fg_palindex, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the foreground palette index of the items in [start, stop).")},
+    {"set_bg_palindex", (void *)NcChannelsArray_set_bg_palindex, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the background palette index of the items in [start, stop).")},
+    {"set_fg_default", (void *)NcChannelsArray_set_fg_default, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Use the default foreground for the items in [start, stop).")},
+    {"set_bg_default", (void *)NcChannelsArray_set_bg_default, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Use the default background for the items in [start, stop).")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcChannelsArray_getset[] = {
+    {"nbytes", (getter)NcChannelsArray_get_nbytes, NULL, PyDoc_STR("Size of the items in bytes."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+static PySequenceMethods NcChannelsArray_as_sequence = {
+    .sq_length = (lenfunc)NcChannelsArray_length,
+    .sq_item = (ssizeargfunc)NcChannelsArray_item,
+    .sq_ass_item = (ssizeobjargproc)NcChannelsArray_ass_item,
+};
+
+static PyBufferProcs NcChannelsArray_as_buffer = {
+    .bf_getbuffer = (getbufferproc)NcChannelsArray_getbuffer,
+};
+
+PyTypeObject NcChannelsArray_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcChannelsArray",
+    .tp_doc = "Fixed size array of channel pairs stored as native uint64 values. Supports the buffer protocol with format 'Q', so it can be passed to NcPlane.blit_cells() and the notcurses.channels functions without converting items.",
+    .tp_basicsize = sizeof(NcChannelsArrayObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcChannelsArray_new,
+    .tp_dealloc = (destructor)NcChannelsArray_dealloc,
+    .tp_methods = NcChannelsArray_methods,
+    .tp_getset = NcChannelsArray_getset,
+    .tp_as_sequence = &NcChannelsArray_as_sequence,
+    .tp_as_buffer = &NcChannelsArray_as_buffer,
+};
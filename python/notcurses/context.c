@@ -17,6 +17,9 @@ limitations under the License.
 
 #include "notcurses-python.h"
 
+#include <langinfo.h>
+#include <locale.h>
+
 static PyObject *uncaught_exception_unicode = NULL;
 
 static int
@@ -52,13 +55,42 @@ PyTypeObject NotcursesOptions_Type = {
     .tp_new = PyType_GenericNew,
 };
 
+static int
+Notcurses_traverse(NotcursesObject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->render.hook);
+    Py_VISIT(self->render.waker);
+    return 0;
+}
+
+static int
+Notcurses_clear(NotcursesObject *self)
+{
+    Py_CLEAR(self->render.hook);
+    Py_CLEAR(self->render.waker);
+    return 0;
+}
+
 static void
 Notcurses_dealloc(NotcursesObject *self)
 {
+    PyObject_GC_UnTrack(self);
+    Notcurses_clear(self);
+    pync_trace_free(&self->trace);
+
     if (NULL != self->notcurses_ptr)
     {
         notcurses_stop(self->notcurses_ptr);
     }
+    if (NULL != self->owned_fp)
+    {
+        fclose(self->owned_fp);
+    }
+    if (NULL != self->saved_ctype)
+    {
+        setlocale(LC_CTYPE, self->saved_ctype);
+        free(self->saved_ctype);
+    }
 
     Py_TYPE(self)->tp_free(self);
 
@@ -72,6 +104,33 @@ Notcurses_dealloc(NotcursesObject *self)
     }
 };
 
+// 'owned_fp' is closed once the context is stopped.
+static PyObject *
+Notcurses_create(PyTypeObject *subtype, const notcurses_options *options, FILE *fp, FILE *owned_fp)
+{
+    struct notcurses *new_notcurses = CHECK_NOTCURSES_PTR(notcurses_init(options, fp));
+
+    NotcursesObject *new_context = (NotcursesObject *)subtype->tp_alloc(subtype, 0);
+    if (NULL == new_context)
+    {
+        notcurses_stop(new_notcurses);
+        return NULL;
+    }
+
+    new_context->notcurses_ptr = new_notcurses;
+    new_context->owned_fp = owned_fp;
+
+    if (PySys_AddAuditHook(Notcurses_uncaught_audit, NULL) < 0)
+    {
+        // Keep 'owned_fp' open, the caller closes it on errors.
+        new_context->owned_fp = NULL;
+        Py_DECREF(new_context);
+        return NULL;
+    }
+
+    return (PyObject *)new_context;
+}
+
 static PyObject *
 Notcurses_new(PyTypeObject *subtype, PyObject *args, PyObject *kwds)
 {
@@ -144,51 +203,433 @@ Notcurses_new(PyTypeObject *subtype, PyObject *args, PyObject *kwds)
         }
     }
 
-    struct notcurses *new_notcurses = CHECK_NOTCURSES_PTR(notcurses_init(&options, main_tty_fp));
+    return Notcurses_create(subtype, &options, main_tty_fp, NULL);
+}
 
-    NotcursesObject *new_context = (NotcursesObject *)GNU_PY_CHECK(subtype->tp_alloc(subtype, 0));
+struct saved_env
+{
+    const char *name;
+    char *value;
+};
 
-    new_context->notcurses_ptr = new_notcurses;
+static void
+saved_env_restore(struct saved_env *env)
+{
+    if (NULL == env->value)
+    {
+        unsetenv(env->name);
+    }
+    else
+    {
+        setenv(env->name, env->value, 1);
+        free(env->value);
+    }
+}
 
-    GNU_PY_CHECK_INT(PySys_AddAuditHook(Notcurses_uncaught_audit, NULL));
+static int
+saved_env_set(struct saved_env *env, const char *name, const char *value)
+{
+    const char *old_value = getenv(name);
 
-    return (PyObject *)new_context;
+    env->name = name;
+    env->value = NULL == old_value ? NULL : strdup(old_value);
+    if ((NULL != old_value && NULL == env->value) || setenv(name, value, 1) < 0)
+    {
+        free(env->value);
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+Notcurses_headless(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    unsigned rows = 24, cols = 80;
+    const char *term_type = "xterm-256color";
+    unsigned long long flags = 0;
+
+    static char *keywords[] = {"rows", "cols", "term_type", "flags", NULL};
+
+    PyObject *parsed[4];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("headless", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        rows = GNU_PY_ARG_UINT(parsed[0]);
+    }
+    if (NULL != parsed[1])
+    {
+        cols = GNU_PY_ARG_UINT(parsed[1]);
+    }
+    if (NULL != parsed[2])
+    {
+        term_type = GNU_PY_ARG_STR(parsed[2]);
+    }
+    if (NULL != parsed[3])
+    {
+        flags = GNU_PY_ARG_ULL(parsed[3]);
+    }
+
+    if (0 == rows || 0 == cols)
+    {
+        PyErr_SetString(PyExc_ValueError, "rows and cols must be positive");
+        return NULL;
+    }
+
+    notcurses_options options = {
+        .termtype = term_type,
+        .flags = (uint64_t)flags | NCOPTION_SUPPRESS_BANNERS | NCOPTION_NO_ALTERNATE_SCREEN |
+                 NCOPTION_NO_WINCH_SIGHANDLER | NCOPTION_NO_QUIT_SIGHANDLERS,
+    };
+
+    // Output goes nowhere, frames are captured with pile_render_to_buffer().
+    FILE *null_fp = fopen("/dev/null", "w");
+    if (NULL == null_fp)
+    {
+        return PyErr_SetFromErrnoWithFilename(PyExc_OSError, "/dev/null");
+    }
+
+    // Force UTF-8 without touching anything else of the locale. Notcurses
+    // decodes EGCs with the C library, so the previous LC_CTYPE is only
+    // restored once the context is stopped.
+    char *saved_ctype = NULL;
+    const char *encoding = nl_langinfo(CODESET);
+    if (NULL == encoding || 0 != strcmp(encoding, "UTF-8"))
+    {
+        saved_ctype = strdup(setlocale(LC_CTYPE, NULL));
+        if (NULL == saved_ctype)
+        {
+            fclose(null_fp);
+            return PyErr_NoMemory();
+        }
+        if (NULL == setlocale(LC_CTYPE, "C.UTF-8"))
+        {
+            free(saved_ctype);
+            fclose(null_fp);
+            PyErr_SetString(PyExc_RuntimeError, "C.UTF-8 locale is not available");
+            return NULL;
+        }
+    }
+    options.flags |= NCOPTION_INHIBIT_SETLOCALE;
+
+    // Without a terminal, Notcurses takes the geometry from LINES/COLUMNS
+    // and truecolor support from COLORTERM.
+    char rows_str[16], cols_str[16];
+    snprintf(rows_str, sizeof(rows_str), "%u", rows);
+    snprintf(cols_str, sizeof(cols_str), "%u", cols);
+
+    const char *const env_names[] = {"LINES", "COLUMNS", "COLORTERM"};
+    const char *const env_values[] = {rows_str, cols_str, "truecolor"};
+    struct saved_env env[3];
+    int env_set = 0;
+    while (env_set < 3 && 0 == saved_env_set(&env[env_set], env_names[env_set], env_values[env_set]))
+    {
+        env_set++;
+    }
+
+    PyObject *new_context = NULL;
+    if (3 == env_set)
+    {
+        new_context = Notcurses_create(cls, &options, null_fp, null_fp);
+    }
+    while (env_set > 0)
+    {
+        saved_env_restore(&env[--env_set]);
+    }
+
+    if (NULL == new_context)
+    {
+        fclose(null_fp);
+        if (NULL != saved_ctype)
+        {
+            setlocale(LC_CTYPE, saved_ctype);
+            free(saved_ctype);
+        }
+        return NULL;
+    }
+    ((NotcursesObject *)new_context)->saved_ctype = saved_ctype;
+    return new_context;
 }
 
 static PyObject *
 Notcurses_drop_planes(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
+    NcPlane_invalidate_planes((PyObject *)self, notcurses_stdplane(self->notcurses_ptr));
+    NcVideoPlayer_drop_planes(self->notcurses_ptr);
     notcurses_drop_planes(self->notcurses_ptr);
     Py_RETURN_NONE;
 }
 
+// A render failed, keep the request it was meant to satisfy pending.
+static void
+render_restore_dirty(struct pync_render_schedule *r, bool was_dirty, double dirty_since)
+{
+    if (!was_dirty)
+    {
+        return;
+    }
+    if (!r->dirty || dirty_since < r->dirty_since)
+    {
+        r->dirty_since = dirty_since;
+    }
+    r->dirty = true;
+}
+
 static PyObject *
 Notcurses_render(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
-    CHECK_NOTCURSES(notcurses_render(self->notcurses_ptr));
+    struct pync_render_schedule *r = &self->render;
+    bool const was_dirty = r->dirty;
+    double const dirty_since = r->dirty_since;
+
+    // An explicit render also satisfies a pending request. Cleared before
+    // the GIL is released, so requests made during the render are kept.
+    r->dirty = false;
+    if (pync_render_pile(self, notcurses_stdplane(self->notcurses_ptr), true, true) < 0)
+    {
+        render_restore_dirty(r, was_dirty, dirty_since);
+        return NULL;
+    }
+    r->last_frame = pync_monotonic();
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Notcurses_render_stats(NotcursesObject *self, PyObject *Py_UNUSED(args))
+{
+    struct pync_render_schedule *r = &self->render;
+
+    return Py_BuildValue("{sKsKsKsKsd}",
+                         "requests", r->requests,
+                         "frames", r->frames,
+                         "coalesced", r->coalesced,
+                         "dropped", r->dropped,
+                         "last_render_time", r->last_render_time);
+}
+
+static PyObject *
+Notcurses_request_render(NotcursesObject *self, PyObject *Py_UNUSED(args))
+{
+    struct pync_render_schedule *r = &self->render;
+
+    r->requests++;
+    if (r->dirty)
+    {
+        r->coalesced++;
+        Py_RETURN_NONE;
+    }
+
+    r->dirty = true;
+    r->dirty_since = pync_monotonic();
+    if (NULL != r->waker)
+    {
+        // The result of the waker is dropped, request_render() returns None.
+        Py_DECREF(GNU_PY_CHECK(PyObject_CallObject(r->waker, NULL)));
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Notcurses_render_due(NotcursesObject *self, PyObject *Py_UNUSED(args))
+{
+    struct pync_render_schedule *r = &self->render;
+
+    if (!r->dirty)
+    {
+        Py_RETURN_NONE;
+    }
+
+    double const wait = r->last_frame + r->min_interval - pync_monotonic();
+    return PyFloat_FromDouble(wait > 0 ? wait : 0.0);
+}
+
+static PyObject *
+Notcurses_render_if_due(NotcursesObject *self, PyObject *Py_UNUSED(args))
+{
+    struct pync_render_schedule *r = &self->render;
+    double const start = pync_monotonic();
+    double const due = fmax(r->dirty_since, r->last_frame + r->min_interval);
+
+    if (!r->dirty || start < due)
+    {
+        Py_RETURN_FALSE;
+    }
+
+    // Cleared before the GIL is released, so requests made during the
+    // render are kept.
+    double const dirty_since = r->dirty_since;
+    r->dirty = false;
+    if (pync_render_pile(self, notcurses_stdplane(self->notcurses_ptr), true, true) < 0)
+    {
+        render_restore_dirty(r, true, dirty_since);
+        return NULL;
+    }
+
+    double const end = pync_monotonic();
+    if (r->min_interval > 0)
+    {
+        // Whole frame slots that passed between the frame becoming due and
+        // the render being started.
+        r->dropped += (unsigned long long)((start - due) / r->min_interval);
+    }
+    r->last_frame = start;
+    r->last_render_time = end - start;
+    r->frames++;
+
+    if (NULL != r->hook)
+    {
+        PyObject *stats CLEANUP_PY_OBJ = GNU_PY_CHECK(Notcurses_render_stats(self, NULL));
+        PyObject *hook_result CLEANUP_PY_OBJ = GNU_PY_CHECK(PyObject_CallFunctionObjArgs(r->hook, stats, NULL));
+    }
+    Py_RETURN_TRUE;
+}
+
+static PyObject *
+Notcurses_trace_start(NotcursesObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    static char *keywords[] = {"capacity", NULL};
+    Py_ssize_t capacity = 16384;
+
+    PyObject *parsed[1];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("trace_start", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        capacity = GNU_PY_ARG_SSIZE(parsed[0]);
+    }
+
+    if (capacity <= 0)
+    {
+        PyErr_Format(PyExc_ValueError, "capacity must be positive");
+        return NULL;
+    }
+
+    GNU_PY_CHECK_INT(pync_trace_start(&self->trace, (size_t)capacity));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Notcurses_trace_stop(NotcursesObject *self, PyObject *Py_UNUSED(args))
+{
+    self->trace.enabled = false;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Notcurses_trace_clear(NotcursesObject *self, PyObject *Py_UNUSED(args))
+{
+    pync_trace_clear(&self->trace);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Notcurses_trace_add(NotcursesObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (3 != nargs)
+    {
+        PyErr_Format(PyExc_TypeError, "trace_add expected 3 arguments, got %zd", nargs);
+        return NULL;
+    }
+    if (!self->trace.enabled)
+    {
+        Py_RETURN_NONE;
+    }
+    if (!PyUnicode_Check(args[0]))
+    {
+        PyErr_Format(PyExc_TypeError, "span name must be str, not %s", Py_TYPE(args[0])->tp_name);
+        return NULL;
+    }
+
+    double const start = PyFloat_AsDouble(args[1]);
+    double const end = PyFloat_AsDouble(args[2]);
+    if (PyErr_Occurred())
+    {
+        return NULL;
+    }
+
+    pync_trace_add(&self->trace, args[0], start, end);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Notcurses_trace_spans(NotcursesObject *self, PyObject *Py_UNUSED(args))
+{
+    return pync_trace_spans(&self->trace);
+}
+
+static PyObject *
+Notcurses_trace_dropped(NotcursesObject *self, PyObject *Py_UNUSED(args))
+{
+    return PyLong_FromUnsignedLongLong(self->trace.dropped);
+}
+
+static PyObject *
+Notcurses_set_max_fps(NotcursesObject *self, PyObject *fps_arg)
+{
+    double const fps = PyFloat_AsDouble(fps_arg);
+    if (PyErr_Occurred())
+    {
+        return NULL;
+    }
+    if (fps < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "negative fps");
+        return NULL;
+    }
+
+    self->render.min_interval = fps > 0 ? 1.0 / fps : 0.0;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Notcurses_set_render_hook(NotcursesObject *self, PyObject *hook)
+{
+    if (hook != Py_None && !PyCallable_Check(hook))
+    {
+        PyErr_SetString(PyExc_TypeError, "hook must be callable or None");
+        return NULL;
+    }
+
+    if (hook == Py_None)
+    {
+        hook = NULL;
+    }
+    Py_XINCREF(hook);
+    Py_XSETREF(self->render.hook, hook);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Notcurses_set_render_waker(NotcursesObject *self, PyObject *waker)
+{
+    if (waker != Py_None && !PyCallable_Check(waker))
+    {
+        PyErr_SetString(PyExc_TypeError, "waker must be callable or None");
+        return NULL;
+    }
+
+    if (waker == Py_None)
+    {
+        waker = NULL;
+    }
+    Py_XINCREF(waker);
+    Py_XSETREF(self->render.waker, waker);
     Py_RETURN_NONE;
 }
 
 static PyObject *
 Notcurses_top(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = CHECK_NOTCURSES_PTR(notcurses_top(self->notcurses_ptr));
+    struct ncplane *new_plane = CHECK_NOTCURSES_PTR(notcurses_top(self->notcurses_ptr));
 
-    Py_INCREF(new_object);
-    return new_object;
+    return NcPlane_wrap(new_plane, (PyObject *)self);
 }
 
 static PyObject *
 Notcurses_bottom(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = CHECK_NOTCURSES_PTR(notcurses_bottom(self->notcurses_ptr));
+    struct ncplane *new_plane = CHECK_NOTCURSES_PTR(notcurses_bottom(self->notcurses_ptr));
 
-    Py_INCREF(new_object);
-    return new_object;
+    return NcPlane_wrap(new_plane, (PyObject *)self);
 }
 
 static PyObject *
@@ -211,19 +652,7 @@ build_NcInput(uint32_t const id, ncinput const *const ni)
         // No input event.
         Py_RETURN_NONE;
     else
-    {
-        PyObject *input = GNU_PY_CHECK(PyStructSequence_New(NcInput_Type));
-        PyObject *utf8 = GNU_PY_CHECK(PyUnicode_FromStringAndSize(ni->utf8, (Py_ssize_t)strlen(ni->utf8)));
-        PyStructSequence_SET_ITEM(input, 0, PyLong_FromLong(ni->id));
-        PyStructSequence_SET_ITEM(input, 1, PyLong_FromLong(ni->y));
-        PyStructSequence_SET_ITEM(input, 2, PyLong_FromLong(ni->x));
-        PyStructSequence_SET_ITEM(input, 3, utf8);
-        PyStructSequence_SET_ITEM(input, 4, PyLong_FromLong(ni->evtype));
-        PyStructSequence_SET_ITEM(input, 5, PyLong_FromLong(ni->modifiers));
-        PyStructSequence_SET_ITEM(input, 6, PyLong_FromLong(ni->ypx));
-        PyStructSequence_SET_ITEM(input, 7, PyLong_FromLong(ni->xpx));
-        return input;
-    }
+        return NcInput_from_ncinput(ni);
 }
 
 static inline struct timespec secs_to_timespec(double const sec) {
@@ -234,37 +663,139 @@ static inline struct timespec secs_to_timespec(double const sec) {
     return timespec;
 }
 
+// Convert a deadline in seconds, None blocks without limit.
+static int
+parse_deadline(PyObject *deadline_arg, struct timespec *timespec, struct timespec **ts)
+{
+    if (deadline_arg == Py_None)
+    {
+        // No deadline.
+        *ts = NULL;
+        return 0;
+    }
+
+    double const deadline = PyFloat_AsDouble(deadline_arg);
+    if (PyErr_Occurred())
+        // Can't convert to float sec.
+        return -1;
+    if (deadline < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "negative deadline");
+        return -1;
+    }
+    *timespec = secs_to_timespec(deadline);
+    *ts = timespec;
+    return 0;
+}
+
 static PyObject *
-Notcurses_get(NotcursesObject *self, PyObject *args, PyObject *kw)
+Notcurses_get(NotcursesObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     static char *keywords[] = {"deadline", NULL};
-    PyObject* deadline_arg;
-    if (!PyArg_ParseTupleAndKeywords(args, kw, "O", keywords, &deadline_arg))
+    PyObject *parsed[1];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("get", args, nargs, kwnames, keywords, 1, parsed));
+
+    struct timespec timespec;
+    struct timespec *ts;
+    GNU_PY_CHECK_INT(parse_deadline(parsed[0], &timespec, &ts));
+
+    struct ncinput ni;
+    uint32_t id;
+    Py_BEGIN_ALLOW_THREADS;
+    id = notcurses_get(self->notcurses_ptr, ts, &ni);
+    Py_END_ALLOW_THREADS;
+    return build_NcInput(id, &ni);
+}
+
+#define GET_MANY_STACK_EVENTS 64
+
+static PyObject *
+Notcurses_get_many(NotcursesObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    static char *keywords[] = {"max_events", "deadline", NULL};
+    Py_ssize_t max_events = GET_MANY_STACK_EVENTS;
+    PyObject *deadline_arg = Py_None;
+
+    PyObject *parsed[2];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("get_many", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        max_events = GNU_PY_ARG_SSIZE(parsed[0]);
+    }
+    if (NULL != parsed[1])
+    {
+        deadline_arg = parsed[1];
+    }
+
+    if (max_events <= 0)
+    {
+        PyErr_Format(PyExc_ValueError, "max_events must be positive");
         return NULL;
+    }
 
     struct timespec timespec;
     struct timespec *ts;
-    if (deadline_arg == Py_None)
-        // No deadline.
-        ts = NULL;
-    else
+    GNU_PY_CHECK_INT(parse_deadline(deadline_arg, &timespec, &ts));
+
+    if (self->input_error)
     {
-        double const deadline = PyFloat_AsDouble(deadline_arg);
-        if (PyErr_Occurred())
-            // Can't convert to float sec.
-            return NULL;
-        if (deadline < 0)
+        self->input_error = false;
+        PyErr_Format(PyExc_RuntimeError, "notcurses_get returned -1");
+        return NULL;
+    }
+
+    // The default batch fits on the stack, only larger ones are allocated.
+    ncinput stack_events[GET_MANY_STACK_EVENTS];
+    ncinput *events = stack_events;
+    if (max_events > GET_MANY_STACK_EVENTS)
+    {
+        events = PyMem_New(ncinput, (size_t)max_events);
+        if (NULL == events)
         {
-            PyErr_Format(PyExc_ValueError, "negative deadline");
-            return NULL;
+            return PyErr_NoMemory();
         }
-        timespec = secs_to_timespec(deadline);
-        ts = &timespec;
     }
 
-    struct ncinput ni;
-    uint32_t const id = notcurses_get(self->notcurses_ptr, ts, &ni);
-    return build_NcInput(id, &ni);
+    // Wait for the first event only, then take whatever else is queued.
+    Py_ssize_t count = 0;
+    uint32_t id;
+    Py_BEGIN_ALLOW_THREADS;
+    id = notcurses_get(self->notcurses_ptr, ts, &events[0]);
+    while (id != 0 && id != (uint32_t)-1)
+    {
+        if (++count == max_events)
+            break;
+        id = notcurses_get_nblock(self->notcurses_ptr, &events[count]);
+    }
+    Py_END_ALLOW_THREADS;
+
+    // Events read before an error are returned, the error is raised by the
+    // next call.
+    PyObject *list = NULL;
+    if (id == (uint32_t)-1 && 0 == count)
+    {
+        PyErr_Format(PyExc_RuntimeError, "notcurses_get returned -1");
+    }
+    else if (NULL != (list = PyList_New(count)))
+    {
+        self->input_error = id == (uint32_t)-1;
+        for (Py_ssize_t i = 0; i < count; i++)
+        {
+            PyObject *event = NcInput_from_ncinput(&events[i]);
+            if (NULL == event)
+            {
+                Py_CLEAR(list);
+                break;
+            }
+            PyList_SET_ITEM(list, i, event);
+        }
+    }
+
+    if (stack_events != events)
+    {
+        PyMem_Free(events);
+    }
+    return list;
 }
 
 static PyObject *
@@ -279,10 +810,31 @@ static PyObject *
 Notcurses_get_blocking(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
     struct ncinput ni;
-    uint32_t const id = notcurses_get_blocking(self->notcurses_ptr, &ni);
+    uint32_t id;
+    Py_BEGIN_ALLOW_THREADS;
+    id = notcurses_get_blocking(self->notcurses_ptr, &ni);
+    Py_END_ALLOW_THREADS;
     return build_NcInput(id, &ni);
 }
 
+static PyObject *
+Notcurses_events(NotcursesObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    static char *keywords[] = {"max_pending", NULL};
+    Py_ssize_t max_pending = 0;
+
+    PyObject *parsed[1];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("events", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        max_pending = GNU_PY_ARG_SSIZE(parsed[0]);
+    }
+
+    PyObject *aio_module CLEANUP_PY_OBJ = GNU_PY_CHECK(PyImport_ImportModule("notcurses.aio"));
+
+    return PyObject_CallMethod(aio_module, "NcEventStream", "On", (PyObject *)self, max_pending);
+}
+
 static PyObject *
 Notcurses_mice_enable(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
@@ -323,23 +875,18 @@ Notcurses_refresh(NotcursesObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 Notcurses_stdplane(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = CHECK_NOTCURSES_PTR(notcurses_stdplane(self->notcurses_ptr));
+    struct ncplane *new_plane = CHECK_NOTCURSES_PTR(notcurses_stdplane(self->notcurses_ptr));
 
-    Py_INCREF(new_object);
-    return new_object;
+    return NcPlane_wrap(new_plane, (PyObject *)self);
 }
 
 static PyObject *
 Notcurses_stddim_yx(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
     unsigned y = 0, x = 0;
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = CHECK_NOTCURSES_PTR(notcurses_stddim_yx(self->notcurses_ptr, &y, &x));
+    struct ncplane *new_plane = CHECK_NOTCURSES_PTR(notcurses_stddim_yx(self->notcurses_ptr, &y, &x));
+    PyObject *new_object CLEANUP_PY_OBJ = GNU_PY_CHECK(NcPlane_wrap(new_plane, (PyObject *)self));
 
-    Py_INCREF(new_object);
     return Py_BuildValue("OII", new_object, y, x);
 }
 
@@ -353,14 +900,14 @@ Notcurses_term_dim_yx(NotcursesObject *self, PyObject *Py_UNUSED(args))
 }
 
 static PyObject *
-Notcurses_at_yx(NotcursesObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+Notcurses_at_yx(NotcursesObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when EGC is implemented");
     return NULL;
 }
 
 static PyObject *
-Notcurses_pile_create(NotcursesObject *self, PyObject *args, PyObject *kwds)
+Notcurses_pile_create(NotcursesObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     int y = 0, x = 0;
     unsigned rows = 0, cols = 0;
@@ -375,12 +922,40 @@ Notcurses_pile_create(NotcursesObject *self, PyObject *args, PyObject *kwds)
                         "flags",
                         "margin_b", "margin_r", NULL};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "|iiIIsKii", keywords,
-                                                  &y, &x,
-                                                  &rows, &cols,
-                                                  &name,
-                                                  &flags,
-                                                  &margin_b, &margin_r));
+    PyObject *parsed[8];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("pile_create", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        y = GNU_PY_ARG_INT(parsed[0]);
+    }
+    if (NULL != parsed[1])
+    {
+        x = GNU_PY_ARG_INT(parsed[1]);
+    }
+    if (NULL != parsed[2])
+    {
+        rows = GNU_PY_ARG_UINT(parsed[2]);
+    }
+    if (NULL != parsed[3])
+    {
+        cols = GNU_PY_ARG_UINT(parsed[3]);
+    }
+    if (NULL != parsed[4])
+    {
+        name = GNU_PY_ARG_STR(parsed[4]);
+    }
+    if (NULL != parsed[5])
+    {
+        flags = GNU_PY_ARG_ULL(parsed[5]);
+    }
+    if (NULL != parsed[6])
+    {
+        margin_b = GNU_PY_ARG_UINT(parsed[6]);
+    }
+    if (NULL != parsed[7])
+    {
+        margin_r = GNU_PY_ARG_UINT(parsed[7]);
+    }
 
     ncplane_options options = {
         .y = y,
@@ -393,12 +968,9 @@ Notcurses_pile_create(NotcursesObject *self, PyObject *args, PyObject *kwds)
         .margin_r = margin_r,
     };
 
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = CHECK_NOTCURSES_PTR(ncpile_create(self->notcurses_ptr, &options));
+    struct ncplane *new_plane = CHECK_NOTCURSES_PTR(ncpile_create(self->notcurses_ptr, &options));
 
-    Py_INCREF(new_object);
-    return new_object;
+    return NcPlane_wrap(new_plane, (PyObject *)self);
 }
 
 static PyObject *
@@ -471,29 +1043,42 @@ Notcurses_check_pixel_support(NotcursesObject *self, PyObject *Py_UNUSED(args))
 }
 
 static PyObject *
-Notcurses_stats(NotcursesObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+Notcurses_stats(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when stats is implemented");
-    return NULL;
+    ncstats stats;
+
+    notcurses_stats(self->notcurses_ptr, &stats);
+
+    return NcStats_from_ncstats(&stats);
 }
 
 static PyObject *
-Notcurses_stats_reset(NotcursesObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+Notcurses_stats_reset(NotcursesObject *self, PyObject *Py_UNUSED(args))
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when stats is implemented");
-    return NULL;
+    ncstats stats;
+
+    notcurses_stats_reset(self->notcurses_ptr, &stats);
+
+    return NcStats_from_ncstats(&stats);
 }
 
 static PyObject *
-Notcurses_cursor_enable(NotcursesObject *self, PyObject *args, PyObject *kwds)
+Notcurses_cursor_enable(NotcursesObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     int y = 0, x = 0;
 
     char *keywords[] = {"y", "x", NULL};
 
-    GNU_PY_CHECK_BOOL(
-        PyArg_ParseTupleAndKeywords(args, kwds, "|ii", keywords,
-                                    &y, &x));
+    PyObject *parsed[2];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("cursor_enable", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        y = GNU_PY_ARG_INT(parsed[0]);
+    }
+    if (NULL != parsed[1])
+    {
+        x = GNU_PY_ARG_INT(parsed[1]);
+    }
 
     CHECK_NOTCURSES(notcurses_cursor_enable(self->notcurses_ptr, y, x));
     Py_RETURN_NONE;
@@ -507,17 +1092,35 @@ Notcurses_cursor_disable(NotcursesObject *self, PyObject *Py_UNUSED(args))
 }
 
 static PyMethodDef Notcurses_methods[] = {
-    {"drop_planes", (PyCFunction)Notcurses_drop_planes, METH_NOARGS, "Destroy all ncplanes other than the stdplane."},
-
-    {"render", (PyCFunction)Notcurses_render, METH_NOARGS, "Renders and rasterizes the standard pile in one shot. Blocking call."},
+    {"headless", (void *)Notcurses_headless, METH_CLASS | METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create a context without a terminal, for tests and benchmarks: 'rows'x'cols' cells, terminfo of 'term_type', truecolor and UTF-8 (LC_CTYPE is switched to C.UTF-8 if needed, and back once the context is stopped). Output is discarded, use NcPlane.pile_render_to_buffer() to capture frames. Terminal queries are only skipped if the process has no controlling terminal (run under setsid(1) otherwise).")},
+    {"drop_planes", (PyCFunction)Notcurses_drop_planes, METH_NOARGS, "Destroy all ncplanes other than the stdplane. Any further use of the destroyed planes raises RuntimeError."},
+
+    {"render", (PyCFunction)Notcurses_render, METH_NOARGS, "Renders and rasterizes the standard pile in one shot. Blocking call, the GIL is released meanwhile."},
+
+    {"request_render", (PyCFunction)Notcurses_request_render, METH_NOARGS, PyDoc_STR("Mark the standard pile dirty. Requests made before the next scheduled frame are coalesced into one render, see render_if_due().")},
+    {"render_if_due", (PyCFunction)Notcurses_render_if_due, METH_NOARGS, PyDoc_STR("Render if a render was requested and the max fps allows a new frame. Returns True if a frame was rendered. The GIL is released while rendering.")},
+    {"render_due", (PyCFunction)Notcurses_render_due, METH_NOARGS, PyDoc_STR("Seconds until render_if_due() will render, or None if no render was requested. Can be passed as the deadline of get().")},
+    {"set_max_fps", (PyCFunction)Notcurses_set_max_fps, METH_O, PyDoc_STR("Limit scheduled renders to 'fps' frames per second, 0 for no limit (the default).")},
+    {"set_render_hook", (PyCFunction)Notcurses_set_render_hook, METH_O, PyDoc_STR("Call 'hook' with render_stats() after every scheduled frame. None removes the hook.")},
+    {"set_render_waker", (PyCFunction)Notcurses_set_render_waker, METH_O, PyDoc_STR("Call 'waker' without arguments from request_render() whenever the screen goes from clean to dirty. None removes the waker.")},
+    {"render_stats", (PyCFunction)Notcurses_render_stats, METH_NOARGS, PyDoc_STR("Return a dict of scheduler counters: 'requests', 'frames' rendered, requests 'coalesced' into a pending frame, frame slots 'dropped' because the frame was rendered late, and 'last_render_time' in seconds.")},
+
+    {"trace_start", (void *)Notcurses_trace_start, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Start recording frame timeline spans into a ring buffer of 'capacity' spans, the oldest are overwritten once it is full. Renders record 'frame', 'draw' (time since the previous frame), 'render', 'rasterize', 'raster' and 'write' spans.")},
+    {"trace_stop", (PyCFunction)Notcurses_trace_stop, METH_NOARGS, PyDoc_STR("Stop recording spans. Recorded spans are kept.")},
+    {"trace_clear", (PyCFunction)Notcurses_trace_clear, METH_NOARGS, PyDoc_STR("Discard recorded spans.")},
+    {"trace_add", (void *)Notcurses_trace_add, METH_FASTCALL, PyDoc_STR("Record a span called 'name' from 'start' to 'end', in time.monotonic() seconds. Does nothing while tracing is stopped.")},
+    {"trace_spans", (PyCFunction)Notcurses_trace_spans, METH_NOARGS, PyDoc_STR("Return the recorded spans, oldest first, as a list of (name, start, duration, thread ident) tuples. Times are time.monotonic() seconds.")},
+    {"trace_dropped", (PyCFunction)Notcurses_trace_dropped, METH_NOARGS, PyDoc_STR("Return the number of spans overwritten because the ring buffer was full.")},
 
     {"top", (PyCFunction)Notcurses_top, METH_NOARGS, "Return the topmost ncplane of the standard pile."},
     {"bottom", (PyCFunction)Notcurses_bottom, METH_NOARGS, "Return the bottommost ncplane of the standard pile."},
 
-    {"get", (void *)Notcurses_get, METH_VARARGS | METH_KEYWORDS, "See ppoll(2) for more detail. Provide a None 'ts' to block at length, a 'ts' of 0 for non-blocking operation, and otherwise a timespec to bound blocking. Signals in sigmask (less several we handle internally) will be atomically masked and unmasked per ppoll(2). It should generally contain all signals. Returns a single Unicode code point, or (char32_t)-1 on error. 'sigmask' may be NULL. Returns 0 on a timeout. If an event is processed, the return value is the 'id' field from that event. 'ni' may be NULL."},
+    {"get", (void *)Notcurses_get, METH_FASTCALL | METH_KEYWORDS, "See ppoll(2) for more detail. Provide a None 'ts' to block at length, a 'ts' of 0 for non-blocking operation, and otherwise a timespec to bound blocking. Signals in sigmask (less several we handle internally) will be atomically masked and unmasked per ppoll(2). It should generally contain all signals. Returns a single Unicode code point, or (char32_t)-1 on error. 'sigmask' may be NULL. Returns 0 on a timeout. If an event is processed, the return value is the 'id' field from that event. 'ni' may be NULL. The GIL is released while waiting."},
     {"inputready_fd", (PyCFunction)Notcurses_inputready_fd, METH_NOARGS, "Get a file descriptor suitable for input event poll()ing. When this descriptor becomes available, you can call notcurses_getc_nblock(), and input ought be ready. This file descriptor is *not* necessarily the file descriptor associated with stdin (but it might be!)."},
+    {"get_many", (void *)Notcurses_get_many, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Wait up to 'deadline' seconds (None blocks, 0 does not wait) for an input event, then drain up to 'max_events' queued events in the same call. Returns a list of NcInput, empty on timeout. The GIL is released while waiting and draining.")},
     {"get_nblock", (PyCFunction)Notcurses_get_nblock, METH_NOARGS, "Get input event without blocking. If no event is ready, returns None."},
-    {"get_blocking", (PyCFunction)Notcurses_get_blocking, METH_NOARGS, "Get input event completely blocking until and event or signal received."},
+    {"get_blocking", (PyCFunction)Notcurses_get_blocking, METH_NOARGS, "Get input event completely blocking until and event or signal received. The GIL is released while waiting."},
+    {"events", (void *)Notcurses_events, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Return an asynchronous iterator over input events, see notcurses.aio.NcEventStream. Must be iterated from a running asyncio event loop.")},
 
     {"mice_enable", (PyCFunction)Notcurses_mice_enable, METH_NOARGS, "Enable the mouse in \"button-event tracking\" mode with focus detection and UTF8-style extended coordinates. On success mouse events will be published to getc()"},
     {"mice_disable", (PyCFunction)Notcurses_mice_disable, METH_NOARGS, "Disable mouse events. Any events in the input queue can still be delivered."},
@@ -529,8 +1132,8 @@ static PyMethodDef Notcurses_methods[] = {
     {"stddim_yx", (PyCFunction)Notcurses_stddim_yx, METH_NOARGS, "Get standard plane plus dimensions dimensions."},
     {"term_dim_yx", (PyCFunction)Notcurses_term_dim_yx, METH_NOARGS, "Return our current idea of the terminal dimensions in rows and cols."},
 
-    {"at_yx", (void *)Notcurses_at_yx, METH_VARARGS | METH_KEYWORDS, "Retrieve the contents of the specified cell as last rendered."},
-    {"pile_create", (void *)Notcurses_pile_create, METH_VARARGS | METH_KEYWORDS, "Same as ncplane_create(), but creates a new pile. The returned plane will be the top, bottom, and root of this new pile."},
+    {"at_yx", (void *)Notcurses_at_yx, METH_FASTCALL | METH_KEYWORDS, "Retrieve the contents of the specified cell as last rendered."},
+    {"pile_create", (void *)Notcurses_pile_create, METH_FASTCALL | METH_KEYWORDS, "Same as ncplane_create(), but creates a new pile. The returned plane will be the top, bottom, and root of this new pile."},
 
     {"supported_styles", (PyCFunction)Notcurses_supported_styles, METH_NOARGS, PyDoc_STR("Returns a 16-bit bitmask of supported curses-style attributes (NCSTYLE_UNDERLINE, NCSTYLE_BOLD, etc.) The attribute is only indicated as supported if the terminal can support it together with color. For more information, see the \"ncv\" capability in terminfo(5).")},
     {"palette_size", (PyCFunction)Notcurses_palette_size, METH_NOARGS, PyDoc_STR("Returns the number of simultaneous colors claimed to be supported, or 1 if there is no color support. Note that several terminal emulators advertise more colors than they actually support, downsampling internally.")},
@@ -544,10 +1147,10 @@ static PyMethodDef Notcurses_methods[] = {
     {"canbraille", (PyCFunction)Notcurses_canbraille, METH_NOARGS, PyDoc_STR("Can we reliably use Unicode Braille?")},
     {"check_pixel_support", (PyCFunction)Notcurses_check_pixel_support, METH_NOARGS, PyDoc_STR("This function must successfully return before NCBLIT_PIXEL is available. Raises exception on error, 0 for no support, or 1 if pixel output is supported. Must not be called concurrently with either input or rasterization.")},
 
-    {"stats", (PyCFunction)Notcurses_stats, METH_NOARGS, PyDoc_STR("Acquire an atomic snapshot of the Notcurses object's stats.")},
-    {"stats_reset", (PyCFunction)Notcurses_stats_reset, METH_NOARGS, PyDoc_STR("Reset all cumulative stats (immediate ones, such as fbbytes, are not reset) and first returning a copy before reset.")},
+    {"stats", (PyCFunction)Notcurses_stats, METH_NOARGS, PyDoc_STR("Acquire an atomic snapshot of the Notcurses object's stats as an NcStats.")},
+    {"stats_reset", (PyCFunction)Notcurses_stats_reset, METH_NOARGS, PyDoc_STR("Reset all cumulative stats (immediate ones, such as fbbytes, are not reset), returning an NcStats copy taken before the reset.")},
 
-    {"cursor_enable", (void *)Notcurses_cursor_enable, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Enable the terminal's cursor, if supported, placing it at 'y', 'x'. Immediate effect (no need for a call to notcurses_render()). It is an error if 'y', 'x' lies outside the standard plane.")},
+    {"cursor_enable", (void *)Notcurses_cursor_enable, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Enable the terminal's cursor, if supported, placing it at 'y', 'x'. Immediate effect (no need for a call to notcurses_render()). It is an error if 'y', 'x' lies outside the standard plane.")},
     {"cursor_disable", (PyCFunction)Notcurses_cursor_disable, METH_NOARGS, PyDoc_STR("Disable the terminal's cursor.")},
 
     {NULL, NULL, 0, NULL},
@@ -559,8 +1162,10 @@ PyTypeObject Notcurses_Type = {
     .tp_doc = "Notcurses Context",
     .tp_basicsize = sizeof(NotcursesObject),
     .tp_itemsize = 0,
-    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
     .tp_new = Notcurses_new,
     .tp_dealloc = (destructor)Notcurses_dealloc,
+    .tp_traverse = (traverseproc)Notcurses_traverse,
+    .tp_clear = (inquiry)Notcurses_clear,
     .tp_methods = Notcurses_methods,
 };
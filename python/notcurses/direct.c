@@ -0,0 +1,592 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+#include <errno.h>
+#include <unistd.h>
+
+// ncdirect writes every colour change with its own write(2), after flushing
+// stdio. NcDirectBatch collects styled runs in a buffer instead, emitting one
+// SGR sequence only where the colours change, and writes the whole buffer at
+// once. A batch starts and ends with the default colours, which is what
+// ncdirect believes is set afterwards. Runs only carry colours: styles set
+// through ncdirect stay active, so the whole batch is drawn with the styles
+// in effect when it is flushed.
+
+typedef struct
+{
+    PyObject_HEAD;
+    struct ncdirect *ncdirect_ptr;
+    bool cursor_enabled;
+    // Flushes running without the GIL, stop() fails meanwhile. Holding a
+    // reference for the call keeps dealloc from running during a flush.
+    unsigned flushing;
+} NcDirectObject;
+
+typedef struct
+{
+    PyObject_HEAD;
+    NcDirectObject *direct;
+    char *data;
+    size_t len;
+    size_t alloc;
+    // Channels the buffered output ends with.
+    uint64_t channels;
+    unsigned long long runs;
+    bool flushing;
+    // Copied from the terminal capabilities.
+    bool rgb;
+    unsigned colors;
+} NcDirectBatchObject;
+
+#define CHECK_NCDIRECT(direct_obj)                                    \
+    ({                                                                \
+        if (NULL == (direct_obj)->ncdirect_ptr)                       \
+        {                                                             \
+            PyErr_SetString(PyExc_RuntimeError, "NcDirect is stopped"); \
+            return NULL;                                              \
+        }                                                             \
+    })
+
+// NcDirect
+
+static PyObject *
+NcDirect_new(PyTypeObject *subtype, PyObject *args, PyObject *kwds)
+{
+    const char *term_type = NULL;
+    unsigned long long flags = 0;
+
+    char *keywords[] = {"term_type", "flags", NULL};
+
+    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "|zK", keywords, &term_type, &flags));
+
+    NcDirectObject *self = (NcDirectObject *)subtype->tp_alloc(subtype, 0);
+    if (NULL == self)
+    {
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS;
+    self->ncdirect_ptr = ncdirect_init(term_type, stdout, flags);
+    Py_END_ALLOW_THREADS;
+
+    if (NULL == self->ncdirect_ptr)
+    {
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to initialize NcDirect");
+        return NULL;
+    }
+    self->cursor_enabled = true;
+
+    return (PyObject *)self;
+}
+
+static void
+NcDirect_dealloc(NcDirectObject *self)
+{
+    if (NULL != self->ncdirect_ptr)
+    {
+        ncdirect_stop(self->ncdirect_ptr);
+    }
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcDirect_stop(NcDirectObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCDIRECT(self);
+    if (0 != self->flushing)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "NcDirect is being flushed by another thread");
+        return NULL;
+    }
+    int const ret = ncdirect_stop(self->ncdirect_ptr);
+    self->ncdirect_ptr = NULL;
+    CHECK_NOTCURSES(ret);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_putstr(NcDirectObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CHECK_NCDIRECT(self);
+    char *keywords[] = {"text", "channels", NULL};
+    PyObject *parsed[2];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("putstr", args, nargs, kwnames, keywords, 1, parsed));
+
+    const char *text = GNU_PY_ARG_STR(parsed[0]);
+    unsigned long long channels = 0;
+    if (NULL != parsed[1] && Py_None != parsed[1])
+    {
+        channels = GNU_PY_ARG_ULL(parsed[1]);
+    }
+
+    return PyLong_FromLong((long)CHECK_NOTCURSES(ncdirect_putstr(self->ncdirect_ptr, channels, text)));
+}
+
+static PyObject *
+NcDirect_flush(NcDirectObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCDIRECT(self);
+    int ret = 0;
+
+    self->flushing++;
+    Py_BEGIN_ALLOW_THREADS;
+    ret = ncdirect_flush(self->ncdirect_ptr);
+    Py_END_ALLOW_THREADS;
+    self->flushing--;
+
+    CHECK_NOTCURSES(ret);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_set_fg_rgb(NcDirectObject *self, PyObject *rgb_arg)
+{
+    CHECK_NCDIRECT(self);
+    unsigned const rgb = GNU_PY_ARG_UINT(rgb_arg);
+    CHECK_NOTCURSES(ncdirect_set_fg_rgb(self->ncdirect_ptr, rgb));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_set_bg_rgb(NcDirectObject *self, PyObject *rgb_arg)
+{
+    CHECK_NCDIRECT(self);
+    unsigned const rgb = GNU_PY_ARG_UINT(rgb_arg);
+    CHECK_NOTCURSES(ncdirect_set_bg_rgb(self->ncdirect_ptr, rgb));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_set_fg_default(NcDirectObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCDIRECT(self);
+    CHECK_NOTCURSES(ncdirect_set_fg_default(self->ncdirect_ptr));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_set_bg_default(NcDirectObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCDIRECT(self);
+    CHECK_NOTCURSES(ncdirect_set_bg_default(self->ncdirect_ptr));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_set_styles(NcDirectObject *self, PyObject *styles_arg)
+{
+    CHECK_NCDIRECT(self);
+    unsigned const styles = GNU_PY_ARG_UINT(styles_arg);
+    CHECK_NOTCURSES(ncdirect_set_styles(self->ncdirect_ptr, styles));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_cursor_move_yx(NcDirectObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    CHECK_NCDIRECT(self);
+    GNU_PY_CHECK_NARGS("cursor_move_yx", nargs, 2, 2);
+    int const y = GNU_PY_ARG_INT(args[0]);
+    int const x = GNU_PY_ARG_INT(args[1]);
+    CHECK_NOTCURSES(ncdirect_cursor_move_yx(self->ncdirect_ptr, y, x));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_clear(NcDirectObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCDIRECT(self);
+    CHECK_NOTCURSES(ncdirect_clear(self->ncdirect_ptr));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirect_palette_size(NcDirectObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCDIRECT(self);
+    return PyLong_FromUnsignedLong(ncdirect_palette_size(self->ncdirect_ptr));
+}
+
+static PyObject *
+NcDirect_canutf8(NcDirectObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCDIRECT(self);
+    return PyBool_FromLong((long)ncdirect_canutf8(self->ncdirect_ptr));
+}
+
+static PyObject *
+NcDirect_batch(NcDirectObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCDIRECT(self);
+    NcDirectBatchObject *batch = PyObject_New(NcDirectBatchObject, &NcDirectBatch_Type);
+    if (NULL == batch)
+    {
+        return NULL;
+    }
+
+    const nccapabilities *caps = ncdirect_capabilities(self->ncdirect_ptr);
+    Py_INCREF(self);
+    batch->direct = self;
+    batch->data = NULL;
+    batch->len = 0;
+    batch->alloc = 0;
+    batch->channels = 0;
+    batch->runs = 0;
+    batch->flushing = false;
+    batch->rgb = caps->rgb;
+    batch->colors = caps->colors;
+
+    return (PyObject *)batch;
+}
+
+static PyObject *
+NcDirect_get_dimensions_yx(NcDirectObject *self, void *Py_UNUSED(closure))
+{
+    CHECK_NCDIRECT(self);
+    return Py_BuildValue("II", ncdirect_dim_y(self->ncdirect_ptr), ncdirect_dim_x(self->ncdirect_ptr));
+}
+
+static PyObject *
+NcDirect_get_cursor_enabled(NcDirectObject *self, void *Py_UNUSED(closure))
+{
+    return PyBool_FromLong((long)self->cursor_enabled);
+}
+
+static int
+NcDirect_set_cursor_enabled(NcDirectObject *self, PyObject *value, void *Py_UNUSED(closure))
+{
+    if (NULL == self->ncdirect_ptr)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "NcDirect is stopped");
+        return -1;
+    }
+    if (NULL == value)
+    {
+        PyErr_SetString(PyExc_TypeError, "Can't delete cursor_enabled");
+        return -1;
+    }
+
+    int const enable = PyObject_IsTrue(value);
+    GNU_PY_CHECK_INT_RET_NEG1(enable);
+    int const ret = enable ? ncdirect_cursor_enable(self->ncdirect_ptr) : ncdirect_cursor_disable(self->ncdirect_ptr);
+    if (ret < 0)
+    {
+        PyErr_Format(PyExc_RuntimeError, "Notcurses returned error %i", ret);
+        return -1;
+    }
+    self->cursor_enabled = enable;
+
+    return 0;
+}
+
+static PyMethodDef NcDirect_methods[] = {
+    {"putstr", (void *)NcDirect_putstr, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Output 'text' with 'channels' (default colours if omitted). Every colour change is a separate write, use batch() for many short runs.")},
+    {"flush", (PyCFunction)NcDirect_flush, METH_NOARGS, PyDoc_STR("Flush the output. The GIL is released meanwhile.")},
+    {"set_fg_rgb", (PyCFunction)NcDirect_set_fg_rgb, METH_O, PyDoc_STR("Set the foreground to the 24-bit 'rgb' colour.")},
+    {"set_bg_rgb", (PyCFunction)NcDirect_set_bg_rgb, METH_O, PyDoc_STR("Set the background to the 24-bit 'rgb' colour.")},
+    {"set_fg_default", (PyCFunction)NcDirect_set_fg_default, METH_NOARGS, PyDoc_STR("Use the default foreground colour.")},
+    {"set_bg_default", (PyCFunction)NcDirect_set_bg_default, METH_NOARGS, PyDoc_STR("Use the default background colour.")},
+    {"set_styles", (PyCFunction)NcDirect_set_styles, METH_O, PyDoc_STR("Set the NCSTYLE_* styles mask.")},
+    {"cursor_move_yx", (void *)NcDirect_cursor_move_yx, METH_FASTCALL, PyDoc_STR("Move the cursor to 'y', 'x'. -1 keeps the current coordinate.")},
+    {"clear", (PyCFunction)NcDirect_clear, METH_NOARGS, PyDoc_STR("Clear the screen.")},
+    {"palette_size", (PyCFunction)NcDirect_palette_size, METH_NOARGS, PyDoc_STR("Number of indexed colours the terminal supports.")},
+    {"canutf8", (PyCFunction)NcDirect_canutf8, METH_NOARGS, PyDoc_STR("Is our encoding UTF-8?")},
+    {"batch", (PyCFunction)NcDirect_batch, METH_NOARGS, PyDoc_STR("Return an NcDirectBatch collecting styled output to write at once.")},
+    {"stop", (PyCFunction)NcDirect_stop, METH_NOARGS, PyDoc_STR("Restore the terminal and release NcDirect. Called on garbage collection otherwise. Fails while another thread flushes output of the NcDirect.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcDirect_getset[] = {
+    {"dimensions_yx", (getter)NcDirect_get_dimensions_yx, NULL, PyDoc_STR("Terminal size as a tuple (rows, cols)."), NULL},
+    {"cursor_enabled", (getter)NcDirect_get_cursor_enabled, (setter)NcDirect_set_cursor_enabled, PyDoc_STR("Whether the cursor is shown. Setting it shows or hides the cursor."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcDirect_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcDirect",
+    .tp_doc = "Direct mode context, writing styled output in the normal flow of the terminal instead of rendering planes.",
+    .tp_basicsize = sizeof(NcDirectObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcDirect_new,
+    .tp_dealloc = (destructor)NcDirect_dealloc,
+    .tp_methods = NcDirect_methods,
+    .tp_getset = NcDirect_getset,
+};
+
+// NcDirectBatch
+
+static int
+batch_reserve(NcDirectBatchObject *self, size_t more)
+{
+    if (self->len + more <= self->alloc)
+    {
+        return 0;
+    }
+
+    size_t new_alloc = 0 == self->alloc ? 4096 : self->alloc;
+    while (new_alloc < self->len + more)
+    {
+        new_alloc *= 2;
+    }
+    char *new_data = PyMem_Realloc(self->data, new_alloc);
+    if (NULL == new_data)
+    {
+        PyErr_NoMemory();
+        return -1;
+    }
+    self->data = new_data;
+    self->alloc = new_alloc;
+    return 0;
+}
+
+// Writes the SGR parameters selecting 'channel' as foreground (base 30) or
+// background (base 40), quantized to what the terminal supports.
+static int
+batch_color_params(const NcDirectBatchObject *self, char *out, size_t size, unsigned base, uint32_t channel)
+{
+    if (ncchannel_default_p(channel))
+    {
+        return snprintf(out, size, "%u", base + 9);
+    }
+    if (ncchannel_palindex_p(channel))
+    {
+        return snprintf(out, size, "%u;5;%u", base + 8, ncchannel_palindex(channel));
+    }
+
+    unsigned r = 0, g = 0, b = 0;
+    ncchannel_rgb8(channel, &r, &g, &b);
+    if (self->rgb)
+    {
+        return snprintf(out, size, "%u;2;%u;%u;%u", base + 8, r, g, b);
+    }
+    if (self->colors >= 256)
+    {
+        return snprintf(out, size, "%u;5;%u", base + 8, 16 + r / 43 * 36 + g / 43 * 6 + b / 43);
+    }
+    if (self->colors >= 8)
+    {
+        return snprintf(out, size, "%u", base + (r >= 128 ? 1u : 0u) + (g >= 128 ? 2u : 0u) + (b >= 128 ? 4u : 0u));
+    }
+    return 0;
+}
+
+// Appends one SGR sequence switching from the current channels to 'channels'.
+static int
+batch_set_channels(NcDirectBatchObject *self, uint64_t channels)
+{
+    uint32_t const fg = ncchannels_fchannel(channels);
+    uint32_t const bg = ncchannels_bchannel(channels);
+    bool const fg_changed = fg != ncchannels_fchannel(self->channels);
+    bool const bg_changed = bg != ncchannels_bchannel(self->channels);
+    if (!fg_changed && !bg_changed)
+    {
+        return 0;
+    }
+
+    char fg_params[24] = "", bg_params[24] = "";
+    int fg_len = 0, bg_len = 0;
+    if (fg_changed)
+    {
+        fg_len = batch_color_params(self, fg_params, sizeof(fg_params), 30, fg);
+    }
+    if (bg_changed)
+    {
+        bg_len = batch_color_params(self, bg_params, sizeof(bg_params), 40, bg);
+    }
+    self->channels = channels;
+    if (fg_len <= 0 && bg_len <= 0)
+    {
+        return 0;
+    }
+
+    GNU_PY_CHECK_INT_RET_NEG1(batch_reserve(self, 4 + sizeof(fg_params) + sizeof(bg_params)));
+    int const written = snprintf(self->data + self->len, self->alloc - self->len, "\x1b[%s%s%sm",
+                                 fg_params, fg_len > 0 && bg_len > 0 ? ";" : "", bg_params);
+    self->len += (size_t)written;
+    return 0;
+}
+
+static int
+batch_check(NcDirectBatchObject *self)
+{
+    if (NULL == self->direct->ncdirect_ptr)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "NcDirect is stopped");
+        return -1;
+    }
+    if (self->flushing)
+    {
+        PyErr_SetString(PyExc_BufferError, "NcDirectBatch is being flushed in another thread");
+        return -1;
+    }
+    return 0;
+}
+
+static void
+NcDirectBatch_dealloc(NcDirectBatchObject *self)
+{
+    PyMem_Free(self->data);
+    Py_XDECREF(self->direct);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcDirectBatch_putstr(NcDirectBatchObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    GNU_PY_CHECK_INT(batch_check(self));
+    char *keywords[] = {"text", "channels", NULL};
+    PyObject *parsed[2];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("putstr", args, nargs, kwnames, keywords, 1, parsed));
+
+    Py_ssize_t text_len = 0;
+    const char *text = PyUnicode_AsUTF8AndSize(parsed[0], &text_len);
+    if (NULL == text)
+    {
+        return NULL;
+    }
+    unsigned long long channels = 0;
+    if (NULL != parsed[1] && Py_None != parsed[1])
+    {
+        channels = GNU_PY_ARG_ULL(parsed[1]);
+    }
+
+    GNU_PY_CHECK_INT(batch_set_channels(self, channels));
+    GNU_PY_CHECK_INT(batch_reserve(self, (size_t)text_len));
+    memcpy(self->data + self->len, text, (size_t)text_len);
+    self->len += (size_t)text_len;
+    self->runs++;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirectBatch_flush(NcDirectBatchObject *self, PyObject *Py_UNUSED(args))
+{
+    GNU_PY_CHECK_INT(batch_check(self));
+    if (0 == self->len)
+    {
+        return PyLong_FromLong(0);
+    }
+
+    // Leave the terminal with the default colours, as ncdirect will assume.
+    GNU_PY_CHECK_INT(batch_set_channels(self, 0));
+    struct ncdirect *n = self->direct->ncdirect_ptr;
+    CHECK_NOTCURSES(ncdirect_set_fg_default(n));
+    CHECK_NOTCURSES(ncdirect_set_bg_default(n));
+
+    int const fd = fileno(stdout);
+    size_t written = 0;
+    int ret = 0;
+    int saved_errno = 0;
+
+    self->flushing = true;
+    self->direct->flushing++;
+    Py_BEGIN_ALLOW_THREADS;
+    // Output ncdirect buffered so far goes first.
+    ret = ncdirect_flush(n);
+    while (0 == ret && written < self->len)
+    {
+        ssize_t const w = write(fd, self->data + written, self->len - written);
+        if (w < 0)
+        {
+            if (EINTR == errno || EAGAIN == errno)
+            {
+                continue;
+            }
+            saved_errno = errno;
+            ret = -1;
+        }
+        else
+        {
+            written += (size_t)w;
+        }
+    }
+    Py_END_ALLOW_THREADS;
+    self->direct->flushing--;
+    self->flushing = false;
+
+    self->len = 0;
+    self->runs = 0;
+    if (0 != saved_errno)
+    {
+        errno = saved_errno;
+        return PyErr_SetFromErrno(PyExc_OSError);
+    }
+    CHECK_NOTCURSES(ret);
+
+    return PyLong_FromSize_t(written);
+}
+
+static PyObject *
+NcDirectBatch_enter(NcDirectBatchObject *self, PyObject *Py_UNUSED(args))
+{
+    Py_INCREF(self);
+    return (PyObject *)self;
+}
+
+static PyObject *
+NcDirectBatch_exit(NcDirectBatchObject *self, PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs))
+{
+    PyObject *flushed CLEANUP_PY_OBJ = GNU_PY_CHECK(NcDirectBatch_flush(self, NULL));
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDirectBatch_get_nbytes(NcDirectBatchObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromSize_t(self->len);
+}
+
+static PyObject *
+NcDirectBatch_get_runs(NcDirectBatchObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromUnsignedLongLong(self->runs);
+}
+
+static PyMethodDef NcDirectBatch_methods[] = {
+    {"putstr", (void *)NcDirectBatch_putstr, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Append 'text' with 'channels' (default colours if omitted). A colour sequence is only added where the colours change.")},
+    {"flush", (PyCFunction)NcDirectBatch_flush, METH_NOARGS, PyDoc_STR("Write the collected output with one write, resetting the colours at the end. The output is drawn with the styles of the NcDirect at this point. Returns the number of bytes written. The GIL is released meanwhile.")},
+    {"__enter__", (PyCFunction)NcDirectBatch_enter, METH_NOARGS, NULL},
+    {"__exit__", (void *)NcDirectBatch_exit, METH_FASTCALL, NULL},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcDirectBatch_getset[] = {
+    {"nbytes", (getter)NcDirectBatch_get_nbytes, NULL, PyDoc_STR("Bytes collected and not yet written."), NULL},
+    {"runs", (getter)NcDirectBatch_get_runs, NULL, PyDoc_STR("Runs collected and not yet written."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcDirectBatch_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcDirectBatch",
+    .tp_doc = "Styled output of an NcDirect collected in a buffer and written at once by flush(). Created by NcDirect.batch(), flushed when used as a context manager exits.",
+    .tp_basicsize = sizeof(NcDirectBatchObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)NcDirectBatch_dealloc,
+    .tp_methods = NcDirectBatch_methods,
+    .tp_getset = NcDirectBatch_getset,
+};
@@ -0,0 +1,484 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+typedef enum
+{
+    DL_PUTSTR_YX,
+    DL_PUTSTR,
+    DL_SET_CHANNELS,
+    DL_SET_STYLES,
+    DL_SET_FG_RGB,
+    DL_SET_BG_RGB,
+    DL_CURSOR_MOVE_YX,
+    DL_FORMAT,
+    DL_STAIN,
+    DL_BOX,
+    DL_BOX_SIZED,
+    DL_ERASE,
+} ncdisplaylist_op_e;
+
+static const char *const ncdisplaylist_op_names[] = {
+    [DL_PUTSTR_YX] = "putstr_yx",
+    [DL_PUTSTR] = "putstr",
+    [DL_SET_CHANNELS] = "set_channels",
+    [DL_SET_STYLES] = "set_styles",
+    [DL_SET_FG_RGB] = "set_fg_rgb",
+    [DL_SET_BG_RGB] = "set_bg_rgb",
+    [DL_CURSOR_MOVE_YX] = "cursor_move_yx",
+    [DL_FORMAT] = "format",
+    [DL_STAIN] = "stain",
+    [DL_BOX] = "box",
+    [DL_BOX_SIZED] = "box_sized",
+    [DL_ERASE] = "erase",
+};
+
+struct ncdisplaylist_op
+{
+    ncdisplaylist_op_e type;
+    int y, x;
+    unsigned ylen, xlen;
+    unsigned ctlword;
+    uint16_t styles;
+    uint64_t channels[4];
+    char *str;
+};
+
+static void
+ncdisplaylist_clear(NcDisplayListObject *self)
+{
+    for (Py_ssize_t i = 0; i < self->len; i++)
+    {
+        free(self->ops[i].str);
+    }
+    self->len = 0;
+}
+
+static struct ncdisplaylist_op *
+ncdisplaylist_append(NcDisplayListObject *self, ncdisplaylist_op_e type)
+{
+    if (self->len == self->alloc)
+    {
+        Py_ssize_t new_alloc = 0 == self->alloc ? 16 : self->alloc * 2;
+        struct ncdisplaylist_op *new_ops = PyMem_Realloc(self->ops, (size_t)new_alloc * sizeof(*new_ops));
+        if (NULL == new_ops)
+        {
+            PyErr_NoMemory();
+            return NULL;
+        }
+        self->ops = new_ops;
+        self->alloc = new_alloc;
+    }
+
+    struct ncdisplaylist_op *op = &self->ops[self->len++];
+    memset(op, 0, sizeof(*op));
+    op->type = type;
+    return op;
+}
+
+static struct ncdisplaylist_op *
+ncdisplaylist_append_str(NcDisplayListObject *self, ncdisplaylist_op_e type, const char *str)
+{
+    char *str_copy = strdup(str);
+    if (NULL == str_copy)
+    {
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    struct ncdisplaylist_op *op = ncdisplaylist_append(self, type);
+    if (NULL == op)
+    {
+        free(str_copy);
+        return NULL;
+    }
+    op->str = str_copy;
+    return op;
+}
+
+static int
+ncdisplaylist_box(struct ncplane *n, const struct ncdisplaylist_op *op)
+{
+    const char *box_chars = op->str;
+
+    if (!notcurses_canutf8(ncplane_notcurses(n)))
+    {
+        box_chars = NCBOXASCII;
+    }
+
+    unsigned ystop = op->ylen, xstop = op->xlen;
+    if (DL_BOX_SIZED == op->type)
+    {
+        unsigned y = 0, x = 0;
+        ncplane_cursor_yx(n, &y, &x);
+        ystop += y - 1;
+        xstop += x - 1;
+    }
+
+    nccell ul = NCCELL_TRIVIAL_INITIALIZER, ur = NCCELL_TRIVIAL_INITIALIZER;
+    nccell ll = NCCELL_TRIVIAL_INITIALIZER, lr = NCCELL_TRIVIAL_INITIALIZER;
+    nccell hl = NCCELL_TRIVIAL_INITIALIZER, vl = NCCELL_TRIVIAL_INITIALIZER;
+    int ret = nccells_load_box(n, op->styles, op->channels[0], &ul, &ur, &ll, &lr, &hl, &vl, box_chars);
+    if (0 == ret)
+    {
+        ret = ncplane_box(n, &ul, &ur, &ll, &lr, &hl, &vl, ystop, xstop, op->ctlword);
+    }
+    nccell_release(n, &ul);
+    nccell_release(n, &ur);
+    nccell_release(n, &ll);
+    nccell_release(n, &lr);
+    nccell_release(n, &hl);
+    nccell_release(n, &vl);
+    return ret;
+}
+
+static int
+ncdisplaylist_op_replay(struct ncplane *n, const struct ncdisplaylist_op *op)
+{
+    switch (op->type)
+    {
+    case DL_PUTSTR_YX:
+        return ncplane_putstr_yx(n, op->y, op->x, op->str);
+    case DL_PUTSTR:
+        return ncplane_putstr(n, op->str);
+    case DL_SET_CHANNELS:
+        ncplane_set_channels(n, op->channels[0]);
+        return 0;
+    case DL_SET_STYLES:
+        ncplane_set_styles(n, op->styles);
+        return 0;
+    case DL_SET_FG_RGB:
+        return ncplane_set_fg_rgb(n, (uint32_t)op->channels[0]);
+    case DL_SET_BG_RGB:
+        return ncplane_set_bg_rgb(n, (uint32_t)op->channels[0]);
+    case DL_CURSOR_MOVE_YX:
+        return ncplane_cursor_move_yx(n, op->y, op->x);
+    case DL_FORMAT:
+        return ncplane_format(n, op->y, op->x, op->ylen, op->xlen, op->styles);
+    case DL_STAIN:
+        return ncplane_stain(n, op->y, op->x, op->ylen, op->xlen,
+                             op->channels[0], op->channels[1], op->channels[2], op->channels[3]);
+    case DL_BOX:
+    case DL_BOX_SIZED:
+        return ncdisplaylist_box(n, op);
+    case DL_ERASE:
+        ncplane_erase(n);
+        return 0;
+    }
+    return -1;
+}
+
+int NcDisplayList_replay(NcDisplayListObject *self, struct ncplane *n)
+{
+    for (Py_ssize_t i = 0; i < self->len; i++)
+    {
+        int ret = ncdisplaylist_op_replay(n, &self->ops[i]);
+        if (ret < 0)
+        {
+            PyErr_Format(PyExc_RuntimeError, "Display list op %zd (%s) failed with %i",
+                         i, ncdisplaylist_op_names[self->ops[i].type], ret);
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static void
+NcDisplayList_dealloc(NcDisplayListObject *self)
+{
+    ncdisplaylist_clear(self);
+    PyMem_Free(self->ops);
+
+    Py_TYPE(self)->tp_free(self);
+}
+
+static Py_ssize_t
+NcDisplayList_length(NcDisplayListObject *self)
+{
+    return self->len;
+}
+
+static PyObject *
+NcDisplayList_putstr_yx(NcDisplayListObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int y = 0, x = 0;
+    const char *egc = NULL;
+
+    GNU_PY_CHECK_NARGS("putstr_yx", nargs, 3, 3);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
+    egc = GNU_PY_ARG_STR(args[2]);
+
+    struct ncdisplaylist_op *op = GNU_PY_CHECK_PTR(ncdisplaylist_append_str(self, DL_PUTSTR_YX, egc));
+    op->y = y;
+    op->x = x;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDisplayList_putstr(NcDisplayListObject *self, PyObject *arg)
+{
+    const char *egc = NULL;
+
+    egc = GNU_PY_ARG_STR(arg);
+
+    GNU_PY_CHECK_PTR(ncdisplaylist_append_str(self, DL_PUTSTR, egc));
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDisplayList_set_channels(NcDisplayListObject *self, PyObject *arg)
+{
+    unsigned long long channels = 0;
+
+    channels = GNU_PY_ARG_ULL(arg);
+
+    struct ncdisplaylist_op *op = GNU_PY_CHECK_PTR(ncdisplaylist_append(self, DL_SET_CHANNELS));
+    op->channels[0] = (uint64_t)channels;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDisplayList_set_styles(NcDisplayListObject *self, PyObject *arg)
+{
+    unsigned short styles = 0;
+
+    styles = GNU_PY_ARG_USHORT(arg);
+
+    struct ncdisplaylist_op *op = GNU_PY_CHECK_PTR(ncdisplaylist_append(self, DL_SET_STYLES));
+    op->styles = (uint16_t)styles;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+ncdisplaylist_append_rgb(NcDisplayListObject *self, PyObject *arg, ncdisplaylist_op_e type)
+{
+    unsigned int rgb = GNU_PY_ARG_UINT(arg);
+
+    if (rgb > 0xffffffu)
+    {
+        PyErr_Format(PyExc_ValueError, "Invalid RGB 0x%x", rgb);
+        return NULL;
+    }
+
+    struct ncdisplaylist_op *op = GNU_PY_CHECK_PTR(ncdisplaylist_append(self, type));
+    op->channels[0] = rgb;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDisplayList_set_fg_rgb(NcDisplayListObject *self, PyObject *arg)
+{
+    return ncdisplaylist_append_rgb(self, arg, DL_SET_FG_RGB);
+}
+
+static PyObject *
+NcDisplayList_set_bg_rgb(NcDisplayListObject *self, PyObject *arg)
+{
+    return ncdisplaylist_append_rgb(self, arg, DL_SET_BG_RGB);
+}
+
+static PyObject *
+NcDisplayList_cursor_move_yx(NcDisplayListObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int y = 0, x = 0;
+
+    GNU_PY_CHECK_NARGS("cursor_move_yx", nargs, 2, 2);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
+
+    struct ncdisplaylist_op *op = GNU_PY_CHECK_PTR(ncdisplaylist_append(self, DL_CURSOR_MOVE_YX));
+    op->y = y;
+    op->x = x;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDisplayList_format(NcDisplayListObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int y = -1, x = -1;
+    unsigned ylen = 0, xlen = 0;
+    unsigned short stylemask = 0;
+
+    GNU_PY_CHECK_NARGS("format", nargs, 5, 5);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
+    ylen = GNU_PY_ARG_UINT(args[2]);
+    xlen = GNU_PY_ARG_UINT(args[3]);
+    stylemask = GNU_PY_ARG_USHORT(args[4]);
+
+    struct ncdisplaylist_op *op = GNU_PY_CHECK_PTR(ncdisplaylist_append(self, DL_FORMAT));
+    op->y = y;
+    op->x = x;
+    op->ylen = ylen;
+    op->xlen = xlen;
+    op->styles = (uint16_t)stylemask;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDisplayList_stain(NcDisplayListObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int y = -1, x = -1;
+    unsigned ylen = 0, xlen = 0;
+    unsigned long long ul = 0, ur = 0, ll = 0, lr = 0;
+
+    char *keywords[] = {"y", "x", "ylen", "xlen",
+                        "ul", "ur", "ll", "lr",
+                        NULL};
+
+    PyObject *parsed[8];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("stain", args, nargs, kwnames, keywords, 8, parsed));
+    y = GNU_PY_ARG_INT(parsed[0]);
+    x = GNU_PY_ARG_INT(parsed[1]);
+    ylen = GNU_PY_ARG_UINT(parsed[2]);
+    xlen = GNU_PY_ARG_UINT(parsed[3]);
+    ul = GNU_PY_ARG_ULL(parsed[4]);
+    ur = GNU_PY_ARG_ULL(parsed[5]);
+    ll = GNU_PY_ARG_ULL(parsed[6]);
+    lr = GNU_PY_ARG_ULL(parsed[7]);
+
+    struct ncdisplaylist_op *op = GNU_PY_CHECK_PTR(ncdisplaylist_append(self, DL_STAIN));
+    op->y = y;
+    op->x = x;
+    op->ylen = ylen;
+    op->xlen = xlen;
+    op->channels[0] = (uint64_t)ul;
+    op->channels[1] = (uint64_t)ur;
+    op->channels[2] = (uint64_t)ll;
+    op->channels[3] = (uint64_t)lr;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+ncdisplaylist_append_box(NcDisplayListObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, ncdisplaylist_op_e type)
+{
+    unsigned ylen = 0, xlen = 0;
+    const char *box_chars = NCBOXLIGHT;
+    unsigned short styles = 0;
+    unsigned long long channels = 0;
+    unsigned ctlword = 0;
+
+    char *stop_keywords[] = {"ystop", "xstop",
+                             "box_chars", "styles", "channels",
+                             "ctlword", NULL};
+    char *sized_keywords[] = {"ylen", "xlen",
+                              "box_chars", "styles", "channels",
+                              "ctlword", NULL};
+    char **keywords = DL_BOX_SIZED == type ? sized_keywords : stop_keywords;
+
+    PyObject *parsed[6];
+    GNU_PY_CHECK_INT(pync_parse_fastcall(DL_BOX_SIZED == type ? "box_sized" : "box", args, nargs, kwnames, keywords, 2, parsed));
+    ylen = GNU_PY_ARG_UINT(parsed[0]);
+    xlen = GNU_PY_ARG_UINT(parsed[1]);
+    if (NULL != parsed[2])
+    {
+        box_chars = GNU_PY_ARG_STR(parsed[2]);
+    }
+    if (NULL != parsed[3])
+    {
+        styles = GNU_PY_ARG_USHORT(parsed[3]);
+    }
+    if (NULL != parsed[4])
+    {
+        channels = GNU_PY_ARG_ULL(parsed[4]);
+    }
+    if (NULL != parsed[5])
+    {
+        ctlword = GNU_PY_ARG_UINT(parsed[5]);
+    }
+
+    struct ncdisplaylist_op *op = GNU_PY_CHECK_PTR(ncdisplaylist_append_str(self, type, box_chars));
+    op->ylen = ylen;
+    op->xlen = xlen;
+    op->styles = (uint16_t)styles;
+    op->channels[0] = (uint64_t)channels;
+    op->ctlword = ctlword;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDisplayList_box(NcDisplayListObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    return ncdisplaylist_append_box(self, args, nargs, kwnames, DL_BOX);
+}
+
+static PyObject *
+NcDisplayList_box_sized(NcDisplayListObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    return ncdisplaylist_append_box(self, args, nargs, kwnames, DL_BOX_SIZED);
+}
+
+static PyObject *
+NcDisplayList_erase(NcDisplayListObject *self, PyObject *Py_UNUSED(args))
+{
+    GNU_PY_CHECK_PTR(ncdisplaylist_append(self, DL_ERASE));
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDisplayList_clear(NcDisplayListObject *self, PyObject *Py_UNUSED(args))
+{
+    ncdisplaylist_clear(self);
+
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef NcDisplayList_methods[] = {
+    {"putstr_yx", (void *)NcDisplayList_putstr_yx, METH_FASTCALL, PyDoc_STR("Append NcPlane.putstr_yx(y, x, str).")},
+    {"putstr", (PyCFunction)NcDisplayList_putstr, METH_O, PyDoc_STR("Append NcPlane.putstr(str).")},
+    {"set_channels", (PyCFunction)NcDisplayList_set_channels, METH_O, PyDoc_STR("Append NcPlane.set_channels(channels).")},
+    {"set_styles", (PyCFunction)NcDisplayList_set_styles, METH_O, PyDoc_STR("Append NcPlane.set_styles(styles).")},
+    {"set_fg_rgb", (PyCFunction)NcDisplayList_set_fg_rgb, METH_O, PyDoc_STR("Append NcPlane.set_fg_rgb(rgb).")},
+    {"set_bg_rgb", (PyCFunction)NcDisplayList_set_bg_rgb, METH_O, PyDoc_STR("Append NcPlane.set_bg_rgb(rgb).")},
+    {"cursor_move_yx", (void *)NcDisplayList_cursor_move_yx, METH_FASTCALL, PyDoc_STR("Append NcPlane.cursor_move_yx(y, x).")},
+    {"format", (void *)NcDisplayList_format, METH_FASTCALL, PyDoc_STR("Append NcPlane.format(y, x, ylen, xlen, stylemask).")},
+    {"stain", (void *)NcDisplayList_stain, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Append NcPlane.stain(y, x, ylen, xlen, ul, ur, ll, lr).")},
+    {"box", (void *)NcDisplayList_box, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Append a box from the cursor to 'ystop'/'xstop' drawn with 'box_chars'.")},
+    {"box_sized", (void *)NcDisplayList_box_sized, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Append a box of 'ylen'x'xlen' cells at the cursor drawn with 'box_chars'.")},
+    {"erase", (PyCFunction)NcDisplayList_erase, METH_NOARGS, PyDoc_STR("Append NcPlane.erase().")},
+    {"clear", (PyCFunction)NcDisplayList_clear, METH_NOARGS, PyDoc_STR("Remove all ops from the display list.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PySequenceMethods NcDisplayList_as_sequence = {
+    .sq_length = (lenfunc)NcDisplayList_length,
+};
+
+PyTypeObject NcDisplayList_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcDisplayList",
+    .tp_doc = "List of drawing ops replayed on a plane by NcPlane.execute()",
+    .tp_basicsize = sizeof(NcDisplayListObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_dealloc = (destructor)NcDisplayList_dealloc,
+    .tp_methods = NcDisplayList_methods,
+    .tp_as_sequence = &NcDisplayList_as_sequence,
+};
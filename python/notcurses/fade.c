@@ -0,0 +1,459 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+#include <math.h>
+
+// The fade functions of notcurses either block until the fade is over or,
+// for single iterations, render and sleep unless a callback is given. Single
+// iterations are run with a callback doing nothing, so they only recolor the
+// plane, and NcFader picks the iteration from the time elapsed, so a fade
+// advances once per frame of the application's own loop.
+
+struct fade_curry
+{
+    PyObject *fader;
+    PyObject *plane;
+};
+
+static int
+fade_noop(struct notcurses *Py_UNUSED(nc), struct ncplane *Py_UNUSED(n),
+          const struct timespec *Py_UNUSED(ts), void *Py_UNUSED(curry))
+{
+    return 0;
+}
+
+// Called by notcurses without the GIL. An exception stays set in the thread
+// state and is raised once the fade returns.
+static int
+fade_callback(struct notcurses *Py_UNUSED(nc), struct ncplane *Py_UNUSED(n),
+              const struct timespec *ts, void *curry)
+{
+    struct fade_curry *c = curry;
+    int ret = 0;
+
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    double const deadline = (double)ts->tv_sec + (double)ts->tv_nsec * 1E-9;
+    PyObject *result = PyObject_CallFunction(c->fader, "Od", c->plane, deadline);
+    if (NULL == result)
+    {
+        ret = -1;
+    }
+    else if (Py_None != result)
+    {
+        // A nonzero int stops the fade and is returned by it.
+        int overflow = 0;
+        long const value = PyLong_Check(result) ? PyLong_AsLongAndOverflow(result, &overflow) : -1;
+        if (!PyLong_Check(result))
+        {
+            PyErr_Format(PyExc_TypeError, "fader must return None or an int, not %.50s", Py_TYPE(result)->tp_name);
+            ret = -1;
+        }
+        else if (0 != overflow || value < 0 || value > INT_MAX)
+        {
+            PyErr_SetString(PyExc_ValueError, "fader must return a non-negative int");
+            ret = -1;
+        }
+        else
+        {
+            ret = (int)value;
+        }
+    }
+    Py_XDECREF(result);
+    PyGILState_Release(gstate);
+
+    return ret;
+}
+
+static int
+fade_duration(PyObject *duration_arg, struct timespec *ts)
+{
+    double const duration = PyFloat_AsDouble(duration_arg);
+    if (PyErr_Occurred())
+    {
+        return -1;
+    }
+    if (duration < 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "negative duration");
+        return -1;
+    }
+    ts->tv_sec = (time_t)duration;
+    ts->tv_nsec = (long)((duration - (double)ts->tv_sec) * 1E9);
+    return 0;
+}
+
+PyObject *
+NcFade_run(NcPlaneObject *plane, enum pync_fade_mode mode, PyObject *duration_arg, PyObject *fader)
+{
+    struct timespec ts;
+    GNU_PY_CHECK_INT(fade_duration(duration_arg, &ts));
+
+    if (Py_None == fader)
+    {
+        fader = NULL;
+    }
+    if (NULL != fader && !PyCallable_Check(fader))
+    {
+        PyErr_SetString(PyExc_TypeError, "fader must be callable or None");
+        return NULL;
+    }
+    if (PYNC_FADE_PULSE == mode && NULL == fader)
+    {
+        PyErr_SetString(PyExc_TypeError, "pulse requires a fader, it runs until the fader returns a nonzero int");
+        return NULL;
+    }
+
+    struct fade_curry curry = {.fader = fader, .plane = (PyObject *)plane};
+    fadecb cb = NULL == fader ? NULL : fade_callback;
+    int ret = 0;
+
+    Py_BEGIN_ALLOW_THREADS;
+    switch (mode)
+    {
+    case PYNC_FADE_IN:
+        ret = ncplane_fadein(plane->ncplane_ptr, &ts, cb, &curry);
+        break;
+    case PYNC_FADE_OUT:
+        ret = ncplane_fadeout(plane->ncplane_ptr, &ts, cb, &curry);
+        break;
+    case PYNC_FADE_PULSE:
+        ret = ncplane_pulse(plane->ncplane_ptr, &ts, cb, &curry);
+        break;
+    }
+    Py_END_ALLOW_THREADS;
+
+    if (PyErr_Occurred())
+    {
+        return NULL;
+    }
+    if (ret < 0)
+    {
+        PyErr_Format(PyExc_RuntimeError, "Notcurses returned error %i", ret);
+        return NULL;
+    }
+    // A fader stopping the fade is not an error, its value is returned.
+    return PyLong_FromLong(ret);
+}
+
+// NcFadeCtx
+
+static void
+NcFadeCtx_dealloc(NcFadeCtxObject *self)
+{
+    ncfadectx_free(self->ncfadectx_ptr);
+    Py_XDECREF(self->plane);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+PyObject *
+NcFadeCtx_setup(NcPlaneObject *plane)
+{
+    struct ncfadectx *ctx = ncfadectx_setup(plane->ncplane_ptr);
+    if (NULL == ctx)
+    {
+        PyErr_SetString(PyExc_RuntimeError, notcurses_canfade(ncplane_notcurses(plane->ncplane_ptr)) ? "Failed to set up fade" : "Terminal can't fade");
+        return NULL;
+    }
+
+    NcFadeCtxObject *self = PyObject_New(NcFadeCtxObject, &NcFadeCtx_Type);
+    if (NULL == self)
+    {
+        ncfadectx_free(ctx);
+        return NULL;
+    }
+    Py_INCREF(plane);
+    self->plane = plane;
+    self->ncfadectx_ptr = ctx;
+
+    return (PyObject *)self;
+}
+
+int NcFadeCtx_iteration(NcFadeCtxObject *self, NcPlaneObject *plane, int iteration, bool fade_in)
+{
+    if (plane != self->plane)
+    {
+        PyErr_SetString(PyExc_ValueError, "NcFadeCtx was set up for another plane");
+        return -1;
+    }
+    if (iteration < 0 || iteration > ncfadectx_iterations(self->ncfadectx_ptr))
+    {
+        PyErr_Format(PyExc_ValueError, "iteration must be between 0 and %d", ncfadectx_iterations(self->ncfadectx_ptr));
+        return -1;
+    }
+
+    int const ret = fade_in ? ncplane_fadein_iteration(plane->ncplane_ptr, self->ncfadectx_ptr, iteration, fade_noop, NULL)
+                            : ncplane_fadeout_iteration(plane->ncplane_ptr, self->ncfadectx_ptr, iteration, fade_noop, NULL);
+    if (ret < 0)
+    {
+        PyErr_Format(PyExc_RuntimeError, "Notcurses returned error %i", ret);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+NcFadeCtx_get_iterations(NcFadeCtxObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromLong(ncfadectx_iterations(self->ncfadectx_ptr));
+}
+
+static PyGetSetDef NcFadeCtx_getset[] = {
+    {"iterations", (getter)NcFadeCtx_get_iterations, NULL, PyDoc_STR("Number of iterations through which the context fades."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcFadeCtx_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcFadeCtx",
+    .tp_doc = "Colors of a plane saved by NcPlane.fade_setup(), for NcPlane.fadein_iteration() and NcPlane.fadeout_iteration().",
+    .tp_basicsize = sizeof(NcFadeCtxObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)NcFadeCtx_dealloc,
+    .tp_getset = NcFadeCtx_getset,
+};
+
+// NcFader
+
+typedef struct
+{
+    PyObject_HEAD;
+    NcPlaneObject *plane;
+    // NULL if the terminal can't fade.
+    struct ncfadectx *ctx;
+    enum pync_fade_mode mode;
+    double duration;
+    double start;
+    int iterations;
+    // Last iteration applied, -1 before the first.
+    int applied;
+    bool applied_in;
+    bool done;
+} NcFaderObject;
+
+static int
+fader_apply(NcFaderObject *self, int iteration, bool fade_in)
+{
+    struct ncplane *n = self->plane->ncplane_ptr;
+    int const ret = fade_in ? ncplane_fadein_iteration(n, self->ctx, iteration, fade_noop, NULL)
+                            : ncplane_fadeout_iteration(n, self->ctx, iteration, fade_noop, NULL);
+    if (ret < 0)
+    {
+        PyErr_Format(PyExc_RuntimeError, "Notcurses returned error %i", ret);
+        return -1;
+    }
+
+    self->applied = iteration;
+    self->applied_in = fade_in;
+    return 0;
+}
+
+static PyObject *
+NcFader_new(PyTypeObject *subtype, PyObject *args, PyObject *kwds)
+{
+    PyObject *plane_arg = NULL;
+    double duration = 0;
+    const char *mode_str = "out";
+
+    char *keywords[] = {"plane", "duration", "mode", NULL};
+
+    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "O!d|s", keywords,
+                                                  &NcPlane_Type, &plane_arg,
+                                                  &duration, &mode_str));
+
+    NcPlaneObject *plane = (NcPlaneObject *)plane_arg;
+    CHECK_NCPLANE(plane);
+
+    enum pync_fade_mode mode;
+    if (0 == strcmp(mode_str, "in"))
+    {
+        mode = PYNC_FADE_IN;
+    }
+    else if (0 == strcmp(mode_str, "out"))
+    {
+        mode = PYNC_FADE_OUT;
+    }
+    else if (0 == strcmp(mode_str, "pulse"))
+    {
+        mode = PYNC_FADE_PULSE;
+    }
+    else
+    {
+        PyErr_Format(PyExc_ValueError, "mode must be 'in', 'out' or 'pulse', not '%s'", mode_str);
+        return NULL;
+    }
+    if (duration < 0 || (PYNC_FADE_PULSE == mode && duration <= 0))
+    {
+        PyErr_SetString(PyExc_ValueError, "duration must be positive");
+        return NULL;
+    }
+
+    NcFaderObject *self = (NcFaderObject *)subtype->tp_alloc(subtype, 0);
+    if (NULL == self)
+    {
+        return NULL;
+    }
+    Py_INCREF(plane);
+    self->plane = plane;
+    self->mode = mode;
+    self->duration = duration;
+    self->start = pync_monotonic();
+    self->applied = -1;
+
+    // Without fade support the plane is left as it is.
+    if (notcurses_canfade(ncplane_notcurses(plane->ncplane_ptr)))
+    {
+        self->ctx = ncfadectx_setup(plane->ncplane_ptr);
+        if (NULL == self->ctx)
+        {
+            Py_DECREF(self);
+            PyErr_SetString(PyExc_RuntimeError, "Failed to set up fade");
+            return NULL;
+        }
+        self->iterations = ncfadectx_iterations(self->ctx);
+    }
+    if (NULL == self->ctx)
+    {
+        self->done = true;
+        return (PyObject *)self;
+    }
+
+    // Fading in starts from black, before the first frame is rendered.
+    if (PYNC_FADE_OUT != mode && fader_apply(self, 0, true) < 0)
+    {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    return (PyObject *)self;
+}
+
+static void
+NcFader_dealloc(NcFaderObject *self)
+{
+    ncfadectx_free(self->ctx);
+    Py_XDECREF(self->plane);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcFader_step(NcFaderObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs > 1)
+    {
+        PyErr_Format(PyExc_TypeError, "step expected at most 1 argument, got %zd", nargs);
+        return NULL;
+    }
+    if (self->done)
+    {
+        Py_RETURN_FALSE;
+    }
+    CHECK_NCPLANE(self->plane);
+
+    double now = pync_monotonic();
+    if (1 == nargs && Py_None != args[0])
+    {
+        now = PyFloat_AsDouble(args[0]);
+        if (PyErr_Occurred())
+        {
+            return NULL;
+        }
+    }
+
+    double const elapsed = fmax(now - self->start, 0.0);
+    double fraction = 1.0;
+    bool fade_in = PYNC_FADE_IN == self->mode;
+
+    if (PYNC_FADE_PULSE == self->mode)
+    {
+        // Fade in during the first half period, out during the second.
+        double const position = fmod(elapsed, 2 * self->duration);
+        fade_in = position < self->duration;
+        fraction = (fade_in ? position : position - self->duration) / self->duration;
+    }
+    else if (elapsed < self->duration)
+    {
+        fraction = elapsed / self->duration;
+    }
+    else
+    {
+        self->done = true;
+    }
+
+    int const iteration = (int)fmin(fraction * self->iterations, self->iterations);
+    if (iteration == self->applied && fade_in == self->applied_in)
+    {
+        Py_RETURN_FALSE;
+    }
+
+    GNU_PY_CHECK_INT(fader_apply(self, iteration, fade_in));
+    Py_RETURN_TRUE;
+}
+
+static PyObject *
+NcFader_cancel(NcFaderObject *self, PyObject *Py_UNUSED(args))
+{
+    if (!self->done && NULL != self->ctx && NULL != self->plane->ncplane_ptr)
+    {
+        GNU_PY_CHECK_INT(fader_apply(self, self->iterations, true));
+    }
+    self->done = true;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcFader_get_done(NcFaderObject *self, void *Py_UNUSED(closure))
+{
+    return PyBool_FromLong((long)self->done);
+}
+
+static PyObject *
+NcFader_get_plane(NcFaderObject *self, void *Py_UNUSED(closure))
+{
+    Py_INCREF(self->plane);
+    return (PyObject *)self->plane;
+}
+
+static PyMethodDef NcFader_methods[] = {
+    {"step", (void *)NcFader_step, METH_FASTCALL, PyDoc_STR("Recolor the plane for time 'now' (time.monotonic() seconds, default the current time). Returns True if the plane changed and needs a render, it does not render. Cheap when nothing changed.")},
+    {"cancel", (PyCFunction)NcFader_cancel, METH_NOARGS, PyDoc_STR("Stop the fade and restore the colors the plane had when the fader was created.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcFader_getset[] = {
+    {"done", (getter)NcFader_get_done, NULL, PyDoc_STR("True once the fade is over or cancelled. A pulse only ends when cancelled."), NULL},
+    {"plane", (getter)NcFader_get_plane, NULL, PyDoc_STR("The faded plane."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcFader_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcFader",
+    .tp_doc = "Fade of a plane over 'duration' seconds, advanced by step() once per frame. 'mode' is 'in', 'out' or 'pulse' (fade in and out with 'duration' as half period, until cancelled). Fading in turns the plane black at once. If the terminal can't fade, the fader is done at once and the plane is left unchanged.",
+    .tp_basicsize = sizeof(NcFaderObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcFader_new,
+    .tp_dealloc = (destructor)NcFader_dealloc,
+    .tp_methods = NcFader_methods,
+    .tp_getset = NcFader_getset,
+};
@@ -70,6 +70,10 @@ pync_meth_box(PyObject* Py_UNUSED(self), PyObject* args, PyObject* kwargs) {
     return NULL;
   uint64_t const channels = (uint64_t) fg << 32 | bg;
 
+  if (plane_arg->ncplane_ptr == NULL) {
+    PyErr_SetString(PyExc_RuntimeError, "NcPlane has been destroyed");
+    return NULL;
+  }
   struct ncplane* const plane = plane_arg->ncplane_ptr;
 
   if (!notcurses_canutf8(ncplane_notcurses(plane)))
@@ -108,12 +112,11 @@ pync_meth_box(PyObject* Py_UNUSED(self), PyObject* args, PyObject* kwargs) {
 }
 
 static PyObject*
-pync_meth_rgb(PyObject* Py_UNUSED(self), PyObject* args) {
-  int r;
-  int g;
-  int b;
-  if (!PyArg_ParseTuple(args, "iii", &r, &g, &b))
-    return NULL;
+pync_meth_rgb(PyObject* Py_UNUSED(self), PyObject* const* args, Py_ssize_t nargs) {
+  GNU_PY_CHECK_NARGS("rgb", nargs, 3, 3);
+  int const r = GNU_PY_ARG_INT(args[0]);
+  int const g = GNU_PY_ARG_INT(args[1]);
+  int const b = GNU_PY_ARG_INT(args[2]);
 
   if ((r & ~0xff) == 0 && (g & ~0xff) == 0 && (b & ~0xff) == 0)
     return PyLong_FromLong(
@@ -134,7 +137,7 @@ struct PyMethodDef pync_methods[] = {
     {
       "rgb",
       (void*) pync_meth_rgb,
-      METH_VARARGS,
+      METH_FASTCALL,
       "FIXME: Docs."
     },
     {NULL, NULL, 0, NULL}
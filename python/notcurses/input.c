@@ -0,0 +1,259 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+// Events are kept as the plain C struct, Python objects for the fields are
+// only created when a field is read. Freed events are recycled, so input
+// storms do not hit the allocator at all.
+
+#define NCINPUT_FREELIST_SIZE 256
+#define NCINPUT_FIELD_COUNT 8
+
+static NcInputObject *ncinput_freelist[NCINPUT_FREELIST_SIZE];
+static int ncinput_numfree = 0;
+
+PyObject *
+NcInput_from_ncinput(const ncinput *ni)
+{
+    NcInputObject *self = NULL;
+
+    if (ncinput_numfree > 0)
+    {
+        self = ncinput_freelist[--ncinput_numfree];
+        (void)PyObject_Init((PyObject *)self, &NcInput_Type);
+    }
+    else
+    {
+        self = PyObject_New(NcInputObject, &NcInput_Type);
+        if (NULL == self)
+        {
+            return NULL;
+        }
+    }
+
+    self->ncinput = *ni;
+    self->utf8 = NULL;
+
+    return (PyObject *)self;
+}
+
+void NcInput_clear_freelist(void)
+{
+    while (ncinput_numfree > 0)
+    {
+        PyObject_Free(ncinput_freelist[--ncinput_numfree]);
+    }
+}
+
+static void
+NcInput_dealloc(NcInputObject *self)
+{
+    Py_CLEAR(self->utf8);
+
+    if (ncinput_numfree < NCINPUT_FREELIST_SIZE)
+    {
+        ncinput_freelist[ncinput_numfree++] = self;
+    }
+    else
+    {
+        PyObject_Free(self);
+    }
+}
+
+static PyObject *
+NcInput_get_utf8(NcInputObject *self, void *Py_UNUSED(closure))
+{
+    if (NULL == self->utf8)
+    {
+        self->utf8 = GNU_PY_CHECK(PyUnicode_FromStringAndSize(self->ncinput.utf8, (Py_ssize_t)strnlen(self->ncinput.utf8, sizeof(self->ncinput.utf8))));
+    }
+
+    Py_INCREF(self->utf8);
+    return self->utf8;
+}
+
+static PyObject *
+NcInput_get_field(NcInputObject *self, Py_ssize_t index)
+{
+    const ncinput *ni = &self->ncinput;
+
+    switch (index)
+    {
+    case 0:
+        return PyLong_FromUnsignedLong(ni->id);
+    case 1:
+        return PyLong_FromLong(ni->y);
+    case 2:
+        return PyLong_FromLong(ni->x);
+    case 3:
+        return NcInput_get_utf8(self, NULL);
+    case 4:
+        return PyLong_FromLong(ni->evtype);
+    case 5:
+        return PyLong_FromUnsignedLong(ni->modifiers);
+    case 6:
+        return PyLong_FromLong(ni->ypx);
+    case 7:
+        return PyLong_FromLong(ni->xpx);
+    default:
+        PyErr_SetString(PyExc_IndexError, "NcInput index out of range");
+        return NULL;
+    }
+}
+
+static PyObject *
+NcInput_getter(NcInputObject *self, void *closure)
+{
+    return NcInput_get_field(self, (Py_ssize_t)(intptr_t)closure);
+}
+
+static Py_ssize_t
+NcInput_length(NcInputObject *Py_UNUSED(self))
+{
+    return NCINPUT_FIELD_COUNT;
+}
+
+static PyObject *
+NcInput_repr(NcInputObject *self)
+{
+    const ncinput *ni = &self->ncinput;
+    PyObject *utf8 CLEANUP_PY_OBJ = GNU_PY_CHECK(NcInput_get_utf8(self, NULL));
+
+    return PyUnicode_FromFormat("notcurses.NcInput(id=%u, y=%d, x=%d, utf8=%R, evtype=%d, modifiers=%u, ypx=%d, xpx=%d)",
+                                ni->id, ni->y, ni->x, utf8, (int)ni->evtype, ni->modifiers, ni->ypx, ni->xpx);
+}
+
+static PyObject *
+NcInput_as_tuple(NcInputObject *self)
+{
+    PyObject *tuple = GNU_PY_CHECK(PyTuple_New(NCINPUT_FIELD_COUNT));
+    for (Py_ssize_t i = 0; i < NCINPUT_FIELD_COUNT; i++)
+    {
+        PyObject *field = NcInput_get_field(self, i);
+        if (NULL == field)
+        {
+            Py_DECREF(tuple);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(tuple, i, field);
+    }
+    return tuple;
+}
+
+static PyObject *
+NcInput_subscript(NcInputObject *self, PyObject *key)
+{
+    if (PyIndex_Check(key))
+    {
+        Py_ssize_t index = PyNumber_AsSsize_t(key, PyExc_IndexError);
+        if (-1 == index && NULL != PyErr_Occurred())
+        {
+            return NULL;
+        }
+        return NcInput_get_field(self, index < 0 ? index + NCINPUT_FIELD_COUNT : index);
+    }
+
+    PyObject *tuple CLEANUP_PY_OBJ = GNU_PY_CHECK(NcInput_as_tuple(self));
+    return PyObject_GetItem(tuple, key);
+}
+
+static Py_hash_t
+NcInput_hash(NcInputObject *self)
+{
+    // Equal to the tuple of its fields, so it must hash the same.
+    PyObject *tuple CLEANUP_PY_OBJ = NcInput_as_tuple(self);
+    if (NULL == tuple)
+    {
+        return -1;
+    }
+    return PyObject_Hash(tuple);
+}
+
+static PyObject *
+NcInput_richcompare(NcInputObject *self, PyObject *other, int op)
+{
+    bool const other_is_input = PyObject_TypeCheck(other, &NcInput_Type);
+    if (!other_is_input && !PyTuple_Check(other))
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    if (!other_is_input || (op != Py_EQ && op != Py_NE))
+    {
+        // Compares like the tuple of its fields, as the former struct
+        // sequence did.
+        PyObject *tuple CLEANUP_PY_OBJ = GNU_PY_CHECK(NcInput_as_tuple(self));
+        PyObject *other_tuple CLEANUP_PY_OBJ = NULL;
+        if (other_is_input)
+        {
+            other_tuple = GNU_PY_CHECK(NcInput_as_tuple((NcInputObject *)other));
+            other = other_tuple;
+        }
+        return PyObject_RichCompare(tuple, other, op);
+    }
+
+    const ncinput *a = &self->ncinput;
+    const ncinput *b = &((NcInputObject *)other)->ncinput;
+    bool equal = a->id == b->id && a->y == b->y && a->x == b->x &&
+                 0 == strncmp(a->utf8, b->utf8, sizeof(a->utf8)) &&
+                 a->evtype == b->evtype && a->modifiers == b->modifiers &&
+                 a->ypx == b->ypx && a->xpx == b->xpx;
+
+    return PyBool_FromLong((long)(equal == (op == Py_EQ)));
+}
+
+static PyGetSetDef NcInput_getset[] = {
+    {"id", (getter)NcInput_getter, NULL, PyDoc_STR("Unicode codepoint or synthesized NCKEY event"), (void *)0},
+    {"y", (getter)NcInput_getter, NULL, PyDoc_STR("y cell coordinate of event, -1 for undefined"), (void *)1},
+    {"x", (getter)NcInput_getter, NULL, PyDoc_STR("x cell coordinate of event, -1 for undefined"), (void *)2},
+    {"utf8", (getter)NcInput_get_utf8, NULL, PyDoc_STR("utf8 representation, if one exists"), NULL},
+    // Note: alt, shift, ctrl fields deprecated in C API are omitted.
+    {"evtype", (getter)NcInput_getter, NULL, NULL, (void *)4},
+    {"modifiers", (getter)NcInput_getter, NULL, PyDoc_STR("bitmask over NCKEY_MOD_*"), (void *)5},
+    {"ypx", (getter)NcInput_getter, NULL, PyDoc_STR("y pixel offset within cell, -1 for undefined"), (void *)6},
+    {"xpx", (getter)NcInput_getter, NULL, PyDoc_STR("x pixel offset within cell, -1 for undefined"), (void *)7},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+// Indexing, slicing, unpacking, hashing and comparing with tuples keep
+// working as with the former struct sequence.
+static PySequenceMethods NcInput_as_sequence = {
+    .sq_length = (lenfunc)NcInput_length,
+    .sq_item = (ssizeargfunc)NcInput_get_field,
+};
+
+static PyMappingMethods NcInput_as_mapping = {
+    .mp_length = (lenfunc)NcInput_length,
+    .mp_subscript = (binaryfunc)NcInput_subscript,
+};
+
+PyTypeObject NcInput_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcInput",
+    .tp_doc = "Notcurses input event",
+    .tp_basicsize = sizeof(NcInputObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)NcInput_dealloc,
+    .tp_repr = (reprfunc)NcInput_repr,
+    .tp_hash = (hashfunc)NcInput_hash,
+    .tp_richcompare = (richcmpfunc)NcInput_richcompare,
+    .tp_getset = NcInput_getset,
+    .tp_as_sequence = &NcInput_as_sequence,
+    .tp_as_mapping = &NcInput_as_mapping,
+};
@@ -0,0 +1,428 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+#include <structmember.h>
+
+// Instrumentation replaces the methods of Notcurses and NcPlane and the
+// channel functions with wrappers counting calls and time. Disabling it puts
+// the original objects back, so nothing is left on the call path when off.
+// Wrappers are kept in a registry by qualified name and keep their counts
+// across enable/disable.
+
+typedef struct
+{
+    PyObject_HEAD;
+    PyObject *wrapped;
+    PyObject *name;
+    unsigned long long calls;
+    double time;
+    double max;
+} NcInstrumentedObject;
+
+static PyTypeObject NcInstrumented_Type;
+
+static PyObject *instrument_registry = NULL;
+static bool instrument_on = false;
+
+static struct
+{
+    PyTypeObject *type;
+    const char *name;
+} instrumented_types[] = {
+    {&Notcurses_Type, "Notcurses"},
+    {&NcPlane_Type, "NcPlane"},
+};
+
+static void
+NcInstrumented_dealloc(NcInstrumentedObject *self)
+{
+    Py_XDECREF(self->wrapped);
+    Py_XDECREF(self->name);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcInstrumented_call(NcInstrumentedObject *self, PyObject *args, PyObject *kwargs)
+{
+    double const start = pync_monotonic();
+    PyObject *ret = PyObject_Call(self->wrapped, args, kwargs);
+    double const elapsed = pync_monotonic() - start;
+
+    self->calls++;
+    self->time += elapsed;
+    if (elapsed > self->max)
+    {
+        self->max = elapsed;
+    }
+
+    return ret;
+}
+
+static PyObject *
+NcInstrumented_descr_get(PyObject *self, PyObject *obj, PyObject *Py_UNUSED(type))
+{
+    if (NULL == obj || Py_None == obj)
+    {
+        Py_INCREF(self);
+        return self;
+    }
+
+    return PyMethod_New(self, obj);
+}
+
+static PyObject *
+NcInstrumented_get_doc(NcInstrumentedObject *self, void *Py_UNUSED(closure))
+{
+    return PyObject_GetAttrString(self->wrapped, "__doc__");
+}
+
+static PyObject *
+NcInstrumented_repr(NcInstrumentedObject *self)
+{
+    return PyUnicode_FromFormat("<instrumented %U>", self->name);
+}
+
+static PyMemberDef NcInstrumented_members[] = {
+    {"__wrapped__", T_OBJECT, offsetof(NcInstrumentedObject, wrapped), READONLY, PyDoc_STR("The instrumented method or function.")},
+    {"__name__", T_OBJECT, offsetof(NcInstrumentedObject, name), READONLY, PyDoc_STR("Qualified name used in instrument_snapshot().")},
+    {NULL, 0, 0, 0, NULL},
+};
+
+static PyGetSetDef NcInstrumented_getset[] = {
+    {"__doc__", (getter)NcInstrumented_get_doc, NULL, NULL, NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+static PyTypeObject NcInstrumented_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcInstrumented",
+    .tp_doc = "Wrapper counting calls and time of a binding method, installed by instrument_enable().",
+    .tp_basicsize = sizeof(NcInstrumentedObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)NcInstrumented_dealloc,
+    .tp_call = (ternaryfunc)NcInstrumented_call,
+    .tp_descr_get = NcInstrumented_descr_get,
+    .tp_repr = (reprfunc)NcInstrumented_repr,
+    .tp_members = NcInstrumented_members,
+    .tp_getset = NcInstrumented_getset,
+};
+
+// Returns a borrowed wrapper of 'original' registered as 'name'.
+static NcInstrumentedObject *
+instrument_wrapper(PyObject *name, PyObject *original)
+{
+    if (NULL == instrument_registry)
+    {
+        if (PyType_Ready(&NcInstrumented_Type) < 0)
+        {
+            return NULL;
+        }
+        instrument_registry = PyDict_New();
+        if (NULL == instrument_registry)
+        {
+            return NULL;
+        }
+    }
+
+    NcInstrumentedObject *wrapper = (NcInstrumentedObject *)PyDict_GetItemWithError(instrument_registry, name);
+    if (NULL == wrapper)
+    {
+        if (PyErr_Occurred())
+        {
+            return NULL;
+        }
+        wrapper = PyObject_New(NcInstrumentedObject, &NcInstrumented_Type);
+        if (NULL == wrapper)
+        {
+            return NULL;
+        }
+        Py_INCREF(name);
+        wrapper->name = name;
+        wrapper->wrapped = NULL;
+        wrapper->calls = 0;
+        wrapper->time = 0.0;
+        wrapper->max = 0.0;
+        int ret = PyDict_SetItem(instrument_registry, name, (PyObject *)wrapper);
+        Py_DECREF(wrapper);
+        if (ret < 0)
+        {
+            return NULL;
+        }
+    }
+
+    Py_INCREF(original);
+    Py_XSETREF(wrapper->wrapped, original);
+    return wrapper;
+}
+
+static int
+instrument_type(PyTypeObject *type, const char *type_name)
+{
+    PyObject *key = NULL, *value = NULL;
+    Py_ssize_t pos = 0;
+
+    // Replacing values of existing keys is allowed while iterating. Only
+    // plain methods are wrapped, not slots, getters or class methods.
+    while (PyDict_Next(type->tp_dict, &pos, &key, &value))
+    {
+        if (Py_TYPE(value) != &PyMethodDescr_Type)
+        {
+            continue;
+        }
+        PyObject *name CLEANUP_PY_OBJ = PyUnicode_FromFormat("%s.%U", type_name, key);
+        if (NULL == name)
+        {
+            return -1;
+        }
+        NcInstrumentedObject *wrapper = instrument_wrapper(name, value);
+        int const ret = NULL == wrapper ? -1 : PyDict_SetItem(type->tp_dict, key, (PyObject *)wrapper);
+        // The attribute cache of the type still holds the method.
+        PyType_Modified(type);
+        if (ret < 0)
+        {
+            return -1;
+        }
+    }
+
+    return 0;
+}
+
+static int
+uninstrument_type(PyTypeObject *type)
+{
+    PyObject *key = NULL, *value = NULL;
+    Py_ssize_t pos = 0;
+
+    while (PyDict_Next(type->tp_dict, &pos, &key, &value))
+    {
+        if (Py_TYPE(value) != &NcInstrumented_Type)
+        {
+            continue;
+        }
+        int const ret = PyDict_SetItem(type->tp_dict, key, ((NcInstrumentedObject *)value)->wrapped);
+        PyType_Modified(type);
+        if (ret < 0)
+        {
+            return -1;
+        }
+    }
+
+    return 0;
+}
+
+// Replaces 'from' by 'to' in the dict of the module if it holds 'from' as
+// 'key'. The notcurses package re-exports the channel functions.
+static int
+replace_in_module(PyObject *module, PyObject *key, PyObject *from, PyObject *to)
+{
+    PyObject *dict = PyModule_GetDict(module);
+    PyObject *current = PyDict_GetItemWithError(dict, key);
+
+    if (NULL == current)
+    {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    if (current != from)
+    {
+        return 0;
+    }
+    return PyDict_SetItem(dict, key, to);
+}
+
+static int
+instrument_functions(PyObject *module, PyObject *package, bool enable)
+{
+    for (PyMethodDef *def = ChannelsFunctions; NULL != def->ml_name; def++)
+    {
+        PyObject *key CLEANUP_PY_OBJ = PyUnicode_FromString(def->ml_name);
+        if (NULL == key)
+        {
+            return -1;
+        }
+        PyObject *current = PyDict_GetItemWithError(PyModule_GetDict(module), key);
+        if (NULL == current)
+        {
+            if (PyErr_Occurred())
+            {
+                return -1;
+            }
+            continue;
+        }
+
+        PyObject *from = NULL, *to = NULL;
+        if (enable && PyCFunction_Check(current))
+        {
+            NcInstrumentedObject *wrapper = instrument_wrapper(key, current);
+            if (NULL == wrapper)
+            {
+                return -1;
+            }
+            from = current;
+            to = (PyObject *)wrapper;
+        }
+        else if (!enable && Py_TYPE(current) == &NcInstrumented_Type)
+        {
+            from = current;
+            to = ((NcInstrumentedObject *)current)->wrapped;
+        }
+        else
+        {
+            continue;
+        }
+
+        // Both wrapper and original outlive the replacement: the wrapper is
+        // held by the registry and holds the original.
+        if (NULL != package && replace_in_module(package, key, from, to) < 0)
+        {
+            return -1;
+        }
+        if (replace_in_module(module, key, from, to) < 0)
+        {
+            return -1;
+        }
+    }
+
+    return 0;
+}
+
+static int
+instrument_set(PyObject *module, bool enable)
+{
+    PyObject *package_name CLEANUP_PY_OBJ = PyUnicode_FromString("notcurses");
+    if (NULL == package_name)
+    {
+        return -1;
+    }
+    PyObject *package CLEANUP_PY_OBJ = PyImport_GetModule(package_name);
+    if (NULL == package && PyErr_Occurred())
+    {
+        return -1;
+    }
+
+    for (size_t i = 0; i < sizeof(instrumented_types) / sizeof(instrumented_types[0]); i++)
+    {
+        int ret = enable ? instrument_type(instrumented_types[i].type, instrumented_types[i].name)
+                         : uninstrument_type(instrumented_types[i].type);
+        if (ret < 0)
+        {
+            return -1;
+        }
+    }
+
+    if (instrument_functions(module, package, enable) < 0)
+    {
+        return -1;
+    }
+
+    instrument_on = enable;
+    return 0;
+}
+
+static PyObject *
+python_instrument_enable(PyObject *self, PyObject *Py_UNUSED(args))
+{
+    if (!instrument_on)
+    {
+        GNU_PY_CHECK_INT(instrument_set(self, true));
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+python_instrument_disable(PyObject *self, PyObject *Py_UNUSED(args))
+{
+    if (instrument_on)
+    {
+        GNU_PY_CHECK_INT(instrument_set(self, false));
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+python_instrument_enabled(PyObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+{
+    return PyBool_FromLong((long)instrument_on);
+}
+
+static PyObject *
+python_instrument_snapshot(PyObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+{
+    PyObject *snapshot CLEANUP_PY_OBJ = GNU_PY_CHECK(PyDict_New());
+
+    if (NULL != instrument_registry)
+    {
+        PyObject *key = NULL, *value = NULL;
+        Py_ssize_t pos = 0;
+
+        while (PyDict_Next(instrument_registry, &pos, &key, &value))
+        {
+            NcInstrumentedObject *wrapper = (NcInstrumentedObject *)value;
+            if (0 == wrapper->calls)
+            {
+                continue;
+            }
+            PyObject *entry CLEANUP_PY_OBJ = GNU_PY_CHECK(Py_BuildValue("{sKsdsd}",
+                                                                        "calls", wrapper->calls,
+                                                                        "time", wrapper->time,
+                                                                        "max", wrapper->max));
+            GNU_PY_CHECK_INT(PyDict_SetItem(snapshot, key, entry));
+        }
+    }
+
+    Py_INCREF(snapshot);
+    return snapshot;
+}
+
+static PyObject *
+python_instrument_reset(PyObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+{
+    if (NULL != instrument_registry)
+    {
+        PyObject *key = NULL, *value = NULL;
+        Py_ssize_t pos = 0;
+
+        while (PyDict_Next(instrument_registry, &pos, &key, &value))
+        {
+            NcInstrumentedObject *wrapper = (NcInstrumentedObject *)value;
+            wrapper->calls = 0;
+            wrapper->time = 0.0;
+            wrapper->max = 0.0;
+        }
+    }
+
+    Py_RETURN_NONE;
+}
+
+void Instrument_clear(void)
+{
+    Py_CLEAR(instrument_registry);
+}
+
+PyMethodDef InstrumentFunctions[] = {
+    {"instrument_enable", (PyCFunction)python_instrument_enable, METH_NOARGS, "Start counting calls and time of the Notcurses and NcPlane methods and of the channel functions. Functions imported by name before enabling are not counted."},
+    {"instrument_disable", (PyCFunction)python_instrument_disable, METH_NOARGS, "Stop counting and restore the plain methods, so instrumentation costs nothing. Counts are kept."},
+    {"instrument_enabled", (PyCFunction)python_instrument_enabled, METH_NOARGS, "Is instrumentation enabled?"},
+    {"instrument_snapshot", (PyCFunction)python_instrument_snapshot, METH_NOARGS, "Return a dict mapping names such as 'NcPlane.putstr_yx' to dicts with the number of 'calls', the total 'time' and the 'max' time of one call, in seconds. Only called methods are listed."},
+    {"instrument_reset", (PyCFunction)python_instrument_reset, METH_NOARGS, "Reset all counts to zero."},
+    {NULL, NULL, 0, NULL},
+};
@@ -27,6 +27,8 @@ Notcurses_module_free(PyObject *Py_UNUSED(self))
 {
     Py_XDECREF(traceback_format_exception);
     Py_XDECREF(new_line_unicode);
+    NcInput_clear_freelist();
+    Instrument_clear();
 }
 
 extern PyMethodDef pync_methods[];
@@ -40,28 +42,6 @@ static struct PyModuleDef NotcursesMiscModule = {
     .m_free = (freefunc)Notcurses_module_free,
 };
 
-static PyStructSequence_Field NcInput_fields[] = {
-    {"id", "Unicode codepoint or synthesized NCKEY event"},
-    {"y", "y cell coordinate of event, -1 for undefined"},
-    {"x", "x cell coordinate of event, -1 for undefined"},
-    {"utf8", "utf8 representation, if one exists"},
-    // Note: alt, shift, ctrl fields deprecated in C API are omitted.
-    {"evtype", NULL},
-    {"modifiers", "bitmask over NCKEY_MOD_*"},
-    {"ypx", "y pixel offset within cell, -1 for undefined"},
-    {"xpx", "x pixel offset within cell, -1 for undefined"},
-    {NULL, NULL},
-};
-
-static struct PyStructSequence_Desc NcInput_desc = {
-    .name = "NcInput",
-    .doc = "Notcurses input event",
-    .fields = NcInput_fields,
-    .n_in_sequence = 8,
-};
-
-PyTypeObject *NcInput_Type;
-
 PyMODINIT_FUNC
 PyInit_notcurses(void)
 {
@@ -70,23 +50,56 @@ PyInit_notcurses(void)
 
     GNU_PY_CHECK_INT(PyModule_AddFunctions(py_module, ChannelsFunctions));
     GNU_PY_CHECK_INT(PyModule_AddFunctions(py_module, MiscFunctions));
+    GNU_PY_CHECK_INT(PyModule_AddFunctions(py_module, InstrumentFunctions));
+
+    // Array versions of the channel functions, importable as notcurses.channels
+    PyObject *channels_module CLEANUP_PY_OBJ = GNU_PY_CHECK(PyModule_Create(&ChannelsArrayModule));
+    GNU_PY_MODULE_ADD_OBJECT(py_module, channels_module, "channels");
+    GNU_PY_CHECK_INT(PyDict_SetItemString(PyImport_GetModuleDict(), "notcurses.channels", channels_module));
 
     // Type ready?
     GNU_PY_TYPE_READY(&Notcurses_Type);
     GNU_PY_TYPE_READY(&NotcursesOptions_Type);
     GNU_PY_TYPE_READY(&NcPlane_Type);
     GNU_PY_TYPE_READY(&NcPlaneOptions_Type);
+    GNU_PY_TYPE_READY(&NcDisplayList_Type);
+    GNU_PY_TYPE_READY(&NcInput_Type);
+    GNU_PY_TYPE_READY(&NcRenderBuffer_Type);
+    GNU_PY_TYPE_READY(&NcRenderSink_Type);
+    GNU_PY_TYPE_READY(&NcStats_Type);
+    GNU_PY_TYPE_READY(&NcFadeCtx_Type);
+    GNU_PY_TYPE_READY(&NcFader_Type);
+    GNU_PY_TYPE_READY(&NcVisual_Type);
+    GNU_PY_TYPE_READY(&NcVideoPlayer_Type);
+    GNU_PY_TYPE_READY(&NcDirect_Type);
+    GNU_PY_TYPE_READY(&NcDirectBatch_Type);
+    GNU_PY_TYPE_READY(&NcChannels_Type);
+    GNU_PY_TYPE_READY(&NcChannelsArray_Type);
+    GNU_PY_TYPE_READY(&NcCell_Type);
+    GNU_PY_TYPE_READY(&NcUplot_Type);
+    GNU_PY_TYPE_READY(&NcDplot_Type);
 
     // Add objects
     GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&Notcurses_Type, "Notcurses");
     GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NotcursesOptions_Type, "NotcursesOptions");
     GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcPlane_Type, "NcPlane");
     GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcPlaneOptions_Type, "NcPlaneOptions");
-
-    NcInput_Type = PyStructSequence_NewType(&NcInput_desc);
-    if (NcInput_Type == NULL)
-        return NULL;
-    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)NcInput_Type, "NcInput");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcDisplayList_Type, "NcDisplayList");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcInput_Type, "NcInput");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcRenderBuffer_Type, "NcRenderBuffer");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcRenderSink_Type, "NcRenderSink");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcStats_Type, "NcStats");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcFadeCtx_Type, "NcFadeCtx");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcFader_Type, "NcFader");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcVisual_Type, "NcVisual");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcVideoPlayer_Type, "NcVideoPlayer");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcDirect_Type, "NcDirect");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcDirectBatch_Type, "NcDirectBatch");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcChannels_Type, "NcChannels");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcChannelsArray_Type, "NcChannelsArray");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcCell_Type, "NcCell");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcUplot_Type, "NcUplot");
+    GNU_PY_MODULE_ADD_OBJECT(py_module, (PyObject *)&NcDplot_Type, "NcDplot");
 
     // background cannot be highcontrast, only foreground
     GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCALPHA_HIGHCONTRAST));
@@ -112,6 +125,47 @@ PyInit_notcurses(void)
     GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCPALETTESIZE));
     // extract these bits to get the background alpha mask
     GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NC_BG_ALPHA_MASK));
+    // set in NcPlane.snapshot() codepoints of cells holding multi-codepoint EGCs
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCPLANE_SNAPSHOT_CLUSTER));
+
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_DEFAULT));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_1x1));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_2x1));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_2x2));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_3x2));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_4x2));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_BRAILLE));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_PIXEL));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_4x1));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCBLIT_8x1));
+
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCSCALE_NONE));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCSCALE_SCALE));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCSCALE_STRETCH));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCSCALE_NONE_HIRES));
+    GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCSCALE_SCALE_HIRES));
+
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCVISUAL_OPTION_NODEGRADE", (long)NCVISUAL_OPTION_NODEGRADE));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCVISUAL_OPTION_BLEND", (long)NCVISUAL_OPTION_BLEND));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCVISUAL_OPTION_HORALIGNED", (long)NCVISUAL_OPTION_HORALIGNED));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCVISUAL_OPTION_VERALIGNED", (long)NCVISUAL_OPTION_VERALIGNED));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCVISUAL_OPTION_ADDALPHA", (long)NCVISUAL_OPTION_ADDALPHA));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCVISUAL_OPTION_CHILDPLANE", (long)NCVISUAL_OPTION_CHILDPLANE));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCVISUAL_OPTION_NOINTERPOLATE", (long)NCVISUAL_OPTION_NOINTERPOLATE));
+
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCDIRECT_OPTION_INHIBIT_SETLOCALE", (long)NCDIRECT_OPTION_INHIBIT_SETLOCALE));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCDIRECT_OPTION_INHIBIT_CBREAK", (long)NCDIRECT_OPTION_INHIBIT_CBREAK));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCDIRECT_OPTION_DRAIN_INPUT", (long)NCDIRECT_OPTION_DRAIN_INPUT));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCDIRECT_OPTION_NO_QUIT_SIGHANDLERS", (long)NCDIRECT_OPTION_NO_QUIT_SIGHANDLERS));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCDIRECT_OPTION_VERBOSE", (long)NCDIRECT_OPTION_VERBOSE));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCDIRECT_OPTION_VERY_VERBOSE", (long)NCDIRECT_OPTION_VERY_VERBOSE));
+
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCPLOT_OPTION_LABELTICKSD", (long)NCPLOT_OPTION_LABELTICKSD));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCPLOT_OPTION_EXPONENTIALD", (long)NCPLOT_OPTION_EXPONENTIALD));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCPLOT_OPTION_VERTICALI", (long)NCPLOT_OPTION_VERTICALI));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCPLOT_OPTION_NODEGRADE", (long)NCPLOT_OPTION_NODEGRADE));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCPLOT_OPTION_DETECTMAXONLY", (long)NCPLOT_OPTION_DETECTMAXONLY));
+    GNU_PY_CHECK_INT(PyModule_AddIntConstant(py_module, "NCPLOT_OPTION_PRINTSAMPLE", (long)NCPLOT_OPTION_PRINTSAMPLE));
 
     GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCKEY_INVALID));
     GNU_PY_CHECK_INT(PyModule_AddIntMacro(py_module, NCKEY_RESIZE));
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Prometheus text exposition of Notcurses stats."""
+
+from __future__ import annotations
+
+import os
+from threading import Event, Thread
+from types import TracebackType
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Type
+
+if TYPE_CHECKING:
+    from .notcurses import NcStats, Notcurses
+
+# Fields describing the current state rather than counting events.
+_STATE_FIELDS = frozenset(('fbbytes', 'planes'))
+
+# Value of the minimum fields until the first frame is recorded.
+_MIN_UNSET = 1 << 62
+
+
+def _is_extreme(name: str) -> bool:
+    return '_max_' in name or '_min_' in name
+
+
+def _escape_label(value: str) -> str:
+    return (value.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+def prometheus_text(stats: NcStats, prefix: str = 'notcurses_',
+                    labels: Optional[Dict[str, str]] = None) -> str:
+    """Format 'stats' in the Prometheus text exposition format.
+
+    Cumulative fields are counters named '<prefix><field>_total', the
+    extremes (such as render_max_ns), fbbytes and planes are gauges.
+    Minimums are left out until a frame has been recorded. Counters
+    restart from zero after Notcurses.stats_reset().
+    """
+    label_text = ''
+    if labels:
+        label_text = '{%s}' % ','.join(
+            f'{key}="{_escape_label(value)}"'
+            for key, value in sorted(labels.items()))
+
+    stats_type = type(stats)
+    lines: List[str] = []
+    for name, value in stats.as_dict().items():
+        if '_min_' in name and value >= _MIN_UNSET:
+            continue
+
+        if _is_extreme(name) or name in _STATE_FIELDS:
+            metric = f'{prefix}{name}'
+            kind = 'gauge'
+        else:
+            metric = f'{prefix}{name}_total'
+            kind = 'counter'
+
+        doc = getattr(stats_type, name).__doc__ or name
+        lines.append(f'# HELP {metric} {doc}')
+        lines.append(f'# TYPE {metric} {kind}')
+        lines.append(f'{metric}{label_text} {value}')
+
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def textfile_writer(path: str) -> Callable[[str], None]:
+    """Return an emit callback replacing 'path' atomically.
+
+    Suited for the textfile collector of the Prometheus node exporter.
+    """
+    def write(text: str) -> None:
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+
+    return write
+
+
+class NcStatsSampler:
+    """Periodic sampler of Notcurses stats.
+
+    Every 'interval' seconds a thread takes a snapshot with
+    Notcurses.stats(), which only copies the stats under their lock,
+    and passes its Prometheus text to 'emit'. The last snapshot, the
+    activity during the last interval and the last text are kept as
+    attributes, for example to be served by an HTTP handler:
+
+        with NcStatsSampler(nc, 15.0, textfile_writer(path)):
+            run_application(nc)
+
+    The sampler must be stopped before the Notcurses context is.
+    Render time regressions are best alerted on with
+    rate(notcurses_render_ns_total) / rate(notcurses_renders_total)
+    and notcurses_render_max_ns.
+    """
+
+    def __init__(self, nc: Notcurses, interval: float = 15.0,
+                 emit: Optional[Callable[[str], None]] = None,
+                 prefix: str = 'notcurses_',
+                 labels: Optional[Dict[str, str]] = None):
+        self._nc = nc
+        self._interval = interval
+        self._emit = emit
+        self._prefix = prefix
+        self._labels = labels
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self.last: Optional[NcStats] = None
+        self.delta: Optional[NcStats] = None
+        self.text = ''
+
+    def sample(self) -> str:
+        """Take a snapshot now and emit it. Returns the text."""
+        stats = self._nc.stats()
+        if self.last is not None:
+            self.delta = stats - self.last
+        self.last = stats
+        self.text = prometheus_text(stats, self._prefix, self._labels)
+        if self._emit is not None:
+            self._emit(self.text)
+        return self.text
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.sample()
+
+    def start(self) -> None:
+        """Take a first sample and start the sampling thread."""
+        if self._thread is not None:
+            return
+
+        self.sample()
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name='NcStatsSampler',
+                              daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and wait for it to exit."""
+        if self._thread is None:
+            return
+
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> NcStatsSampler:
+        self.start()
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.stop()
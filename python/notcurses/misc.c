@@ -35,18 +35,16 @@ python_notcurses_version_components(PyObject *Py_UNUSED(self), PyObject *Py_UNUS
 }
 
 static PyObject *
-python_ncstrwidth(PyObject *Py_UNUSED(self), PyObject *args)
+python_ncstrwidth(PyObject *Py_UNUSED(self), PyObject *arg)
 {
-    const char *s = NULL;
+    const char *s = GNU_PY_ARG_STR(arg);
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "s", &s, NULL, NULL));
-
-    return Py_BuildValue("i", ncstrwidth(s, NULL, NULL));
+    return PyLong_FromLong(ncstrwidth(s, NULL, NULL));
 }
 
 PyMethodDef MiscFunctions[] = {
     {"notcurses_version", (PyCFunction)python_notcurses_version, METH_NOARGS, "Get a human-readable string describing the running Notcurses version."},
     {"notcurses_version_components", (PyCFunction)python_notcurses_version_components, METH_NOARGS, "Get a tuple of major, minor, patch, tweak integer of the running Notcurses version."},
-    {"ncstrwidth", (PyCFunction)python_ncstrwidth, METH_VARARGS, "Returns the number of columns occupied by a string, or -1 if a non-printable/illegal character is encountered."},
+    {"ncstrwidth", (PyCFunction)python_ncstrwidth, METH_O, "Returns the number of columns occupied by a string, or -1 if a non-printable/illegal character is encountered."},
     {NULL, NULL, 0, NULL},
 };
@@ -17,17 +17,76 @@ limitations under the License.
 #pragma once
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#include <stddef.h>
 #include <notcurses/notcurses.h>
 #include <notcurses/direct.h>
 
 // Define classes
 
+// State of the render scheduler, see Notcurses.request_render(). Times are
+// CLOCK_MONOTONIC seconds.
+struct pync_render_schedule
+{
+    double min_interval;
+    double last_frame;
+    double dirty_since;
+    double last_render_time;
+    bool dirty;
+    unsigned long long requests;
+    unsigned long long frames;
+    unsigned long long coalesced;
+    unsigned long long dropped;
+    // Called with render_stats() after every scheduled frame.
+    PyObject *hook;
+    // Called when the screen becomes dirty.
+    PyObject *waker;
+};
+
+// Frame tracer, see Notcurses.trace_start(). Spans are kept in a ring buffer
+// of 'capacity' spans, 'head' is the next one written.
+struct pync_trace_span
+{
+    PyObject *name;
+    double start;
+    double duration;
+    unsigned long thread;
+};
+
+struct pync_trace
+{
+    struct pync_trace_span *spans;
+    size_t capacity;
+    size_t head;
+    size_t count;
+    unsigned long long dropped;
+    // End of the last traced frame, start of the next "draw" span.
+    double frame_end;
+    bool enabled;
+};
+
 typedef struct
 {
     PyObject_HEAD;
     struct notcurses *notcurses_ptr;
+    // Output file opened by the binding, closed after notcurses_stop().
+    FILE *owned_fp;
+    // LC_CTYPE replaced by headless(), restored after notcurses_stop().
+    char *saved_ctype;
+    struct pync_render_schedule render;
+    struct pync_trace trace;
+    // get_many() failed after reading events, raised by its next call.
+    bool input_error;
 } NotcursesObject;
 
+// Renders and/or rasterizes the pile with the GIL released, recording the
+// phases if tracing is enabled. Returns -1 with an exception set on errors.
+int pync_render_pile(NotcursesObject *nc, struct ncplane *pile, bool render, bool rasterize);
+int pync_trace_start(struct pync_trace *t, size_t capacity);
+void pync_trace_add(struct pync_trace *t, PyObject *name, double start, double end);
+PyObject *pync_trace_spans(struct pync_trace *t);
+void pync_trace_clear(struct pync_trace *t);
+void pync_trace_free(struct pync_trace *t);
+
 extern PyTypeObject Notcurses_Type;
 
 typedef struct
@@ -38,14 +97,28 @@ typedef struct
 
 extern PyTypeObject NotcursesOptions_Type;
 
-typedef struct
+// There is at most one NcPlaneObject per ncplane, found through a table keyed
+// by the plane. The plane userptr is left alone, as library widgets use it.
+// Use NcPlane_wrap() instead of allocating one directly.
+typedef struct NcPlaneObject
 {
     PyObject_HEAD;
+    // NULL once the plane was destroyed.
     struct ncplane *ncplane_ptr;
+    // Owning Notcurses object, kept alive as long as the wrapper.
+    PyObject *notcurses_obj;
+    PyObject *weakreflist;
+    struct NcPlaneObject *registry_prev;
+    struct NcPlaneObject *registry_next;
 } NcPlaneObject;
 
 extern PyTypeObject NcPlane_Type;
 
+PyObject *NcPlane_wrap(struct ncplane *ncplane_ptr, PyObject *notcurses_obj);
+void NcPlane_invalidate_planes(PyObject *notcurses_obj, const struct ncplane *keep);
+// Mark the wrapper as destroyed. Must be called before the library frees the plane.
+void NcPlane_forget(NcPlaneObject *plane);
+
 typedef struct
 {
     PyObject_HEAD;
@@ -54,18 +127,94 @@ typedef struct
 
 extern PyTypeObject NcPlaneOptions_Type;
 
+struct ncdisplaylist_op;
+
+typedef struct
+{
+    PyObject_HEAD;
+    struct ncdisplaylist_op *ops;
+    Py_ssize_t len;
+    Py_ssize_t alloc;
+} NcDisplayListObject;
+
+extern PyTypeObject NcDisplayList_Type;
+
+int NcDisplayList_replay(NcDisplayListObject *self, struct ncplane *n);
+
+typedef struct
+{
+    PyObject_HEAD;
+    char *data;
+    size_t len;
+    size_t alloc;
+    Py_ssize_t exports;
+    bool rendering;
+    unsigned long long frames;
+} NcRenderBufferObject;
+
+extern PyTypeObject NcRenderBuffer_Type;
+
+int NcRenderBuffer_render(NcRenderBufferObject *self, NcPlaneObject *plane);
+
+extern PyTypeObject NcRenderSink_Type;
+
+typedef struct
+{
+    PyObject_HEAD;
+    struct ncvisual *ncvisual_ptr;
+} NcVisualObject;
+
+extern PyTypeObject NcVisual_Type;
+
+// Takes ownership of 'ncvisual_ptr', destroying it on failure.
+PyObject *NcVisual_wrap(struct ncvisual *ncvisual_ptr);
+
+extern PyTypeObject NcVideoPlayer_Type;
+
+// Stop the players of 'nc' and forget their planes. Must be called before
+// the library frees every pile.
+void NcVideoPlayer_drop_planes(const struct notcurses *nc);
+
+extern PyTypeObject NcChannels_Type;
+extern PyTypeObject NcChannelsArray_Type;
+
+// New NcChannelsArray of 'len' uninitialized items, stored at '*data'.
+PyObject *NcChannelsArray_alloc(Py_ssize_t len, uint64_t **data);
+
+extern PyTypeObject NcDirect_Type;
+extern PyTypeObject NcDirectBatch_Type;
+
+extern PyTypeObject NcUplot_Type;
+extern PyTypeObject NcDplot_Type;
+
+// The plot owns its plane: destroying either destroys both. The library
+// keeps the sample window private, so it is mirrored here to let
+// add_samples() skip samples the batch itself pushes out of the window.
+typedef struct
+{
+    NcPlaneObject *plane;
+    int64_t slotx; // newest x
+    int64_t slotcount;
+} NcPlotWindow;
+
 typedef struct
 {
     PyObject_HEAD;
     struct ncuplot *ncuplot_ptr;
+    NcPlotWindow window;
 } NcUplotObject;
 
 typedef struct
 {
     PyObject_HEAD;
     struct ncdplot *ncdplot_ptr;
+    NcPlotWindow window;
 } NcDplotObject;
 
+// Both take ownership of the plane of 'plane', which is destroyed on failure.
+PyObject *NcUplot_create(NcPlaneObject *plane, const ncplot_options *opts, uint64_t miny, uint64_t maxy);
+PyObject *NcDplot_create(NcPlaneObject *plane, const ncplot_options *opts, double miny, double maxy);
+
 typedef struct
 {
     PyObject_HEAD;
@@ -106,8 +255,13 @@ typedef struct
 {
     PyObject_HEAD;
     struct ncfadectx *ncfadectx_ptr;
+    // Plane the colors were saved from.
+    NcPlaneObject *plane;
 } NcFadeCtxObject;
 
+extern PyTypeObject NcFadeCtx_Type;
+extern PyTypeObject NcFader_Type;
+
 typedef struct
 {
     PyObject_HEAD;
@@ -132,25 +286,85 @@ typedef struct
     struct nctabbed *nctabbed_ptr;
 } NcTabbedObject;
 
+// EGCs of up to four bytes are stored inline in 'nccell', longer ones in
+// 'egc', with a zero gcluster. Cells are thus not bound to any plane.
 typedef struct
 {
     PyObject_HEAD;
     struct nccell nccell;
+    PyObject *egc;
 } NcCellObject;
 
+extern PyTypeObject NcCell_Type;
+
+// Wrap 'c', read from 'n', releasing it.
+PyObject *NcCell_from_plane(struct ncplane *n, nccell *c);
+// Load 'cell' into 'out', bound to 'n'. Release 'out' with nccell_release().
+int NcCell_load(const NcCellObject *cell, struct ncplane *n, nccell *out);
+// Put 'cell' at 'y', 'x' of 'n'. Returns the columns advanced, or -1 without
+// setting an exception. Does not touch Python objects.
+int NcCell_put(const NcCellObject *cell, struct ncplane *n, int y, int x);
+
+// Copy of an NcCell holding its own reference to the EGC, so it can be put
+// without the GIL while other threads assign to the cell.
+typedef struct
+{
+    struct nccell nccell;
+    PyObject *egc;
+} NcCellSnapshot;
+
+// Take a snapshot of 'cell'. Release it with NcCellSnapshot_release().
+void NcCell_snapshot(const NcCellObject *cell, NcCellSnapshot *out);
+// Drop the EGC reference of 'snapshot', needs the GIL.
+void NcCellSnapshot_release(NcCellSnapshot *snapshot);
+// Like NcCell_put(), callable without the GIL.
+int NcCellSnapshot_put(const NcCellSnapshot *snapshot, struct ncplane *n, int y, int x);
+
 typedef struct
 {
     PyObject_HEAD;
     struct ncstats ncstats;
 } NcStatsObject;
 
+enum pync_fade_mode
+{
+    PYNC_FADE_IN,
+    PYNC_FADE_OUT,
+    PYNC_FADE_PULSE,
+};
+
+// Runs a blocking fade, calling 'fader' (plane, deadline) every iteration if
+// it is not None.
+PyObject *NcFade_run(NcPlaneObject *plane, enum pync_fade_mode mode, PyObject *duration_arg, PyObject *fader);
+PyObject *NcFadeCtx_setup(NcPlaneObject *plane);
+// Recolors the plane for one iteration, without rendering or sleeping.
+int NcFadeCtx_iteration(NcFadeCtxObject *self, NcPlaneObject *plane, int iteration, bool fade_in);
+
+extern PyTypeObject NcStats_Type;
+
+PyObject *NcStats_from_ncstats(const ncstats *stats);
+
 typedef struct
 {
     PyObject_HEAD;
     struct ncpalette ncpalette;
 } Palette256Object;
 
-extern PyTypeObject *NcInput_Type;
+typedef struct
+{
+    PyObject_HEAD;
+    struct ncinput ncinput;
+    // Created on first access to the utf8 field.
+    PyObject *utf8;
+} NcInputObject;
+
+extern PyTypeObject NcInput_Type;
+
+PyObject *NcInput_from_ncinput(const ncinput *ni);
+void NcInput_clear_freelist(void);
+
+// Set in NcPlane.snapshot() codepoints when the cell holds a multi-codepoint EGC
+#define NCPLANE_SNAPSHOT_CLUSTER 0x80000000u
 
 // Imports
 
@@ -165,12 +379,198 @@ PyMODINIT_FUNC PyInit_notcurses(void);
 
 extern PyMethodDef ChannelsFunctions[];
 
+// // Channel arrays
+
+extern struct PyModuleDef ChannelsArrayModule;
+
 // // Misc
 
 extern PyMethodDef MiscFunctions[];
 
+// // Instrumentation
+
+extern PyMethodDef InstrumentFunctions[];
+void Instrument_clear(void);
+
+// // Arguments
+
+int pync_parse_fastcall(const char *func_name,
+                        PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames,
+                        char *const keywords[], Py_ssize_t required,
+                        PyObject **parsed);
+bool pync_buffer_format_p(const char *format, Py_ssize_t itemsize, Py_ssize_t wanted_itemsize, const char *codes);
+bool pync_buffer_integer_format_p(const char *format, Py_ssize_t itemsize, Py_ssize_t wanted_itemsize);
+
 // Helpers
 
+static inline int
+pync_check_nargs(const char *func_name, Py_ssize_t nargs, Py_ssize_t min_args, Py_ssize_t max_args)
+{
+    if (nargs < min_args || nargs > max_args)
+    {
+        if (min_args == max_args)
+        {
+            PyErr_Format(PyExc_TypeError, "%s() takes exactly %zd argument%s (%zd given)",
+                         func_name, min_args, 1 == min_args ? "" : "s", nargs);
+        }
+        else
+        {
+            PyErr_Format(PyExc_TypeError, "%s() takes from %zd to %zd arguments (%zd given)",
+                         func_name, min_args, max_args, nargs);
+        }
+        return -1;
+    }
+    return 0;
+}
+
+// CLOCK_MONOTONIC time in seconds.
+static inline double
+pync_monotonic(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1E-9;
+}
+
+// Converters follow PyArg_ParseTuple() semantics: 'i' is range checked,
+// unsigned formats 'H', 'I', 'k' and 'K' are masked without overflow checking.
+
+static inline int
+pync_as_int(PyObject *object, int *value)
+{
+    long long_value = PyLong_AsLong(object);
+    if (-1 == long_value && PyErr_Occurred())
+    {
+        return -1;
+    }
+    if (long_value > INT_MAX || long_value < INT_MIN)
+    {
+        PyErr_SetString(PyExc_OverflowError, "signed integer is out of range for C int");
+        return -1;
+    }
+    *value = (int)long_value;
+    return 0;
+}
+
+static inline int
+pync_as_ulong(PyObject *object, unsigned long *value)
+{
+    unsigned long ulong_value = PyLong_AsUnsignedLongMask(object);
+    if ((unsigned long)-1 == ulong_value && PyErr_Occurred())
+    {
+        return -1;
+    }
+    *value = ulong_value;
+    return 0;
+}
+
+static inline int
+pync_as_uint(PyObject *object, unsigned *value)
+{
+    unsigned long ulong_value = 0;
+    if (pync_as_ulong(object, &ulong_value) < 0)
+    {
+        return -1;
+    }
+    *value = (unsigned)ulong_value;
+    return 0;
+}
+
+static inline int
+pync_as_ushort(PyObject *object, unsigned short *value)
+{
+    unsigned long ulong_value = 0;
+    if (pync_as_ulong(object, &ulong_value) < 0)
+    {
+        return -1;
+    }
+    *value = (unsigned short)ulong_value;
+    return 0;
+}
+
+static inline int
+pync_as_ull(PyObject *object, unsigned long long *value)
+{
+    unsigned long long ull_value = PyLong_AsUnsignedLongLongMask(object);
+    if ((unsigned long long)-1 == ull_value && PyErr_Occurred())
+    {
+        return -1;
+    }
+    *value = ull_value;
+    return 0;
+}
+
+static inline int
+pync_as_ssize(PyObject *object, Py_ssize_t *value)
+{
+    Py_ssize_t ssize_value = PyNumber_AsSsize_t(object, PyExc_OverflowError);
+    if (-1 == ssize_value && PyErr_Occurred())
+    {
+        return -1;
+    }
+    *value = ssize_value;
+    return 0;
+}
+
+static inline int
+pync_as_str(PyObject *object, const char **value)
+{
+    if (!PyUnicode_Check(object))
+    {
+        PyErr_Format(PyExc_TypeError, "argument must be str, not %.50s", Py_TYPE(object)->tp_name);
+        return -1;
+    }
+
+    Py_ssize_t len = 0;
+    const char *str = PyUnicode_AsUTF8AndSize(object, &len);
+    if (NULL == str)
+    {
+        return -1;
+    }
+    if ((size_t)len != strlen(str))
+    {
+        PyErr_SetString(PyExc_ValueError, "embedded null character");
+        return -1;
+    }
+    *value = str;
+    return 0;
+}
+
+static inline int
+pync_as_bool(PyObject *object, int *value)
+{
+    int bool_value = PyObject_IsTrue(object);
+    if (bool_value < 0)
+    {
+        return -1;
+    }
+    *value = bool_value;
+    return 0;
+}
+
+static inline int
+pync_as_double(PyObject *object, double *value)
+{
+    double double_value = PyFloat_AsDouble(object);
+    if (-1.0 == double_value && PyErr_Occurred())
+    {
+        return -1;
+    }
+    *value = double_value;
+    return 0;
+}
+
+static inline int
+pync_check_type(PyObject *object, PyTypeObject *type)
+{
+    if (!PyObject_TypeCheck(object, type))
+    {
+        PyErr_Format(PyExc_TypeError, "argument must be %.50s, not %.50s", type->tp_name, Py_TYPE(object)->tp_name);
+        return -1;
+    }
+    return 0;
+}
+
 static inline void PyObject_cleanup(PyObject **object)
 {
     Py_XDECREF(*object);
@@ -188,6 +588,16 @@ static inline void PyObject_cleanup(PyObject **object)
         new_object;                         \
     })
 
+#define GNU_PY_CHECK_PTR(c_function)  \
+    ({                                \
+        void *new_ptr = c_function;   \
+        if (new_ptr == NULL)          \
+        {                             \
+            return NULL;              \
+        }                             \
+        new_ptr;                      \
+    })
+
 #define GNU_PY_CHECK_RET_NEG1(py_function)  \
     ({                                      \
         PyObject *new_object = py_function; \
@@ -239,6 +649,22 @@ static inline void PyObject_cleanup(PyObject **object)
         return_value;                                                                      \
     })
 
+// Same as CHECK_NOTCURSES but the call is made with the GIL released.
+// 'notcurses_func' must not touch any Python objects.
+#define CHECK_NOTCURSES_NOGIL(notcurses_func)                                              \
+    ({                                                                                     \
+        int return_value;                                                                  \
+        Py_BEGIN_ALLOW_THREADS;                                                            \
+        return_value = notcurses_func;                                                     \
+        Py_END_ALLOW_THREADS;                                                              \
+        if (return_value < 0)                                                              \
+        {                                                                                  \
+            PyErr_Format(PyExc_RuntimeError, "Notcurses returned error %i", return_value); \
+            return NULL;                                                                   \
+        }                                                                                  \
+        return_value;                                                                      \
+    })
+
 #define CHECK_NOTCURSES_PTR(notcurses_func)                                  \
     ({                                                                       \
         void *return_ptr = notcurses_func;                                   \
@@ -270,6 +696,60 @@ static inline void PyObject_cleanup(PyObject **object)
         new_long;                               \
     })
 
+#define GNU_PY_CHECK_NARGS(func_name, nargs, min_args, max_args)          \
+    ({                                                                    \
+        if (pync_check_nargs(func_name, nargs, min_args, max_args) < 0) \
+        {                                                                 \
+            return NULL;                                                  \
+        }                                                                 \
+    })
+
+#define GNU_PY_ARG_CONVERT(converter, py_object, c_type) \
+    ({                                                   \
+        c_type converted_value;                          \
+        if (converter(py_object, &converted_value) < 0)  \
+        {                                                \
+            return NULL;                                 \
+        }                                                \
+        converted_value;                                 \
+    })
+
+#define GNU_PY_ARG_INT(py_object) GNU_PY_ARG_CONVERT(pync_as_int, py_object, int)
+#define GNU_PY_ARG_UINT(py_object) GNU_PY_ARG_CONVERT(pync_as_uint, py_object, unsigned)
+#define GNU_PY_ARG_USHORT(py_object) GNU_PY_ARG_CONVERT(pync_as_ushort, py_object, unsigned short)
+#define GNU_PY_ARG_ULONG(py_object) GNU_PY_ARG_CONVERT(pync_as_ulong, py_object, unsigned long)
+#define GNU_PY_ARG_ULL(py_object) GNU_PY_ARG_CONVERT(pync_as_ull, py_object, unsigned long long)
+#define GNU_PY_ARG_SSIZE(py_object) GNU_PY_ARG_CONVERT(pync_as_ssize, py_object, Py_ssize_t)
+#define GNU_PY_ARG_STR(py_object) GNU_PY_ARG_CONVERT(pync_as_str, py_object, const char *)
+#define GNU_PY_ARG_BOOL(py_object) GNU_PY_ARG_CONVERT(pync_as_bool, py_object, int)
+#define GNU_PY_ARG_DOUBLE(py_object) GNU_PY_ARG_CONVERT(pync_as_double, py_object, double)
+
+#define GNU_PY_ARG_TYPE(py_object, py_type, c_type)      \
+    ({                                                   \
+        PyObject *checked_object = py_object;            \
+        if (pync_check_type(checked_object, py_type) < 0) \
+        {                                                \
+            return NULL;                                 \
+        }                                                \
+        (c_type *)checked_object;                        \
+    })
+
+#define CHECK_NCPLANE(plane_obj)                                             \
+    ({                                                                       \
+        if (NULL == (plane_obj)->ncplane_ptr)                                \
+        {                                                                    \
+            PyErr_SetString(PyExc_RuntimeError, "NcPlane has been destroyed"); \
+            return NULL;                                                     \
+        }                                                                    \
+    })
+
+#define GNU_PY_ARG_NCPLANE(py_object)                                   \
+    ({                                                                  \
+        NcPlaneObject *plane_obj = GNU_PY_ARG_TYPE(py_object, &NcPlane_Type, NcPlaneObject); \
+        CHECK_NCPLANE(plane_obj);                                       \
+        plane_obj;                                                      \
+    })
+
 #define GNU_PY_MODULE_ADD_OBJECT(module, py_object, py_object_name)    \
     ({                                                                 \
         Py_INCREF(py_object);                                          \
@@ -15,9 +15,13 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterator, List,
+                    Optional, Tuple, Union, overload)
 import importlib
 
+if TYPE_CHECKING:
+    from .aio import NcEventStream
+
 _c = importlib.import_module("notcurses.notcurses")
 
 # Stub file for typing and docs
@@ -44,6 +48,47 @@ def ncstrwidth(text: str, /) -> int:
 
 # endregion misc
 
+
+# region instrument
+def instrument_enable() -> None:
+    """Start counting calls and time of the Notcurses and NcPlane
+    methods and of the channel functions.
+
+    The methods are replaced by counting wrappers until
+    instrument_disable(). Functions imported by name before enabling
+    keep calling the plain version.
+    """
+    _c.instrument_enable()
+
+
+def instrument_disable() -> None:
+    """Stop counting and restore the plain methods.
+
+    Disabled instrumentation costs nothing. Counts are kept.
+    """
+    _c.instrument_disable()
+
+
+def instrument_enabled() -> bool:
+    """Is instrumentation enabled?"""
+    return _c.instrument_enabled()
+
+
+def instrument_snapshot() -> Dict[str, Dict[str, float]]:
+    """Counts of the methods called since the last reset.
+
+    Maps names such as 'NcPlane.putstr_yx' to dicts with the number
+    of 'calls', the total 'time' and the 'max' time of one call,
+    in seconds.
+    """
+    return _c.instrument_snapshot()
+
+
+def instrument_reset() -> None:
+    """Reset all counts to zero."""
+    _c.instrument_reset()
+# endregion instrument
+
 # region ncchannel
 
 
@@ -302,6 +347,10 @@ def ncchannels_set_bg_default(channels: int, /) -> int:
     """Mark the background ncchannel as using its default color."""
     return _c.ncchannels_set_bg_default(channels)
 
+
+# Array versions of the functions above, see channels.pyi
+channels = _c.channels
+
 # endregion ncchannel
 
 
@@ -475,9 +524,110 @@ NCOPTION_CLI_MODE: int
 # endregion ncoption
 
 
+# region ncdirect
+NCDIRECT_OPTION_INHIBIT_SETLOCALE: int
+NCDIRECT_OPTION_INHIBIT_CBREAK: int
+NCDIRECT_OPTION_DRAIN_INPUT: int
+NCDIRECT_OPTION_NO_QUIT_SIGHANDLERS: int
+NCDIRECT_OPTION_VERBOSE: int
+NCDIRECT_OPTION_VERY_VERBOSE: int
+# endregion ncdirect
+
+
+# region ncplot
+NCPLOT_OPTION_LABELTICKSD: int
+NCPLOT_OPTION_EXPONENTIALD: int
+NCPLOT_OPTION_VERTICALI: int
+NCPLOT_OPTION_NODEGRADE: int
+NCPLOT_OPTION_DETECTMAXONLY: int
+NCPLOT_OPTION_PRINTSAMPLE: int
+# endregion ncplot
+
+
+# region ncvisual
+NCBLIT_DEFAULT: int
+NCBLIT_1x1: int
+NCBLIT_2x1: int
+NCBLIT_2x2: int
+NCBLIT_3x2: int
+NCBLIT_4x2: int
+NCBLIT_BRAILLE: int
+NCBLIT_PIXEL: int
+NCBLIT_4x1: int
+NCBLIT_8x1: int
+
+NCSCALE_NONE: int
+NCSCALE_SCALE: int
+NCSCALE_STRETCH: int
+NCSCALE_NONE_HIRES: int
+NCSCALE_SCALE_HIRES: int
+
+NCVISUAL_OPTION_NODEGRADE: int
+NCVISUAL_OPTION_BLEND: int
+NCVISUAL_OPTION_HORALIGNED: int
+NCVISUAL_OPTION_VERALIGNED: int
+NCVISUAL_OPTION_ADDALPHA: int
+NCVISUAL_OPTION_CHILDPLANE: int
+NCVISUAL_OPTION_NOINTERPOLATE: int
+# endregion ncvisual
+
+
 NcInput = _c.NcInput
 
 
+class NcStats:
+    """Snapshot of the Notcurses stats.
+
+    'newer - older' is an NcStats holding the counters accumulated in
+    between, with the extremes and the current state (fbbytes, planes)
+    of 'newer'. Returned by Notcurses.stats().
+    """
+
+    renders: int
+    writeouts: int
+    failed_renders: int
+    failed_writeouts: int
+    raster_bytes: int
+    render_ns: int
+    raster_ns: int
+    writeout_ns: int
+    cellelisions: int
+    cellemissions: int
+    fgelisions: int
+    fgemissions: int
+    bgelisions: int
+    bgemissions: int
+    defaultelisions: int
+    defaultemissions: int
+    refreshes: int
+    sprixelemissions: int
+    sprixelelisions: int
+    sprixelbytes: int
+    appsync_updates: int
+    input_errors: int
+    input_events: int
+    hpa_gratuitous: int
+    cell_geo_changes: int
+    pixel_geo_changes: int
+    raster_max_bytes: int
+    raster_min_bytes: int
+    render_max_ns: int
+    render_min_ns: int
+    raster_max_ns: int
+    raster_min_ns: int
+    writeout_max_ns: int
+    writeout_min_ns: int
+    fbbytes: int
+    planes: int
+
+    def __sub__(self, older: NcStats) -> NcStats:
+        return _c.NcStats.__sub__(self, older)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return all fields as a dict."""
+        return _c.NcStats.as_dict(self)
+
+
 class NotcursesOptions:
     ...
 
@@ -511,17 +661,138 @@ class Notcurses:
             flags=flags,
         )
 
+    @classmethod
+    def headless(cls, rows: int = 24, cols: int = 80,
+                 term_type: str = "xterm-256color",
+                 flags: int = 0) -> Notcurses:
+        """Create a context without a terminal, for tests and benchmarks.
+
+        The geometry is fixed to 'rows' x 'cols', capabilities come from
+        the terminfo entry of 'term_type' plus truecolor and UTF-8
+        (LC_CTYPE is switched to C.UTF-8 if needed, and switched back
+        once the context is stopped). Sextants depend on terminal
+        detection and are not available.
+
+        Output is discarded, use NcPlane.pile_render_to_buffer() or an
+        NcRenderBuffer to capture frames. Terminal queries are only
+        skipped if the process has no controlling terminal, so run
+        under setsid(1) on machines with one.
+        """
+        self = cls.__new__(cls)
+        self._c = _c.Notcurses.headless(rows, cols, term_type, flags)
+        return self
+
     def drop_planes(self) -> None:
-        """Destroy all ncplanes other than the stdplane."""
+        """Destroy all ncplanes other than the stdplane.
+
+        Any further use of the destroyed planes raises RuntimeError.
+        """
         self._c.drop_planes()
 
     def render(self) -> None:
         """Renders and rasterizes the standard pile in one shot.
 
-        Blocking call.
+        Blocking call. The GIL is released meanwhile, see docs/nc_threads.
         """
         self._c.render()
 
+    def request_render(self) -> None:
+        """Mark the standard pile dirty.
+
+        Requests made before the next scheduled frame are coalesced into
+        one render. Frames are rendered by render_if_due(), called from
+        the main loop, or by an NcRenderClock under asyncio.
+        """
+        self._c.request_render()
+
+    def render_if_due(self) -> bool:
+        """Render if a render was requested and max fps allows a frame.
+
+        Returns True if a frame was rendered. The GIL is released while
+        rendering.
+        """
+        return self._c.render_if_due()
+
+    def render_due(self) -> Optional[float]:
+        """Seconds until render_if_due() will render.
+
+        None if no render was requested, so it can be passed as the
+        deadline of get() in a plain loop:
+
+            while True:
+                event = nc.get(nc.render_due())
+                ...
+                nc.render_if_due()
+        """
+        return self._c.render_due()
+
+    def set_max_fps(self, fps: float) -> None:
+        """Limit scheduled renders to 'fps' frames per second.
+
+        0, the default, renders every due frame right away.
+        """
+        self._c.set_max_fps(fps)
+
+    def set_render_hook(
+            self,
+            hook: Optional[Callable[[Dict[str, float]], object]]) -> None:
+        """Call 'hook' with render_stats() after every scheduled frame."""
+        self._c.set_render_hook(hook)
+
+    def set_render_waker(self, waker: Optional[Callable[[], object]]) -> None:
+        """Call 'waker' when the screen goes from clean to dirty.
+
+        Used by NcRenderClock to wake the event loop.
+        """
+        self._c.set_render_waker(waker)
+
+    def render_stats(self) -> Dict[str, float]:
+        """Render scheduler counters.
+
+        'requests' made, 'frames' rendered, requests 'coalesced' into a
+        pending frame, frame slots 'dropped' because a frame was rendered
+        late, and 'last_render_time' in seconds.
+        """
+        return self._c.render_stats()
+
+    def trace_start(self, capacity: int = 16384) -> None:
+        """Start recording frame timeline spans.
+
+        Spans are kept in a ring buffer of 'capacity' spans, the oldest
+        are overwritten once it is full. Renders record 'frame', 'draw'
+        (time since the previous frame), 'render', 'rasterize', 'raster'
+        and 'write' spans.
+        """
+        self._c.trace_start(capacity)
+
+    def trace_stop(self) -> None:
+        """Stop recording spans. Recorded spans are kept."""
+        self._c.trace_stop()
+
+    def trace_clear(self) -> None:
+        """Discard recorded spans."""
+        self._c.trace_clear()
+
+    def trace_add(self, name: str, start: float, end: float, /) -> None:
+        """Record a span from 'start' to 'end'.
+
+        Times are time.monotonic() seconds. Does nothing while tracing
+        is stopped.
+        """
+        self._c.trace_add(name, start, end)
+
+    def trace_spans(self) -> List[Tuple[str, float, float, int]]:
+        """Recorded spans, oldest first.
+
+        Tuples of name, start, duration and thread ident. Times are
+        time.monotonic() seconds.
+        """
+        return self._c.trace_spans()
+
+    def trace_dropped(self) -> int:
+        """Number of spans overwritten because the buffer was full."""
+        return self._c.trace_dropped()
+
     def top(self) -> NcPlane:
         """Return the topmost ncplane of the standard pile."""
         return NcPlane(self._c.top())
@@ -535,9 +806,24 @@ class Notcurses:
         return self._c.inputready_fd()
 
     def get(self, deadline: Optional[float]) -> NcInput:
-        """Reads an input event. If no event is ready, returns None."""
+        """Reads an input event. If no event is ready, returns None.
+
+        The GIL is released while waiting."""
         return self._c.get(deadline)
 
+    def get_many(self, max_events: int = 64,
+                 deadline: Optional[float] = None) -> List[NcInput]:
+        """Read a batch of input events.
+
+        Waits up to 'deadline' seconds for the first event (None blocks,
+        0 does not wait), then drains up to 'max_events' queued events
+        in the same call. Returns an empty list on timeout. If reading
+        fails after some events were read, those are returned and the
+        error is raised by the next call.
+
+        The GIL is released while waiting and draining."""
+        return self._c.get_many(max_events, deadline)
+
     def get_nblock(self) -> NcInput:
         """Get input event without blocking. If no event is ready,
         returns None."""
@@ -545,9 +831,20 @@ class Notcurses:
 
     def get_blocking(self) -> NcInput:
         """Get input event completely blocking until and event or signal
-        received."""
+        received. The GIL is released while waiting."""
         return self._c.get_blocking()
 
+    def events(self, max_pending: int = 0) -> NcEventStream:
+        """Return an asynchronous iterator over input events.
+
+        The input ready descriptor is watched by the running asyncio
+        event loop and each wake-up drains every pending event:
+
+            async for event in nc.events():
+                ...
+        """
+        return self._c.events(max_pending=max_pending)
+
     def mouse_enable(self) -> None:
         """Enable the mouse in \"button-event tracking\" mode with
         focus detection and UTF8-style extended coordinates."""
@@ -675,11 +972,16 @@ class Notcurses:
         """
         return self._c.check_pixel_support()
 
-    def stats(self) -> None:
-        """Acquire an atomic snapshot of the Notcurses stats."""
+    def stats(self) -> NcStats:
+        """Acquire an atomic snapshot of the Notcurses stats.
+
+        Snapshots are cheap. 'newer - older' gives the activity in
+        between: counters are subtracted, the extremes and the current
+        state (fbbytes, planes) are those of 'newer'.
+        """
         return self._c.stats()
 
-    def stats_reset(self) -> None:
+    def stats_reset(self) -> NcStats:
         """Reset all cumulative stats (immediate ones, such as fbbytes,
         are not reset) and returning a copy before reset."""
         return self._c.stats_reset()
@@ -716,8 +1018,7 @@ class NcPlane:
     def destroy(self) -> None:
         """Destroy the plane.
 
-        Do NOT try to use the plane after its been
-        destoryed.
+        Any further use of the plane raises RuntimeError.
         """
         self._c.destroy()
 
@@ -787,26 +1088,18 @@ class NcPlane:
         """
         self._c.resize_simple(ylen, xlen)
 
-    def set_base_cell(self) -> None:
-        """Set the plane's base NcCell.
-
-        TODO
-        """
-        self._c.set_base_cell()
-
-    def set_base(self) -> None:
-        """Set the plane's base NcCell.
-
-        TODO
-        """
-        self._c.set_base()
+    def set_base_cell(self, cell: NcCell, /) -> None:
+        """Set the plane's base NcCell to 'cell'."""
+        self._c.set_base_cell(cell._c)
 
-    def base(self) -> None:
-        """Extract the plane's base NcCell.
+    def set_base(self, egc: str, styles: int = 0,
+                 channels: int = 0) -> None:
+        """Set the plane's base NcCell from its components."""
+        self._c.set_base(egc, styles, channels)
 
-        TODO
-        """
-        self._c.base()
+    def base(self) -> NcCell:
+        """Extract the plane's base NcCell."""
+        return NcCell._from_c(self._c.base())
 
     def move_yx(self, y: int, x: int, /) -> None:
         """Move this plane relative to the standard plane,
@@ -898,23 +1191,17 @@ class NcPlane:
         """Retrieve the current contents of the cell under the cursor."""
         return self._c.at_cursor()
 
-    def at_cursor_cell(self) -> None:
-        """Retrieve the current contents of the cell under the cursor.
-
-        TODO
-        """
-        self._c.at_cursor_cell()
+    def at_cursor_cell(self) -> NcCell:
+        """Retrieve the current contents of the cell under the cursor."""
+        return NcCell._from_c(self._c.at_cursor_cell())
 
     def at_yx(self, y: int, x: int, /) -> Tuple[str, int, int]:
         """Retrieve the current contents of the specified cell."""
         return self._c.at_yx(y, x)
 
-    def at_yx_cell(self) -> None:
-        """"Retrieve the current contents of the specified cell"
-
-        TODO
-        """
-        self._c.at_yx_cell()
+    def at_yx_cell(self, y: int, x: int, /) -> NcCell:
+        """Retrieve the current contents of the specified cell."""
+        return NcCell._from_c(self._c.at_yx_cell(y, x))
 
     def contents(self, begy: int, begx: int,
                  leny: int = -1, lenx: int = -1) -> str:
@@ -961,20 +1248,20 @@ class NcPlane:
         """Return the current styling for this ncplane."""
         return self._c.styles()
 
-    def putc_yx(self) -> None:
+    def putc_yx(self, y: int, x: int, cell: NcCell, /) -> int:
         """Replace the cell at the specified coordinates with
         the provided cell.
 
-        TODO
+        Returns the number of columns the cursor advanced.
         """
-        self._c.putc_yx()
+        return self._c.putc_yx(y, x, cell._c)
 
-    def putc(self) -> None:
+    def putc(self, cell: NcCell, /) -> int:
         """Replace cell at the current cursor location.
 
-        TODO
+        Returns the number of columns the cursor advanced.
         """
-        self._c.putc()
+        return self._c.putc(cell._c)
 
     def putchar_yx(self, y: int, x: int, char: str, /) -> None:
         """Replace the cell at the specified coordinates
@@ -1062,38 +1349,52 @@ class NcPlane:
         """
         return self._c.puttext(y, align)
 
-    def box(self) -> None:
+    def box(self, ul: NcCell, ur: NcCell, ll: NcCell, lr: NcCell,
+            hline: NcCell, vline: NcCell,
+            ystop: int, xstop: int, ctlword: int = 0) -> None:
         """Draw a box with its upper-left corner
         at the current cursor position.
 
-        TODO
+        The opposite corner is at 'ystop'/'xstop'.
         """
-        self._c.box()
+        self._c.box(ul._c, ur._c, ll._c, lr._c, hline._c, vline._c,
+                    ystop, xstop, ctlword)
 
-    def box_sized(self) -> None:
+    def box_sized(self, ul: NcCell, ur: NcCell, ll: NcCell, lr: NcCell,
+                  hline: NcCell, vline: NcCell,
+                  ylen: int, xlen: int, ctlword: int = 0) -> None:
         """Draw a box with its upper-left corner at
         the current cursor position, having dimensions.
-
-        TODO
         """
-        self._c.box_sized()
+        self._c.box_sized(ul._c, ur._c, ll._c, lr._c, hline._c, vline._c,
+                          ylen, xlen, ctlword)
 
-    def perimeter(self) -> None:
-        """Draw a perimeter with its upper-left corner
-        at the current cursor position
+    def perimeter(self, ul: NcCell, ur: NcCell, ll: NcCell, lr: NcCell,
+                  hline: NcCell, vline: NcCell, ctlword: int = 0) -> None:
+        """Draw a perimeter around the plane."""
+        self._c.perimeter(ul._c, ur._c, ll._c, lr._c, hline._c, vline._c,
+                          ctlword)
 
-        TODO
+    def polyfill_yx(self, y: int, x: int, cell: NcCell) -> int:
+        """Starting at the specified coordinate, replace every
+        connected cell having the same glyph with 'cell'.
+
+        Returns the number of cells filled.
         """
-        self._c.perimeter()
+        return self._c.polyfill_yx(y, x, cell._c)
 
-    def polyfill_yx(self) -> None:
-        """Starting at the specified coordinate, if its glyph
-        is different from that of is copied into it, and the
-        original glyph is considered the fill target.
+    def fill_yx(self, y: int, x: int, ylen: int, xlen: int,
+                cell: NcCell) -> int:
+        """Put 'cell' across the 'ylen' x 'xlen' region at 'y'/'x'.
 
-        TODO
+        Zero lengths extend the region to the plane edge. Wide cells
+        step by their width, so the region width must be a multiple of
+        it, else ValueError is raised. The loop runs in C with the GIL
+        released, on a copy of 'cell' taken before the call.
+
+        Returns the number of cells put.
         """
-        self._c.polyfill_yx()
+        return self._c.fill_yx(y, x, ylen, xlen, cell._c)
 
     def gradient(self, egc: str, stylemask: int,
                  ul: int, ur: int, ll: int, lr: int,
@@ -1296,56 +1597,88 @@ class NcPlane:
         """Set the current background color using channel."""
         self._c.set_bg_alpha(aplha)
 
-    def fadeout(self) -> None:
-        """Fade the ncplane out over the provided time,
-        calling 'fader' at each iteration.
+    def fadeout(self, duration: float,
+                fader: Optional[Callable[[NcPlane, float],
+                                         Optional[int]]] = None
+                ) -> int:
+        """Fade the ncplane out over 'duration' seconds, blocking until done.
 
-        TODO
+        'fader' is called with the plane and the deadline of the next
+        iteration (time.monotonic() seconds) at each iteration and must
+        render. Without it the plane is rendered and the call sleeps
+        between iterations. 'fader' returns None or an int, a nonzero
+        int stops the fade and is returned. An exception raised by
+        'fader' aborts the fade and propagates. The GIL is released
+        meanwhile.
+
+        Use NcFader to fade from an event loop.
         """
-        self._c.fadeout()
+        return self._c.fadeout(duration, fader)
 
-    def fadein(self) -> None:
-        """Fade the ncplane in over the specified time.
+    def fadein(self, duration: float,
+               fader: Optional[Callable[[NcPlane, float],
+                                        Optional[int]]] = None
+               ) -> int:
+        """Fade the ncplane in over 'duration' seconds, like fadeout().
 
-        TODO
+        Load the ncplane with the target cells without rendering,
+        then call this function.
         """
-        self._c.fadein()
+        return self._c.fadein(duration, fader)
 
-    def fade_setup(self) -> None:
-        """Create NcFadeCtx.
+    def fade_setup(self) -> NcFadeCtx:
+        """Save the colors of the plane into an NcFadeCtx.
 
-        TODO
+        Raises RuntimeError if the terminal can't fade.
         """
-        self._c.fade_setup()
+        return self._c.fade_setup()
 
-    def fadeout_iteration(self) -> None:
-        """TODO"""
-        self._c.fadeout_iteration()
+    def fadeout_iteration(self, ctx: NcFadeCtx, iteration: int, /) -> None:
+        """Recolor the plane to 'iteration' of a fade out.
 
-    def fadein_iteration(self) -> None:
-        """TODO"""
-        self._c.fadein_iteration()
+        'iteration' goes from 0 to ctx.iterations. Colors are computed
+        from those saved in 'ctx'. Does not render or sleep.
+        """
+        self._c.fadeout_iteration(ctx, iteration)
 
-    def pulse(self) -> None:
-        """Pulse the plane in and out until the callback returns non-zero.
+    def fadein_iteration(self, ctx: NcFadeCtx, iteration: int, /) -> None:
+        """Recolor the plane to 'iteration' of a fade in.
 
-        TODO
+        'iteration' goes from 0 to ctx.iterations. Colors are computed
+        from those saved in 'ctx'. Does not render or sleep.
+        """
+        self._c.fadein_iteration(ctx, iteration)
+
+    def pulse(self, duration: float,
+              fader: Callable[[NcPlane, float], Optional[int]]
+              ) -> int:
+        """Pulse the plane in and out until 'fader' returns nonzero.
+
+        'duration' is the half period in seconds. 'fader' is called
+        like for fadeout() and must render. Blocks meanwhile with the
+        GIL released.
         """
-        self._c.pulse()
+        return self._c.pulse(duration, fader)
 
-    def cells_load_box(self) -> None:
+    def cells_load_box(self, styles: int, channels: int,
+                       gclusters: str) -> Tuple[NcCell, ...]:
         """Load up six cells with the EGCs necessary to draw a box.
 
-        TODO
+        'gclusters' holds the six EGCs in order.
+
+        Returns (ul, ur, ll, lr, hline, vline).
         """
-        self._c.cells_load_box()
+        return tuple(NcCell._from_c(c) for c in
+                     self._c.cells_load_box(styles, channels, gclusters))
 
-    def cells_rounded_box(self) -> None:
+    def cells_rounded_box(self, styles: int,
+                          channels: int) -> Tuple[NcCell, ...]:
         """Load up six cells with the EGCs necessary to draw a round box.
 
-        TODO
+        Returns (ul, ur, ll, lr, hline, vline).
         """
-        self._c.cells_rounded_box()
+        return tuple(NcCell._from_c(c) for c in
+                     self._c.cells_rounded_box(styles, channels))
 
     def perimeter_rounded(
             self,
@@ -1361,12 +1694,14 @@ class NcPlane:
         """Draw a round box around plane."""
         self._c.rounded_box_sized(styles, channels, ylen, xlen, ctlword)
 
-    def cells_double_box(self) -> None:
-        """Draw a double box with cells.
+    def cells_double_box(self, styles: int,
+                         channels: int) -> Tuple[NcCell, ...]:
+        """Load up six cells with the EGCs necessary to draw a double box.
 
-        TODO
+        Returns (ul, ur, ll, lr, hline, vline).
         """
-        self._c.cells_double_box()
+        return tuple(NcCell._from_c(c) for c in
+                     self._c.cells_double_box(styles, channels))
 
     def double_box(self,
                    styles: int, channels: int,
@@ -1388,20 +1723,29 @@ class NcPlane:
         """Draw a double box sized."""
         self._c.double_box_sized(styles, channels, ylen, xlen, ctlword)
 
-    def ncvisual_from_plane(self) -> None:
-        """Promote an plane to an NcVisual.
+    def ncvisual_from_plane(self, blitter: int = 0,
+                            begy: int = 0, begx: int = 0,
+                            leny: int = 0, lenx: int = 0) -> NcVisual:
+        """Promote the selected region of the plane to an NcVisual.
 
-        TODO
+        The cells are interpreted as drawn by the NCBLIT_* 'blitter'.
+        Zero length extends the region to the plane edge.
+        The GIL is released meanwhile.
         """
-        self._c.ncvisual_from_plane()
+        return NcVisual(self._c.ncvisual_from_plane(
+            blitter, begy, begx, leny, lenx))
 
-    def as_rgba(self) -> None:
+    def as_rgba(self, blitter: int = 0,
+                begy: int = 0, begx: int = 0,
+                leny: int = 0, lenx: int = 0) -> Tuple[bytes, int, int]:
         """Create an RGBA flat array from the selected
         region of the plane.
 
-        TODO
+        Returns the pixels and their geometry as
+        (data, pixel rows, pixel cols).
+        The GIL is released meanwhile.
         """
-        self._c.as_rgba()
+        return self._c.as_rgba(blitter, begy, begx, leny, lenx)
 
     def reel_create(self) -> None:
         """Take over the plane and use it to draw a reel.
@@ -1456,19 +1800,35 @@ class NcPlane:
         """
         self._c.tabbed_create()
 
-    def uplot_create(self) -> None:
-        """Create NcUplot.
+    def uplot_create(self, miny: int = 0, maxy: int = 0,
+                     maxchannels: int = 0, minchannels: int = 0,
+                     legendstyle: int = 0, gridtype: int = NCBLIT_DEFAULT,
+                     rangex: int = 0, title: Optional[str] = None,
+                     flags: int = 0) -> NcUplot:
+        """Create a plot of uint64 samples drawing on this plane.
 
-        TODO
+        The plot takes the plane over, destroying either destroys both.
+        The plane is destroyed as well if the plot cannot be created.
+        Equal 'miny' and 'maxy' (both 0) detect the domain from the
+        samples. 'rangex' is the number of x values shown, 0 for one per
+        column. 'flags' is a mask of NCPLOT_OPTION_*.
         """
-        self._c.uplot_create()
+        return NcUplot._from_c(self._c.uplot_create(
+            miny, maxy, maxchannels, minchannels, legendstyle,
+            gridtype, rangex, title, flags))
 
-    def dplot_create(self) -> None:
-        """Create NcDplot.
+    def dplot_create(self, miny: float = 0, maxy: float = 0,
+                     maxchannels: int = 0, minchannels: int = 0,
+                     legendstyle: int = 0, gridtype: int = NCBLIT_DEFAULT,
+                     rangex: int = 0, title: Optional[str] = None,
+                     flags: int = 0) -> NcDplot:
+        """Create a plot of double samples drawing on this plane.
 
-        TODO
+        Same as uplot_create().
         """
-        self._c.dplot_create()
+        return NcDplot._from_c(self._c.dplot_create(
+            miny, maxy, maxchannels, minchannels, legendstyle,
+            gridtype, rangex, title, flags))
 
     def fdplane_create(self) -> None:
         """Create NcFdPlane.
@@ -1518,23 +1878,45 @@ class NcPlane:
         return NcPlane(self._c.pile_bottom())
 
     def pile_render(self) -> None:
-        """Renders the pile of which plane is a part."""
+        """Renders the pile of which plane is a part.
+
+        The GIL is released meanwhile."""
         self._c.pile_render()
 
     def pile_rasterize(self) -> None:
         """Make the physical screen match the last
-        rendered frame from the pile."""
+        rendered frame from the pile. The GIL is released meanwhile."""
         self._c.pile_rasterize()
 
-    def pile_render_to_buffer(self) -> bytes:
+    @overload
+    def pile_render_to_buffer(self, into: None = None) -> bytes:
+        ...
+
+    @overload
+    def pile_render_to_buffer(self, into: NcRenderBuffer) -> NcRenderBuffer:
+        ...
+
+    def pile_render_to_buffer(
+            self,
+            into: Optional[NcRenderBuffer] = None,
+    ) -> Union[bytes, NcRenderBuffer]:
         """Perform the rendering and rasterization portion of render()
-        and write it to bytes object instead of terminal."""
+        and write it to bytes object instead of terminal.
+
+        If 'into' is given, the frame is rendered into that
+        NcRenderBuffer instead, which is returned.
+
+        The GIL is released meanwhile."""
+        if into is not None:
+            into.render(self)
+            return into
         return self._c.pile_render_to_buffer()
 
     def pile_render_to_file(self, fd: int, /) -> None:
         """Write the last rendered frame, in its entirety, to file descriptor.
 
         If render() has not yet been called, nothing will be written.
+        The fd is left open. Use NcRenderSink to stream frames to a fd.
         """
         self._c.pile_render_to_file(fd)
 
@@ -1542,6 +1924,1061 @@ class NcPlane:
         """Effect scroll events on the plane."""
         self._c.scrollup(r)
 
+    def execute(self, display_list: NcDisplayList, /) -> int:
+        """Replay every op of the display list on the plane.
+
+        Stops on the first failing op and raises RuntimeError
+        naming its index.
+
+        Returns the number of ops replayed.
+        """
+        return self._c.execute(display_list._c)
+
+    def snapshot(self, begy: int = 0, begx: int = 0,
+                 leny: int = 0, lenx: int = 0,
+                 ) -> Tuple[memoryview, memoryview, memoryview]:
+        """Copy the cells of the selected region in one call.
+
+        Returns read-only 2-D memoryviews of uint32 codepoints,
+        uint16 stylemasks and uint64 channels, usable directly
+        or through numpy.asarray().
+
+        Codepoint is the first codepoint of the cell's EGC, with
+        NCPLANE_SNAPSHOT_CLUSTER set if the EGC has more of them.
+        Use egcs() to resolve those. Right halves of wide glyphs are
+        0, with the stylemask and channels of their left half. Zero
+        length extends the region to the plane edge.
+
+        Cells are copied out without touching the plane, so this can
+        run while another thread renders its pile.
+        """
+        return self._c.snapshot(begy, begx, leny, lenx)
+
+    def egcs(self, begy: int = 0, begx: int = 0,
+             leny: int = 0, lenx: int = 0) -> List[List[str]]:
+        """Return EGCs of the selected region as a list of rows.
+
+        Right halves of wide glyphs and empty cells are empty
+        strings, so joining a row gives the same text as contents().
+        On a plane with a base cell, empty cells hold its EGC instead.
+        """
+        return self._c.egcs(begy, begx, leny, lenx)
+
+    def blit_cells(self, y: int, x: int, codepoints: Any,
+                   fg: Any = None, bg: Any = None, styles: Any = None,
+                   cols: int = 0, channels: Any = None) -> int:
+        """Write a rectangle of cells in one call.
+
+        Arrays are any buffer protocol objects (NumPy arrays,
+        array.array, memoryview) of the same 2-D shape: uint32
+        codepoints, uint32 fg and bg RGB and uint16 styles.
+        One-dimensional arrays are split into rows of 'cols'.
+        Missing fg, bg or styles use the plane's current ones.
+
+        'channels' is an array of uint64 channel pairs, such as an
+        NcChannelsArray, replacing the plane's channels per cell.
+        fg and bg, if given, are applied on top of it.
+
+        A zero codepoint leaves the cell untouched, use it for the
+        column following a wide glyph.
+
+        Returns the number of cells written.
+        """
+        return self._c.blit_cells(y, x, codepoints, fg, bg, styles, cols,
+                                  channels)
+
+
+
+class NcDisplayList:
+    """List of drawing ops replayed on a plane by NcPlane.execute()
+
+    Arguments are parsed once, when an op is appended. A display
+    list can be replayed any number of times, on any plane.
+    """
+
+    def __init__(self) -> None:
+        self._c = _c.NcDisplayList()
+
+    def __len__(self) -> int:
+        return len(self._c)
+
+    def putstr_yx(self, y: int, x: int, egc: str, /) -> None:
+        """Append NcPlane.putstr_yx(y, x, egc)."""
+        self._c.putstr_yx(y, x, egc)
+
+    def putstr(self, egc: str, /) -> None:
+        """Append NcPlane.putstr(egc)."""
+        self._c.putstr(egc)
+
+    def set_channels(self, channels: int, /) -> None:
+        """Append NcPlane.set_channels(channels)."""
+        self._c.set_channels(channels)
+
+    def set_styles(self, styles: int, /) -> None:
+        """Append NcPlane.set_styles(styles)."""
+        self._c.set_styles(styles)
+
+    def set_fg_rgb(self, rgb: int, /) -> None:
+        """Append NcPlane.set_fg_rgb(rgb)."""
+        self._c.set_fg_rgb(rgb)
+
+    def set_bg_rgb(self, rgb: int, /) -> None:
+        """Append NcPlane.set_bg_rgb(rgb)."""
+        self._c.set_bg_rgb(rgb)
+
+    def cursor_move_yx(self, y: int, x: int, /) -> None:
+        """Append NcPlane.cursor_move_yx(y, x)."""
+        self._c.cursor_move_yx(y, x)
+
+    def format(self, y: int, x: int, ylen: int, xlen: int,
+               stylemask: int, /) -> None:
+        """Append NcPlane.format(y, x, ylen, xlen, stylemask)."""
+        self._c.format(y, x, ylen, xlen, stylemask)
+
+    def stain(self, y: int, x: int, ylen: int, xlen: int,
+              ul: int, ur: int, ll: int, lr: int) -> None:
+        """Append NcPlane.stain(y, x, ylen, xlen, ul, ur, ll, lr)."""
+        self._c.stain(y, x, ylen, xlen, ul, ur, ll, lr)
+
+    def box(self, ystop: int, xstop: int,
+            box_chars: str = _c.NCBOXLIGHT, styles: int = 0,
+            channels: int = 0, ctlword: int = 0) -> None:
+        """Append a box from the cursor to ystop/xstop.
+
+        Falls back to NCBOXASCII on terminals without UTF-8.
+        """
+        self._c.box(ystop, xstop, box_chars, styles, channels, ctlword)
+
+    def box_sized(self, ylen: int, xlen: int,
+                  box_chars: str = _c.NCBOXLIGHT, styles: int = 0,
+                  channels: int = 0, ctlword: int = 0) -> None:
+        """Append a box of ylen x xlen cells at the cursor."""
+        self._c.box_sized(ylen, xlen, box_chars, styles, channels, ctlword)
+
+    def erase(self) -> None:
+        """Append NcPlane.erase()."""
+        self._c.erase()
+
+    def clear(self) -> None:
+        """Remove all ops from the display list."""
+        self._c.clear()
+
+
+class NcFadeCtx:
+    """Colors of a plane saved by NcPlane.fade_setup()."""
+
+    _c: Any
+
+    @property
+    def iterations(self) -> int:
+        """Number of iterations through which the context fades."""
+        return self._c.iterations
+
+
+class NcFader:
+    """Fade of a plane advanced once per frame.
+
+    'mode' is 'in', 'out' or 'pulse'. A pulse fades in and out with
+    'duration' as half period until cancelled. The colors of the plane
+    are saved when the fader is created. Fading in turns the plane black
+    at once, so load it with the target cells before.
+
+    step() recolors the plane for the current time and never blocks,
+    so fades run alongside input handling and other animations:
+
+        fader = NcFader(plane, 0.5, 'in')
+        while not fader.done:
+            if fader.step():
+                nc.request_render()
+            ...
+
+    If the terminal can't fade, the fader is done at once and the plane
+    is left unchanged.
+    """
+
+    def __init__(self, plane: NcPlane, duration: float, mode: str = 'out'):
+        self._c = _c.NcFader(plane._c, duration, mode)
+
+    @property
+    def done(self) -> bool:
+        """True once the fade is over or cancelled."""
+        return self._c.done
+
+    @property
+    def plane(self) -> NcPlane:
+        """The faded plane."""
+        return NcPlane(self._c.plane)
+
+    def step(self, now: Optional[float] = None, /) -> bool:
+        """Recolor the plane for time 'now'.
+
+        'now' is in time.monotonic() seconds, the current time by
+        default. Returns True if the plane changed and needs a render.
+        Does not render.
+        """
+        return self._c.step(now)
+
+    def cancel(self) -> None:
+        """Stop the fade and restore the colors saved at creation."""
+        self._c.cancel()
+
+
+class NcVisual:
+    """Decoded image or video frame.
+
+    Decoding and scaling run with the GIL released. To show the same
+    image repeatedly, prescale() it once for the target plane and blit
+    with the returned blitter and NCSCALE_NONE, or use NcVisualCache.
+    """
+
+    def __init__(self, visual: NcVisual):
+        self._c = visual
+
+    @classmethod
+    def from_file(cls, path: str, /) -> NcVisual:
+        """Open and decode the first frame of the file at 'path'."""
+        return cls(_c.NcVisual.from_file(path))
+
+    @classmethod
+    def from_rgba(cls, data: bytes, rows: int, cols: int,
+                  rowstride: Optional[int] = None) -> NcVisual:
+        """Create a visual from 'rows' lines of 'cols' RGBA pixels.
+
+        'data' is any buffer, each line is 'rowstride' bytes long,
+        cols * 4 by default. The data is copied.
+        """
+        return cls(_c.NcVisual.from_rgba(data, rows, cols, rowstride))
+
+    @property
+    def pixel_dim(self) -> Tuple[int, int]:
+        """Pixel geometry of the decoded frame as (rows, cols)."""
+        return self._c.pixel_dim
+
+    @property
+    def nbytes(self) -> int:
+        """Size in bytes of the decoded RGBA frame."""
+        return self._c.nbytes
+
+    def blit(self, plane: NcPlane, blitter: int = 0, scaling: int = 0,
+             y: int = 0, x: int = 0, flags: int = 0,
+             transcolor: int = 0) -> NcPlane:
+        """Render the visual to 'plane'.
+
+        'blitter' is an NCBLIT_* constant, 'scaling' an NCSCALE_*
+        constant and 'flags' a mask of NCVISUAL_OPTION_* constants.
+        Returns the plane drawn to, a new child of 'plane' if
+        NCVISUAL_OPTION_CHILDPLANE is set.
+        The GIL is released meanwhile.
+        """
+        return NcPlane(self._c.blit(plane._c, blitter, scaling, y, x,
+                                    flags, transcolor))
+
+    def resize(self, rows: int, cols: int, interpolate: bool = True) -> None:
+        """Scale the visual to 'rows' x 'cols' pixels."""
+        self._c.resize(rows, cols, interpolate)
+
+    def geom(self, plane: Optional[NcPlane] = None, blitter: int = 0,
+             scaling: int = 0) -> Dict[str, int]:
+        """Return the fields of the visual's ncvgeom as a dict.
+
+        Without 'plane' only pixy and pixx are filled in.
+        """
+        return self._c.geom(None if plane is None else plane._c,
+                            blitter, scaling)
+
+    def prescale(self, plane: NcPlane, blitter: int = 0,
+                 scaling: int = _c.NCSCALE_SCALE,
+                 interpolate: bool = True) -> int:
+        """Resize the visual as a blit to 'plane' would scale it.
+
+        Returns the blitter that will be used. Blitting with it and
+        NCSCALE_NONE afterwards draws the same picture without scaling
+        the pixels again.
+        """
+        return self._c.prescale(plane._c, blitter, scaling, interpolate)
+
+
+class NcVideoPlayer:
+    """Player of the media at 'path' on 'plane'.
+
+    A thread decodes and scales up to 'queue' frames ahead, with
+    'blitter' and 'scaling', to the size the plane has at creation.
+    update() shows the frame due at the current time and drops the
+    frames it is too late for, so playback keeps to wall clock time
+    when rendering falls behind:
+
+        player = NcVideoPlayer(plane, 'clip.mov', loop=True)
+        while running:
+            event = nc.get(player.next_due())
+            ...
+            if player.update():
+                nc.request_render()
+            nc.render_if_due()
+
+    'loop' restarts the media at its end and 'timescale' multiplies
+    frame durations. Frames are copied as cells, NCBLIT_PIXEL can't
+    be used. Requires Notcurses built with video support.
+    Notcurses.drop_planes() stops the player and drops its frames.
+    """
+
+    def __init__(self, plane: NcPlane, path: str, blitter: int = 0,
+                 scaling: int = _c.NCSCALE_SCALE, queue: int = 8,
+                 loop: bool = False, timescale: float = 1.0):
+        self._c = _c.NcVideoPlayer(plane._c, path, blitter, scaling,
+                                   queue, loop, timescale)
+
+    @property
+    def done(self) -> bool:
+        """True once every decoded frame was shown or dropped and
+        the decoder stopped."""
+        return self._c.done
+
+    @property
+    def plane(self) -> NcPlane:
+        """The plane frames are copied to."""
+        return NcPlane(self._c.plane)
+
+    def update(self, now: Optional[float] = None, /) -> bool:
+        """Copy the frame due at time 'now' to the plane.
+
+        'now' is in time.monotonic() seconds, the current time by
+        default. Returns True if the plane changed and needs a render.
+        Does not render. The clock starts with the first frame shown.
+        """
+        return self._c.update(now)
+
+    def next_due(self) -> Optional[float]:
+        """Seconds until update() should be called next.
+
+        None once playback is over, so it can be passed as the
+        deadline of Notcurses.get().
+        """
+        return self._c.next_due()
+
+    def stop(self) -> None:
+        """Stop the decoder thread and wait for it to exit."""
+        self._c.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the frames 'decoded', 'shown' and 'dropped' since
+        creation, and the frames 'queued' now.
+
+        A high dropped to shown ratio means the application renders
+        slower than the media's frame rate.
+        """
+        return self._c.stats()
+
+
+class NcChannels:
+    """Mutable channel pair, foreground and background.
+
+    The pair is stored inline and edited in place through its
+    properties. It converts to int, so it can be passed wherever
+    channels are expected:
+
+        channels = NcChannels()
+        channels.fg_rgb = 0xff0000
+        channels.bg_alpha = NCALPHA_TRANSPARENT
+        plane.set_channels(channels)
+
+    Compares equal to NcChannels and ints of the same value. Mutable,
+    so not hashable.
+    """
+
+    def __init__(self, channels: int = 0):
+        self._c = _c.NcChannels(channels)
+
+    def __index__(self) -> int:
+        return self._c.channels
+
+    def __int__(self) -> int:
+        return self._c.channels
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NcChannels):
+            other = other._c
+        return bool(self._c == other)
+
+    @property
+    def channels(self) -> int:
+        """The 64-bit channel pair."""
+        return self._c.channels
+
+    @channels.setter
+    def channels(self, channels: int) -> None:
+        self._c.channels = channels
+
+    @property
+    def fchannel(self) -> int:
+        """The 32-bit foreground channel."""
+        return self._c.fchannel
+
+    @fchannel.setter
+    def fchannel(self, channel: int) -> None:
+        self._c.fchannel = channel
+
+    @property
+    def bchannel(self) -> int:
+        """The 32-bit background channel."""
+        return self._c.bchannel
+
+    @bchannel.setter
+    def bchannel(self, channel: int) -> None:
+        self._c.bchannel = channel
+
+    @property
+    def fg_rgb(self) -> int:
+        """Foreground 24-bit RGB.
+
+        Setting it marks the foreground not default.
+        """
+        return self._c.fg_rgb
+
+    @fg_rgb.setter
+    def fg_rgb(self, rgb: int) -> None:
+        self._c.fg_rgb = rgb
+
+    @property
+    def bg_rgb(self) -> int:
+        """Background 24-bit RGB.
+
+        Setting it marks the background not default.
+        """
+        return self._c.bg_rgb
+
+    @bg_rgb.setter
+    def bg_rgb(self, rgb: int) -> None:
+        self._c.bg_rgb = rgb
+
+    @property
+    def fg_alpha(self) -> int:
+        """Foreground NCALPHA_* value."""
+        return self._c.fg_alpha
+
+    @fg_alpha.setter
+    def fg_alpha(self, alpha: int) -> None:
+        self._c.fg_alpha = alpha
+
+    @property
+    def bg_alpha(self) -> int:
+        """Background NCALPHA_* value.
+
+        NCALPHA_HIGHCONTRAST is invalid for the background.
+        """
+        return self._c.bg_alpha
+
+    @bg_alpha.setter
+    def bg_alpha(self, alpha: int) -> None:
+        self._c.bg_alpha = alpha
+
+    @property
+    def fg_palindex(self) -> Optional[int]:
+        """Foreground palette index, None if not indexed."""
+        return self._c.fg_palindex
+
+    @fg_palindex.setter
+    def fg_palindex(self, index: int) -> None:
+        self._c.fg_palindex = index
+
+    @property
+    def bg_palindex(self) -> Optional[int]:
+        """Background palette index, None if not indexed."""
+        return self._c.bg_palindex
+
+    @bg_palindex.setter
+    def bg_palindex(self, index: int) -> None:
+        self._c.bg_palindex = index
+
+    @property
+    def fg_default(self) -> bool:
+        """Whether the terminal's default foreground is used."""
+        return self._c.fg_default
+
+    @fg_default.setter
+    def fg_default(self, default: bool) -> None:
+        self._c.fg_default = default
+
+    @property
+    def bg_default(self) -> bool:
+        """Whether the terminal's default background is used."""
+        return self._c.bg_default
+
+    @bg_default.setter
+    def bg_default(self, default: bool) -> None:
+        self._c.bg_default = default
+
+    def set_fg_rgb8(self, r: int, g: int, b: int, /) -> None:
+        """Set the foreground to the 8-bit components 'r', 'g', 'b'."""
+        self._c.set_fg_rgb8(r, g, b)
+
+    def set_bg_rgb8(self, r: int, g: int, b: int, /) -> None:
+        """Set the background to the 8-bit components 'r', 'g', 'b'."""
+        self._c.set_bg_rgb8(r, g, b)
+
+    def fg_rgb8(self) -> Tuple[int, int, int]:
+        """Foreground as a tuple (r, g, b)."""
+        return self._c.fg_rgb8()
+
+    def bg_rgb8(self) -> Tuple[int, int, int]:
+        """Background as a tuple (r, g, b)."""
+        return self._c.bg_rgb8()
+
+    def reverse(self) -> None:
+        """Swap the foreground and background colours in place."""
+        self._c.reverse()
+
+    def copy(self) -> NcChannels:
+        """Return a new NcChannels with the same value."""
+        return NcChannels(self._c.channels)
+
+
+class NcChannelsArray:
+    """Fixed size array of channel pairs.
+
+    Pairs are stored contiguously as native uint64 values and exposed
+    through the buffer protocol with format 'Q', so the array is
+    passed to NcPlane.blit_cells() and the notcurses.channels
+    functions without converting each item, and can be viewed with
+    memoryview() or numpy.frombuffer():
+
+        row = NcChannelsArray(cols)
+        row.set_bg_rgb(0x202020)
+        row.set_fg_rgb(0xffcc00, 0, highlighted)
+        plane.blit_cells(y, 0, codepoints, channels=row, cols=cols)
+
+    'init' is a length, filled with 'fill', or an iterable or buffer
+    of channel pairs to copy. Items are read as ints.
+    """
+
+    def __init__(self, init: Any = 0, fill: int = 0):
+        self._c = _c.NcChannelsArray(init, fill)
+
+    def __len__(self) -> int:
+        return len(self._c)
+
+    def __getitem__(self, index: int) -> int:
+        return self._c[index]
+
+    def __setitem__(self, index: int, channels: int) -> None:
+        self._c[index] = channels
+
+    def __delitem__(self, index: int) -> None:
+        """Items can't be deleted, raises TypeError."""
+        del self._c[index]
+
+    def __iter__(self) -> Iterator[int]:
+        for index in range(len(self._c)):
+            yield self._c[index]
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        return memoryview(self._c)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the items in bytes."""
+        return self._c.nbytes
+
+    def fill(self, value: int, start: int = 0,
+             stop: Optional[int] = None) -> None:
+        """Set the items in [start, stop) to the channel pair 'value'."""
+        self._c.fill(value, start, stop)
+
+    def set_fg_rgb(self, value: int, start: int = 0,
+                   stop: Optional[int] = None) -> None:
+        """Set the foreground RGB of the items in [start, stop)."""
+        self._c.set_fg_rgb(value, start, stop)
+
+    def set_bg_rgb(self, value: int, start: int = 0,
+                   stop: Optional[int] = None) -> None:
+        """Set the background RGB of the items in [start, stop)."""
+        self._c.set_bg_rgb(value, start, stop)
+
+    def set_fg_alpha(self, value: int, start: int = 0,
+                     stop: Optional[int] = None) -> None:
+        """Set the foreground alpha of the items in [start, stop)."""
+        self._c.set_fg_alpha(value, start, stop)
+
+    def set_bg_alpha(self, value: int, start: int = 0,
+                     stop: Optional[int] = None) -> None:
+        """Set the background alpha of the items in [start, stop)."""
+        self._c.set_bg_alpha(value, start, stop)
+
+    def set_fg_palindex(self, value: int, start: int = 0,
+                        stop: Optional[int] = None) -> None:
+        """Set the foreground palette index of the items in
+        [start, stop)."""
+        self._c.set_fg_palindex(value, start, stop)
+
+    def set_bg_palindex(self, value: int, start: int = 0,
+                        stop: Optional[int] = None) -> None:
+        """Set the background palette index of the items in
+        [start, stop)."""
+        self._c.set_bg_palindex(value, start, stop)
+
+    def set_fg_default(self, start: int = 0,
+                       stop: Optional[int] = None) -> None:
+        """Use the default foreground for the items in [start, stop)."""
+        self._c.set_fg_default(start, stop)
+
+    def set_bg_default(self, start: int = 0,
+                       stop: Optional[int] = None) -> None:
+        """Use the default background for the items in [start, stop)."""
+        self._c.set_bg_default(start, stop)
+
+
+class NcCell:
+    """Cell made of an EGC, styles and channels.
+
+    Not bound to a plane: the EGC is owned by the cell, so it stays
+    valid when planes are erased or resized, and the same cell can be
+    put on any plane. Clusters of up to four bytes are stored inline,
+    longer ones once per cell and shared by its copies.
+
+        cell = NcCell('█', channels=channels)
+        plane.fill_yx(0, 0, 0, 0, cell)
+
+    Mutable, so not hashable.
+    """
+
+    def __init__(self, egc: str = '', styles: int = 0, channels: int = 0):
+        self._c = _c.NcCell(egc, styles, channels)
+
+    @classmethod
+    def _from_c(cls, c: Any) -> NcCell:
+        self = cls.__new__(cls)
+        self._c = c
+        return self
+
+    @property
+    def egc(self) -> str:
+        """The extended grapheme cluster, '' for a blank cell."""
+        return self._c.egc
+
+    @egc.setter
+    def egc(self, egc: str) -> None:
+        self._c.egc = egc
+
+    @property
+    def cols(self) -> int:
+        """Number of columns the EGC occupies."""
+        return self._c.cols
+
+    @property
+    def styles(self) -> int:
+        """NCSTYLE_* styles mask."""
+        return self._c.styles
+
+    @styles.setter
+    def styles(self, styles: int) -> None:
+        self._c.styles = styles
+
+    @property
+    def channels(self) -> int:
+        """The 64-bit channel pair."""
+        return self._c.channels
+
+    @channels.setter
+    def channels(self, channels: int) -> None:
+        self._c.channels = channels
+
+    @property
+    def fg_rgb(self) -> int:
+        """Foreground 24-bit RGB.
+
+        Setting it marks the foreground not default.
+        """
+        return self._c.fg_rgb
+
+    @fg_rgb.setter
+    def fg_rgb(self, fg_rgb: int) -> None:
+        self._c.fg_rgb = fg_rgb
+
+    @property
+    def bg_rgb(self) -> int:
+        """Background 24-bit RGB.
+
+        Setting it marks the background not default.
+        """
+        return self._c.bg_rgb
+
+    @bg_rgb.setter
+    def bg_rgb(self, bg_rgb: int) -> None:
+        self._c.bg_rgb = bg_rgb
+
+    @property
+    def fg_alpha(self) -> int:
+        """Foreground NCALPHA_* value."""
+        return self._c.fg_alpha
+
+    @fg_alpha.setter
+    def fg_alpha(self, fg_alpha: int) -> None:
+        self._c.fg_alpha = fg_alpha
+
+    @property
+    def bg_alpha(self) -> int:
+        """Background NCALPHA_* value."""
+        return self._c.bg_alpha
+
+    @bg_alpha.setter
+    def bg_alpha(self, bg_alpha: int) -> None:
+        self._c.bg_alpha = bg_alpha
+
+    def copy(self) -> NcCell:
+        """Return a new NcCell with the same EGC, styles and channels."""
+        return NcCell._from_c(self._c.copy())
+
+
+class NcUplot:
+    """Plot of uint64 samples, created with NcPlane.uplot_create().
+
+    Lives as long as its plane. Every sample added redraws the plot, so
+    feed batches through add_samples() rather than add_sample() in a
+    loop.
+    """
+
+    _c: Any
+
+    @classmethod
+    def _from_c(cls, c: Any) -> NcUplot:
+        self = cls.__new__(cls)
+        self._c = c
+        return self
+
+    @property
+    def plane(self) -> NcPlane:
+        """The plane the plot draws on, destroyed along with it."""
+        return NcPlane(self._c.plane)
+
+    def add_sample(self, x: int, y: int, /) -> None:
+        """Add 'y' to the value at 'x' and redraw the plot.
+
+        If 'x' is past the window, the window advances to it and the
+        samples falling out of it are lost.
+        """
+        self._c.add_sample(x, y)
+
+    def set_sample(self, x: int, y: int, /) -> None:
+        """Set the value at 'x' to 'y' and redraw the plot."""
+        self._c.set_sample(x, y)
+
+    def sample(self, x: int, /) -> int:
+        """Return the value at 'x', which must be within the window."""
+        return self._c.sample(x)
+
+    def add_samples(self, xs: Any, ys: Any, /) -> None:
+        """Add a batch of samples in one call.
+
+        'xs' and 'ys' are one dimensional buffers of the same length,
+        such as array('Q') or numpy arrays, of 8-byte integers. The
+        batch is ingested in C with the GIL released. Consecutive
+        samples with the same x are summed and samples older than the
+        window the batch ends with are skipped, so the plot is redrawn
+        at most once per x left in the window. With domain detection,
+        the domain thus follows those sums rather than every
+        intermediate value.
+
+        A sample behind the current window raises ValueError before
+        any sample is added.
+        """
+        self._c.add_samples(xs, ys)
+
+    def destroy(self) -> None:
+        """Destroy the plot and its plane."""
+        self._c.destroy()
+
+
+class NcDplot:
+    """Plot of double samples, created with NcPlane.dplot_create().
+
+    Lives as long as its plane. Every sample added redraws the plot, so
+    feed batches through add_samples() rather than add_sample() in a
+    loop.
+    """
+
+    _c: Any
+
+    @classmethod
+    def _from_c(cls, c: Any) -> NcDplot:
+        self = cls.__new__(cls)
+        self._c = c
+        return self
+
+    @property
+    def plane(self) -> NcPlane:
+        """The plane the plot draws on, destroyed along with it."""
+        return NcPlane(self._c.plane)
+
+    def add_sample(self, x: int, y: float, /) -> None:
+        """Add 'y' to the value at 'x' and redraw the plot.
+
+        If 'x' is past the window, the window advances to it and the
+        samples falling out of it are lost.
+        """
+        self._c.add_sample(x, y)
+
+    def set_sample(self, x: int, y: float, /) -> None:
+        """Set the value at 'x' to 'y' and redraw the plot."""
+        self._c.set_sample(x, y)
+
+    def sample(self, x: int, /) -> float:
+        """Return the value at 'x', which must be within the window."""
+        return self._c.sample(x)
+
+    def add_samples(self, xs: Any, ys: Any, /) -> None:
+        """Add a batch of samples in one call.
+
+        'xs' and 'ys' are one dimensional buffers of the same length,
+        such as array('Q') or numpy arrays: 8-byte integers for 'xs'
+        and doubles for 'ys'. The batch is ingested in C with the GIL
+        released. Consecutive samples with the same x are summed and
+        samples older than the window the batch ends with are skipped,
+        so the plot is redrawn at most once per x left in the window.
+        With domain detection, the domain thus follows those sums
+        rather than every intermediate value.
+
+        A sample behind the current window raises ValueError before
+        any sample is added.
+        """
+        self._c.add_samples(xs, ys)
+
+    def destroy(self) -> None:
+        """Destroy the plot and its plane."""
+        self._c.destroy()
+
+
+class NcDirect:
+    """Direct mode context.
+
+    Styled text is written in the normal flow of the terminal, without
+    planes or rendering. 'flags' are NCDIRECT_OPTION_*.
+    """
+
+    def __init__(self, term_type: Optional[str] = None, flags: int = 0):
+        self._c = _c.NcDirect(term_type, flags)
+
+    @property
+    def dimensions_yx(self) -> Tuple[int, int]:
+        """Terminal size as a tuple (rows, cols)."""
+        return self._c.dimensions_yx
+
+    @property
+    def cursor_enabled(self) -> bool:
+        """Whether the cursor is shown. Setting it shows or hides
+        the cursor."""
+        return self._c.cursor_enabled
+
+    @cursor_enabled.setter
+    def cursor_enabled(self, enabled: bool) -> None:
+        self._c.cursor_enabled = enabled
+
+    def putstr(self, text: str, channels: int = 0, /) -> int:
+        """Output 'text' with 'channels', default colours if omitted.
+
+        Every colour change is written out on its own, use batch()
+        when printing many short runs.
+        """
+        return self._c.putstr(text, channels)
+
+    def flush(self) -> None:
+        """Flush the output. The GIL is released meanwhile."""
+        self._c.flush()
+
+    def set_fg_rgb(self, rgb: int, /) -> None:
+        """Set the foreground to the 24-bit 'rgb' colour."""
+        self._c.set_fg_rgb(rgb)
+
+    def set_bg_rgb(self, rgb: int, /) -> None:
+        """Set the background to the 24-bit 'rgb' colour."""
+        self._c.set_bg_rgb(rgb)
+
+    def set_fg_default(self) -> None:
+        """Use the default foreground colour."""
+        self._c.set_fg_default()
+
+    def set_bg_default(self) -> None:
+        """Use the default background colour."""
+        self._c.set_bg_default()
+
+    def set_styles(self, styles: int, /) -> None:
+        """Set the NCSTYLE_* styles mask."""
+        self._c.set_styles(styles)
+
+    def cursor_move_yx(self, y: int, x: int, /) -> None:
+        """Move the cursor to 'y', 'x'. -1 keeps the current
+        coordinate."""
+        self._c.cursor_move_yx(y, x)
+
+    def clear(self) -> None:
+        """Clear the screen."""
+        self._c.clear()
+
+    def palette_size(self) -> int:
+        """Number of indexed colours the terminal supports."""
+        return self._c.palette_size()
+
+    def canutf8(self) -> bool:
+        """Is our encoding UTF-8?"""
+        return self._c.canutf8()
+
+    def batch(self) -> NcDirectBatch:
+        """Return a batch collecting styled output to write at once."""
+        return NcDirectBatch(self._c.batch())
+
+    def stop(self) -> None:
+        """Restore the terminal and release the context.
+
+        Called on garbage collection otherwise. Fails while another
+        thread flushes output of the context.
+        """
+        self._c.stop()
+
+
+class NcDirectBatch:
+    """Styled output of an NcDirect written with a single write.
+
+    putstr() appends to a buffer, adding an escape sequence only where
+    the colours change, and flush() writes the buffer at once. A bar
+    of hundreds of coloured cells becomes one write instead of one per
+    cell:
+
+        with nc_direct.batch() as batch:
+            for rgb in gradient:
+                batch.putstr('X', channels(rgb))
+
+    Colours are converted to what the terminal supports. The output
+    ends with the default colours. Flushed when the context manager
+    exits.
+
+    Runs only carry colours. Styles are not reset: the whole batch is
+    drawn with the styles set by NcDirect.set_styles() at the time of
+    flush(), so change styles between batches rather than within one.
+    """
+
+    def __init__(self, batch: Any):
+        self._c = batch
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes collected and not yet written."""
+        return self._c.nbytes
+
+    @property
+    def runs(self) -> int:
+        """Runs collected and not yet written."""
+        return self._c.runs
+
+    def putstr(self, text: str, channels: int = 0, /) -> None:
+        """Append 'text' with 'channels', default colours if
+        omitted."""
+        self._c.putstr(text, channels)
+
+    def flush(self) -> int:
+        """Write the collected output and return its length in bytes.
+
+        Output of the NcDirect not yet flushed goes first, and its
+        current styles apply to the whole batch. The GIL is released
+        meanwhile.
+        """
+        return self._c.flush()
+
+    def __enter__(self) -> NcDirectBatch:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.flush()
+
+
+class NcRenderBuffer:
+    """Reusable buffer holding the last rendered frame.
+
+    The buffer is grown as needed and kept across frames. It supports
+    the buffer protocol, so the frame can be written without copying:
+
+        buffer = NcRenderBuffer()
+        while True:
+            plane.pile_render_to_buffer(buffer)
+            os.write(fd, buffer)
+
+    Memoryviews of the frame must be released before the next render.
+    """
+
+    def __init__(self) -> None:
+        self._c = _c.NcRenderBuffer()
+
+    def __len__(self) -> int:
+        return len(self._c)
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        return memoryview(self._c)
+
+    @property
+    def capacity(self) -> int:
+        """Bytes allocated, kept across frames."""
+        return self._c.capacity
+
+    @property
+    def frames(self) -> int:
+        """Number of frames rendered into the buffer."""
+        return self._c.frames
+
+    def render(self, plane: NcPlane, /) -> int:
+        """Render and rasterize the pile of 'plane' into the buffer.
+
+        Replaces the previous frame and returns its length in bytes.
+        Raises BufferError while memoryviews of the previous frame
+        are alive. The GIL is released meanwhile.
+        """
+        return self._c.render(plane._c)
+
+
+class NcRenderSink:
+    """Long-lived writer of the frames of a pile to a file descriptor.
+
+    The sink is bound to the pile of 'plane' and to 'fd' (a file, pipe
+    or socket) once and keeps its buffer across frames. The fd is never
+    closed by the sink.
+
+    With 'nonblocking' the fd is switched to O_NONBLOCK. A frame the
+    peer does not take at once stays pending, and new frames are
+    skipped until it is written, so a slow peer never blocks the
+    caller and always receives whole frames. The flag applies to every
+    duplicate of the fd; the sink puts the previous flags back when it
+    is deleted, which must thus happen before the fd is closed.
+    """
+
+    def __init__(self, plane: NcPlane, fd: int, nonblocking: bool = False):
+        self._c = _c.NcRenderSink(plane._c, fd, nonblocking)
+
+    def render(self) -> bool:
+        """Render and rasterize the pile and write the frame to the fd.
+
+        If the previous frame is still pending, the rest of it is
+        written instead and the new frame is skipped. Returns True if a
+        new frame was rendered. The GIL is released meanwhile.
+        """
+        return self._c.render()
+
+    def flush(self) -> int:
+        """Write as much of the pending frame as the fd takes.
+
+        Returns the number of bytes still pending.
+        """
+        return self._c.flush()
+
+    def fileno(self) -> int:
+        """Return the file descriptor frames are written to."""
+        return self._c.fileno()
+
+    def stats(self) -> Dict[str, float]:
+        """Frame and write statistics.
+
+        'last_bytes' and 'last_latency' (seconds from the end of
+        rasterization to the last byte written) describe the last
+        complete frame. 'frames_written', 'frames_skipped',
+        'bytes_written' and 'pending' bytes are counted since creation.
+        """
+        return self._c.stats()
+
 
 NCBOXASCII: str
 NCBOXDOUBLE: str
@@ -1550,6 +2987,8 @@ NCBOXLIGHT: str
 NCBOXOUTER: str
 NCBOXROUND: str
 
+NCPLANE_SNAPSHOT_CLUSTER: int
+
 # region functions from functions.c
 def box(
     plane: NcPlane, ystop: int, xstop: int,
@@ -27,6 +27,156 @@ PyTypeObject NcPlaneOptions_Type = {
     .tp_new = PyType_GenericNew,
 };
 
+// Every live wrapper, so planes freed by the library can be invalidated.
+static NcPlaneObject *ncplane_registry = NULL;
+
+// ncplane address -> address of its wrapper, as ints. The wrapper removes
+// itself before it is freed or its plane is, so the references are borrowed.
+static PyObject *ncplane_wrappers = NULL;
+
+static int
+ncplane_wrappers_find(const struct ncplane *ncplane_ptr, NcPlaneObject **wrapper)
+{
+    *wrapper = NULL;
+    if (NULL == ncplane_wrappers)
+    {
+        return 0;
+    }
+
+    PyObject *key CLEANUP_PY_OBJ = GNU_PY_CHECK_RET_NEG1(PyLong_FromVoidPtr((void *)ncplane_ptr));
+    PyObject *value = PyDict_GetItemWithError(ncplane_wrappers, key);
+    if (NULL == value)
+    {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    *wrapper = PyLong_AsVoidPtr(value);
+    return 0;
+}
+
+static int
+ncplane_wrappers_add(NcPlaneObject *wrapper)
+{
+    if (NULL == ncplane_wrappers)
+    {
+        ncplane_wrappers = GNU_PY_CHECK_RET_NEG1(PyDict_New());
+    }
+
+    PyObject *key CLEANUP_PY_OBJ = GNU_PY_CHECK_RET_NEG1(PyLong_FromVoidPtr(wrapper->ncplane_ptr));
+    PyObject *value CLEANUP_PY_OBJ = GNU_PY_CHECK_RET_NEG1(PyLong_FromVoidPtr(wrapper));
+    return PyDict_SetItem(ncplane_wrappers, key, value);
+}
+
+// Never fails, may be called while an exception is set.
+static void
+ncplane_wrappers_remove(const struct ncplane *ncplane_ptr)
+{
+    if (NULL == ncplane_wrappers)
+    {
+        return;
+    }
+
+    PyObject *type = NULL, *value = NULL, *traceback = NULL;
+    PyErr_Fetch(&type, &value, &traceback);
+    PyObject *key = PyLong_FromVoidPtr((void *)ncplane_ptr);
+    if (NULL == key || PyDict_DelItem(ncplane_wrappers, key) < 0)
+    {
+        // Only fails on memory exhaustion, or if the plane was not wrapped.
+        PyErr_Clear();
+    }
+    Py_XDECREF(key);
+    PyErr_Restore(type, value, traceback);
+}
+
+// Return the wrapper of 'ncplane_ptr', creating it if there is none yet.
+// Returns None for a NULL plane.
+PyObject *
+NcPlane_wrap(struct ncplane *ncplane_ptr, PyObject *notcurses_obj)
+{
+    if (NULL == ncplane_ptr)
+    {
+        Py_RETURN_NONE;
+    }
+
+    NcPlaneObject *existing = NULL;
+    GNU_PY_CHECK_INT(ncplane_wrappers_find(ncplane_ptr, &existing));
+    if (NULL != existing)
+    {
+        Py_INCREF(existing);
+        return (PyObject *)existing;
+    }
+
+    NcPlaneObject *new_plane = (NcPlaneObject *)GNU_PY_CHECK(NcPlane_Type.tp_alloc(&NcPlane_Type, 0));
+    Py_INCREF(notcurses_obj);
+    new_plane->notcurses_obj = notcurses_obj;
+
+    new_plane->registry_next = ncplane_registry;
+    if (NULL != ncplane_registry)
+    {
+        ncplane_registry->registry_prev = new_plane;
+    }
+    ncplane_registry = new_plane;
+
+    new_plane->ncplane_ptr = ncplane_ptr;
+    if (ncplane_wrappers_add(new_plane) < 0)
+    {
+        new_plane->ncplane_ptr = NULL;
+        Py_DECREF(new_plane);
+        return NULL;
+    }
+    return (PyObject *)new_plane;
+}
+
+void
+NcPlane_forget(NcPlaneObject *plane)
+{
+    if (NULL != plane->ncplane_ptr)
+    {
+        ncplane_wrappers_remove(plane->ncplane_ptr);
+        plane->ncplane_ptr = NULL;
+    }
+}
+
+// Mark wrappers of 'notcurses_obj' planes as destroyed, except for 'keep'.
+// Must be called before the library frees the planes.
+void
+NcPlane_invalidate_planes(PyObject *notcurses_obj, const struct ncplane *keep)
+{
+    for (NcPlaneObject *plane = ncplane_registry; NULL != plane; plane = plane->registry_next)
+    {
+        if (plane->notcurses_obj == notcurses_obj && plane->ncplane_ptr != keep)
+        {
+            NcPlane_forget(plane);
+        }
+    }
+}
+
+static void
+NcPlane_dealloc(NcPlaneObject *self)
+{
+    if (NULL != self->weakreflist)
+    {
+        PyObject_ClearWeakRefs((PyObject *)self);
+    }
+
+    NcPlane_forget(self);
+
+    if (NULL != self->registry_prev)
+    {
+        self->registry_prev->registry_next = self->registry_next;
+    }
+    else if (ncplane_registry == self)
+    {
+        ncplane_registry = self->registry_next;
+    }
+    if (NULL != self->registry_next)
+    {
+        self->registry_next->registry_prev = self->registry_prev;
+    }
+
+    Py_XDECREF(self->notcurses_obj);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
 static PyObject *
 NcPlane_new(PyTypeObject *Py_UNUSED(subtype), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
 {
@@ -35,8 +185,9 @@ NcPlane_new(PyTypeObject *Py_UNUSED(subtype), PyObject *Py_UNUSED(args), PyObjec
 }
 
 static PyObject *
-Ncplane_create(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+Ncplane_create(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
     unsigned rows = 0, cols = 0;
     const char *name = NULL;
@@ -50,12 +201,34 @@ Ncplane_create(NcPlaneObject *self, PyObject *args, PyObject *kwds)
                         "flags",
                         "margin_b", "margin_r", NULL};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "ii|iisKii", keywords,
-                                                  &rows, &cols,
-                                                  &y, &x,
-                                                  &name,
-                                                  &flags,
-                                                  &margin_b, &margin_r));
+    PyObject *parsed[8];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("create", args, nargs, kwnames, keywords, 2, parsed));
+    rows = GNU_PY_ARG_UINT(parsed[0]);
+    cols = GNU_PY_ARG_UINT(parsed[1]);
+    if (NULL != parsed[2])
+    {
+        y = GNU_PY_ARG_INT(parsed[2]);
+    }
+    if (NULL != parsed[3])
+    {
+        x = GNU_PY_ARG_INT(parsed[3]);
+    }
+    if (NULL != parsed[4])
+    {
+        name = GNU_PY_ARG_STR(parsed[4]);
+    }
+    if (NULL != parsed[5])
+    {
+        flags = GNU_PY_ARG_ULL(parsed[5]);
+    }
+    if (NULL != parsed[6])
+    {
+        margin_b = GNU_PY_ARG_UINT(parsed[6]);
+    }
+    if (NULL != parsed[7])
+    {
+        margin_r = GNU_PY_ARG_UINT(parsed[7]);
+    }
 
     ncplane_options options = {
         .y = y,
@@ -69,19 +242,17 @@ Ncplane_create(NcPlaneObject *self, PyObject *args, PyObject *kwds)
         .resizecb = ncplane_resize_maximize,
     };
 
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = CHECK_NOTCURSES_PTR(ncplane_create(self->ncplane_ptr, &options));
+    struct ncplane *new_plane = CHECK_NOTCURSES_PTR(ncplane_create(self->ncplane_ptr, &options));
 
-    Py_INCREF(new_object);
-    return new_object;
+    return NcPlane_wrap(new_plane, self->notcurses_obj);
 }
 
 static PyObject *
 NcPlane_destroy(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     struct ncplane *temp_ptr = self->ncplane_ptr;
-    self->ncplane_ptr = NULL;
+    NcPlane_forget(self);
     CHECK_NOTCURSES(ncplane_destroy(temp_ptr));
 
     Py_RETURN_NONE;
@@ -90,17 +261,15 @@ NcPlane_destroy(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_notcurses(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    PyObject *new_object = Notcurses_Type.tp_alloc((PyTypeObject *)&Notcurses_Type, 0);
-    NotcursesObject *new_notcurses = (NotcursesObject *)new_object;
-    new_notcurses->notcurses_ptr = CHECK_NOTCURSES_PTR(ncplane_notcurses(self->ncplane_ptr));
-
-    Py_INCREF(new_object);
-    return new_object;
+    CHECK_NCPLANE(self);
+    Py_INCREF(self->notcurses_obj);
+    return self->notcurses_obj;
 }
 
 static PyObject *
 NcPlane_dim_yx(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     unsigned y = 0, x = 0;
     ncplane_dim_yx(self->ncplane_ptr, &y, &x);
 
@@ -110,18 +279,21 @@ NcPlane_dim_yx(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_dim_x(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    return Py_BuildValue("I", ncplane_dim_x(self->ncplane_ptr));
+    CHECK_NCPLANE(self);
+    return PyLong_FromUnsignedLong(ncplane_dim_x(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_dim_y(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    return Py_BuildValue("I", ncplane_dim_y(self->ncplane_ptr));
+    CHECK_NCPLANE(self);
+    return PyLong_FromUnsignedLong(ncplane_dim_y(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_pixel_geom(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     unsigned pxy = 0, pxx = 0, celldimy = 0, celldimx = 0, maxbmapy = 0, maxbmapx = 0;
     ncplane_pixel_geom(self->ncplane_ptr, &pxy, &pxx, &celldimy, &celldimx, &maxbmapy, &maxbmapx);
 
@@ -129,18 +301,19 @@ NcPlane_pixel_geom(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 }
 
 static PyObject *
-NcPlane_set_resizecb(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_set_resizecb(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO");
     return NULL;
 }
 
 static PyObject *
-NcPlane_reparent(NcPlaneObject *self, PyObject *args)
+NcPlane_reparent(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     NcPlaneObject *new_parent = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "O!", &NcPlane_Type, &new_parent));
+    new_parent = GNU_PY_ARG_NCPLANE(arg);
 
     CHECK_NOTCURSES_PTR(ncplane_reparent(self->ncplane_ptr, new_parent->ncplane_ptr));
 
@@ -148,11 +321,12 @@ NcPlane_reparent(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_reparent_family(NcPlaneObject *self, PyObject *args)
+NcPlane_reparent_family(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     NcPlaneObject *new_parent = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "O!", &NcPlane_Type, &new_parent));
+    new_parent = GNU_PY_ARG_NCPLANE(arg);
 
     CHECK_NOTCURSES_PTR(ncplane_reparent_family(self->ncplane_ptr, new_parent->ncplane_ptr));
 
@@ -162,53 +336,58 @@ NcPlane_reparent_family(NcPlaneObject *self, PyObject *args)
 static PyObject *
 NcPlane_dup(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = CHECK_NOTCURSES_PTR(ncplane_dup(self->ncplane_ptr, NULL));
+    CHECK_NCPLANE(self);
+    struct ncplane *new_plane = CHECK_NOTCURSES_PTR(ncplane_dup(self->ncplane_ptr, NULL));
 
-    Py_INCREF(new_object);
-    return new_object;
+    return NcPlane_wrap(new_plane, self->notcurses_obj);
 }
 
 static PyObject *
-NcPlane_translate(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_translate(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     NcPlaneObject *dst_obj = NULL;
     int y = 0, x = 0;
 
     char *keywords[] = {"dst",
                         NULL};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "O!", keywords,
-                                                  &NcPlane_Type, &dst_obj));
+    PyObject *parsed[1];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("translate", args, nargs, kwnames, keywords, 1, parsed));
+    dst_obj = GNU_PY_ARG_NCPLANE(parsed[0]);
 
     ncplane_translate(self->ncplane_ptr, dst_obj->ncplane_ptr, &y, &x);
 
-    return Py_BuildValue("ii", &y, &x);
+    return Py_BuildValue("ii", y, x);
 }
 
 static PyObject *
-NcPlane_translate_abs(NcPlaneObject *self, PyObject *args)
+NcPlane_translate_abs(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int x = 0, y = 0;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "ii", &y, &x));
+    GNU_PY_CHECK_NARGS("translate_abs", nargs, 2, 2);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
 
     return PyBool_FromLong((long)ncplane_translate_abs(self->ncplane_ptr, &y, &x));
 }
 
 static PyObject *
-NcPlane_set_scrolling(NcPlaneObject *self, PyObject *args)
+NcPlane_set_scrolling(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     int scrollp_int = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "p", &scrollp_int));
+    scrollp_int = GNU_PY_ARG_BOOL(arg);
 
     return PyBool_FromLong((long)ncplane_set_scrolling(self->ncplane_ptr, (bool)scrollp_int));
 }
 
 static PyObject *
-NcPlane_resize(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_resize(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     int keepy = 0, keepx = 0;
     unsigned keepleny = 0, keeplenx = 0;
     int yoff = 0, xoff = 0;
@@ -220,11 +399,16 @@ NcPlane_resize(NcPlaneObject *self, PyObject *args, PyObject *kwds)
                         "ylen", "xlen",
                         NULL};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "iiIIiiII", keywords,
-                                                  &keepy, &keepx,
-                                                  &keepleny, &keeplenx,
-                                                  &yoff, &xoff,
-                                                  &ylen, &xlen));
+    PyObject *parsed[8];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("resize", args, nargs, kwnames, keywords, 8, parsed));
+    keepy = GNU_PY_ARG_INT(parsed[0]);
+    keepx = GNU_PY_ARG_INT(parsed[1]);
+    keepleny = GNU_PY_ARG_UINT(parsed[2]);
+    keeplenx = GNU_PY_ARG_UINT(parsed[3]);
+    yoff = GNU_PY_ARG_INT(parsed[4]);
+    xoff = GNU_PY_ARG_INT(parsed[5]);
+    ylen = GNU_PY_ARG_UINT(parsed[6]);
+    xlen = GNU_PY_ARG_UINT(parsed[7]);
 
     CHECK_NOTCURSES(ncplane_resize(self->ncplane_ptr, keepy, keepx, keepleny, keeplenx, yoff, xoff, ylen, xlen));
 
@@ -232,11 +416,14 @@ NcPlane_resize(NcPlaneObject *self, PyObject *args, PyObject *kwds)
 }
 
 static PyObject *
-NcPlane_resize_simple(NcPlaneObject *self, PyObject *args)
+NcPlane_resize_simple(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     unsigned ylen = 0, xlen = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "II", &ylen, &xlen));
+    GNU_PY_CHECK_NARGS("resize_simple", nargs, 2, 2);
+    ylen = GNU_PY_ARG_UINT(args[0]);
+    xlen = GNU_PY_ARG_UINT(args[1]);
 
     CHECK_NOTCURSES(ncplane_resize_simple(self->ncplane_ptr, ylen, xlen));
 
@@ -244,32 +431,67 @@ NcPlane_resize_simple(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_set_base_cell(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_set_base_cell(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
+    CHECK_NCPLANE(self);
+    GNU_PY_CHECK_NARGS("set_base_cell", nargs, 1, 1);
+    NcCellObject *cell = GNU_PY_ARG_TYPE(args[0], &NcCell_Type, NcCellObject);
+
+    nccell c = NCCELL_TRIVIAL_INITIALIZER;
+    GNU_PY_CHECK_INT(NcCell_load(cell, self->ncplane_ptr, &c));
+    int const ret = ncplane_set_base_cell(self->ncplane_ptr, &c);
+    nccell_release(self->ncplane_ptr, &c);
+    CHECK_NOTCURSES(ret);
+
+    Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_set_base(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_set_base(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
+    CHECK_NCPLANE(self);
+    const char *egc = NULL;
+    unsigned short styles = 0;
+    unsigned long long channels = 0;
+
+    char *keywords[] = {"egc", "styles", "channels", NULL};
+
+    PyObject *parsed[3];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("set_base", args, nargs, kwnames, keywords, 1, parsed));
+    egc = GNU_PY_ARG_STR(parsed[0]);
+    if (NULL != parsed[1])
+    {
+        styles = GNU_PY_ARG_USHORT(parsed[1]);
+    }
+    if (NULL != parsed[2])
+    {
+        channels = GNU_PY_ARG_ULL(parsed[2]);
+    }
+
+    CHECK_NOTCURSES(ncplane_set_base(self->ncplane_ptr, egc, styles, (uint64_t)channels));
+
+    Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_base(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_base(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
+    CHECK_NCPLANE(self);
+    nccell c = NCCELL_TRIVIAL_INITIALIZER;
+    CHECK_NOTCURSES(ncplane_base(self->ncplane_ptr, &c));
+
+    return NcCell_from_plane(self->ncplane_ptr, &c);
 }
 
 static PyObject *
-NcPlane_move_yx(NcPlaneObject *self, PyObject *args)
+NcPlane_move_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "ii", &y, &x));
+    GNU_PY_CHECK_NARGS("move_yx", nargs, 2, 2);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
 
     CHECK_NOTCURSES(ncplane_move_yx(self->ncplane_ptr, y, x));
 
@@ -279,6 +501,7 @@ NcPlane_move_yx(NcPlaneObject *self, PyObject *args)
 static PyObject *
 NcPlane_yx(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
 
     ncplane_yx(self->ncplane_ptr, &y, &x);
@@ -289,18 +512,21 @@ NcPlane_yx(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_y(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     return PyLong_FromLong((long)ncplane_y(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_x(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     return PyLong_FromLong((long)ncplane_x(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_abs_yx(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
 
     ncplane_abs_yx(self->ncplane_ptr, &y, &x);
@@ -311,41 +537,33 @@ NcPlane_abs_yx(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_abs_y(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     return PyLong_FromLong((long)ncplane_abs_y(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_abs_x(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     return PyLong_FromLong((long)ncplane_abs_x(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_parent(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     struct ncplane *possible_parent = ncplane_parent(self->ncplane_ptr);
 
-    if (NULL == possible_parent)
-    {
-        Py_RETURN_NONE;
-    }
-    else
-    {
-        PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-        NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-        new_plane->ncplane_ptr = possible_parent;
-
-        Py_INCREF(new_object);
-        return new_object;
-    }
+    return NcPlane_wrap(possible_parent, self->notcurses_obj);
 }
 
 static PyObject *
-NcPlane_descendant_p(NcPlaneObject *self, PyObject *args)
+NcPlane_descendant_p(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     NcPlaneObject *ancestor_obj = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "O!", &NcPlane_Type, &ancestor_obj));
+    ancestor_obj = GNU_PY_ARG_NCPLANE(arg);
 
     return PyBool_FromLong((long)ncplane_descendant_p(self->ncplane_ptr, ancestor_obj->ncplane_ptr));
 }
@@ -353,6 +571,7 @@ NcPlane_descendant_p(NcPlaneObject *self, PyObject *args)
 static PyObject *
 NcPlane_move_top(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     ncplane_move_top(self->ncplane_ptr);
     Py_RETURN_NONE;
 }
@@ -360,16 +579,18 @@ NcPlane_move_top(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_move_bottom(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     ncplane_move_bottom(self->ncplane_ptr);
     Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_move_above(NcPlaneObject *self, PyObject *args)
+NcPlane_move_above(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     NcPlaneObject *above_obj = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "O!", &NcPlane_Type, &above_obj));
+    above_obj = GNU_PY_ARG_NCPLANE(arg);
 
     CHECK_NOTCURSES(ncplane_move_above(self->ncplane_ptr, above_obj->ncplane_ptr));
 
@@ -377,11 +598,12 @@ NcPlane_move_above(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_move_below(NcPlaneObject *self, PyObject *args)
+NcPlane_move_below(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     NcPlaneObject *bellow_obj = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "O!", &NcPlane_Type, &bellow_obj));
+    bellow_obj = GNU_PY_ARG_NCPLANE(arg);
 
     CHECK_NOTCURSES(ncplane_move_below(self->ncplane_ptr, bellow_obj->ncplane_ptr));
 
@@ -391,42 +613,25 @@ NcPlane_move_below(NcPlaneObject *self, PyObject *args)
 static PyObject *
 NcPlane_below(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     struct ncplane *possible_bellow = ncplane_below(self->ncplane_ptr);
 
-    if (NULL == possible_bellow)
-    {
-        Py_RETURN_NONE;
-    }
-    else
-    {
-        NcPlaneObject *new_plane = (NcPlaneObject *)NcPlane_Type.tp_alloc((PyTypeObject *)&Notcurses_Type, 0);
-        new_plane->ncplane_ptr = possible_bellow;
-
-        return (PyObject *)new_plane;
-    }
+    return NcPlane_wrap(possible_bellow, self->notcurses_obj);
 }
 
 static PyObject *
 NcPlane_above(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     struct ncplane *possible_above = ncplane_above(self->ncplane_ptr);
 
-    if (NULL == possible_above)
-    {
-        Py_RETURN_NONE;
-    }
-    else
-    {
-        NcPlaneObject *new_plane = (NcPlaneObject *)NcPlane_Type.tp_alloc((PyTypeObject *)&Notcurses_Type, 0);
-        new_plane->ncplane_ptr = possible_above;
-
-        return (PyObject *)new_plane;
-    }
+    return NcPlane_wrap(possible_above, self->notcurses_obj);
 }
 
 static PyObject *
 NcPlane_rotate_cw(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     CHECK_NOTCURSES(ncplane_rotate_cw(self->ncplane_ptr));
     Py_RETURN_NONE;
 }
@@ -434,6 +639,7 @@ NcPlane_rotate_cw(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_rotate_ccw(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     CHECK_NOTCURSES(ncplane_rotate_ccw(self->ncplane_ptr));
     Py_RETURN_NONE;
 }
@@ -441,6 +647,7 @@ NcPlane_rotate_ccw(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_at_cursor(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     uint16_t style_mask = 0;
     uint64_t channels = 0;
     char *egc = CHECK_NOTCURSES_PTR(ncplane_at_cursor(self->ncplane_ptr, &style_mask, &channels));
@@ -452,21 +659,26 @@ NcPlane_at_cursor(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 }
 
 static PyObject *
-NcPlane_at_cursor_cell(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_at_cursor_cell(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // ncplane_at_cursor_cell();
+    CHECK_NCPLANE(self);
+    nccell c = NCCELL_TRIVIAL_INITIALIZER;
+    CHECK_NOTCURSES(ncplane_at_cursor_cell(self->ncplane_ptr, &c));
+
+    return NcCell_from_plane(self->ncplane_ptr, &c);
 }
 
 static PyObject *
-NcPlane_at_yx(NcPlaneObject *self, PyObject *args)
+NcPlane_at_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     uint16_t style_mask = 0;
     uint64_t channels = 0;
     int y = 0, x = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "ii", &y, &x));
+    GNU_PY_CHECK_NARGS("at_yx", nargs, 2, 2);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
 
     char *egc = CHECK_NOTCURSES_PTR(ncplane_at_yx(self->ncplane_ptr, y, x, &style_mask, &channels));
 
@@ -477,24 +689,40 @@ NcPlane_at_yx(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_at_yx_cell(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_at_yx_cell(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // ncplane_at_yx_cell();
+    CHECK_NCPLANE(self);
+    GNU_PY_CHECK_NARGS("at_yx_cell", nargs, 2, 2);
+    int const y = GNU_PY_ARG_INT(args[0]);
+    int const x = GNU_PY_ARG_INT(args[1]);
+
+    nccell c = NCCELL_TRIVIAL_INITIALIZER;
+    CHECK_NOTCURSES(ncplane_at_yx_cell(self->ncplane_ptr, y, x, &c));
+
+    return NcCell_from_plane(self->ncplane_ptr, &c);
 }
 
 static PyObject *
-NcPlane_contents(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_contents(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     int beg_y = 0, beg_x = 0;
     unsigned len_y = 0, len_x = 0;
 
     char *keywords[] = {"begy", "begx", "leny", "lenx", NULL};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "ii|II", keywords,
-                                                  &beg_y, &beg_x,
-                                                  &len_y, &len_x));
+    PyObject *parsed[4];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("contents", args, nargs, kwnames, keywords, 2, parsed));
+    beg_y = GNU_PY_ARG_INT(parsed[0]);
+    beg_x = GNU_PY_ARG_INT(parsed[1]);
+    if (NULL != parsed[2])
+    {
+        len_y = GNU_PY_ARG_UINT(parsed[2]);
+    }
+    if (NULL != parsed[3])
+    {
+        len_x = GNU_PY_ARG_UINT(parsed[3]);
+    }
 
     char *egcs = CHECK_NOTCURSES_PTR(ncplane_contents(self->ncplane_ptr, beg_y, beg_x, len_y, len_x));
 
@@ -507,6 +735,7 @@ NcPlane_contents(NcPlaneObject *self, PyObject *args, PyObject *kwds)
 static PyObject *
 NcPlane_center_abs(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
     ncplane_center_abs(self->ncplane_ptr, &y, &x);
 
@@ -514,33 +743,44 @@ NcPlane_center_abs(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 }
 
 static PyObject *
-NcPlane_halign(NcPlaneObject *self, PyObject *args)
+NcPlane_halign(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int align = 0, c = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "ii", &align, &c));
+    GNU_PY_CHECK_NARGS("halign", nargs, 2, 2);
+    align = GNU_PY_ARG_INT(args[0]);
+    c = GNU_PY_ARG_INT(args[1]);
+
     int collumn = CHECK_NOTCURSES(ncplane_halign(self->ncplane_ptr, (ncalign_e)align, c));
 
-    return Py_BuildValue("i", collumn);
+    return PyLong_FromLong(collumn);
 }
 
 static PyObject *
-NcPlane_valign(NcPlaneObject *self, PyObject *args)
+NcPlane_valign(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int align = 0, r = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "ii", &align, &r));
+    GNU_PY_CHECK_NARGS("valign", nargs, 2, 2);
+    align = GNU_PY_ARG_INT(args[0]);
+    r = GNU_PY_ARG_INT(args[1]);
+
     int row = CHECK_NOTCURSES(ncplane_valign(self->ncplane_ptr, (ncalign_e)align, r));
 
-    return Py_BuildValue("i", row);
+    return PyLong_FromLong(row);
 }
 
 static PyObject *
-NcPlane_cursor_move_yx(NcPlaneObject *self, PyObject *args)
+NcPlane_cursor_move_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "ii", &y, &x));
+    GNU_PY_CHECK_NARGS("cursor_move_yx", nargs, 2, 2);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
 
     CHECK_NOTCURSES(ncplane_cursor_move_yx(self->ncplane_ptr, y, x));
 
@@ -550,6 +790,7 @@ NcPlane_cursor_move_yx(NcPlaneObject *self, PyObject *args)
 static PyObject *
 NcPlane_home(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     ncplane_home(self->ncplane_ptr);
     Py_RETURN_NONE;
 }
@@ -557,6 +798,7 @@ NcPlane_home(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_cursor_yx(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     unsigned y = 0, x = 0;
 
     ncplane_cursor_yx(self->ncplane_ptr, &y, &x);
@@ -567,38 +809,52 @@ NcPlane_cursor_yx(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_channels(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     uint64_t channels = ncplane_channels(self->ncplane_ptr);
-    return Py_BuildValue("K", (unsigned long long)channels);
+    return PyLong_FromUnsignedLongLong((unsigned long long)channels);
 }
 
 static PyObject *
 NcPlane_styles(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     uint16_t styles = ncplane_styles(self->ncplane_ptr);
-    return Py_BuildValue("H", (unsigned short)styles);
+    return PyLong_FromUnsignedLong((unsigned short)styles);
 }
 
 static PyObject *
-NcPlane_putc_yx(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_putc_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
+    CHECK_NCPLANE(self);
+    GNU_PY_CHECK_NARGS("putc_yx", nargs, 3, 3);
+    int const y = GNU_PY_ARG_INT(args[0]);
+    int const x = GNU_PY_ARG_INT(args[1]);
+    NcCellObject *cell = GNU_PY_ARG_TYPE(args[2], &NcCell_Type, NcCellObject);
+
+    return PyLong_FromLong((long)CHECK_NOTCURSES(NcCell_put(cell, self->ncplane_ptr, y, x)));
 }
 
 static PyObject *
-NcPlane_putc(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_putc(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
+    CHECK_NCPLANE(self);
+    GNU_PY_CHECK_NARGS("putc", nargs, 1, 1);
+    NcCellObject *cell = GNU_PY_ARG_TYPE(args[0], &NcCell_Type, NcCellObject);
+
+    return PyLong_FromLong((long)CHECK_NOTCURSES(NcCell_put(cell, self->ncplane_ptr, -1, -1)));
 }
 
 static PyObject *
-NcPlane_putchar_yx(NcPlaneObject *self, PyObject *args)
+NcPlane_putchar_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
     const char *c_str = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iis", &y, &x, &c_str));
+    GNU_PY_CHECK_NARGS("putchar_yx", nargs, 3, 3);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
+    c_str = GNU_PY_ARG_STR(args[2]);
 
     CHECK_NOTCURSES(ncplane_putchar_yx(self->ncplane_ptr, y, x, c_str[0]));
 
@@ -606,11 +862,12 @@ NcPlane_putchar_yx(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putchar(NcPlaneObject *self, PyObject *args)
+NcPlane_putchar(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     const char *c_str = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "s", &c_str));
+    c_str = GNU_PY_ARG_STR(arg);
 
     CHECK_NOTCURSES(ncplane_putchar(self->ncplane_ptr, c_str[0]));
 
@@ -618,11 +875,12 @@ NcPlane_putchar(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putchar_stained(NcPlaneObject *self, PyObject *args)
+NcPlane_putchar_stained(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     const char *c_str = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "s", &c_str));
+    c_str = GNU_PY_ARG_STR(arg);
 
     CHECK_NOTCURSES(ncplane_putchar_stained(self->ncplane_ptr, c_str[0]));
 
@@ -630,58 +888,62 @@ NcPlane_putchar_stained(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putegc_yx(NcPlaneObject *self, PyObject *args)
+NcPlane_putegc_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
     const char *egc = NULL;
     size_t sbytes = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iis",
-                                       &y, &x,
-                                       &egc));
+    GNU_PY_CHECK_NARGS("putegc_yx", nargs, 3, 3);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
+    egc = GNU_PY_ARG_STR(args[2]);
 
     CHECK_NOTCURSES(ncplane_putegc_yx(self->ncplane_ptr, y, x, egc, &sbytes));
 
-    return Py_BuildValue("n", sbytes);
+    return PyLong_FromSize_t(sbytes);
 }
 
 static PyObject *
-NcPlane_putegc(NcPlaneObject *self, PyObject *args)
+NcPlane_putegc(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     const char *egc = NULL;
     size_t sbytes = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "s",
-                                       &egc));
+    egc = GNU_PY_ARG_STR(arg);
 
     CHECK_NOTCURSES(ncplane_putegc(self->ncplane_ptr, egc, &sbytes));
 
-    return Py_BuildValue("n", sbytes);
+    return PyLong_FromSize_t(sbytes);
 }
 
 static PyObject *
-NcPlane_putegc_stained(NcPlaneObject *self, PyObject *args)
+NcPlane_putegc_stained(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     const char *egc = NULL;
     size_t sbytes = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "s",
-                                       &egc));
+    egc = GNU_PY_ARG_STR(arg);
 
     CHECK_NOTCURSES(ncplane_putegc(self->ncplane_ptr, egc, &sbytes));
 
-    return Py_BuildValue("n", sbytes);
+    return PyLong_FromSize_t(sbytes);
 }
 
 static PyObject *
-NcPlane_putstr_yx(NcPlaneObject *self, PyObject *args)
+NcPlane_putstr_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
     const char *egc = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iis",
-                                       &y, &x,
-                                       &egc));
+    GNU_PY_CHECK_NARGS("putstr_yx", nargs, 3, 3);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
+    egc = GNU_PY_ARG_STR(args[2]);
 
     CHECK_NOTCURSES(ncplane_putstr_yx(self->ncplane_ptr, y, x, egc));
 
@@ -689,12 +951,12 @@ NcPlane_putstr_yx(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putstr(NcPlaneObject *self, PyObject *args)
+NcPlane_putstr(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     const char *egc = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "s",
-                                       &egc));
+    egc = GNU_PY_ARG_STR(arg);
 
     CHECK_NOTCURSES(ncplane_putstr(self->ncplane_ptr, egc));
 
@@ -702,14 +964,16 @@ NcPlane_putstr(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putstr_aligned(NcPlaneObject *self, PyObject *args)
+NcPlane_putstr_aligned(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, align_int = 0;
     const char *egc = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iis",
-                                       &y, &align_int,
-                                       &egc));
+    GNU_PY_CHECK_NARGS("putstr_aligned", nargs, 3, 3);
+    y = GNU_PY_ARG_INT(args[0]);
+    align_int = GNU_PY_ARG_INT(args[1]);
+    egc = GNU_PY_ARG_STR(args[2]);
 
     CHECK_NOTCURSES(ncplane_putstr_aligned(self->ncplane_ptr, y, (ncalign_e)align_int, egc));
 
@@ -717,12 +981,12 @@ NcPlane_putstr_aligned(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putstr_stained(NcPlaneObject *self, PyObject *args)
+NcPlane_putstr_stained(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     const char *egc = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "s",
-                                       &egc));
+    egc = GNU_PY_ARG_STR(arg);
 
     CHECK_NOTCURSES(ncplane_putstr_stained(self->ncplane_ptr, egc));
 
@@ -730,16 +994,18 @@ NcPlane_putstr_stained(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putnstr_yx(NcPlaneObject *self, PyObject *args)
+NcPlane_putnstr_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, x = 0;
     Py_ssize_t s = 0;
     const char *egc = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iins",
-                                       &y, &x,
-                                       &s,
-                                       &egc));
+    GNU_PY_CHECK_NARGS("putnstr_yx", nargs, 4, 4);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
+    s = GNU_PY_ARG_SSIZE(args[2]);
+    egc = GNU_PY_ARG_STR(args[3]);
 
     CHECK_NOTCURSES(ncplane_putnstr_yx(self->ncplane_ptr, y, x, (size_t)s, egc));
 
@@ -747,14 +1013,15 @@ NcPlane_putnstr_yx(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putnstr(NcPlaneObject *self, PyObject *args)
+NcPlane_putnstr(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     Py_ssize_t s = 0;
     const char *egc = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "ns",
-                                       &s,
-                                       &egc));
+    GNU_PY_CHECK_NARGS("putnstr", nargs, 2, 2);
+    s = GNU_PY_ARG_SSIZE(args[0]);
+    egc = GNU_PY_ARG_STR(args[1]);
 
     CHECK_NOTCURSES(ncplane_putnstr(self->ncplane_ptr, (size_t)s, egc));
 
@@ -762,16 +1029,18 @@ NcPlane_putnstr(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_putnstr_aligned(NcPlaneObject *self, PyObject *args)
+NcPlane_putnstr_aligned(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, align_int = 0;
     Py_ssize_t s = 0;
     const char *egc = NULL;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iins",
-                                       &y, &align_int,
-                                       &s,
-                                       &egc));
+    GNU_PY_CHECK_NARGS("putnstr_aligned", nargs, 4, 4);
+    y = GNU_PY_ARG_INT(args[0]);
+    align_int = GNU_PY_ARG_INT(args[1]);
+    s = GNU_PY_ARG_SSIZE(args[2]);
+    egc = GNU_PY_ARG_STR(args[3]);
 
     CHECK_NOTCURSES(ncplane_putnstr_aligned(self->ncplane_ptr, y, (ncalign_e)align_int, (size_t)s, egc));
 
@@ -779,56 +1048,191 @@ NcPlane_putnstr_aligned(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_puttext(NcPlaneObject *self, PyObject *args)
+NcPlane_puttext(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = 0, align_int = 0;
     const char *text = NULL;
     size_t bytes_written = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iis",
-                                       &y, &align_int,
-                                       &text));
+    GNU_PY_CHECK_NARGS("puttext", nargs, 3, 3);
+    y = GNU_PY_ARG_INT(args[0]);
+    align_int = GNU_PY_ARG_INT(args[1]);
+    text = GNU_PY_ARG_STR(args[2]);
 
     CHECK_NOTCURSES(ncplane_puttext(self->ncplane_ptr, y, (ncalign_e)align_int, text, &bytes_written));
 
-    return Py_BuildValue("n", (Py_ssize_t)bytes_written);
+    return PyLong_FromSsize_t((Py_ssize_t)bytes_written);
+}
+
+// Box cells: ul, ur, ll, lr, hline, vline
+#define PLANE_BOX_CELLS 6
+
+static void
+plane_box_cells_release(struct ncplane *n, nccell *cells)
+{
+    for (size_t i = 0; i < PLANE_BOX_CELLS; i++)
+    {
+        nccell_release(n, &cells[i]);
+    }
+}
+
+// Load the six NcCells of 'objects' into 'cells', bound to 'n'.
+static int
+plane_box_cells_load(struct ncplane *n, PyObject *const *objects, nccell *cells)
+{
+    for (size_t i = 0; i < PLANE_BOX_CELLS; i++)
+    {
+        nccell_init(&cells[i]);
+    }
+    for (size_t i = 0; i < PLANE_BOX_CELLS; i++)
+    {
+        if (pync_check_type(objects[i], &NcCell_Type) < 0 ||
+            NcCell_load((NcCellObject *)objects[i], n, &cells[i]) < 0)
+        {
+            plane_box_cells_release(n, cells);
+            return -1;
+        }
+    }
+    return 0;
 }
 
+// Wrap the six plane bound 'cells' into a tuple of NcCells, releasing them.
 static PyObject *
-NcPlane_box(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+plane_box_cells_tuple(struct ncplane *n, nccell *cells)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // ncplane_box
+    PyObject *tuple = PyTuple_New(PLANE_BOX_CELLS);
+    if (NULL == tuple)
+    {
+        plane_box_cells_release(n, cells);
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < PLANE_BOX_CELLS; i++)
+    {
+        // Takes care of releasing the cell, even on failure.
+        PyObject *cell = NcCell_from_plane(n, &cells[i]);
+        if (NULL == cell)
+        {
+            for (Py_ssize_t j = i + 1; j < PLANE_BOX_CELLS; j++)
+            {
+                nccell_release(n, &cells[j]);
+            }
+            Py_DECREF(tuple);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(tuple, i, cell);
+    }
+    return tuple;
 }
 
 static PyObject *
-NcPlane_box_sized(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_box(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // ncplane_box_sized
+    CHECK_NCPLANE(self);
+    unsigned ystop = 0, xstop = 0, ctlword = 0;
+
+    char *keywords[] = {"ul", "ur", "ll", "lr", "hline", "vline", "ystop", "xstop", "ctlword", NULL};
+
+    PyObject *parsed[9];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("box", args, nargs, kwnames, keywords, 8, parsed));
+    ystop = GNU_PY_ARG_UINT(parsed[6]);
+    xstop = GNU_PY_ARG_UINT(parsed[7]);
+    if (NULL != parsed[8])
+    {
+        ctlword = GNU_PY_ARG_UINT(parsed[8]);
+    }
+
+    nccell cells[PLANE_BOX_CELLS];
+    GNU_PY_CHECK_INT(plane_box_cells_load(self->ncplane_ptr, parsed, cells));
+    int const ret = ncplane_box(self->ncplane_ptr, &cells[0], &cells[1], &cells[2], &cells[3], &cells[4], &cells[5],
+                                ystop, xstop, ctlword);
+    plane_box_cells_release(self->ncplane_ptr, cells);
+    CHECK_NOTCURSES(ret);
+
+    Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_perimeter(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_box_sized(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // ncplane_perimeter
+    CHECK_NCPLANE(self);
+    unsigned ylen = 0, xlen = 0, ctlword = 0;
+
+    char *keywords[] = {"ul", "ur", "ll", "lr", "hline", "vline", "ylen", "xlen", "ctlword", NULL};
+
+    PyObject *parsed[9];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("box_sized", args, nargs, kwnames, keywords, 8, parsed));
+    ylen = GNU_PY_ARG_UINT(parsed[6]);
+    xlen = GNU_PY_ARG_UINT(parsed[7]);
+    if (NULL != parsed[8])
+    {
+        ctlword = GNU_PY_ARG_UINT(parsed[8]);
+    }
+
+    nccell cells[PLANE_BOX_CELLS];
+    GNU_PY_CHECK_INT(plane_box_cells_load(self->ncplane_ptr, parsed, cells));
+    int const ret = ncplane_box_sized(self->ncplane_ptr, &cells[0], &cells[1], &cells[2], &cells[3], &cells[4], &cells[5],
+                                      ylen, xlen, ctlword);
+    plane_box_cells_release(self->ncplane_ptr, cells);
+    CHECK_NOTCURSES(ret);
+
+    Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_polyfill_yx(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_perimeter(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // ncplane_polyfill_yx
+    CHECK_NCPLANE(self);
+    unsigned ctlword = 0;
+
+    char *keywords[] = {"ul", "ur", "ll", "lr", "hline", "vline", "ctlword", NULL};
+
+    PyObject *parsed[7];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("perimeter", args, nargs, kwnames, keywords, 6, parsed));
+    if (NULL != parsed[6])
+    {
+        ctlword = GNU_PY_ARG_UINT(parsed[6]);
+    }
+
+    nccell cells[PLANE_BOX_CELLS];
+    GNU_PY_CHECK_INT(plane_box_cells_load(self->ncplane_ptr, parsed, cells));
+    int const ret = ncplane_perimeter(self->ncplane_ptr, &cells[0], &cells[1], &cells[2], &cells[3], &cells[4], &cells[5],
+                                      ctlword);
+    plane_box_cells_release(self->ncplane_ptr, cells);
+    CHECK_NOTCURSES(ret);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcPlane_polyfill_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CHECK_NCPLANE(self);
+    int y = 0, x = 0;
+
+    char *keywords[] = {"y", "x", "cell", NULL};
+
+    PyObject *parsed[3];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("polyfill_yx", args, nargs, kwnames, keywords, 3, parsed));
+    y = GNU_PY_ARG_INT(parsed[0]);
+    x = GNU_PY_ARG_INT(parsed[1]);
+    NcCellObject *cell = GNU_PY_ARG_TYPE(parsed[2], &NcCell_Type, NcCellObject);
+
+    nccell c = NCCELL_TRIVIAL_INITIALIZER;
+    GNU_PY_CHECK_INT(NcCell_load(cell, self->ncplane_ptr, &c));
+    int ret = 0;
+    Py_BEGIN_ALLOW_THREADS;
+    ret = ncplane_polyfill_yx(self->ncplane_ptr, y, x, &c);
+    Py_END_ALLOW_THREADS;
+    nccell_release(self->ncplane_ptr, &c);
+
+    return PyLong_FromLong((long)CHECK_NOTCURSES(ret));
 }
 
 static PyObject *
-NcPlane_gradient(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_gradient(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     int y = -1, x = -1;
     unsigned ylen = 0, xlen = 0;
     const char *egc = NULL;
@@ -839,10 +1243,18 @@ NcPlane_gradient(NcPlaneObject *self, PyObject *args, PyObject *kwds)
                         "stylemask",
                         "ul", "ur", "ll", "lr",
                         NULL};
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "siiIIkKKKK", keywords,
-                                                  &y, &x, &ylen, &xlen, &egc,
-                                                  &stylemask,
-                                                  &ul, &ur, &ll, &lr));
+    PyObject *parsed[10];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("gradient", args, nargs, kwnames, keywords, 10, parsed));
+    y = GNU_PY_ARG_INT(parsed[0]);
+    x = GNU_PY_ARG_INT(parsed[1]);
+    ylen = GNU_PY_ARG_UINT(parsed[2]);
+    xlen = GNU_PY_ARG_UINT(parsed[3]);
+    egc = GNU_PY_ARG_STR(parsed[4]);
+    stylemask = GNU_PY_ARG_ULONG(parsed[5]);
+    ul = GNU_PY_ARG_ULL(parsed[6]);
+    ur = GNU_PY_ARG_ULL(parsed[7]);
+    ll = GNU_PY_ARG_ULL(parsed[8]);
+    lr = GNU_PY_ARG_ULL(parsed[9]);
 
     int cells_filled = CHECK_NOTCURSES(
         ncplane_gradient(
@@ -850,51 +1262,64 @@ NcPlane_gradient(NcPlaneObject *self, PyObject *args, PyObject *kwds)
             (uint16_t)stylemask,
             (uint64_t)ul, (uint64_t)ur, (uint64_t)ll, (uint64_t)lr));
 
-    return Py_BuildValue("i", cells_filled);
+    return PyLong_FromLong(cells_filled);
 }
 
 static PyObject *
-NcPlane_gradient2x1(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_gradient2x1(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     unsigned long ul = 0, ur = 0, ll = 0, lr = 0;
     int y = -1, x = -1;
     unsigned ylen = 0, xlen = 0;
 
     char *keywords[] = {"y", "x", "ylen", "xlen", "ul", "ur", "ll", "lr",
                         NULL};
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "iiIIkkkk", keywords,
-                                                  &y, &x, &ylen, &xlen,
-                                                  &ul, &ur, &ll, &lr));
+    PyObject *parsed[8];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("gradient2x1", args, nargs, kwnames, keywords, 8, parsed));
+    y = GNU_PY_ARG_INT(parsed[0]);
+    x = GNU_PY_ARG_INT(parsed[1]);
+    ylen = GNU_PY_ARG_UINT(parsed[2]);
+    xlen = GNU_PY_ARG_UINT(parsed[3]);
+    ul = GNU_PY_ARG_ULONG(parsed[4]);
+    ur = GNU_PY_ARG_ULONG(parsed[5]);
+    ll = GNU_PY_ARG_ULONG(parsed[6]);
+    lr = GNU_PY_ARG_ULONG(parsed[7]);
 
     int cells_filled = CHECK_NOTCURSES(
         ncplane_gradient2x1(
             self->ncplane_ptr, y, x, ylen, xlen,
             (uint32_t)ul, (uint32_t)ur, (uint32_t)ll, (uint32_t)lr));
 
-    return Py_BuildValue("i", cells_filled);
+    return PyLong_FromLong(cells_filled);
 }
 
 static PyObject *
-NcPlane_format(NcPlaneObject *self, PyObject *args)
+NcPlane_format(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int y = -1, x = -1;
     unsigned ylen = 0, xlen = 0;
     unsigned long stylemark = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iiIIk",
-                                       &y, &x, &ylen, &xlen,
-                                       &stylemark));
+    GNU_PY_CHECK_NARGS("format", nargs, 5, 5);
+    y = GNU_PY_ARG_INT(args[0]);
+    x = GNU_PY_ARG_INT(args[1]);
+    ylen = GNU_PY_ARG_UINT(args[2]);
+    xlen = GNU_PY_ARG_UINT(args[3]);
+    stylemark = GNU_PY_ARG_ULONG(args[4]);
 
     int cells_set = CHECK_NOTCURSES(ncplane_format(self->ncplane_ptr,
                                                    y, x, ylen, xlen,
                                                    (uint16_t)stylemark));
 
-    return Py_BuildValue("i", cells_set);
+    return PyLong_FromLong(cells_set);
 }
 
 static PyObject *
-NcPlane_stain(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_stain(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     int x = -1, y = -1;
     unsigned ylen = 0, xlen = 0;
     unsigned long long ul = 0, ur = 0, ll = 0, lr = 0;
@@ -904,9 +1329,16 @@ NcPlane_stain(NcPlaneObject *self, PyObject *args, PyObject *kwds)
         "ul", "ur", "ll", "lr",
         NULL};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "iiIIKKKK", keywords,
-                                                  &y, &x, &ylen, &xlen,
-                                                  &ul, &ur, &ll, &lr));
+    PyObject *parsed[8];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("stain", args, nargs, kwnames, keywords, 8, parsed));
+    y = GNU_PY_ARG_INT(parsed[0]);
+    x = GNU_PY_ARG_INT(parsed[1]);
+    ylen = GNU_PY_ARG_UINT(parsed[2]);
+    xlen = GNU_PY_ARG_UINT(parsed[3]);
+    ul = GNU_PY_ARG_ULL(parsed[4]);
+    ur = GNU_PY_ARG_ULL(parsed[5]);
+    ll = GNU_PY_ARG_ULL(parsed[6]);
+    lr = GNU_PY_ARG_ULL(parsed[7]);
 
     int cells_set = CHECK_NOTCURSES(
         ncplane_stain(
@@ -914,15 +1346,14 @@ NcPlane_stain(NcPlaneObject *self, PyObject *args, PyObject *kwds)
             y, x, ylen, xlen,
             (uint64_t)ul, (uint64_t)ur, (uint64_t)ll, (uint64_t)lr));
 
-    return Py_BuildValue("i", cells_set);
+    return PyLong_FromLong(cells_set);
 }
 
 static PyObject *
-NcPlane_mergedown_simple(NcPlaneObject *self, PyObject *args)
+NcPlane_mergedown_simple(NcPlaneObject *self, PyObject *arg)
 {
-    NcPlaneObject *dst_obj = NULL;
-
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "|O!", &NcPlane_Type, &dst_obj));
+    CHECK_NCPLANE(self);
+    NcPlaneObject *dst_obj = GNU_PY_ARG_NCPLANE(arg);
 
     CHECK_NOTCURSES(ncplane_mergedown_simple(self->ncplane_ptr, dst_obj->ncplane_ptr));
 
@@ -930,8 +1361,9 @@ NcPlane_mergedown_simple(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_mergedown(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_mergedown(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     NcPlaneObject *dst_obj = NULL;
     int begsrcy = 0, begsrcx = 0;
     unsigned leny = 0, lenx = 0;
@@ -941,10 +1373,15 @@ NcPlane_mergedown(NcPlaneObject *self, PyObject *args, PyObject *kwds)
                         "begsrcy", "begsrcx", "leny", "lenx",
                         "dsty", "dstx",
                         NULL};
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "O!iiIIii", keywords,
-                                                  &NcPlane_Type, &dst_obj,
-                                                  &begsrcy, &begsrcx, &leny, &lenx,
-                                                  &dsty, &dstx));
+    PyObject *parsed[7];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("mergedown", args, nargs, kwnames, keywords, 7, parsed));
+    dst_obj = GNU_PY_ARG_NCPLANE(parsed[0]);
+    begsrcy = GNU_PY_ARG_INT(parsed[1]);
+    begsrcx = GNU_PY_ARG_INT(parsed[2]);
+    leny = GNU_PY_ARG_UINT(parsed[3]);
+    lenx = GNU_PY_ARG_UINT(parsed[4]);
+    dsty = GNU_PY_ARG_INT(parsed[5]);
+    dstx = GNU_PY_ARG_INT(parsed[6]);
 
     CHECK_NOTCURSES(ncplane_mergedown(
         self->ncplane_ptr, dst_obj->ncplane_ptr,
@@ -957,6 +1394,7 @@ NcPlane_mergedown(NcPlaneObject *self, PyObject *args, PyObject *kwds)
 static PyObject *
 NcPlane_erase(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     ncplane_erase(self->ncplane_ptr);
     Py_RETURN_NONE;
 }
@@ -964,21 +1402,24 @@ NcPlane_erase(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_bchannel(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    return Py_BuildValue("k", (unsigned long)ncplane_bchannel(self->ncplane_ptr));
+    CHECK_NCPLANE(self);
+    return PyLong_FromUnsignedLong((unsigned long)ncplane_bchannel(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_fchannel(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    return Py_BuildValue("k", (unsigned long)ncplane_fchannel(self->ncplane_ptr));
+    CHECK_NCPLANE(self);
+    return PyLong_FromUnsignedLong((unsigned long)ncplane_fchannel(self->ncplane_ptr));
 }
 
 static PyObject *
-NcPlane_set_channels(NcPlaneObject *self, PyObject *args)
+NcPlane_set_channels(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned long long channels = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "K", &channels));
+    channels = GNU_PY_ARG_ULL(arg);
 
     ncplane_set_channels(self->ncplane_ptr, (uint64_t)channels);
 
@@ -986,11 +1427,12 @@ NcPlane_set_channels(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_set_styles(NcPlaneObject *self, PyObject *args)
+NcPlane_set_styles(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned int stylebits = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &stylebits));
+    stylebits = GNU_PY_ARG_UINT(arg);
 
     ncplane_set_styles(self->ncplane_ptr, stylebits);
 
@@ -998,11 +1440,12 @@ NcPlane_set_styles(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_on_styles(NcPlaneObject *self, PyObject *args)
+NcPlane_on_styles(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned int stylebits = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &stylebits));
+    stylebits = GNU_PY_ARG_UINT(arg);
 
     ncplane_on_styles(self->ncplane_ptr, stylebits);
 
@@ -1010,11 +1453,12 @@ NcPlane_on_styles(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_off_styles(NcPlaneObject *self, PyObject *args)
+NcPlane_off_styles(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned int stylebits = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &stylebits));
+    stylebits = GNU_PY_ARG_UINT(arg);
 
     ncplane_off_styles(self->ncplane_ptr, stylebits);
 
@@ -1024,42 +1468,49 @@ NcPlane_off_styles(NcPlaneObject *self, PyObject *args)
 static PyObject *
 NcPlane_fg_rgb(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    return Py_BuildValue("k", (unsigned long)ncplane_fg_rgb(self->ncplane_ptr));
+    CHECK_NCPLANE(self);
+    return PyLong_FromUnsignedLong((unsigned long)ncplane_fg_rgb(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_bg_rgb(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    return Py_BuildValue("k", (unsigned long)ncplane_bg_rgb(self->ncplane_ptr));
+    CHECK_NCPLANE(self);
+    return PyLong_FromUnsignedLong((unsigned long)ncplane_bg_rgb(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_fg_alpha(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    return Py_BuildValue("k", (unsigned long)ncplane_fg_alpha(self->ncplane_ptr));
+    CHECK_NCPLANE(self);
+    return PyLong_FromUnsignedLong((unsigned long)ncplane_fg_alpha(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_fg_default_p(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     return PyBool_FromLong((long)ncplane_fg_default_p(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_bg_alpha(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    return Py_BuildValue("k", (unsigned long)ncplane_bg_alpha(self->ncplane_ptr));
+    CHECK_NCPLANE(self);
+    return PyLong_FromUnsignedLong((unsigned long)ncplane_bg_alpha(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_bg_default_p(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     return PyBool_FromLong((long)ncplane_bg_default_p(self->ncplane_ptr));
 }
 
 static PyObject *
 NcPlane_fg_rgb8(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     unsigned int r = 0, g = 0, b = 0;
     ncplane_fg_rgb8(self->ncplane_ptr, &r, &g, &b);
 
@@ -1069,6 +1520,7 @@ NcPlane_fg_rgb8(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_bg_rgb8(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     unsigned int r = 0, g = 0, b = 0;
     ncplane_bg_rgb8(self->ncplane_ptr, &r, &g, &b);
 
@@ -1076,29 +1528,35 @@ NcPlane_bg_rgb8(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 }
 
 static PyObject *
-NcPlane_set_fchannel(NcPlaneObject *self, PyObject *args)
+NcPlane_set_fchannel(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned long channel = 0;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &channel));
+    channel = GNU_PY_ARG_ULONG(arg);
 
-    return Py_BuildValue("K", (unsigned long long)ncplane_set_fchannel(self->ncplane_ptr, (uint32_t)channel));
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncplane_set_fchannel(self->ncplane_ptr, (uint32_t)channel));
 }
 
 static PyObject *
-NcPlane_set_bchannel(NcPlaneObject *self, PyObject *args)
+NcPlane_set_bchannel(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned long channel = 0;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &channel));
+    channel = GNU_PY_ARG_ULONG(arg);
 
-    return Py_BuildValue("K", (unsigned long long)ncplane_set_bchannel(self->ncplane_ptr, (uint32_t)channel));
+    return PyLong_FromUnsignedLongLong((unsigned long long)ncplane_set_bchannel(self->ncplane_ptr, (uint32_t)channel));
 }
 
 static PyObject *
-NcPlane_set_fg_rgb8(NcPlaneObject *self, PyObject *args)
+NcPlane_set_fg_rgb8(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     unsigned r = 0, g = 0, b = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "III", &r, &g, &b));
+    GNU_PY_CHECK_NARGS("set_fg_rgb8", nargs, 3, 3);
+    r = GNU_PY_ARG_UINT(args[0]);
+    g = GNU_PY_ARG_UINT(args[1]);
+    b = GNU_PY_ARG_UINT(args[2]);
 
     CHECK_NOTCURSES(ncplane_set_fg_rgb8(self->ncplane_ptr, r, g, b));
 
@@ -1106,11 +1564,15 @@ NcPlane_set_fg_rgb8(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_set_bg_rgb8(NcPlaneObject *self, PyObject *args)
+NcPlane_set_bg_rgb8(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     unsigned r = 0, g = 0, b = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "III", &r, &g, &b));
+    GNU_PY_CHECK_NARGS("set_bg_rgb8", nargs, 3, 3);
+    r = GNU_PY_ARG_UINT(args[0]);
+    g = GNU_PY_ARG_UINT(args[1]);
+    b = GNU_PY_ARG_UINT(args[2]);
 
     CHECK_NOTCURSES(ncplane_set_bg_rgb8(self->ncplane_ptr, r, g, b));
 
@@ -1118,11 +1580,15 @@ NcPlane_set_bg_rgb8(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_set_bg_rgb8_clipped(NcPlaneObject *self, PyObject *args)
+NcPlane_set_bg_rgb8_clipped(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int r = 0, g = 0, b = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iii", &r, &g, &b));
+    GNU_PY_CHECK_NARGS("set_bg_rgb8_clipped", nargs, 3, 3);
+    r = GNU_PY_ARG_INT(args[0]);
+    g = GNU_PY_ARG_INT(args[1]);
+    b = GNU_PY_ARG_INT(args[2]);
 
     ncplane_set_bg_rgb8_clipped(self->ncplane_ptr, r, g, b);
 
@@ -1130,11 +1596,15 @@ NcPlane_set_bg_rgb8_clipped(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_set_fg_rgb8_clipped(NcPlaneObject *self, PyObject *args)
+NcPlane_set_fg_rgb8_clipped(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
+    CHECK_NCPLANE(self);
     int r = 0, g = 0, b = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "iii", &r, &g, &b));
+    GNU_PY_CHECK_NARGS("set_fg_rgb8_clipped", nargs, 3, 3);
+    r = GNU_PY_ARG_INT(args[0]);
+    g = GNU_PY_ARG_INT(args[1]);
+    b = GNU_PY_ARG_INT(args[2]);
 
     ncplane_set_fg_rgb8_clipped(self->ncplane_ptr, r, g, b);
 
@@ -1142,11 +1612,12 @@ NcPlane_set_fg_rgb8_clipped(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_set_fg_rgb(NcPlaneObject *self, PyObject *args)
+NcPlane_set_fg_rgb(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned long channel = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &channel));
+    channel = GNU_PY_ARG_ULONG(arg);
 
     CHECK_NOTCURSES(ncplane_set_fg_rgb(self->ncplane_ptr, (uint32_t)channel));
 
@@ -1154,11 +1625,12 @@ NcPlane_set_fg_rgb(NcPlaneObject *self, PyObject *args)
 }
 
 static PyObject *
-NcPlane_set_bg_rgb(NcPlaneObject *self, PyObject *args)
+NcPlane_set_bg_rgb(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned long channel = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "k", &channel));
+    channel = GNU_PY_ARG_ULONG(arg);
 
     CHECK_NOTCURSES(ncplane_set_bg_rgb(self->ncplane_ptr, (uint32_t)channel));
 
@@ -1168,6 +1640,7 @@ NcPlane_set_bg_rgb(NcPlaneObject *self, PyObject *args)
 static PyObject *
 NcPlane_set_fg_default(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     ncplane_set_fg_default(self->ncplane_ptr);
 
     Py_RETURN_NONE;
@@ -1176,128 +1649,185 @@ NcPlane_set_fg_default(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 static PyObject *
 NcPlane_set_bg_default(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     ncplane_set_bg_default(self->ncplane_ptr);
 
     Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_set_fg_palindex(NcPlaneObject *self, PyObject *args)
+NcPlane_set_fg_palindex(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned idx = 0;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &idx));
+    idx = GNU_PY_ARG_UINT(arg);
+
     ncplane_set_fg_palindex(self->ncplane_ptr, idx);
 
     Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_set_bg_palindex(NcPlaneObject *self, PyObject *args)
+NcPlane_set_bg_palindex(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     unsigned idx = 0;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "I", &idx));
+    idx = GNU_PY_ARG_UINT(arg);
+
     ncplane_set_bg_palindex(self->ncplane_ptr, idx);
 
     Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_set_fg_alpha(NcPlaneObject *self, PyObject *args)
+NcPlane_set_fg_alpha(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     int alpha = 0;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "i", &alpha));
+    alpha = GNU_PY_ARG_INT(arg);
+
     ncplane_set_fg_alpha(self->ncplane_ptr, alpha);
 
     Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_set_bg_alpha(NcPlaneObject *self, PyObject *args)
+NcPlane_set_bg_alpha(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     int alpha = 0;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "i", &alpha));
+    alpha = GNU_PY_ARG_INT(arg);
+
     ncplane_set_bg_alpha(self->ncplane_ptr, alpha);
 
     Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_fadeout(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_fade(NcPlaneObject *self, const char *name, enum pync_fade_mode mode,
+             PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when fader is added");
-    return NULL;
-    // ncplane_fadeout
+    static char *keywords[] = {"duration", "fader", NULL};
+    PyObject *parsed[2];
+    GNU_PY_CHECK_INT(pync_parse_fastcall(name, args, nargs, kwnames, keywords, 1, parsed));
+
+    CHECK_NCPLANE(self);
+    return NcFade_run(self, mode, parsed[0], NULL == parsed[1] ? Py_None : parsed[1]);
 }
 
 static PyObject *
-NcPlane_fadein(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_fadeout(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when fader is added");
-    return NULL;
-    // ncplane_fadein
+    return NcPlane_fade(self, "fadeout", PYNC_FADE_OUT, args, nargs, kwnames);
 }
 
 static PyObject *
-NcPlane_fade_setup(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_fadein(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when fader is added");
-    return NULL;
-    // ncfadectx_setup
+    return NcPlane_fade(self, "fadein", PYNC_FADE_IN, args, nargs, kwnames);
 }
 
 static PyObject *
-NcPlane_fadeout_iteration(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_fade_setup(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when fader is added");
-    return NULL;
-    // ncplane_fadeout_iteration
+    CHECK_NCPLANE(self);
+    return NcFadeCtx_setup(self);
 }
 
 static PyObject *
-NcPlane_fadein_iteration(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_fade_iteration(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, bool fade_in)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when fader is added");
-    return NULL;
-    // ncplane_fadein_iteration
+    if (2 != nargs)
+    {
+        PyErr_Format(PyExc_TypeError, "expected 2 arguments, got %zd", nargs);
+        return NULL;
+    }
+    CHECK_NCPLANE(self);
+
+    NcFadeCtxObject *ctx = GNU_PY_ARG_TYPE(args[0], &NcFadeCtx_Type, NcFadeCtxObject);
+    int iteration = GNU_PY_ARG_INT(args[1]);
+
+    GNU_PY_CHECK_INT(NcFadeCtx_iteration(ctx, self, iteration, fade_in));
+    Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_pulse(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args))
+NcPlane_fadeout_iteration(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when fader is added");
-    return NULL;
-    // ncplane_pulse
+    return NcPlane_fade_iteration(self, args, nargs, false);
 }
 
 static PyObject *
-NcPlane_cells_load_box(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_fadein_iteration(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // nccells_load_box
+    return NcPlane_fade_iteration(self, args, nargs, true);
 }
 
 static PyObject *
-NcPlane_cells_rounded_box(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_pulse(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // nccells_rounded_box
+    return NcPlane_fade(self, "pulse", PYNC_FADE_PULSE, args, nargs, kwnames);
+}
+
+static PyObject *
+NcPlane_cells_load_box(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CHECK_NCPLANE(self);
+    unsigned short styles = 0;
+    unsigned long long channels = 0;
+    const char *gclusters = NULL;
+
+    char *keywords[] = {"styles", "channels", "gclusters", NULL};
+
+    PyObject *parsed[3];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("cells_load_box", args, nargs, kwnames, keywords, 3, parsed));
+    styles = GNU_PY_ARG_USHORT(parsed[0]);
+    channels = GNU_PY_ARG_ULL(parsed[1]);
+    gclusters = GNU_PY_ARG_STR(parsed[2]);
+
+    nccell cells[PLANE_BOX_CELLS];
+    CHECK_NOTCURSES(nccells_load_box(self->ncplane_ptr, styles, (uint64_t)channels,
+                                     &cells[0], &cells[1], &cells[2], &cells[3], &cells[4], &cells[5], gclusters));
+
+    return plane_box_cells_tuple(self->ncplane_ptr, cells);
+}
+
+static PyObject *
+NcPlane_cells_rounded_box(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CHECK_NCPLANE(self);
+    unsigned short styles = 0;
+    unsigned long long channels = 0;
+
+    char *keywords[] = {"styles", "channels", NULL};
+
+    PyObject *parsed[2];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("cells_rounded_box", args, nargs, kwnames, keywords, 2, parsed));
+    styles = GNU_PY_ARG_USHORT(parsed[0]);
+    channels = GNU_PY_ARG_ULL(parsed[1]);
+
+    nccell cells[PLANE_BOX_CELLS];
+    CHECK_NOTCURSES(nccells_rounded_box(self->ncplane_ptr, styles, (uint64_t)channels,
+                                        &cells[0], &cells[1], &cells[2], &cells[3], &cells[4], &cells[5]));
+
+    return plane_box_cells_tuple(self->ncplane_ptr, cells);
 }
 
 static PyObject *
-NcPlane_perimeter_rounded(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_perimeter_rounded(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     unsigned long stylemask = 0;
     unsigned long long channels = 0;
     unsigned int ctlword = 0;
 
     char *keywords[] = {"stylemask", "channels", "ctlword", NULL};
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "kKI", keywords,
-                                                  &stylemask,
-                                                  &channels,
-                                                  &ctlword));
+    PyObject *parsed[3];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("perimeter_rounded", args, nargs, kwnames, keywords, 3, parsed));
+    stylemask = GNU_PY_ARG_ULONG(parsed[0]);
+    channels = GNU_PY_ARG_ULL(parsed[1]);
+    ctlword = GNU_PY_ARG_UINT(parsed[2]);
 
     CHECK_NOTCURSES(ncplane_perimeter_rounded(self->ncplane_ptr, (uint16_t)stylemask, (uint64_t)channels, ctlword));
 
@@ -1305,8 +1835,9 @@ NcPlane_perimeter_rounded(NcPlaneObject *self, PyObject *args, PyObject *kwds)
 }
 
 static PyObject *
-NcPlane_rounded_box_sized(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_rounded_box_sized(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     unsigned long styles = 0;
     unsigned long long channels = 0;
     unsigned ylen = 0, xlen = 0;
@@ -1318,12 +1849,13 @@ NcPlane_rounded_box_sized(NcPlaneObject *self, PyObject *args, PyObject *kwds)
                         "ctlword",
                         NULL};
 
-    GNU_PY_CHECK_BOOL(
-        PyArg_ParseTupleAndKeywords(
-            args, kwds, "kKIII", keywords,
-            &styles, &channels,
-            &ylen, &xlen,
-            &ctlword));
+    PyObject *parsed[5];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("rounded_box_sized", args, nargs, kwnames, keywords, 5, parsed));
+    styles = GNU_PY_ARG_ULONG(parsed[0]);
+    channels = GNU_PY_ARG_ULL(parsed[1]);
+    ylen = GNU_PY_ARG_UINT(parsed[2]);
+    xlen = GNU_PY_ARG_UINT(parsed[3]);
+    ctlword = GNU_PY_ARG_UINT(parsed[4]);
 
     CHECK_NOTCURSES(ncplane_rounded_box_sized(
         self->ncplane_ptr,
@@ -1336,16 +1868,30 @@ NcPlane_rounded_box_sized(NcPlaneObject *self, PyObject *args, PyObject *kwds)
 }
 
 static PyObject *
-NcPlane_cells_double_box(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_cells_double_box(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when cells are added");
-    return NULL;
-    // nccells_double_box
+    CHECK_NCPLANE(self);
+    unsigned short styles = 0;
+    unsigned long long channels = 0;
+
+    char *keywords[] = {"styles", "channels", NULL};
+
+    PyObject *parsed[2];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("cells_double_box", args, nargs, kwnames, keywords, 2, parsed));
+    styles = GNU_PY_ARG_USHORT(parsed[0]);
+    channels = GNU_PY_ARG_ULL(parsed[1]);
+
+    nccell cells[PLANE_BOX_CELLS];
+    CHECK_NOTCURSES(nccells_double_box(self->ncplane_ptr, styles, (uint64_t)channels,
+                                       &cells[0], &cells[1], &cells[2], &cells[3], &cells[4], &cells[5]));
+
+    return plane_box_cells_tuple(self->ncplane_ptr, cells);
 }
 
 static PyObject *
-NcPlane_double_box(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_double_box(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     unsigned long styles = 0;
     unsigned long long channels = 0;
     unsigned ylen = 0, xlen = 0;
@@ -1357,12 +1903,13 @@ NcPlane_double_box(NcPlaneObject *self, PyObject *args, PyObject *kwds)
                         "ctlword",
                         NULL};
 
-    GNU_PY_CHECK_BOOL(
-        PyArg_ParseTupleAndKeywords(
-            args, kwds, "kKIII", keywords,
-            &styles, &channels,
-            &ylen, &xlen,
-            &ctlword));
+    PyObject *parsed[5];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("double_box", args, nargs, kwnames, keywords, 5, parsed));
+    styles = GNU_PY_ARG_ULONG(parsed[0]);
+    channels = GNU_PY_ARG_ULL(parsed[1]);
+    ylen = GNU_PY_ARG_UINT(parsed[2]);
+    xlen = GNU_PY_ARG_UINT(parsed[3]);
+    ctlword = GNU_PY_ARG_UINT(parsed[4]);
 
     CHECK_NOTCURSES(ncplane_double_box(
         self->ncplane_ptr,
@@ -1375,8 +1922,9 @@ NcPlane_double_box(NcPlaneObject *self, PyObject *args, PyObject *kwds)
 }
 
 static PyObject *
-NcPlane_perimeter_double(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_perimeter_double(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
     unsigned long styles = 0;
     unsigned long long channels = 0;
     unsigned int ctlword = 0;
@@ -1386,11 +1934,11 @@ NcPlane_perimeter_double(NcPlaneObject *self, PyObject *args, PyObject *kwds)
                         "ctlword",
                         NULL};
 
-    GNU_PY_CHECK_BOOL(
-        PyArg_ParseTupleAndKeywords(
-            args, kwds, "kKI", keywords,
-            &styles, &channels,
-            &ctlword));
+    PyObject *parsed[3];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("perimeter_double", args, nargs, kwnames, keywords, 3, parsed));
+    styles = GNU_PY_ARG_ULONG(parsed[0]);
+    channels = GNU_PY_ARG_ULL(parsed[1]);
+    ctlword = GNU_PY_ARG_UINT(parsed[2]);
 
     CHECK_NOTCURSES(ncplane_perimeter_double(
         self->ncplane_ptr,
@@ -1402,8 +1950,9 @@ NcPlane_perimeter_double(NcPlaneObject *self, PyObject *args, PyObject *kwds)
 }
 
 static PyObject *
-NcPlane_double_box_sized(NcPlaneObject *self, PyObject *args, PyObject *kwds)
+NcPlane_double_box_sized(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
 
     unsigned long styles = 0;
     unsigned long long channels = 0;
@@ -1416,12 +1965,13 @@ NcPlane_double_box_sized(NcPlaneObject *self, PyObject *args, PyObject *kwds)
                         "ctlword",
                         NULL};
 
-    GNU_PY_CHECK_BOOL(
-        PyArg_ParseTupleAndKeywords(
-            args, kwds, "kKIII", keywords,
-            &styles, &channels,
-            &ylen, &xlen,
-            &ctlword));
+    PyObject *parsed[5];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("double_box_sized", args, nargs, kwnames, keywords, 5, parsed));
+    styles = GNU_PY_ARG_ULONG(parsed[0]);
+    channels = GNU_PY_ARG_ULL(parsed[1]);
+    ylen = GNU_PY_ARG_UINT(parsed[2]);
+    xlen = GNU_PY_ARG_UINT(parsed[3]);
+    ctlword = GNU_PY_ARG_UINT(parsed[4]);
 
     CHECK_NOTCURSES(ncplane_double_box_sized(
         self->ncplane_ptr,
@@ -1433,26 +1983,101 @@ NcPlane_double_box_sized(NcPlaneObject *self, PyObject *args, PyObject *kwds)
     Py_RETURN_NONE;
 }
 
-static PyObject *
-NcPlane_ncvisual_from_plane(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+// Parses the 'blitter', 'begy', 'begx', 'leny', 'lenx' arguments shared by
+// ncvisual_from_plane() and as_rgba().
+static int
+plane_pixels_parse(const char *func_name, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames,
+                   ncblitter_e *blitter, int *beg_y, int *beg_x, unsigned *len_y, unsigned *len_x)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when visual is added");
-    return NULL;
-    // ncvisual_from_plane
+    char *keywords[] = {"blitter", "begy", "begx", "leny", "lenx", NULL};
+    PyObject *parsed[5];
+    unsigned blitter_value = NCBLIT_DEFAULT;
+
+    GNU_PY_CHECK_INT_RET_NEG1(pync_parse_fastcall(func_name, args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_uint(parsed[0], &blitter_value));
+    }
+    if (NULL != parsed[1])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_int(parsed[1], beg_y));
+    }
+    if (NULL != parsed[2])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_int(parsed[2], beg_x));
+    }
+    if (NULL != parsed[3])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_uint(parsed[3], len_y));
+    }
+    if (NULL != parsed[4])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_uint(parsed[4], len_x));
+    }
+
+    *blitter = (ncblitter_e)blitter_value;
+    return 0;
 }
 
 static PyObject *
-NcPlane_as_rgba(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_ncvisual_from_plane(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when visual is added");
-    return NULL;
-    // ncplane_as_rgba
+    CHECK_NCPLANE(self);
+    ncblitter_e blitter = NCBLIT_DEFAULT;
+    int beg_y = 0, beg_x = 0;
+    unsigned len_y = 0, len_x = 0;
+
+    GNU_PY_CHECK_INT(plane_pixels_parse("ncvisual_from_plane", args, nargs, kwnames, &blitter, &beg_y, &beg_x, &len_y, &len_x));
+
+    struct ncvisual *ncv = NULL;
+
+    Py_BEGIN_ALLOW_THREADS;
+    ncv = ncvisual_from_plane(self->ncplane_ptr, blitter, beg_y, beg_x, len_y, len_x);
+    Py_END_ALLOW_THREADS;
+
+    if (NULL == ncv)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to create visual from plane");
+        return NULL;
+    }
+
+    return NcVisual_wrap(ncv);
 }
 
 static PyObject *
-NcPlane_reel_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_as_rgba(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when NcReel is added");
+    CHECK_NCPLANE(self);
+    ncblitter_e blitter = NCBLIT_DEFAULT;
+    int beg_y = 0, beg_x = 0;
+    unsigned len_y = 0, len_x = 0;
+
+    GNU_PY_CHECK_INT(plane_pixels_parse("as_rgba", args, nargs, kwnames, &blitter, &beg_y, &beg_x, &len_y, &len_x));
+
+    uint32_t *rgba = NULL;
+    unsigned pixel_y = 0, pixel_x = 0;
+
+    Py_BEGIN_ALLOW_THREADS;
+    rgba = ncplane_as_rgba(self->ncplane_ptr, blitter, beg_y, beg_x, len_y, len_x, &pixel_y, &pixel_x);
+    Py_END_ALLOW_THREADS;
+
+    if (NULL == rgba)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to convert plane to RGBA");
+        return NULL;
+    }
+
+    PyObject *rgba_bytes CLEANUP_PY_OBJ = PyBytes_FromStringAndSize((const char *)rgba, (Py_ssize_t)pixel_y * pixel_x * (Py_ssize_t)sizeof(uint32_t));
+    free(rgba);
+    GNU_PY_CHECK(rgba_bytes);
+
+    return Py_BuildValue("OII", rgba_bytes, pixel_y, pixel_x);
+}
+
+static PyObject *
+NcPlane_reel_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
+{
+    PyErr_SetString(PyExc_NotImplementedError, "TODO when NcReel is added");
     return NULL;
     // ncreel_create
 }
@@ -1460,12 +2085,13 @@ NcPlane_reel_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), P
 static PyObject *
 NcPlane_greyscale(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
+    CHECK_NCPLANE(self);
     ncplane_greyscale(self->ncplane_ptr);
     Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_selector_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_selector_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcSelector is added");
     return NULL;
@@ -1473,7 +2099,7 @@ NcPlane_selector_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args
 }
 
 static PyObject *
-NcPlane_multiselector_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_multiselector_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcSelector is added");
     return NULL;
@@ -1481,7 +2107,7 @@ NcPlane_multiselector_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED
 }
 
 static PyObject *
-NcPlane_tree_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_tree_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcTree is added");
     return NULL;
@@ -1489,7 +2115,7 @@ NcPlane_tree_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), P
 }
 
 static PyObject *
-NcPlane_menu_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_menu_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcMenu is added");
     return NULL;
@@ -1497,7 +2123,7 @@ NcPlane_menu_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), P
 }
 
 static PyObject *
-NcPlane_progbar_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_progbar_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcProgbar is added");
     return NULL;
@@ -1505,31 +2131,109 @@ NcPlane_progbar_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args)
 }
 
 static PyObject *
-NcPlane_tabbed_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_tabbed_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcTabbed is added");
     return NULL;
     // nctabbed_create
 }
 
+// Fill 'opts' from the maxchannels, minchannels, legendstyle, gridtype,
+// rangex, title and flags arguments, any of which may be missing.
+static int
+plane_plot_options_parse(PyObject *const *parsed, ncplot_options *opts)
+{
+    unsigned long long value = 0;
+    if (NULL != parsed[0])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_ull(parsed[0], &value));
+        opts->maxchannels = (uint64_t)value;
+    }
+    if (NULL != parsed[1])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_ull(parsed[1], &value));
+        opts->minchannels = (uint64_t)value;
+    }
+    if (NULL != parsed[2])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_ushort(parsed[2], &opts->legendstyle));
+    }
+    if (NULL != parsed[3])
+    {
+        unsigned gridtype = 0;
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_uint(parsed[3], &gridtype));
+        opts->gridtype = (ncblitter_e)gridtype;
+    }
+    if (NULL != parsed[4])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_int(parsed[4], &opts->rangex));
+    }
+    if (NULL != parsed[5] && Py_None != parsed[5])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_str(parsed[5], &opts->title));
+    }
+    if (NULL != parsed[6])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_ull(parsed[6], &value));
+        opts->flags = (uint64_t)value;
+    }
+    return 0;
+}
+
 static PyObject *
-NcPlane_uplot_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_uplot_create(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when NcUplot is added");
-    return NULL;
-    // ncuplot_create
+    CHECK_NCPLANE(self);
+    unsigned long long miny = 0, maxy = 0;
+    ncplot_options opts = {0};
+
+    char *keywords[] = {"miny", "maxy",
+                        "maxchannels", "minchannels", "legendstyle",
+                        "gridtype", "rangex", "title", "flags", NULL};
+
+    PyObject *parsed[9];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("uplot_create", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        miny = GNU_PY_ARG_ULL(parsed[0]);
+    }
+    if (NULL != parsed[1])
+    {
+        maxy = GNU_PY_ARG_ULL(parsed[1]);
+    }
+    GNU_PY_CHECK_INT(plane_plot_options_parse(parsed + 2, &opts));
+
+    return NcUplot_create(self, &opts, (uint64_t)miny, (uint64_t)maxy);
 }
 
 static PyObject *
-NcPlane_dplot_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_dplot_create(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    PyErr_SetString(PyExc_NotImplementedError, "TODO when NcDplot is added");
-    return NULL;
-    // ncdplot_create
+    CHECK_NCPLANE(self);
+    double miny = 0, maxy = 0;
+    ncplot_options opts = {0};
+
+    char *keywords[] = {"miny", "maxy",
+                        "maxchannels", "minchannels", "legendstyle",
+                        "gridtype", "rangex", "title", "flags", NULL};
+
+    PyObject *parsed[9];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("dplot_create", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        miny = GNU_PY_ARG_DOUBLE(parsed[0]);
+    }
+    if (NULL != parsed[1])
+    {
+        maxy = GNU_PY_ARG_DOUBLE(parsed[1]);
+    }
+    GNU_PY_CHECK_INT(plane_plot_options_parse(parsed + 2, &opts));
+
+    return NcDplot_create(self, &opts, miny, maxy);
 }
 
 static PyObject *
-NcPlane_fdplane_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_fdplane_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcFdPlane is added");
     return NULL;
@@ -1537,7 +2241,7 @@ NcPlane_fdplane_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args)
 }
 
 static PyObject *
-NcPlane_subproc_createv(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_subproc_createv(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcFdPlane is added");
     return NULL;
@@ -1545,7 +2249,7 @@ NcPlane_subproc_createv(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args
 }
 
 static PyObject *
-NcPlane_subproc_createvp(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_subproc_createvp(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcFdPlane is added");
     return NULL;
@@ -1553,7 +2257,7 @@ NcPlane_subproc_createvp(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(arg
 }
 
 static PyObject *
-NcPlane_subproc_createvpe(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_subproc_createvpe(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcFdPlane is added");
     return NULL;
@@ -1561,22 +2265,37 @@ NcPlane_subproc_createvpe(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(ar
 }
 
 static PyObject *
-NcPlane_qrcode(NcPlaneObject *self, PyObject *args)
+NcPlane_qrcode(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
+    Py_buffer data_buffer __attribute__((cleanup(PyBuffer_Release))) = {0};
     const char *data = NULL;
     Py_ssize_t len = 0;
 
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "s#", &data, &len));
+    if (PyUnicode_Check(arg))
+    {
+        data = PyUnicode_AsUTF8AndSize(arg, &len);
+        if (NULL == data)
+        {
+            return NULL;
+        }
+    }
+    else
+    {
+        GNU_PY_CHECK_INT(PyObject_GetBuffer(arg, &data_buffer, PyBUF_SIMPLE));
+        data = data_buffer.buf;
+        len = data_buffer.len;
+    }
 
     unsigned ymax = 0, xmax = 0;
 
     CHECK_NOTCURSES(ncplane_qrcode(self->ncplane_ptr, &ymax, &xmax, (void *)data, (size_t)len));
 
-    return Py_BuildValue("II", &ymax, &xmax);
+    return Py_BuildValue("II", ymax, xmax);
 }
 
 static PyObject *
-NcPlane_reader_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+NcPlane_reader_create(NcPlaneObject *Py_UNUSED(self), PyObject *const *Py_UNUSED(args), Py_ssize_t Py_UNUSED(nargs), PyObject *Py_UNUSED(kwnames))
 {
     PyErr_SetString(PyExc_NotImplementedError, "TODO when NcReader is added");
     return NULL;
@@ -1586,32 +2305,30 @@ NcPlane_reader_create(NcPlaneObject *Py_UNUSED(self), PyObject *Py_UNUSED(args),
 static PyObject *
 NcPlane_pile_top(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = ncpile_top(self->ncplane_ptr);
-    return new_object;
+    CHECK_NCPLANE(self);
+    return NcPlane_wrap(ncpile_top(self->ncplane_ptr), self->notcurses_obj);
 }
 
 static PyObject *
 NcPlane_pile_bottom(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    PyObject *new_object = NcPlane_Type.tp_alloc((PyTypeObject *)&NcPlane_Type, 0);
-    NcPlaneObject *new_plane = (NcPlaneObject *)new_object;
-    new_plane->ncplane_ptr = ncpile_bottom(self->ncplane_ptr);
-    return new_object;
+    CHECK_NCPLANE(self);
+    return NcPlane_wrap(ncpile_bottom(self->ncplane_ptr), self->notcurses_obj);
 }
 
 static PyObject *
 NcPlane_pile_render(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    ncpile_render(self->ncplane_ptr);
+    CHECK_NCPLANE(self);
+    GNU_PY_CHECK_INT(pync_render_pile((NotcursesObject *)self->notcurses_obj, self->ncplane_ptr, true, false));
     Py_RETURN_NONE;
 }
 
 static PyObject *
 NcPlane_pile_rasterize(NcPlaneObject *self, PyObject *Py_UNUSED(args))
 {
-    ncpile_rasterize(self->ncplane_ptr);
+    CHECK_NCPLANE(self);
+    GNU_PY_CHECK_INT(pync_render_pile((NotcursesObject *)self->notcurses_obj, self->ncplane_ptr, false, true));
     Py_RETURN_NONE;
 }
 
@@ -1624,12 +2341,26 @@ static void cleanup_char_buffer(char **buffer_ptr)
 }
 
 static PyObject *
-NcPlane_pile_render_to_buffer(NcPlaneObject *self, PyObject *Py_UNUSED(args))
+NcPlane_pile_render_to_buffer(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
+    CHECK_NCPLANE(self);
+    static char *keywords[] = {"into", NULL};
+    PyObject *parsed[1];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("pile_render_to_buffer", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0] && Py_None != parsed[0])
+    {
+        NcRenderBufferObject *into = GNU_PY_ARG_TYPE(parsed[0], &NcRenderBuffer_Type, NcRenderBufferObject);
+        GNU_PY_CHECK_INT(NcRenderBuffer_render(into, self));
+        Py_INCREF(into);
+        return (PyObject *)into;
+    }
+
+    // The buffer belongs to the notcurses context and is reused by the next
+    // render, so it is copied out and must not be freed.
     char *buffer = NULL;
     size_t buffer_len = 0;
 
-    CHECK_NOTCURSES(ncpile_render_to_buffer(self->ncplane_ptr, &buffer, &buffer_len));
+    CHECK_NOTCURSES_NOGIL(ncpile_render_to_buffer(self->ncplane_ptr, &buffer, &buffer_len));
 
     return PyBytes_FromStringAndSize(buffer, (Py_ssize_t)buffer_len);
 }
@@ -1643,34 +2374,704 @@ static void cleanup_file(FILE **file_to_close)
 }
 
 static PyObject *
-NcPlane_pile_render_to_file(NcPlaneObject *self, PyObject *args)
+NcPlane_pile_render_to_file(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     int fd = INT_MAX;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "i", &fd));
+    fd = GNU_PY_ARG_INT(arg);
 
-    FILE *new_render_file = fdopen(fd, "w");
+    // fclose() below must not close the caller's fd.
+    int const render_fd = dup(fd);
+    if (render_fd < 0)
+    {
+        return PyErr_SetFromErrno(PyExc_RuntimeError);
+    }
+
+    FILE *new_render_file = fdopen(render_fd, "w");
 
     if (NULL == new_render_file)
     {
+        close(render_fd);
         return PyErr_SetFromErrno(PyExc_RuntimeError);
     }
 
-    int ret = ncpile_render_to_file(self->ncplane_ptr, new_render_file);
+    int ret;
+    Py_BEGIN_ALLOW_THREADS;
+    ret = ncpile_render_to_file(self->ncplane_ptr, new_render_file);
     fclose(new_render_file);
+    Py_END_ALLOW_THREADS;
     CHECK_NOTCURSES(ret);
 
     Py_RETURN_NONE;
 }
 
 static PyObject *
-NcPlane_scrollup(NcPlaneObject *self, PyObject *args)
+NcPlane_scrollup(NcPlaneObject *self, PyObject *arg)
 {
+    CHECK_NCPLANE(self);
     int r;
-    GNU_PY_CHECK_BOOL(PyArg_ParseTuple(args, "i", &r));
+    r = GNU_PY_ARG_INT(arg);
+
     CHECK_NOTCURSES(ncplane_scrollup(self->ncplane_ptr, r));
     Py_RETURN_NONE;
 }
 
+// Bulk blitting from buffer protocol arrays
+
+typedef struct
+{
+    Py_buffer view;
+    const char *data;
+    Py_ssize_t rows, cols;
+    Py_ssize_t stride_y, stride_x;
+} NcPlaneBlitSource;
+
+typedef enum
+{
+    BLIT_OK = 0,
+    BLIT_BAD_CODEPOINT,
+    BLIT_BAD_FG,
+    BLIT_BAD_BG,
+    BLIT_PUT_FAILED,
+} NcPlaneBlitResult;
+
+static void NcPlaneBlitSource_release(NcPlaneBlitSource *source)
+{
+    if (NULL != source->view.obj)
+    {
+        PyBuffer_Release(&source->view);
+    }
+}
+
+static int
+NcPlaneBlitSource_acquire(NcPlaneBlitSource *source, PyObject *object, Py_ssize_t itemsize, Py_ssize_t cols, const char *name)
+{
+    GNU_PY_CHECK_INT_RET_NEG1(PyObject_GetBuffer(object, &source->view, PyBUF_STRIDED_RO | PyBUF_FORMAT));
+
+    if (!pync_buffer_integer_format_p(source->view.format, source->view.itemsize, itemsize))
+    {
+        PyErr_Format(PyExc_TypeError, "%s must be an array of %zd-byte integers, not format '%s'",
+                     name, itemsize, NULL == source->view.format ? "B" : source->view.format);
+        return -1;
+    }
+
+    source->data = source->view.buf;
+
+    switch (source->view.ndim)
+    {
+    case 2:
+        source->rows = source->view.shape[0];
+        source->cols = source->view.shape[1];
+        source->stride_y = source->view.strides[0];
+        source->stride_x = source->view.strides[1];
+        return 0;
+    case 1:
+        if (cols <= 0)
+        {
+            PyErr_Format(PyExc_TypeError, "%s is one-dimensional, pass 'cols' to give the row width", name);
+            return -1;
+        }
+        if (0 != source->view.shape[0] % cols)
+        {
+            PyErr_Format(PyExc_ValueError, "%s length %zd is not a multiple of cols %zd", name, source->view.shape[0], cols);
+            return -1;
+        }
+        source->rows = source->view.shape[0] / cols;
+        source->cols = cols;
+        source->stride_x = source->view.strides[0];
+        source->stride_y = source->view.strides[0] * cols;
+        return 0;
+    default:
+        PyErr_Format(PyExc_ValueError, "%s must be one or two dimensional, got %d dimensions", name, source->view.ndim);
+        return -1;
+    }
+}
+
+static int
+NcPlaneBlitSource_match(const NcPlaneBlitSource *source, const NcPlaneBlitSource *codepoints, const char *name)
+{
+    if (source->rows != codepoints->rows || source->cols != codepoints->cols)
+    {
+        PyErr_Format(PyExc_ValueError, "%s has shape (%zd, %zd), codepoints has shape (%zd, %zd)",
+                     name, source->rows, source->cols, codepoints->rows, codepoints->cols);
+        return -1;
+    }
+    return 0;
+}
+
+static inline uint32_t
+NcPlaneBlitSource_u32(const NcPlaneBlitSource *source, Py_ssize_t y, Py_ssize_t x)
+{
+    uint32_t value = 0;
+    memcpy(&value, source->data + y * source->stride_y + x * source->stride_x, sizeof(value));
+    return value;
+}
+
+static inline uint64_t
+NcPlaneBlitSource_u64(const NcPlaneBlitSource *source, Py_ssize_t y, Py_ssize_t x)
+{
+    uint64_t value = 0;
+    memcpy(&value, source->data + y * source->stride_y + x * source->stride_x, sizeof(value));
+    return value;
+}
+
+static inline uint16_t
+NcPlaneBlitSource_u16(const NcPlaneBlitSource *source, Py_ssize_t y, Py_ssize_t x)
+{
+    uint16_t value = 0;
+    memcpy(&value, source->data + y * source->stride_y + x * source->stride_x, sizeof(value));
+    return value;
+}
+
+// Called without the GIL held, must not touch any Python objects.
+static NcPlaneBlitResult
+ncplane_blit_cells(struct ncplane *n, int y, int x,
+                   const NcPlaneBlitSource *codepoints,
+                   const NcPlaneBlitSource *fg, const NcPlaneBlitSource *bg,
+                   const NcPlaneBlitSource *styles, const NcPlaneBlitSource *channels,
+                   Py_ssize_t *fail_y, Py_ssize_t *fail_x, Py_ssize_t *written)
+{
+    const uint64_t base_channels = ncplane_channels(n);
+    const uint16_t base_styles = ncplane_styles(n);
+    NcPlaneBlitResult result = BLIT_OK;
+    nccell cell = NCCELL_TRIVIAL_INITIALIZER;
+
+    for (Py_ssize_t row = 0; row < codepoints->rows && BLIT_OK == result; row++)
+    {
+        for (Py_ssize_t col = 0; col < codepoints->cols; col++)
+        {
+            uint32_t codepoint = NcPlaneBlitSource_u32(codepoints, row, col);
+
+            if (0 == codepoint)
+            {
+                continue;
+            }
+
+            if (nccell_load_ucs32(n, &cell, codepoint) < 0)
+            {
+                result = BLIT_BAD_CODEPOINT;
+            }
+            else
+            {
+                cell.channels = NULL == channels->data ? base_channels : NcPlaneBlitSource_u64(channels, row, col);
+                cell.stylemask = NULL == styles->data ? base_styles : NcPlaneBlitSource_u16(styles, row, col);
+
+                if (NULL != fg->data && ncchannels_set_fg_rgb(&cell.channels, NcPlaneBlitSource_u32(fg, row, col)) < 0)
+                {
+                    result = BLIT_BAD_FG;
+                }
+                else if (NULL != bg->data && ncchannels_set_bg_rgb(&cell.channels, NcPlaneBlitSource_u32(bg, row, col)) < 0)
+                {
+                    result = BLIT_BAD_BG;
+                }
+                else if (ncplane_putc_yx(n, y + (int)row, x + (int)col, &cell) < 0)
+                {
+                    result = BLIT_PUT_FAILED;
+                }
+            }
+
+            if (BLIT_OK != result)
+            {
+                *fail_y = row;
+                *fail_x = col;
+                break;
+            }
+
+            (*written)++;
+        }
+    }
+
+    nccell_release(n, &cell);
+    return result;
+}
+
+static PyObject *
+NcPlane_blit_cells(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CHECK_NCPLANE(self);
+    int y = 0, x = 0;
+    PyObject *codepoints_obj = NULL, *fg_obj = Py_None, *bg_obj = Py_None, *styles_obj = Py_None, *channels_obj = Py_None;
+    Py_ssize_t cols = 0;
+
+    char *keywords[] = {"y", "x", "codepoints", "fg", "bg", "styles", "cols", "channels", NULL};
+
+    PyObject *parsed[8];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("blit_cells", args, nargs, kwnames, keywords, 3, parsed));
+    y = GNU_PY_ARG_INT(parsed[0]);
+    x = GNU_PY_ARG_INT(parsed[1]);
+    codepoints_obj = parsed[2];
+    if (NULL != parsed[3])
+    {
+        fg_obj = parsed[3];
+    }
+    if (NULL != parsed[4])
+    {
+        bg_obj = parsed[4];
+    }
+    if (NULL != parsed[5])
+    {
+        styles_obj = parsed[5];
+    }
+    if (NULL != parsed[6])
+    {
+        cols = GNU_PY_ARG_SSIZE(parsed[6]);
+    }
+    if (NULL != parsed[7])
+    {
+        channels_obj = parsed[7];
+    }
+
+    NcPlaneBlitSource codepoints __attribute__((cleanup(NcPlaneBlitSource_release))) = {0};
+    NcPlaneBlitSource fg __attribute__((cleanup(NcPlaneBlitSource_release))) = {0};
+    NcPlaneBlitSource bg __attribute__((cleanup(NcPlaneBlitSource_release))) = {0};
+    NcPlaneBlitSource styles __attribute__((cleanup(NcPlaneBlitSource_release))) = {0};
+    NcPlaneBlitSource channels __attribute__((cleanup(NcPlaneBlitSource_release))) = {0};
+
+    GNU_PY_CHECK_INT(NcPlaneBlitSource_acquire(&codepoints, codepoints_obj, sizeof(uint32_t), cols, "codepoints"));
+    if (Py_None != fg_obj)
+    {
+        GNU_PY_CHECK_INT(NcPlaneBlitSource_acquire(&fg, fg_obj, sizeof(uint32_t), cols, "fg"));
+        GNU_PY_CHECK_INT(NcPlaneBlitSource_match(&fg, &codepoints, "fg"));
+    }
+    if (Py_None != bg_obj)
+    {
+        GNU_PY_CHECK_INT(NcPlaneBlitSource_acquire(&bg, bg_obj, sizeof(uint32_t), cols, "bg"));
+        GNU_PY_CHECK_INT(NcPlaneBlitSource_match(&bg, &codepoints, "bg"));
+    }
+    if (Py_None != styles_obj)
+    {
+        GNU_PY_CHECK_INT(NcPlaneBlitSource_acquire(&styles, styles_obj, sizeof(uint16_t), cols, "styles"));
+        GNU_PY_CHECK_INT(NcPlaneBlitSource_match(&styles, &codepoints, "styles"));
+    }
+    if (Py_None != channels_obj)
+    {
+        GNU_PY_CHECK_INT(NcPlaneBlitSource_acquire(&channels, channels_obj, sizeof(uint64_t), cols, "channels"));
+        GNU_PY_CHECK_INT(NcPlaneBlitSource_match(&channels, &codepoints, "channels"));
+    }
+
+    unsigned dim_y = 0, dim_x = 0;
+    ncplane_dim_yx(self->ncplane_ptr, &dim_y, &dim_x);
+
+    if (y < 0 || x < 0 || (Py_ssize_t)y + codepoints.rows > (Py_ssize_t)dim_y || (Py_ssize_t)x + codepoints.cols > (Py_ssize_t)dim_x)
+    {
+        PyErr_Format(PyExc_ValueError, "%zdx%zd region at %d/%d does not fit into %ux%u plane",
+                     codepoints.rows, codepoints.cols, y, x, dim_y, dim_x);
+        return NULL;
+    }
+
+    Py_ssize_t fail_y = 0, fail_x = 0, written = 0;
+    NcPlaneBlitResult result = BLIT_OK;
+
+    Py_BEGIN_ALLOW_THREADS;
+    result = ncplane_blit_cells(self->ncplane_ptr, y, x, &codepoints, &fg, &bg, &styles, &channels, &fail_y, &fail_x, &written);
+    Py_END_ALLOW_THREADS;
+
+    switch (result)
+    {
+    case BLIT_OK:
+        return PyLong_FromSsize_t(written);
+    case BLIT_BAD_CODEPOINT:
+        PyErr_Format(PyExc_ValueError, "Invalid codepoint 0x%x at [%zd, %zd]",
+                     NcPlaneBlitSource_u32(&codepoints, fail_y, fail_x), fail_y, fail_x);
+        return NULL;
+    case BLIT_BAD_FG:
+        PyErr_Format(PyExc_ValueError, "Invalid fg RGB 0x%x at [%zd, %zd]",
+                     NcPlaneBlitSource_u32(&fg, fail_y, fail_x), fail_y, fail_x);
+        return NULL;
+    case BLIT_BAD_BG:
+        PyErr_Format(PyExc_ValueError, "Invalid bg RGB 0x%x at [%zd, %zd]",
+                     NcPlaneBlitSource_u32(&bg, fail_y, fail_x), fail_y, fail_x);
+        return NULL;
+    default:
+        PyErr_Format(PyExc_RuntimeError, "Notcurses failed to put cell at [%zd, %zd]", fail_y, fail_x);
+        return NULL;
+    }
+}
+
+static PyObject *
+NcPlane_execute(NcPlaneObject *self, PyObject *arg)
+{
+    CHECK_NCPLANE(self);
+    NcDisplayListObject *display_list = NULL;
+
+    display_list = GNU_PY_ARG_TYPE(arg, &NcDisplayList_Type, NcDisplayListObject);
+
+    GNU_PY_CHECK_INT(NcDisplayList_replay(display_list, self->ncplane_ptr));
+
+    return PyLong_FromSsize_t(display_list->len);
+}
+
+// Bulk inspection of plane cells
+
+static int
+ncplane_region_check(struct ncplane *n, int beg_y, int beg_x, unsigned *len_y, unsigned *len_x)
+{
+    unsigned dim_y = 0, dim_x = 0;
+    ncplane_dim_yx(n, &dim_y, &dim_x);
+
+    if (beg_y < 0 || beg_x < 0 || (unsigned)beg_y >= dim_y || (unsigned)beg_x >= dim_x)
+    {
+        PyErr_Format(PyExc_ValueError, "Origin %d/%d is outside of %ux%u plane", beg_y, beg_x, dim_y, dim_x);
+        return -1;
+    }
+
+    // Zero length extends the region to the plane edge, as in ncplane_contents()
+    if (0 == *len_y)
+    {
+        *len_y = dim_y - (unsigned)beg_y;
+    }
+    if (0 == *len_x)
+    {
+        *len_x = dim_x - (unsigned)beg_x;
+    }
+
+    if (*len_y > dim_y - (unsigned)beg_y || *len_x > dim_x - (unsigned)beg_x)
+    {
+        PyErr_Format(PyExc_ValueError, "%ux%u region at %d/%d does not fit into %ux%u plane",
+                     *len_y, *len_x, beg_y, beg_x, dim_y, dim_x);
+        return -1;
+    }
+
+    return 0;
+}
+
+// Puts 'cell' across a region, stepping by the cell width. Returns the number of cells put.
+static int
+plane_fill_region(struct ncplane *n, const NcCellSnapshot *cell, int beg_y, int beg_x, unsigned len_y, unsigned len_x)
+{
+    int count = 0;
+    for (unsigned y = 0; y < len_y; y++)
+    {
+        unsigned x = 0;
+        while (x < len_x)
+        {
+            int const cols = NcCellSnapshot_put(cell, n, beg_y + (int)y, beg_x + (int)x);
+            if (cols <= 0)
+            {
+                return -1;
+            }
+            x += (unsigned)cols;
+            count++;
+        }
+    }
+    return count;
+}
+
+static PyObject *
+NcPlane_fill_yx(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CHECK_NCPLANE(self);
+    int y = 0, x = 0;
+    unsigned ylen = 0, xlen = 0;
+
+    char *keywords[] = {"y", "x", "ylen", "xlen", "cell", NULL};
+
+    PyObject *parsed[5];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("fill_yx", args, nargs, kwnames, keywords, 5, parsed));
+    y = GNU_PY_ARG_INT(parsed[0]);
+    x = GNU_PY_ARG_INT(parsed[1]);
+    ylen = GNU_PY_ARG_UINT(parsed[2]);
+    xlen = GNU_PY_ARG_UINT(parsed[3]);
+    NcCellObject *cell = GNU_PY_ARG_TYPE(parsed[4], &NcCell_Type, NcCellObject);
+
+    GNU_PY_CHECK_INT(ncplane_region_check(self->ncplane_ptr, y, x, &ylen, &xlen));
+
+    unsigned const width = cell->nccell.width < 1 ? 1 : cell->nccell.width;
+    if (0 != xlen % width)
+    {
+        PyErr_Format(PyExc_ValueError, "%u columns can't be filled with a %u column wide cell", xlen, width);
+        return NULL;
+    }
+
+    // The loop runs without the GIL, so put a snapshot other threads can't change.
+    NcCellSnapshot snapshot;
+    NcCell_snapshot(cell, &snapshot);
+    int ret = 0;
+    Py_BEGIN_ALLOW_THREADS;
+    ret = plane_fill_region(self->ncplane_ptr, &snapshot, y, x, ylen, xlen);
+    Py_END_ALLOW_THREADS;
+    NcCellSnapshot_release(&snapshot);
+
+    return PyLong_FromLong((long)CHECK_NOTCURSES(ret));
+}
+
+// Decode the first codepoint of an EGC, flagging clusters made of several.
+static uint32_t
+egc_snapshot_codepoint(const char *egc)
+{
+    const unsigned char *s = (const unsigned char *)egc;
+    uint32_t codepoint = 0;
+    size_t len = 1;
+
+    if (s[0] < 0x80)
+    {
+        codepoint = s[0];
+    }
+    else if (0xc0 == (s[0] & 0xe0))
+    {
+        codepoint = s[0] & 0x1fu;
+        len = 2;
+    }
+    else if (0xe0 == (s[0] & 0xf0))
+    {
+        codepoint = s[0] & 0x0fu;
+        len = 3;
+    }
+    else if (0xf0 == (s[0] & 0xf8))
+    {
+        codepoint = s[0] & 0x07u;
+        len = 4;
+    }
+    else
+    {
+        return 0xfffd;
+    }
+
+    for (size_t i = 1; i < len; i++)
+    {
+        if (0x80 != (s[i] & 0xc0))
+        {
+            return 0xfffd;
+        }
+        codepoint = (codepoint << 6) | (s[i] & 0x3fu);
+    }
+
+    if (0 != codepoint && '\0' != s[len])
+    {
+        codepoint |= NCPLANE_SNAPSHOT_CLUSTER;
+    }
+
+    return codepoint;
+}
+
+// Read 'len_x' cells of row 'y' from 'beg_x'. ncplane_at_yx_cell() would
+// stash every extended EGC into the egcpool of the plane, a write to the pile
+// racing with renders, so ncplane_at_yx() is used instead, which copies them
+// out. Right halves of wide glyphs are NULL EGCs with the colours of their
+// left half, release the others with plane_row_release(). Scanning starts at
+// column 0, to tell right halves at 'beg_x' apart. Touches no Python objects.
+static int
+plane_row_read(const struct ncplane *n, int y, int beg_x, unsigned len_x, char **egcs, uint16_t *styles, uint64_t *channels)
+{
+    unsigned right_halves = 0;
+    uint16_t stylemask = 0;
+    uint64_t pair = 0;
+
+    for (int x = 0; x < beg_x + (int)len_x; x++)
+    {
+        char *egc = NULL;
+        if (right_halves > 0)
+        {
+            right_halves--;
+        }
+        else
+        {
+            egc = ncplane_at_yx(n, y, x, &stylemask, &pair);
+            if (NULL == egc)
+            {
+                return -1;
+            }
+            int const cols = ncstrwidth(egc, NULL, NULL);
+            right_halves = cols > 1 ? (unsigned)cols - 1 : 0;
+        }
+
+        if (x < beg_x)
+        {
+            free(egc);
+            continue;
+        }
+        size_t const i = (size_t)(x - beg_x);
+        egcs[i] = egc;
+        styles[i] = stylemask;
+        channels[i] = pair;
+    }
+    return 0;
+}
+
+static void
+plane_row_buffer_free(void *buffer_ptr)
+{
+    PyMem_Free(*(void **)buffer_ptr);
+}
+
+static void
+plane_row_release(char **egcs, unsigned len_x)
+{
+    for (unsigned i = 0; i < len_x; i++)
+    {
+        free(egcs[i]);
+        egcs[i] = NULL;
+    }
+}
+
+// Called without the GIL held, must not touch any Python objects.
+static int
+ncplane_snapshot(const struct ncplane *n, int beg_y, int beg_x, unsigned len_y, unsigned len_x,
+                 char **row_egcs, uint32_t *codepoints, uint16_t *styles, uint64_t *channels)
+{
+    for (unsigned row = 0; row < len_y; row++)
+    {
+        size_t const offset = (size_t)row * len_x;
+        if (plane_row_read(n, beg_y + (int)row, beg_x, len_x, row_egcs, styles + offset, channels + offset) < 0)
+        {
+            plane_row_release(row_egcs, len_x);
+            return -1;
+        }
+        for (unsigned col = 0; col < len_x; col++)
+        {
+            codepoints[offset + col] = NULL == row_egcs[col] ? 0 : egc_snapshot_codepoint(row_egcs[col]);
+        }
+        plane_row_release(row_egcs, len_x);
+    }
+    return 0;
+}
+
+static PyObject *
+snapshot_view(PyObject *bytes, const char *format, unsigned len_y, unsigned len_x)
+{
+    PyObject *flat_view CLEANUP_PY_OBJ = GNU_PY_CHECK(PyMemoryView_FromObject(bytes));
+    return PyObject_CallMethod(flat_view, "cast", "s(II)", format, len_y, len_x);
+}
+
+static PyObject *
+NcPlane_snapshot(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CHECK_NCPLANE(self);
+    int beg_y = 0, beg_x = 0;
+    unsigned len_y = 0, len_x = 0;
+
+    char *keywords[] = {"begy", "begx", "leny", "lenx", NULL};
+
+    PyObject *parsed[4];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("snapshot", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        beg_y = GNU_PY_ARG_INT(parsed[0]);
+    }
+    if (NULL != parsed[1])
+    {
+        beg_x = GNU_PY_ARG_INT(parsed[1]);
+    }
+    if (NULL != parsed[2])
+    {
+        len_y = GNU_PY_ARG_UINT(parsed[2]);
+    }
+    if (NULL != parsed[3])
+    {
+        len_x = GNU_PY_ARG_UINT(parsed[3]);
+    }
+
+    GNU_PY_CHECK_INT(ncplane_region_check(self->ncplane_ptr, beg_y, beg_x, &len_y, &len_x));
+
+    Py_ssize_t cells = (Py_ssize_t)len_y * (Py_ssize_t)len_x;
+    PyObject *codepoints_bytes CLEANUP_PY_OBJ = GNU_PY_CHECK(PyBytes_FromStringAndSize(NULL, cells * (Py_ssize_t)sizeof(uint32_t)));
+    PyObject *styles_bytes CLEANUP_PY_OBJ = GNU_PY_CHECK(PyBytes_FromStringAndSize(NULL, cells * (Py_ssize_t)sizeof(uint16_t)));
+    PyObject *channels_bytes CLEANUP_PY_OBJ = GNU_PY_CHECK(PyBytes_FromStringAndSize(NULL, cells * (Py_ssize_t)sizeof(uint64_t)));
+
+    uint32_t *codepoints = (uint32_t *)PyBytes_AS_STRING(codepoints_bytes);
+    uint16_t *styles = (uint16_t *)PyBytes_AS_STRING(styles_bytes);
+    uint64_t *channels = (uint64_t *)PyBytes_AS_STRING(channels_bytes);
+    char **row_egcs = PyMem_Calloc((size_t)len_x + 1, sizeof(char *));
+    if (NULL == row_egcs)
+    {
+        return PyErr_NoMemory();
+    }
+    int ret = 0;
+
+    Py_BEGIN_ALLOW_THREADS;
+    ret = ncplane_snapshot(self->ncplane_ptr, beg_y, beg_x, len_y, len_x, row_egcs, codepoints, styles, channels);
+    Py_END_ALLOW_THREADS;
+
+    PyMem_Free(row_egcs);
+    CHECK_NOTCURSES(ret);
+
+    PyObject *codepoints_view CLEANUP_PY_OBJ = GNU_PY_CHECK(snapshot_view(codepoints_bytes, "I", len_y, len_x));
+    PyObject *styles_view CLEANUP_PY_OBJ = GNU_PY_CHECK(snapshot_view(styles_bytes, "H", len_y, len_x));
+    PyObject *channels_view CLEANUP_PY_OBJ = GNU_PY_CHECK(snapshot_view(channels_bytes, "Q", len_y, len_x));
+
+    return PyTuple_Pack(3, codepoints_view, styles_view, channels_view);
+}
+
+static PyObject *
+NcPlane_egcs(NcPlaneObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    CHECK_NCPLANE(self);
+    int beg_y = 0, beg_x = 0;
+    unsigned len_y = 0, len_x = 0;
+
+    char *keywords[] = {"begy", "begx", "leny", "lenx", NULL};
+
+    PyObject *parsed[4];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("egcs", args, nargs, kwnames, keywords, 0, parsed));
+    if (NULL != parsed[0])
+    {
+        beg_y = GNU_PY_ARG_INT(parsed[0]);
+    }
+    if (NULL != parsed[1])
+    {
+        beg_x = GNU_PY_ARG_INT(parsed[1]);
+    }
+    if (NULL != parsed[2])
+    {
+        len_y = GNU_PY_ARG_UINT(parsed[2]);
+    }
+    if (NULL != parsed[3])
+    {
+        len_x = GNU_PY_ARG_UINT(parsed[3]);
+    }
+
+    GNU_PY_CHECK_INT(ncplane_region_check(self->ncplane_ptr, beg_y, beg_x, &len_y, &len_x));
+
+    PyObject *rows CLEANUP_PY_OBJ = GNU_PY_CHECK(PyList_New((Py_ssize_t)len_y));
+    PyObject *empty_str CLEANUP_PY_OBJ = GNU_PY_CHECK(PyUnicode_FromStringAndSize(NULL, 0));
+    // One spare item keeps the buffers valid for empty rows.
+    size_t const row_len = (size_t)len_x + 1;
+    char **row_egcs __attribute__((cleanup(plane_row_buffer_free))) = PyMem_Calloc(row_len, sizeof(char *));
+    uint16_t *row_styles __attribute__((cleanup(plane_row_buffer_free))) = PyMem_Calloc(row_len, sizeof(uint16_t));
+    uint64_t *row_channels __attribute__((cleanup(plane_row_buffer_free))) = PyMem_Calloc(row_len, sizeof(uint64_t));
+    if (NULL == row_egcs || NULL == row_styles || NULL == row_channels)
+    {
+        return PyErr_NoMemory();
+    }
+
+    for (unsigned row = 0; row < len_y; row++)
+    {
+        PyObject *row_list = GNU_PY_CHECK(PyList_New((Py_ssize_t)len_x));
+        PyList_SET_ITEM(rows, (Py_ssize_t)row, row_list);
+
+        if (plane_row_read(self->ncplane_ptr, beg_y + (int)row, beg_x, len_x, row_egcs, row_styles, row_channels) < 0)
+        {
+            plane_row_release(row_egcs, len_x);
+            PyErr_Format(PyExc_RuntimeError, "Notcurses failed to read row %d", beg_y + (int)row);
+            return NULL;
+        }
+
+        for (unsigned col = 0; col < len_x; col++)
+        {
+            PyObject *egc_str = NULL;
+            if (NULL == row_egcs[col])
+            {
+                Py_INCREF(empty_str);
+                egc_str = empty_str;
+            }
+            else
+            {
+                egc_str = PyUnicode_FromString(row_egcs[col]);
+                if (NULL == egc_str)
+                {
+                    plane_row_release(row_egcs, len_x);
+                    return NULL;
+                }
+            }
+            PyList_SET_ITEM(row_list, (Py_ssize_t)col, egc_str);
+        }
+        plane_row_release(row_egcs, len_x);
+    }
+
+    Py_INCREF(rows);
+    return rows;
+}
+
 /*
 static PyObject *
 NcPlane_(NcPlaneObject *self, PyObject *args)
@@ -1680,8 +3081,8 @@ NcPlane_(NcPlaneObject *self, PyObject *args)
 */
 
 static PyMethodDef NcPlane_methods[] = {
-    {"create", (void *)Ncplane_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create a new ncplane bound to plane 'n', at the offset 'y'x'x' (relative to the origin of 'n') and the specified size. The number of 'rows' and 'cols' must both be positive. This plane is initially at the top of the z-buffer, as if ncplane_move_top() had been called on it. The void* 'userptr' can be retrieved (and reset) later. A 'name' can be set, used in debugging.")},
-    {"destroy", (PyCFunction)NcPlane_destroy, METH_NOARGS, "Destroy the plane."},
+    {"create", (void *)Ncplane_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create a new ncplane bound to plane 'n', at the offset 'y'x'x' (relative to the origin of 'n') and the specified size. The number of 'rows' and 'cols' must both be positive. This plane is initially at the top of the z-buffer, as if ncplane_move_top() had been called on it. The void* 'userptr' can be retrieved (and reset) later. A 'name' can be set, used in debugging.")},
+    {"destroy", (PyCFunction)NcPlane_destroy, METH_NOARGS, "Destroy the plane. Any further use of the plane raises RuntimeError."},
 
     {"notcurses", (PyCFunction)NcPlane_notcurses, METH_NOARGS, PyDoc_STR("Extract the Notcurses context to which this plane is attached.")},
     {"dim_yx", (PyCFunction)NcPlane_dim_yx, METH_NOARGS, PyDoc_STR("Return the dimensions of this ncplane.")},
@@ -1689,23 +3090,23 @@ static PyMethodDef NcPlane_methods[] = {
     {"dim_y", (PyCFunction)NcPlane_dim_y, METH_NOARGS, PyDoc_STR("Return Y dimension of this ncplane.")},
     {"pixel_geom", (PyCFunction)NcPlane_pixel_geom, METH_NOARGS, PyDoc_STR("Retrieve pixel geometry for the display region ('pxy', 'pxx'), each cell ('celldimy', 'celldimx'), and the maximum displayable bitmap ('maxbmapy', 'maxbmapx'). Note that this will call notcurses_check_pixel_support(), possibly leading to an interrogation of the terminal. If bitmaps are not supported, 'maxbmapy' and 'maxbmapx' will be 0. Any of the geometry arguments may be NULL.")},
 
-    {"set_resizecb", (PyCFunction)NcPlane_set_resizecb, METH_VARARGS, PyDoc_STR("Replace the ncplane's existing resizecb with 'resizecb' (which may be NULL). The standard plane's resizecb may not be changed.")},
-    {"reparent", (PyCFunction)NcPlane_reparent, METH_VARARGS, PyDoc_STR("Plane 'n' will be unbound from its parent plane, and will be made a bound child of 'newparent'.")},
-    {"reparent_family", (PyCFunction)NcPlane_reparent_family, METH_VARARGS, PyDoc_STR("The same as reparent(), except any planes bound to 'n' come along with it to its new destination.")},
+    {"set_resizecb", (void *)NcPlane_set_resizecb, METH_FASTCALL, PyDoc_STR("Replace the ncplane's existing resizecb with 'resizecb' (which may be NULL). The standard plane's resizecb may not be changed.")},
+    {"reparent", (PyCFunction)NcPlane_reparent, METH_O, PyDoc_STR("Plane 'n' will be unbound from its parent plane, and will be made a bound child of 'newparent'.")},
+    {"reparent_family", (PyCFunction)NcPlane_reparent_family, METH_O, PyDoc_STR("The same as reparent(), except any planes bound to 'n' come along with it to its new destination.")},
     {"dup", (PyCFunction)NcPlane_dup, METH_NOARGS, PyDoc_STR("Duplicate an existing ncplane.")},
 
-    {"translate", (void *)NcPlane_translate, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("provided a coordinate relative to the origin of 'src', map it to the same absolute coordinate relative to the origin of 'dst'.")},
-    {"translate_abs", (PyCFunction)NcPlane_translate_abs, METH_VARARGS, PyDoc_STR("Fed absolute 'y'/'x' coordinates, determine whether that coordinate is within the ncplane.")},
-    {"set_scrolling", (PyCFunction)NcPlane_set_scrolling, METH_VARARGS, PyDoc_STR("All planes are created with scrolling disabled. Returns true if scrolling was previously enabled, or false if it was disabled.")},
+    {"translate", (void *)NcPlane_translate, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("provided a coordinate relative to the origin of 'src', map it to the same absolute coordinate relative to the origin of 'dst'.")},
+    {"translate_abs", (void *)NcPlane_translate_abs, METH_FASTCALL, PyDoc_STR("Fed absolute 'y'/'x' coordinates, determine whether that coordinate is within the ncplane.")},
+    {"set_scrolling", (PyCFunction)NcPlane_set_scrolling, METH_O, PyDoc_STR("All planes are created with scrolling disabled. Returns true if scrolling was previously enabled, or false if it was disabled.")},
 
-    {"resize", (void *)NcPlane_resize, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Resize the specified ncplane.")},
-    {"resize_simple", (PyCFunction)NcPlane_resize_simple, METH_VARARGS, PyDoc_STR("Resize the plane, retaining what data we can (everything, unless we're shrinking in some dimension). Keep the origin where it is.")},
+    {"resize", (void *)NcPlane_resize, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Resize the specified ncplane.")},
+    {"resize_simple", (void *)NcPlane_resize_simple, METH_FASTCALL, PyDoc_STR("Resize the plane, retaining what data we can (everything, unless we're shrinking in some dimension). Keep the origin where it is.")},
 
-    {"set_base_cell", (PyCFunction)NcPlane_set_base_cell, METH_VARARGS, PyDoc_STR("Set the ncplane's base nccell to 'c'.")},
-    {"set_base", (void *)NcPlane_set_base, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Set the ncplane's base nccell.")},
+    {"set_base_cell", (void *)NcPlane_set_base_cell, METH_FASTCALL, PyDoc_STR("Set the ncplane's base nccell to 'c'.")},
+    {"set_base", (void *)NcPlane_set_base, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the ncplane's base nccell.")},
     {"base", (PyCFunction)NcPlane_base, METH_NOARGS, PyDoc_STR("Extract the ncplane's base nccell.")},
 
-    {"move_yx", (PyCFunction)NcPlane_move_yx, METH_VARARGS, PyDoc_STR("Move this plane relative to the standard plane, or the plane to which it is bound (if it is bound to a plane).")},
+    {"move_yx", (void *)NcPlane_move_yx, METH_FASTCALL, PyDoc_STR("Move this plane relative to the standard plane, or the plane to which it is bound (if it is bound to a plane).")},
     {"yx", (PyCFunction)NcPlane_yx, METH_NOARGS, PyDoc_STR("Get the origin of plane relative to its bound plane, or pile.")},
     {"y", (PyCFunction)NcPlane_y, METH_NOARGS, PyDoc_STR("Get the Y origin of plane relative to its bound plane, or pile.")},
     {"x", (PyCFunction)NcPlane_x, METH_NOARGS, PyDoc_STR("Get the X origin of plane relative to its bound plane, or pile.")},
@@ -1714,12 +3115,12 @@ static PyMethodDef NcPlane_methods[] = {
     {"abs_x", (PyCFunction)NcPlane_abs_x, METH_NOARGS, PyDoc_STR("Get the X origin of plane relative to its pile.")},
 
     {"parent", (PyCFunction)NcPlane_parent, METH_NOARGS, PyDoc_STR("Get the plane to which the plane is bound or None if plane does not have parent.")},
-    {"descendant_p", (PyCFunction)NcPlane_descendant_p, METH_VARARGS, PyDoc_STR("Return True if plane is a proper descendent of passed 'ancestor' plane.")},
+    {"descendant_p", (PyCFunction)NcPlane_descendant_p, METH_O, PyDoc_STR("Return True if plane is a proper descendent of passed 'ancestor' plane.")},
 
     {"move_top", (PyCFunction)NcPlane_move_top, METH_NOARGS, PyDoc_STR("Splice ncplane out of the z-buffer, and reinsert it at the top.")},
     {"move_bottom", (PyCFunction)NcPlane_move_bottom, METH_NOARGS, PyDoc_STR("Splice ncplane out of the z-buffer, and reinsert it at the bottom.")},
-    {"move_above", (PyCFunction)NcPlane_move_above, METH_VARARGS, PyDoc_STR("Splice ncplane out of the z-buffer, and reinsert it above passed plane.")},
-    {"move_below", (PyCFunction)NcPlane_move_below, METH_VARARGS, PyDoc_STR("Splice ncplane out of the z-buffer, and reinsert it bellow passed plane.")},
+    {"move_above", (PyCFunction)NcPlane_move_above, METH_O, PyDoc_STR("Splice ncplane out of the z-buffer, and reinsert it above passed plane.")},
+    {"move_below", (PyCFunction)NcPlane_move_below, METH_O, PyDoc_STR("Splice ncplane out of the z-buffer, and reinsert it bellow passed plane.")},
     {"below", (PyCFunction)NcPlane_below, METH_NOARGS, PyDoc_STR("Return the plane below this one, or None if this is at the bottom.")},
     {"above", (PyCFunction)NcPlane_above, METH_NOARGS, PyDoc_STR("Return the plane above this one, or None if this is at the top.")},
 
@@ -1728,65 +3129,66 @@ static PyMethodDef NcPlane_methods[] = {
 
     {"at_cursor", (PyCFunction)NcPlane_at_cursor, METH_NOARGS, PyDoc_STR("Retrieve the current contents of the cell under the cursor.")},
     {"at_cursor_cell", (PyCFunction)NcPlane_at_cursor_cell, METH_NOARGS, PyDoc_STR("Retrieve the current contents of the cell under the cursor.")},
-    {"at_yx", (PyCFunction)NcPlane_at_yx, METH_VARARGS, PyDoc_STR("Retrieve the current contents of the specified cell.")},
-    {"at_yx_cell", (PyCFunction)NcPlane_at_yx_cell, METH_VARARGS, PyDoc_STR("Retrieve the current contents of the specified cell")},
-    {"contents", (void *)NcPlane_contents, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create a flat string from the EGCs of the selected region of the ncplane.")},
+    {"at_yx", (void *)NcPlane_at_yx, METH_FASTCALL, PyDoc_STR("Retrieve the current contents of the specified cell.")},
+    {"at_yx_cell", (void *)NcPlane_at_yx_cell, METH_FASTCALL, PyDoc_STR("Retrieve the current contents of the specified cell")},
+    {"contents", (void *)NcPlane_contents, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create a flat string from the EGCs of the selected region of the ncplane.")},
 
     {"center_abs", (PyCFunction)NcPlane_center_abs, METH_NOARGS, PyDoc_STR("Return the plane center absolute coordiantes.")},
 
-    {"halign", (PyCFunction)NcPlane_halign, METH_VARARGS, PyDoc_STR("Return the column at which cols ought start in order to be aligned.")},
-    {"valign", (PyCFunction)NcPlane_valign, METH_VARARGS, PyDoc_STR("Return the row at which rows ought start in order to be aligned.")},
+    {"halign", (void *)NcPlane_halign, METH_FASTCALL, PyDoc_STR("Return the column at which cols ought start in order to be aligned.")},
+    {"valign", (void *)NcPlane_valign, METH_FASTCALL, PyDoc_STR("Return the row at which rows ought start in order to be aligned.")},
 
-    {"cursor_move_yx", (PyCFunction)NcPlane_cursor_move_yx, METH_VARARGS, PyDoc_STR("Move the cursor to the specified position (the cursor needn't be visible).")},
+    {"cursor_move_yx", (void *)NcPlane_cursor_move_yx, METH_FASTCALL, PyDoc_STR("Move the cursor to the specified position (the cursor needn't be visible).")},
     {"home", (PyCFunction)NcPlane_home, METH_NOARGS, PyDoc_STR("Move the cursor to 0, 0.")},
     {"cursor_yx", (PyCFunction)NcPlane_cursor_yx, METH_NOARGS, PyDoc_STR("Get the current position of the cursor within plane.")},
 
     {"channels", (PyCFunction)NcPlane_channels, METH_NOARGS, PyDoc_STR("Get the current channels or attribute word.")},
     {"styles", (PyCFunction)NcPlane_styles, METH_NOARGS, PyDoc_STR("Return the current styling for this ncplane.")},
 
-    {"putc_yx", (PyCFunction)NcPlane_putc_yx, METH_VARARGS, PyDoc_STR("Replace the cell at the specified coordinates with the provided cell.")},
-    {"putc", (PyCFunction)NcPlane_putc, METH_VARARGS, PyDoc_STR("Replace cell at the current cursor location.")},
+    {"putc_yx", (void *)NcPlane_putc_yx, METH_FASTCALL, PyDoc_STR("Replace the cell at the specified coordinates with the provided cell.")},
+    {"putc", (void *)NcPlane_putc, METH_FASTCALL, PyDoc_STR("Replace cell at the current cursor location.")},
 
-    {"putchar_yx", (PyCFunction)NcPlane_putchar_yx, METH_VARARGS, PyDoc_STR("Replace the cell at the specified coordinates with the provided 7-bit char.")},
-    {"putchar", (PyCFunction)NcPlane_putchar, METH_VARARGS, PyDoc_STR("Replace the cell at the current cursor location.")},
-    {"putchar_stained", (PyCFunction)NcPlane_putchar_stained, METH_VARARGS, PyDoc_STR("Replace the EGC underneath us, but retain the styling.")},
+    {"putchar_yx", (void *)NcPlane_putchar_yx, METH_FASTCALL, PyDoc_STR("Replace the cell at the specified coordinates with the provided 7-bit char.")},
+    {"putchar", (PyCFunction)NcPlane_putchar, METH_O, PyDoc_STR("Replace the cell at the current cursor location.")},
+    {"putchar_stained", (PyCFunction)NcPlane_putchar_stained, METH_O, PyDoc_STR("Replace the EGC underneath us, but retain the styling.")},
 
-    {"putegc_yx", (PyCFunction)NcPlane_putegc_yx, METH_VARARGS, PyDoc_STR("Replace the cell at the specified coordinates with the provided EGC.")},
-    {"putegc", (PyCFunction)NcPlane_putegc, METH_VARARGS, PyDoc_STR("Replace the cell at the current cursor location with the provided EGC")},
-    {"putegc_stained", (PyCFunction)NcPlane_putegc_stained, METH_VARARGS, PyDoc_STR("Replace the EGC underneath us, but retain the styling.")},
+    {"putegc_yx", (void *)NcPlane_putegc_yx, METH_FASTCALL, PyDoc_STR("Replace the cell at the specified coordinates with the provided EGC.")},
+    {"putegc", (PyCFunction)NcPlane_putegc, METH_O, PyDoc_STR("Replace the cell at the current cursor location with the provided EGC")},
+    {"putegc_stained", (PyCFunction)NcPlane_putegc_stained, METH_O, PyDoc_STR("Replace the EGC underneath us, but retain the styling.")},
 
-    {"putstr_yx", (PyCFunction)NcPlane_putstr_yx, METH_VARARGS, PyDoc_STR("Write a series of EGCs to the location, using the current style.")},
-    {"putstr", (PyCFunction)NcPlane_putstr, METH_VARARGS, PyDoc_STR("Write a series of EGCs to the current location, using the current style.")},
-    {"putstr_aligned", (PyCFunction)NcPlane_putstr_aligned, METH_VARARGS, PyDoc_STR("Write a series of EGCs to the current location, using the alignment.")},
-    {"putstr_stained", (PyCFunction)NcPlane_putstr_stained, METH_VARARGS, PyDoc_STR("Replace a string's worth of glyphs at the current cursor location, but retain the styling.")},
-    {"putnstr_yx", (PyCFunction)NcPlane_putnstr_yx, METH_VARARGS, PyDoc_STR("Write a series of EGCs to the location, using the current style.")},
-    {"putnstr", (PyCFunction)NcPlane_putnstr, METH_VARARGS, PyDoc_STR("Write a series of EGCs to the current location, using the current style.")},
-    {"putnstr_aligned", (PyCFunction)NcPlane_putnstr_aligned, METH_VARARGS, PyDoc_STR("Write a series of EGCs to the current location, using the alignment.")},
+    {"putstr_yx", (void *)NcPlane_putstr_yx, METH_FASTCALL, PyDoc_STR("Write a series of EGCs to the location, using the current style.")},
+    {"putstr", (PyCFunction)NcPlane_putstr, METH_O, PyDoc_STR("Write a series of EGCs to the current location, using the current style.")},
+    {"putstr_aligned", (void *)NcPlane_putstr_aligned, METH_FASTCALL, PyDoc_STR("Write a series of EGCs to the current location, using the alignment.")},
+    {"putstr_stained", (PyCFunction)NcPlane_putstr_stained, METH_O, PyDoc_STR("Replace a string's worth of glyphs at the current cursor location, but retain the styling.")},
+    {"putnstr_yx", (void *)NcPlane_putnstr_yx, METH_FASTCALL, PyDoc_STR("Write a series of EGCs to the location, using the current style.")},
+    {"putnstr", (void *)NcPlane_putnstr, METH_FASTCALL, PyDoc_STR("Write a series of EGCs to the current location, using the current style.")},
+    {"putnstr_aligned", (void *)NcPlane_putnstr_aligned, METH_FASTCALL, PyDoc_STR("Write a series of EGCs to the current location, using the alignment.")},
 
-    {"puttext", (PyCFunction)NcPlane_puttext, METH_VARARGS, PyDoc_STR("Write the specified text to the plane, breaking lines sensibly, beginning at the specified line.")},
+    {"puttext", (void *)NcPlane_puttext, METH_FASTCALL, PyDoc_STR("Write the specified text to the plane, breaking lines sensibly, beginning at the specified line.")},
 
-    {"box", (void *)NcPlane_box, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a box with its upper-left corner at the current cursor position.")},
-    {"box_sized", (void *)NcPlane_box_sized, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a box with its upper-left corner at the current cursor position, having dimensions.")},
-    {"perimeter", (void *)NcPlane_perimeter, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a perimeter with its upper-left corner at the current cursor position")},
-    {"polyfill_yx", (void *)NcPlane_polyfill_yx, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Starting at the specified coordinate, if its glyph is different from that of is copied into it, and the original glyph is considered the fill target.")},
+    {"box", (void *)NcPlane_box, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a box with its upper-left corner at the current cursor position.")},
+    {"box_sized", (void *)NcPlane_box_sized, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a box with its upper-left corner at the current cursor position, having dimensions.")},
+    {"perimeter", (void *)NcPlane_perimeter, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a perimeter with its upper-left corner at the current cursor position")},
+    {"polyfill_yx", (void *)NcPlane_polyfill_yx, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Starting at the specified coordinate, replace every connected cell having the same glyph with 'cell'. Returns the number of cells filled.")},
+    {"fill_yx", (void *)NcPlane_fill_yx, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Put 'cell' across the ylen x xlen region at y/x, zero lengths extending to the plane edge. The width of the region must be a multiple of the cell width. Returns the number of cells put.")},
 
-    {"gradient", (void *)NcPlane_gradient, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a gradient with its upper-left corner at the current cursor position.")},
-    {"gradient2x1", (void *)NcPlane_gradient2x1, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("NcPlane.gradent_sized() meets NcPlane.highgradient().")},
+    {"gradient", (void *)NcPlane_gradient, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a gradient with its upper-left corner at the current cursor position.")},
+    {"gradient2x1", (void *)NcPlane_gradient2x1, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("NcPlane.gradent_sized() meets NcPlane.highgradient().")},
 
-    {"format", (PyCFunction)NcPlane_format, METH_VARARGS, PyDoc_STR("Set the given style throughout the specified region, keeping content and attributes unchanged. Returns the number of cells set.")},
-    {"stain", (void *)NcPlane_stain, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Set the given style throughout the specified region, keeping content and attributes unchanged. Returns the number of cells set.")},
+    {"format", (void *)NcPlane_format, METH_FASTCALL, PyDoc_STR("Set the given style throughout the specified region, keeping content and attributes unchanged. Returns the number of cells set.")},
+    {"stain", (void *)NcPlane_stain, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Set the given style throughout the specified region, keeping content and attributes unchanged. Returns the number of cells set.")},
 
-    {"mergedown_simple", (PyCFunction)NcPlane_mergedown_simple, METH_VARARGS, PyDoc_STR("Merge the ncplane down onto the passed ncplane.")},
-    {"mergedown", (void *)NcPlane_mergedown, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Merge with parameters the ncplane down onto the passed ncplane.")},
+    {"mergedown_simple", (PyCFunction)NcPlane_mergedown_simple, METH_O, PyDoc_STR("Merge the ncplane down onto the passed ncplane.")},
+    {"mergedown", (void *)NcPlane_mergedown, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Merge with parameters the ncplane down onto the passed ncplane.")},
     {"erase", (PyCFunction)NcPlane_erase, METH_NOARGS, PyDoc_STR("Erase every cell in the ncplane.")},
 
     {"bchannel", (PyCFunction)NcPlane_bchannel, METH_NOARGS, PyDoc_STR("Extract the 32-bit working background channel from an ncplane.")},
     {"fchannel", (PyCFunction)NcPlane_fchannel, METH_NOARGS, PyDoc_STR("Extract the 32-bit working foreground channel from an ncplane.")},
-    {"set_channels", (PyCFunction)NcPlane_set_channels, METH_VARARGS, PyDoc_STR("Set both foreground and background channels of the plane.")},
+    {"set_channels", (PyCFunction)NcPlane_set_channels, METH_O, PyDoc_STR("Set both foreground and background channels of the plane.")},
 
-    {"set_styles", (PyCFunction)NcPlane_set_styles, METH_VARARGS, PyDoc_STR("Set the specified style bits for the plane, whether they're actively supported or not.")},
-    {"on_styles", (PyCFunction)NcPlane_on_styles, METH_VARARGS, PyDoc_STR("Add the specified styles to the ncplane's existing spec.")},
-    {"off_styles", (PyCFunction)NcPlane_off_styles, METH_VARARGS, PyDoc_STR("Remove the specified styles from the ncplane's existing spec.")},
+    {"set_styles", (PyCFunction)NcPlane_set_styles, METH_O, PyDoc_STR("Set the specified style bits for the plane, whether they're actively supported or not.")},
+    {"on_styles", (PyCFunction)NcPlane_on_styles, METH_O, PyDoc_STR("Add the specified styles to the ncplane's existing spec.")},
+    {"off_styles", (PyCFunction)NcPlane_off_styles, METH_O, PyDoc_STR("Remove the specified styles from the ncplane's existing spec.")},
 
     {"fg_rgb", (PyCFunction)NcPlane_fg_rgb, METH_NOARGS, PyDoc_STR("Extract 24 bits of working foreground RGB from the plane, shifted to LSBs.")},
     {"bg_rgb", (PyCFunction)NcPlane_bg_rgb, METH_NOARGS, PyDoc_STR("Extract 24 bits of working background RGB from the plane, shifted to LSBs.")},
@@ -1797,71 +3199,76 @@ static PyMethodDef NcPlane_methods[] = {
 
     {"fg_rgb8", (PyCFunction)NcPlane_fg_rgb8, METH_NOARGS, PyDoc_STR("Extract 24 bits of foreground RGB from the plane, split into components.")},
     {"bg_rgb8", (PyCFunction)NcPlane_bg_rgb8, METH_NOARGS, PyDoc_STR("Extract 24 bits of background RGB from the plane, split into components.")},
-    {"set_fchannel", (PyCFunction)NcPlane_set_fchannel, METH_VARARGS, PyDoc_STR("Set an entire foreground channel of the plane, return new channels.")},
-    {"set_bchannel", (PyCFunction)NcPlane_set_bchannel, METH_VARARGS, PyDoc_STR("Set an entire background channel of the plane, return new channels.")},
+    {"set_fchannel", (PyCFunction)NcPlane_set_fchannel, METH_O, PyDoc_STR("Set an entire foreground channel of the plane, return new channels.")},
+    {"set_bchannel", (PyCFunction)NcPlane_set_bchannel, METH_O, PyDoc_STR("Set an entire background channel of the plane, return new channels.")},
 
-    {"set_fg_rgb8", (PyCFunction)NcPlane_set_fg_rgb8, METH_VARARGS, PyDoc_STR("Set the current foreground color using RGB specifications.")},
-    {"set_bg_rgb8", (PyCFunction)NcPlane_set_bg_rgb8, METH_VARARGS, PyDoc_STR("Set the current background color using RGB specifications.")},
-    {"set_bg_rgb8_clipped", (PyCFunction)NcPlane_set_bg_rgb8_clipped, METH_VARARGS, PyDoc_STR("Set the current foreground color using RGB specifications but clipped to [0..255].")},
-    {"set_fg_rgb8_clipped", (PyCFunction)NcPlane_set_fg_rgb8_clipped, METH_VARARGS, PyDoc_STR("Set the current background color using RGB specifications but clipped to [0..255].")},
-    {"set_fg_rgb", (PyCFunction)NcPlane_set_fg_rgb, METH_VARARGS, PyDoc_STR("Set the current foreground color using channel.")},
-    {"set_bg_rgb", (PyCFunction)NcPlane_set_bg_rgb, METH_VARARGS, PyDoc_STR("Set the current background color using channel.")},
+    {"set_fg_rgb8", (void *)NcPlane_set_fg_rgb8, METH_FASTCALL, PyDoc_STR("Set the current foreground color using RGB specifications.")},
+    {"set_bg_rgb8", (void *)NcPlane_set_bg_rgb8, METH_FASTCALL, PyDoc_STR("Set the current background color using RGB specifications.")},
+    {"set_bg_rgb8_clipped", (void *)NcPlane_set_bg_rgb8_clipped, METH_FASTCALL, PyDoc_STR("Set the current foreground color using RGB specifications but clipped to [0..255].")},
+    {"set_fg_rgb8_clipped", (void *)NcPlane_set_fg_rgb8_clipped, METH_FASTCALL, PyDoc_STR("Set the current background color using RGB specifications but clipped to [0..255].")},
+    {"set_fg_rgb", (PyCFunction)NcPlane_set_fg_rgb, METH_O, PyDoc_STR("Set the current foreground color using channel.")},
+    {"set_bg_rgb", (PyCFunction)NcPlane_set_bg_rgb, METH_O, PyDoc_STR("Set the current background color using channel.")},
 
     {"set_fg_default", (PyCFunction)NcPlane_set_fg_default, METH_NOARGS, PyDoc_STR("Use the default color for the foreground.")},
     {"set_bg_default", (PyCFunction)NcPlane_set_bg_default, METH_NOARGS, PyDoc_STR("Use the default color for the background.")},
-    {"set_fg_palindex", (PyCFunction)NcPlane_set_fg_palindex, METH_VARARGS, PyDoc_STR("Set the ncplane's foreground palette index.")},
-    {"set_bg_palindex", (PyCFunction)NcPlane_set_bg_palindex, METH_VARARGS, PyDoc_STR("Set the ncplane's background palette index.")},
-    {"set_fg_alpha", (PyCFunction)NcPlane_set_fg_alpha, METH_VARARGS, PyDoc_STR("Set the foreground alpha parameters for the plane.")},
-    {"set_bg_alpha", (PyCFunction)NcPlane_set_bg_alpha, METH_VARARGS, PyDoc_STR("Set the background alpha parameters for the plane.")},
-
-    {"fadeout", (PyCFunction)NcPlane_fadeout, METH_VARARGS, PyDoc_STR("Fade the ncplane out over the provided time, calling 'fader' at each iteration.")},
-    {"fadein", (PyCFunction)NcPlane_fadein, METH_VARARGS, PyDoc_STR("Fade the ncplane in over the specified time. ")},
-    {"fade_setup", (PyCFunction)NcPlane_fade_setup, METH_VARARGS, PyDoc_STR("Create NcFadeCtx.")},
-    {"fadeout_iteration", (PyCFunction)NcPlane_fadeout_iteration, METH_VARARGS, PyDoc_STR("TODO")},
-    {"fadein_iteration", (PyCFunction)NcPlane_fadein_iteration, METH_VARARGS, PyDoc_STR("TODO")},
-    {"pulse", (PyCFunction)NcPlane_pulse, METH_VARARGS, PyDoc_STR("Pulse the plane in and out until the callback returns non-zero.")},
-
-    {"cells_load_box", (void *)NcPlane_cells_load_box, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Load up six cells with the EGCs necessary to draw a box.")},
-    {"cells_rounded_box", (void *)NcPlane_cells_rounded_box, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Load up six cells with the EGCs necessary to draw a round box.")},
-    {"perimeter_rounded", (void *)NcPlane_perimeter_rounded, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a perimeter around plane.")},
-
-    {"rounded_box_sized", (void *)NcPlane_rounded_box_sized, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a round box around plane.")},
-    {"cells_double_box", (void *)NcPlane_cells_double_box, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a double box with cells.")},
-    {"double_box", (void *)NcPlane_double_box, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a double box.")},
-    {"perimeter_double", (void *)NcPlane_perimeter_double, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a double perimeter.")},
-    {"double_box_sized", (void *)NcPlane_double_box_sized, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Draw a double box sized.")},
-
-    {"ncvisual_from_plane", (void *)NcPlane_ncvisual_from_plane, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Promote an plane to an NcVisual.")},
-    {"as_rgba", (void *)NcPlane_as_rgba, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create an RGBA flat array from the selected region of the plane.")},
-    {"reel_create", (void *)NcPlane_reel_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Take over the plane and use it to draw a reel.")},
+    {"set_fg_palindex", (PyCFunction)NcPlane_set_fg_palindex, METH_O, PyDoc_STR("Set the ncplane's foreground palette index.")},
+    {"set_bg_palindex", (PyCFunction)NcPlane_set_bg_palindex, METH_O, PyDoc_STR("Set the ncplane's background palette index.")},
+    {"set_fg_alpha", (PyCFunction)NcPlane_set_fg_alpha, METH_O, PyDoc_STR("Set the foreground alpha parameters for the plane.")},
+    {"set_bg_alpha", (PyCFunction)NcPlane_set_bg_alpha, METH_O, PyDoc_STR("Set the background alpha parameters for the plane.")},
+
+    {"fadeout", (void *)NcPlane_fadeout, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Fade the ncplane out over 'duration' seconds, blocking until done. 'fader' is called with the plane and the deadline of the next iteration (time.monotonic() seconds) at each iteration and must render, otherwise the plane is rendered and the call sleeps between iterations. 'fader' returns None or an int, a nonzero int stops the fade and is returned. The GIL is released meanwhile. Use NcFader in event loops.")},
+    {"fadein", (void *)NcPlane_fadein, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Fade the ncplane in over 'duration' seconds, like fadeout(). Load the ncplane with the target cells without rendering, then call this function.")},
+    {"fade_setup", (PyCFunction)NcPlane_fade_setup, METH_NOARGS, PyDoc_STR("Save the colors of the plane into an NcFadeCtx, for fadein_iteration() and fadeout_iteration().")},
+    {"fadeout_iteration", (void *)NcPlane_fadeout_iteration, METH_FASTCALL, PyDoc_STR("Recolor the plane to 'iteration' (0 to NcFadeCtx.iterations) of a fade out from the colors saved in the NcFadeCtx. Does not render or sleep.")},
+    {"fadein_iteration", (void *)NcPlane_fadein_iteration, METH_FASTCALL, PyDoc_STR("Recolor the plane to 'iteration' (0 to NcFadeCtx.iterations) of a fade in to the colors saved in the NcFadeCtx. Does not render or sleep.")},
+    {"pulse", (void *)NcPlane_pulse, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Pulse the plane in and out with 'duration' seconds as half period until 'fader', which must render, returns a nonzero int. Blocks meanwhile with the GIL released.")},
+
+    {"cells_load_box", (void *)NcPlane_cells_load_box, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Load up six cells with the EGCs necessary to draw a box.")},
+    {"cells_rounded_box", (void *)NcPlane_cells_rounded_box, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Load up six cells with the EGCs necessary to draw a round box.")},
+    {"perimeter_rounded", (void *)NcPlane_perimeter_rounded, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a perimeter around plane.")},
+
+    {"rounded_box_sized", (void *)NcPlane_rounded_box_sized, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a round box around plane.")},
+    {"cells_double_box", (void *)NcPlane_cells_double_box, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a double box with cells.")},
+    {"double_box", (void *)NcPlane_double_box, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a double box.")},
+    {"perimeter_double", (void *)NcPlane_perimeter_double, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a double perimeter.")},
+    {"double_box_sized", (void *)NcPlane_double_box_sized, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Draw a double box sized.")},
+
+    {"ncvisual_from_plane", (void *)NcPlane_ncvisual_from_plane, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Promote the selected region of the plane to an NcVisual, interpreting its cells as drawn by 'blitter'. The GIL is released meanwhile.")},
+    {"as_rgba", (void *)NcPlane_as_rgba, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create an RGBA flat array from the selected region of the plane, interpreting its cells as drawn by 'blitter'. Returns a tuple (bytes, pixel rows, pixel cols). The GIL is released meanwhile.")},
+    {"reel_create", (void *)NcPlane_reel_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Take over the plane and use it to draw a reel.")},
     {"greyscale", (PyCFunction)NcPlane_greyscale, METH_NOARGS, PyDoc_STR("Convert the plane's content to greyscale.")},
-    {"selector_create", (void *)NcPlane_selector_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcSelector.")},
-    {"multiselector_create", (void *)NcPlane_multiselector_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create MultiSelector.")},
-    {"tree_create", (void *)NcPlane_tree_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcTree.")},
-    {"menu_create", (void *)NcPlane_menu_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcMenu.")},
-    {"progbar_create", (void *)NcPlane_progbar_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcProgbar.")},
-    {"tabbed_create", (void *)NcPlane_tabbed_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcTabbed.")},
-    {"uplot_create", (void *)NcPlane_uplot_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcUplot.")},
-    {"dplot_create", (void *)NcPlane_dplot_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcDplot.")},
-    {"fdplane_create", (void *)NcPlane_fdplane_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcFdPlane.")},
+    {"selector_create", (void *)NcPlane_selector_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create NcSelector.")},
+    {"multiselector_create", (void *)NcPlane_multiselector_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create MultiSelector.")},
+    {"tree_create", (void *)NcPlane_tree_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create NcTree.")},
+    {"menu_create", (void *)NcPlane_menu_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create NcMenu.")},
+    {"progbar_create", (void *)NcPlane_progbar_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create NcProgbar.")},
+    {"tabbed_create", (void *)NcPlane_tabbed_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create NcTabbed.")},
+    {"uplot_create", (void *)NcPlane_uplot_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create an NcUplot of uint64 samples drawing on this plane, which it takes over. Equal 'miny' and 'maxy' (both 0) detect the domain from the samples. Other arguments are the ncplot_options fields. The plane is destroyed if the plot cannot be created.")},
+    {"dplot_create", (void *)NcPlane_dplot_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create an NcDplot of double samples drawing on this plane, which it takes over. Equal 'miny' and 'maxy' (both 0) detect the domain from the samples. Other arguments are the ncplot_options fields. The plane is destroyed if the plot cannot be created.")},
+    {"fdplane_create", (void *)NcPlane_fdplane_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create NcFdPlane.")},
 
-    {"subproc_createv", (void *)NcPlane_subproc_createv, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create subprocess plane.")},
-    {"subproc_createvp", (void *)NcPlane_subproc_createvp, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create subprocess plane.")},
-    {"subproc_createvpe", (void *)NcPlane_subproc_createvpe, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create subprocess plane.")},
+    {"subproc_createv", (void *)NcPlane_subproc_createv, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create subprocess plane.")},
+    {"subproc_createvp", (void *)NcPlane_subproc_createvp, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create subprocess plane.")},
+    {"subproc_createvpe", (void *)NcPlane_subproc_createvpe, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create subprocess plane.")},
 
-    {"qrcode", (void *)NcPlane_qrcode, METH_VARARGS, PyDoc_STR("Create QR code, return y and x size.")},
+    {"qrcode", (PyCFunction)NcPlane_qrcode, METH_O, PyDoc_STR("Create QR code, return y and x size.")},
 
-    {"reader_create", (void *)NcPlane_reader_create, METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Create NcReader.")},
+    {"reader_create", (void *)NcPlane_reader_create, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Create NcReader.")},
 
     {"pile_top", (PyCFunction)NcPlane_pile_top, METH_NOARGS, PyDoc_STR("Return the topmost plane of the pile.")},
     {"pile_bottom", (PyCFunction)NcPlane_pile_bottom, METH_NOARGS, PyDoc_STR("Return the bottommost plane of the pile.")},
-    {"pile_render", (PyCFunction)NcPlane_pile_render, METH_NOARGS, PyDoc_STR("Renders the pile of which plane is a part.")},
-    {"pile_rasterize", (PyCFunction)NcPlane_pile_rasterize, METH_NOARGS, PyDoc_STR("Make the physical screen match the last rendered frame from the pile.")},
+    {"pile_render", (PyCFunction)NcPlane_pile_render, METH_NOARGS, PyDoc_STR("Renders the pile of which plane is a part. The GIL is released meanwhile.")},
+    {"pile_rasterize", (PyCFunction)NcPlane_pile_rasterize, METH_NOARGS, PyDoc_STR("Make the physical screen match the last rendered frame from the pile. The GIL is released meanwhile.")},
 
-    {"pile_render_to_buffer", (PyCFunction)NcPlane_pile_render_to_buffer, METH_NOARGS, "Perform the rendering and rasterization portion of notcurses_render() and write it to bytes object instead of terminal."},
-    {"render_to_file", (PyCFunction)NcPlane_pile_render_to_file, METH_VARARGS, "Write the last rendered frame, in its entirety, to file descriptor. If render() has not yet been called, nothing will be written."},
+    {"pile_render_to_buffer", (void *)NcPlane_pile_render_to_buffer, METH_FASTCALL | METH_KEYWORDS, "Perform the rendering and rasterization portion of notcurses_render() and write it to bytes object instead of terminal. If 'into' is an NcRenderBuffer, the frame is rendered into it instead and the buffer is returned, without creating a new object per frame. The GIL is released meanwhile."},
+    {"pile_render_to_file", (PyCFunction)NcPlane_pile_render_to_file, METH_O, "Write the last rendered frame, in its entirety, to file descriptor. If render() has not yet been called, nothing will be written. The fd is left open. To stream frames to a fd use NcRenderSink instead."},
+    {"render_to_file", (PyCFunction)NcPlane_pile_render_to_file, METH_O, "Deprecated alias of pile_render_to_file()."},
 
-    {"scrollup", (PyCFunction)NcPlane_scrollup, METH_VARARGS, "Effect scroll events on the plane."},
+    {"scrollup", (PyCFunction)NcPlane_scrollup, METH_O, "Effect scroll events on the plane."},
+    {"execute", (PyCFunction)NcPlane_execute, METH_O, PyDoc_STR("Replay every op of the NcDisplayList on the plane. Stops and raises on the first failing op. Returns the number of ops replayed.")},
+    {"snapshot", (void *)NcPlane_snapshot, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Copy the selected region in one call. Returns a tuple of read-only 2-D memoryviews: uint32 codepoints (first codepoint of the EGC, NCPLANE_SNAPSHOT_CLUSTER bit set for multi-codepoint EGCs, 0 for right halves of wide glyphs), uint16 stylemasks and uint64 channels.")},
+    {"egcs", (void *)NcPlane_egcs, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Return the EGCs of the selected region as a list of rows, each a list of strings. Right halves of wide glyphs and empty cells are empty strings, empty cells holding the EGC of the base cell if the plane has one.")},
+    {"blit_cells", (void *)NcPlane_blit_cells, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Write a rectangle of cells at 'y'/'x' from 2-D arrays of uint32 'codepoints' and optional uint32 'fg'/'bg' RGB and uint16 'styles', in one call with the GIL released. One-dimensional arrays need 'cols'. Zero codepoints leave the cell untouched. Returns the number of cells written.")},
 
     //  {"", (PyCFunction) NULL, METH_VARARGS, PyDoc_STR("")},
     {NULL, NULL, 0, NULL},
@@ -1875,5 +3282,7 @@ PyTypeObject NcPlane_Type = {
     .tp_itemsize = 0,
     .tp_flags = Py_TPFLAGS_DEFAULT,
     .tp_new = NcPlane_new,
+    .tp_dealloc = (destructor)NcPlane_dealloc,
+    .tp_weaklistoffset = offsetof(NcPlaneObject, weakreflist),
     .tp_methods = NcPlane_methods,
 };
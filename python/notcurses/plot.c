@@ -0,0 +1,723 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+// Every sample added to a plot redraws its whole plane, which is what limits
+// the sample rate, not the call overhead. add_samples() therefore reduces a
+// batch before handing it to the library: consecutive samples with the same
+// x are summed into one, and samples older than the window the batch ends
+// with are skipped, since they would be dropped by the time it is drawn.
+// The window is not exposed by the library, its length is found once by
+// probing ncuplot_sample()/ncdplot_sample() on a scratch plot and its newest
+// x is tracked here.
+
+#define CHECK_PLOT(self, ptr_field, name)                                          \
+    ({                                                                             \
+        /* Destroying the plane destroys the plot along with it. */                \
+        if (NULL != (self)->ptr_field && NULL == (self)->window.plane->ncplane_ptr) \
+        {                                                                          \
+            (self)->ptr_field = NULL;                                              \
+        }                                                                          \
+        if (NULL == (self)->ptr_field)                                             \
+        {                                                                          \
+            PyErr_SetString(PyExc_RuntimeError, name " has been destroyed");       \
+            return NULL;                                                           \
+        }                                                                          \
+    })
+
+typedef int (*PlotHasSample)(const void *plot, uint64_t x);
+
+static int
+uplot_has_sample(const void *plot, uint64_t x)
+{
+    uint64_t y = 0;
+    return ncuplot_sample(plot, x, &y);
+}
+
+static int
+dplot_has_sample(const void *plot, uint64_t x)
+{
+    double y = 0;
+    return ncdplot_sample(plot, x, &y);
+}
+
+// The x a scratch plot is slid to, so that its window lies in non-negative
+// x values: the library indexes its slots with x values behind 0.
+#define PLOT_PROBE_X ((int64_t)UINT_MAX)
+
+// Find the window length of a plot slid to PLOT_PROBE_X, by searching for
+// the oldest x that still has a sample.
+static int64_t
+plot_window_probe(const void *plot, PlotHasSample has_sample)
+{
+    // x values up to 'lo' have no sample, those from 'hi' on do.
+    int64_t lo = -1, hi = PLOT_PROBE_X;
+    while (hi - lo > 1)
+    {
+        int64_t const x = lo + (hi - lo) / 2;
+        if (0 == has_sample(plot, (uint64_t)x))
+        {
+            hi = x;
+        }
+        else
+        {
+            lo = x;
+        }
+    }
+    return PLOT_PROBE_X - hi + 1;
+}
+
+// A plane the size of 'n' to create a scratch plot on.
+static struct ncplane *
+plot_scratch_plane(struct ncplane *n)
+{
+    unsigned rows = 0, cols = 0;
+    ncplane_dim_yx(n, &rows, &cols);
+    struct ncplane_options const nopts = {.rows = rows, .cols = cols};
+    return ncplane_create(n, &nopts);
+}
+
+// Follow the window after a sample at 'x' was added or set, even if the
+// library failed after sliding the window.
+static inline void
+plot_window_track(NcPlotWindow *window, const void *plot, PlotHasSample has_sample, int64_t x)
+{
+    if (x > window->slotx && 0 == has_sample(plot, (uint64_t)x))
+    {
+        window->slotx = x;
+    }
+}
+
+typedef struct
+{
+    Py_buffer xs;
+    Py_buffer ys;
+    Py_ssize_t len;
+} PlotSamples;
+
+static void
+PlotSamples_release(PlotSamples *samples)
+{
+    if (NULL != samples->xs.obj)
+    {
+        PyBuffer_Release(&samples->xs);
+    }
+    if (NULL != samples->ys.obj)
+    {
+        PyBuffer_Release(&samples->ys);
+    }
+}
+
+static int
+PlotSamples_acquire(PlotSamples *samples, PyObject *xs, PyObject *ys, const char *y_codes, const char *y_kind)
+{
+    GNU_PY_CHECK_INT_RET_NEG1(PyObject_GetBuffer(xs, &samples->xs, PyBUF_STRIDED_RO | PyBUF_FORMAT));
+    GNU_PY_CHECK_INT_RET_NEG1(PyObject_GetBuffer(ys, &samples->ys, PyBUF_STRIDED_RO | PyBUF_FORMAT));
+
+    if (!pync_buffer_integer_format_p(samples->xs.format, samples->xs.itemsize, sizeof(uint64_t)))
+    {
+        PyErr_Format(PyExc_TypeError, "xs must be an array of 8-byte integers, not format '%s'",
+                     NULL == samples->xs.format ? "B" : samples->xs.format);
+        return -1;
+    }
+    if (!pync_buffer_format_p(samples->ys.format, samples->ys.itemsize, 8, y_codes))
+    {
+        PyErr_Format(PyExc_TypeError, "ys must be an array of %s, not format '%s'",
+                     y_kind, NULL == samples->ys.format ? "B" : samples->ys.format);
+        return -1;
+    }
+    if (1 != samples->xs.ndim || 1 != samples->ys.ndim)
+    {
+        PyErr_SetString(PyExc_ValueError, "xs and ys must be one dimensional");
+        return -1;
+    }
+    if (samples->xs.shape[0] != samples->ys.shape[0])
+    {
+        PyErr_Format(PyExc_ValueError, "xs has %zd samples, ys has %zd", samples->xs.shape[0], samples->ys.shape[0]);
+        return -1;
+    }
+
+    samples->len = samples->xs.shape[0];
+    return 0;
+}
+
+static inline int64_t
+PlotSamples_x(const PlotSamples *samples, Py_ssize_t index)
+{
+    uint64_t value = 0;
+    memcpy(&value, (const char *)samples->xs.buf + index * samples->xs.strides[0], sizeof(value));
+    return (int64_t)value;
+}
+
+static inline uint64_t
+PlotSamples_u64(const PlotSamples *samples, Py_ssize_t index)
+{
+    uint64_t value = 0;
+    memcpy(&value, (const char *)samples->ys.buf + index * samples->ys.strides[0], sizeof(value));
+    return value;
+}
+
+static inline double
+PlotSamples_double(const PlotSamples *samples, Py_ssize_t index)
+{
+    double value = 0;
+    memcpy(&value, (const char *)samples->ys.buf + index * samples->ys.strides[0], sizeof(value));
+    return value;
+}
+
+// Find the oldest x still in the window once all of 'samples' are added.
+// Returns -1 with the x in 'behind_x' if a sample is behind the current
+// window, which the library would refuse after adding the samples before it.
+static int
+PlotSamples_oldest(const PlotSamples *samples, const NcPlotWindow *window, int64_t *oldest, int64_t *behind_x)
+{
+    int64_t const first = window->slotx - (window->slotcount - 1);
+    int64_t newest = window->slotx;
+    for (Py_ssize_t i = 0; i < samples->len; i++)
+    {
+        int64_t const x = PlotSamples_x(samples, i);
+        // x values past INT64_MAX wrap to negative ones, which the library can't place.
+        if (x < 0 || x < first)
+        {
+            *behind_x = x;
+            return -1;
+        }
+        if (x > newest)
+        {
+            newest = x;
+        }
+    }
+    *oldest = newest - (window->slotcount - 1);
+    return 0;
+}
+
+// Raise the error of a failed uplot_ingest()/dplot_ingest().
+static PyObject *
+plot_ingest_error(bool behind, int64_t failed_x, Py_ssize_t failed_index)
+{
+    if (behind && failed_x < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "x %llu is too large, no samples were added", (unsigned long long)failed_x);
+    }
+    else if (behind)
+    {
+        PyErr_Format(PyExc_ValueError, "x %lld is behind the window of the plot, no samples were added",
+                     (long long)failed_x);
+    }
+    else
+    {
+        PyErr_Format(PyExc_RuntimeError,
+                     "Notcurses returned error adding samples at x %lld, the samples before index %zd were added",
+                     (long long)failed_x, failed_index);
+    }
+    return NULL;
+}
+
+// NcUplot
+
+static int
+uplot_add(NcUplotObject *self, int64_t x, uint64_t y)
+{
+    int const ret = ncuplot_add_sample(self->ncuplot_ptr, (uint64_t)x, y);
+    plot_window_track(&self->window, self->ncuplot_ptr, uplot_has_sample, x);
+    return ret;
+}
+
+// Called without the GIL held, must not touch any Python objects. On failure
+// 'behind' tells whether no sample was added because one is behind the window,
+// else 'failed_index' is the first sample of the x the library failed at.
+static int
+uplot_ingest(NcUplotObject *self, const PlotSamples *samples, int64_t *failed_x, Py_ssize_t *failed_index, bool *behind)
+{
+    int64_t oldest = 0;
+    if (PlotSamples_oldest(samples, &self->window, &oldest, failed_x) < 0)
+    {
+        *behind = true;
+        return -1;
+    }
+
+    bool pending = false;
+    int64_t run_x = 0;
+    Py_ssize_t run_index = 0;
+    uint64_t run_y = 0;
+
+    for (Py_ssize_t i = 0; i < samples->len; i++)
+    {
+        int64_t const x = PlotSamples_x(samples, i);
+        if (x < oldest)
+        {
+            continue;
+        }
+        if (pending && x != run_x)
+        {
+            if (uplot_add(self, run_x, run_y) < 0)
+            {
+                *failed_x = run_x;
+                *failed_index = run_index;
+                return -1;
+            }
+            pending = false;
+        }
+        if (!pending)
+        {
+            pending = true;
+            run_x = x;
+            run_index = i;
+            run_y = 0;
+        }
+        run_y += PlotSamples_u64(samples, i);
+    }
+
+    if (pending && uplot_add(self, run_x, run_y) < 0)
+    {
+        *failed_x = run_x;
+        *failed_index = run_index;
+        return -1;
+    }
+    return 0;
+}
+
+// Window length of a plot created with these arguments, probed on a scratch
+// plot so that the new plot is never slid. Returns -1 on failure.
+static int64_t
+uplot_window_length(struct ncplane *n, const ncplot_options *opts, uint64_t miny, uint64_t maxy)
+{
+    struct ncplane *scratch_plane = plot_scratch_plane(n);
+    if (NULL == scratch_plane)
+    {
+        return -1;
+    }
+    // Takes ownership of the scratch plane on all paths.
+    struct ncuplot *scratch = ncuplot_create(scratch_plane, opts, miny, maxy);
+    if (NULL == scratch)
+    {
+        return -1;
+    }
+
+    // 'miny' is within a fixed domain, and 0 with domain detection.
+    int64_t length = -1;
+    if (0 == ncuplot_set_sample(scratch, (uint64_t)PLOT_PROBE_X, miny))
+    {
+        length = plot_window_probe(scratch, uplot_has_sample);
+    }
+    ncuplot_destroy(scratch);
+    return length;
+}
+
+PyObject *
+NcUplot_create(NcPlaneObject *plane, const ncplot_options *opts, uint64_t miny, uint64_t maxy)
+{
+    NcUplotObject *self = (NcUplotObject *)GNU_PY_CHECK(NcUplot_Type.tp_alloc(&NcUplot_Type, 0));
+
+    self->ncuplot_ptr = ncuplot_create(plane->ncplane_ptr, opts, miny, maxy);
+    if (NULL == self->ncuplot_ptr)
+    {
+        // The library destroyed the plane.
+        NcPlane_forget(plane);
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to create NcUplot");
+        return NULL;
+    }
+
+    Py_INCREF(plane);
+    self->window.plane = plane;
+    self->window.slotx = 0;
+    self->window.slotcount = uplot_window_length(plane->ncplane_ptr, opts, miny, maxy);
+    if (self->window.slotcount < 0)
+    {
+        NcPlane_forget(plane);
+        ncuplot_destroy(self->ncuplot_ptr);
+        self->ncuplot_ptr = NULL;
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to create NcUplot");
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+static PyObject *
+NcUplot_new(PyTypeObject *Py_UNUSED(subtype), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+{
+    PyErr_SetString(PyExc_ValueError, "NcUplot should NOT be initialied directly, use NcPlane.uplot_create().");
+    return NULL;
+}
+
+static void
+NcUplot_dealloc(NcUplotObject *self)
+{
+    // The plot stays on its plane and is destroyed along with it.
+    Py_XDECREF(self->window.plane);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcUplot_add_sample(NcUplotObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    CHECK_PLOT(self, ncuplot_ptr, "NcUplot");
+    GNU_PY_CHECK_NARGS("add_sample", nargs, 2, 2);
+    unsigned long long const x = GNU_PY_ARG_ULL(args[0]);
+    unsigned long long const y = GNU_PY_ARG_ULL(args[1]);
+
+    CHECK_NOTCURSES(uplot_add(self, (int64_t)x, (uint64_t)y));
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcUplot_set_sample(NcUplotObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    CHECK_PLOT(self, ncuplot_ptr, "NcUplot");
+    GNU_PY_CHECK_NARGS("set_sample", nargs, 2, 2);
+    unsigned long long const x = GNU_PY_ARG_ULL(args[0]);
+    unsigned long long const y = GNU_PY_ARG_ULL(args[1]);
+
+    int const ret = ncuplot_set_sample(self->ncuplot_ptr, (uint64_t)x, (uint64_t)y);
+    plot_window_track(&self->window, self->ncuplot_ptr, uplot_has_sample, (int64_t)x);
+    CHECK_NOTCURSES(ret);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcUplot_sample(NcUplotObject *self, PyObject *arg)
+{
+    CHECK_PLOT(self, ncuplot_ptr, "NcUplot");
+    unsigned long long const x = GNU_PY_ARG_ULL(arg);
+
+    uint64_t y = 0;
+    CHECK_NOTCURSES(ncuplot_sample(self->ncuplot_ptr, (uint64_t)x, &y));
+
+    return PyLong_FromUnsignedLongLong((unsigned long long)y);
+}
+
+static PyObject *
+NcUplot_add_samples(NcUplotObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    CHECK_PLOT(self, ncuplot_ptr, "NcUplot");
+    GNU_PY_CHECK_NARGS("add_samples", nargs, 2, 2);
+
+    PlotSamples samples __attribute__((cleanup(PlotSamples_release))) = {0};
+    GNU_PY_CHECK_INT(PlotSamples_acquire(&samples, args[0], args[1], "bBhHiIlLqQ", "8-byte integers"));
+
+    int64_t failed_x = 0;
+    Py_ssize_t failed_index = 0;
+    bool behind = false;
+    int ret = 0;
+    Py_BEGIN_ALLOW_THREADS;
+    ret = uplot_ingest(self, &samples, &failed_x, &failed_index, &behind);
+    Py_END_ALLOW_THREADS;
+    if (ret < 0)
+    {
+        return plot_ingest_error(behind, failed_x, failed_index);
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcUplot_destroy(NcUplotObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_PLOT(self, ncuplot_ptr, "NcUplot");
+    NcPlane_forget(self->window.plane);
+    ncuplot_destroy(self->ncuplot_ptr);
+    self->ncuplot_ptr = NULL;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcUplot_get_plane(NcUplotObject *self, void *Py_UNUSED(closure))
+{
+    CHECK_PLOT(self, ncuplot_ptr, "NcUplot");
+    Py_INCREF(self->window.plane);
+    return (PyObject *)self->window.plane;
+}
+
+static PyMethodDef NcUplot_methods[] = {
+    {"add_sample", (void *)NcUplot_add_sample, METH_FASTCALL, PyDoc_STR("Add 'y' to the value at 'x', advancing the window if 'x' is past it, and redraw the plot.")},
+    {"set_sample", (void *)NcUplot_set_sample, METH_FASTCALL, PyDoc_STR("Set the value at 'x' to 'y', advancing the window if 'x' is past it, and redraw the plot.")},
+    {"sample", (PyCFunction)NcUplot_sample, METH_O, PyDoc_STR("Return the value at 'x', which must be within the window.")},
+    {"add_samples", (void *)NcUplot_add_samples, METH_FASTCALL, PyDoc_STR("Add the samples of the one dimensional arrays 'xs' and 'ys' of 8-byte integers in one call, with the GIL released. Consecutive samples with the same x are summed and samples older than the final window are skipped, so the plot is redrawn at most once per x left in the window. A sample behind the current window raises ValueError before any sample is added.")},
+    {"destroy", (PyCFunction)NcUplot_destroy, METH_NOARGS, PyDoc_STR("Destroy the plot and its plane.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcUplot_getset[] = {
+    {"plane", (getter)NcUplot_get_plane, NULL, PyDoc_STR("The plane the plot draws on, destroyed along with it."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcUplot_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcUplot",
+    .tp_doc = "Plot of 64-bit unsigned integer samples, created with NcPlane.uplot_create(). Lives as long as its plane.",
+    .tp_basicsize = sizeof(NcUplotObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcUplot_new,
+    .tp_dealloc = (destructor)NcUplot_dealloc,
+    .tp_methods = NcUplot_methods,
+    .tp_getset = NcUplot_getset,
+};
+
+// NcDplot
+
+static int
+dplot_add(NcDplotObject *self, int64_t x, double y)
+{
+    int const ret = ncdplot_add_sample(self->ncdplot_ptr, (uint64_t)x, y);
+    plot_window_track(&self->window, self->ncdplot_ptr, dplot_has_sample, x);
+    return ret;
+}
+
+// Called without the GIL held, must not touch any Python objects. On failure
+// 'behind' tells whether no sample was added because one is behind the window,
+// else 'failed_index' is the first sample of the x the library failed at.
+static int
+dplot_ingest(NcDplotObject *self, const PlotSamples *samples, int64_t *failed_x, Py_ssize_t *failed_index, bool *behind)
+{
+    int64_t oldest = 0;
+    if (PlotSamples_oldest(samples, &self->window, &oldest, failed_x) < 0)
+    {
+        *behind = true;
+        return -1;
+    }
+
+    bool pending = false;
+    int64_t run_x = 0;
+    Py_ssize_t run_index = 0;
+    double run_y = 0;
+
+    for (Py_ssize_t i = 0; i < samples->len; i++)
+    {
+        int64_t const x = PlotSamples_x(samples, i);
+        if (x < oldest)
+        {
+            continue;
+        }
+        if (pending && x != run_x)
+        {
+            if (dplot_add(self, run_x, run_y) < 0)
+            {
+                *failed_x = run_x;
+                *failed_index = run_index;
+                return -1;
+            }
+            pending = false;
+        }
+        if (!pending)
+        {
+            pending = true;
+            run_x = x;
+            run_index = i;
+            run_y = 0;
+        }
+        run_y += PlotSamples_double(samples, i);
+    }
+
+    if (pending && dplot_add(self, run_x, run_y) < 0)
+    {
+        *failed_x = run_x;
+        *failed_index = run_index;
+        return -1;
+    }
+    return 0;
+}
+
+// Window length of a plot created with these arguments, probed on a scratch
+// plot so that the new plot is never slid. Returns -1 on failure.
+static int64_t
+dplot_window_length(struct ncplane *n, const ncplot_options *opts, double miny, double maxy)
+{
+    struct ncplane *scratch_plane = plot_scratch_plane(n);
+    if (NULL == scratch_plane)
+    {
+        return -1;
+    }
+    // Takes ownership of the scratch plane on all paths.
+    struct ncdplot *scratch = ncdplot_create(scratch_plane, opts, miny, maxy);
+    if (NULL == scratch)
+    {
+        return -1;
+    }
+
+    // 'miny' is within a fixed domain, and 0 with domain detection.
+    int64_t length = -1;
+    if (0 == ncdplot_set_sample(scratch, (uint64_t)PLOT_PROBE_X, miny))
+    {
+        length = plot_window_probe(scratch, dplot_has_sample);
+    }
+    ncdplot_destroy(scratch);
+    return length;
+}
+
+PyObject *
+NcDplot_create(NcPlaneObject *plane, const ncplot_options *opts, double miny, double maxy)
+{
+    NcDplotObject *self = (NcDplotObject *)GNU_PY_CHECK(NcDplot_Type.tp_alloc(&NcDplot_Type, 0));
+
+    self->ncdplot_ptr = ncdplot_create(plane->ncplane_ptr, opts, miny, maxy);
+    if (NULL == self->ncdplot_ptr)
+    {
+        // The library destroyed the plane.
+        NcPlane_forget(plane);
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to create NcDplot");
+        return NULL;
+    }
+
+    Py_INCREF(plane);
+    self->window.plane = plane;
+    self->window.slotx = 0;
+    self->window.slotcount = dplot_window_length(plane->ncplane_ptr, opts, miny, maxy);
+    if (self->window.slotcount < 0)
+    {
+        NcPlane_forget(plane);
+        ncdplot_destroy(self->ncdplot_ptr);
+        self->ncdplot_ptr = NULL;
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to create NcDplot");
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+static PyObject *
+NcDplot_new(PyTypeObject *Py_UNUSED(subtype), PyObject *Py_UNUSED(args), PyObject *Py_UNUSED(kwds))
+{
+    PyErr_SetString(PyExc_ValueError, "NcDplot should NOT be initialied directly, use NcPlane.dplot_create().");
+    return NULL;
+}
+
+static void
+NcDplot_dealloc(NcDplotObject *self)
+{
+    // The plot stays on its plane and is destroyed along with it.
+    Py_XDECREF(self->window.plane);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcDplot_add_sample(NcDplotObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    CHECK_PLOT(self, ncdplot_ptr, "NcDplot");
+    GNU_PY_CHECK_NARGS("add_sample", nargs, 2, 2);
+    unsigned long long const x = GNU_PY_ARG_ULL(args[0]);
+    double const y = GNU_PY_ARG_DOUBLE(args[1]);
+
+    CHECK_NOTCURSES(dplot_add(self, (int64_t)x, y));
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDplot_set_sample(NcDplotObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    CHECK_PLOT(self, ncdplot_ptr, "NcDplot");
+    GNU_PY_CHECK_NARGS("set_sample", nargs, 2, 2);
+    unsigned long long const x = GNU_PY_ARG_ULL(args[0]);
+    double const y = GNU_PY_ARG_DOUBLE(args[1]);
+
+    int const ret = ncdplot_set_sample(self->ncdplot_ptr, (uint64_t)x, y);
+    plot_window_track(&self->window, self->ncdplot_ptr, dplot_has_sample, (int64_t)x);
+    CHECK_NOTCURSES(ret);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDplot_sample(NcDplotObject *self, PyObject *arg)
+{
+    CHECK_PLOT(self, ncdplot_ptr, "NcDplot");
+    unsigned long long const x = GNU_PY_ARG_ULL(arg);
+
+    double y = 0;
+    CHECK_NOTCURSES(ncdplot_sample(self->ncdplot_ptr, (uint64_t)x, &y));
+
+    return PyFloat_FromDouble(y);
+}
+
+static PyObject *
+NcDplot_add_samples(NcDplotObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    CHECK_PLOT(self, ncdplot_ptr, "NcDplot");
+    GNU_PY_CHECK_NARGS("add_samples", nargs, 2, 2);
+
+    PlotSamples samples __attribute__((cleanup(PlotSamples_release))) = {0};
+    GNU_PY_CHECK_INT(PlotSamples_acquire(&samples, args[0], args[1], "d", "doubles"));
+
+    int64_t failed_x = 0;
+    Py_ssize_t failed_index = 0;
+    bool behind = false;
+    int ret = 0;
+    Py_BEGIN_ALLOW_THREADS;
+    ret = dplot_ingest(self, &samples, &failed_x, &failed_index, &behind);
+    Py_END_ALLOW_THREADS;
+    if (ret < 0)
+    {
+        return plot_ingest_error(behind, failed_x, failed_index);
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDplot_destroy(NcDplotObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_PLOT(self, ncdplot_ptr, "NcDplot");
+    NcPlane_forget(self->window.plane);
+    ncdplot_destroy(self->ncdplot_ptr);
+    self->ncdplot_ptr = NULL;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcDplot_get_plane(NcDplotObject *self, void *Py_UNUSED(closure))
+{
+    CHECK_PLOT(self, ncdplot_ptr, "NcDplot");
+    Py_INCREF(self->window.plane);
+    return (PyObject *)self->window.plane;
+}
+
+static PyMethodDef NcDplot_methods[] = {
+    {"add_sample", (void *)NcDplot_add_sample, METH_FASTCALL, PyDoc_STR("Add 'y' to the value at 'x', advancing the window if 'x' is past it, and redraw the plot.")},
+    {"set_sample", (void *)NcDplot_set_sample, METH_FASTCALL, PyDoc_STR("Set the value at 'x' to 'y', advancing the window if 'x' is past it, and redraw the plot.")},
+    {"sample", (PyCFunction)NcDplot_sample, METH_O, PyDoc_STR("Return the value at 'x', which must be within the window.")},
+    {"add_samples", (void *)NcDplot_add_samples, METH_FASTCALL, PyDoc_STR("Add the samples of the one dimensional arrays 'xs' of 8-byte integers and 'ys' of doubles in one call, with the GIL released. Consecutive samples with the same x are summed and samples older than the final window are skipped, so the plot is redrawn at most once per x left in the window. A sample behind the current window raises ValueError before any sample is added.")},
+    {"destroy", (PyCFunction)NcDplot_destroy, METH_NOARGS, PyDoc_STR("Destroy the plot and its plane.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcDplot_getset[] = {
+    {"plane", (getter)NcDplot_get_plane, NULL, PyDoc_STR("The plane the plot draws on, destroyed along with it."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcDplot_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcDplot",
+    .tp_doc = "Plot of double samples, created with NcPlane.dplot_create(). Lives as long as its plane.",
+    .tp_basicsize = sizeof(NcDplotObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcDplot_new,
+    .tp_dealloc = (destructor)NcDplot_dealloc,
+    .tp_methods = NcDplot_methods,
+    .tp_getset = NcDplot_getset,
+};
@@ -0,0 +1,184 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+// ncpile_render_to_buffer() hands out the raster buffer of the notcurses
+// context, which the next render of any pile overwrites. The frame is moved
+// into a buffer owned by the object, grown as needed and kept across frames,
+// so no Python object is created per frame.
+
+int NcRenderBuffer_render(NcRenderBufferObject *self, NcPlaneObject *plane)
+{
+    if (self->exports > 0)
+    {
+        PyErr_SetString(PyExc_BufferError, "NcRenderBuffer frame is still exported, release memoryviews before rendering");
+        return -1;
+    }
+    if (self->rendering)
+    {
+        PyErr_SetString(PyExc_BufferError, "NcRenderBuffer is rendering in another thread");
+        return -1;
+    }
+
+    struct ncplane *n = plane->ncplane_ptr;
+    char *frame = NULL;
+    size_t frame_len = 0;
+    int ret = 0;
+    bool grow_failed = false;
+
+    // Other threads may run meanwhile, keep them away from the buffer.
+    self->rendering = true;
+    Py_BEGIN_ALLOW_THREADS;
+    ret = ncpile_render_to_buffer(n, &frame, &frame_len);
+    if (0 == ret && frame_len > self->alloc)
+    {
+        size_t new_alloc = 0 == self->alloc ? 4096 : self->alloc;
+        while (new_alloc < frame_len)
+        {
+            new_alloc *= 2;
+        }
+        char *new_data = PyMem_RawRealloc(self->data, new_alloc);
+        if (NULL == new_data)
+        {
+            grow_failed = true;
+        }
+        else
+        {
+            self->data = new_data;
+            self->alloc = new_alloc;
+        }
+    }
+    if (0 == ret && !grow_failed)
+    {
+        memcpy(self->data, frame, frame_len);
+        self->len = frame_len;
+    }
+    Py_END_ALLOW_THREADS;
+    self->rendering = false;
+
+    if (ret < 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Notcurses returned error.");
+        return -1;
+    }
+    if (grow_failed)
+    {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    self->frames++;
+    return 0;
+}
+
+static void
+NcRenderBuffer_dealloc(NcRenderBufferObject *self)
+{
+    PyMem_RawFree(self->data);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcRenderBuffer_render_method(NcRenderBufferObject *self, PyObject *plane_arg)
+{
+    NcPlaneObject *plane = GNU_PY_ARG_NCPLANE(plane_arg);
+
+    GNU_PY_CHECK_INT(NcRenderBuffer_render(self, plane));
+
+    return PyLong_FromSize_t(self->len);
+}
+
+static PyObject *
+NcRenderBuffer_get_capacity(NcRenderBufferObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromSize_t(self->alloc);
+}
+
+static PyObject *
+NcRenderBuffer_get_frames(NcRenderBufferObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromUnsignedLongLong(self->frames);
+}
+
+static Py_ssize_t
+NcRenderBuffer_length(NcRenderBufferObject *self)
+{
+    return (Py_ssize_t)self->len;
+}
+
+static int
+NcRenderBuffer_getbuffer(NcRenderBufferObject *self, Py_buffer *view, int flags)
+{
+    if (self->rendering)
+    {
+        PyErr_SetString(PyExc_BufferError, "NcRenderBuffer is rendering in another thread");
+        return -1;
+    }
+
+    static char empty[1];
+    void *data = NULL == self->data ? empty : self->data;
+
+    if (PyBuffer_FillInfo(view, (PyObject *)self, data, (Py_ssize_t)self->len, 1, flags) < 0)
+    {
+        return -1;
+    }
+    self->exports++;
+    return 0;
+}
+
+static void
+NcRenderBuffer_releasebuffer(NcRenderBufferObject *self, Py_buffer *Py_UNUSED(view))
+{
+    self->exports--;
+}
+
+static PyMethodDef NcRenderBuffer_methods[] = {
+    {"render", (PyCFunction)NcRenderBuffer_render_method, METH_O, PyDoc_STR("Render and rasterize the pile of the plane into the buffer, replacing the previous frame. Returns the frame length in bytes. Raises BufferError while memoryviews of the previous frame are alive. The GIL is released meanwhile.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcRenderBuffer_getset[] = {
+    {"capacity", (getter)NcRenderBuffer_get_capacity, NULL, PyDoc_STR("Bytes allocated, kept across frames."), NULL},
+    {"frames", (getter)NcRenderBuffer_get_frames, NULL, PyDoc_STR("Number of frames rendered into the buffer."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+static PySequenceMethods NcRenderBuffer_as_sequence = {
+    .sq_length = (lenfunc)NcRenderBuffer_length,
+};
+
+static PyBufferProcs NcRenderBuffer_as_buffer = {
+    .bf_getbuffer = (getbufferproc)NcRenderBuffer_getbuffer,
+    .bf_releasebuffer = (releasebufferproc)NcRenderBuffer_releasebuffer,
+};
+
+PyTypeObject NcRenderBuffer_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcRenderBuffer",
+    .tp_doc = "Reusable buffer holding the last frame rendered by NcRenderBuffer.render(). Supports the buffer protocol, so the frame can be passed to os.write() or socket.sendmsg() without copying.",
+    .tp_basicsize = sizeof(NcRenderBufferObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_dealloc = (destructor)NcRenderBuffer_dealloc,
+    .tp_methods = NcRenderBuffer_methods,
+    .tp_getset = NcRenderBuffer_getset,
+    .tp_as_sequence = &NcRenderBuffer_as_sequence,
+    .tp_as_buffer = &NcRenderBuffer_as_buffer,
+};
@@ -0,0 +1,275 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+#include <errno.h>
+#include <fcntl.h>
+#include <unistd.h>
+
+// Frames are rasterized into an NcRenderBuffer and written with write(2).
+// A frame that could not be written completely stays pending, and new
+// frames are skipped until it is out: the rasterizer only emits changes
+// against the previous frame, so a frame must never be dropped halfway.
+
+typedef struct
+{
+    PyObject_HEAD;
+    NcPlaneObject *plane;
+    NcRenderBufferObject *buffer;
+    int fd;
+    // File status flags of the fd before O_NONBLOCK was set, -1 if unchanged.
+    int saved_flags;
+    // Bytes of the current frame already written.
+    size_t written;
+    double write_start;
+    // Stats of the last frame written in full.
+    size_t last_bytes;
+    double last_latency;
+    unsigned long long frames_written;
+    unsigned long long frames_skipped;
+    unsigned long long bytes_written;
+} NcRenderSinkObject;
+
+// Write as much of the pending frame as the fd takes. Returns -1 with errno
+// set on errors other than EAGAIN. Called without the GIL.
+static int
+rendersink_write_pending(NcRenderSinkObject *self)
+{
+    const char *data = self->buffer->data;
+    size_t const len = self->buffer->len;
+
+    while (self->written < len)
+    {
+        ssize_t const ret = write(self->fd, data + self->written, len - self->written);
+        if (ret < 0)
+        {
+            if (EINTR == errno)
+            {
+                continue;
+            }
+            if (EAGAIN == errno || EWOULDBLOCK == errno)
+            {
+                return 0;
+            }
+            return -1;
+        }
+        self->written += (size_t)ret;
+    }
+
+    self->last_bytes = len;
+    self->last_latency = pync_monotonic() - self->write_start;
+    self->bytes_written += len;
+    self->frames_written++;
+    return 0;
+}
+
+static bool
+rendersink_pending_p(NcRenderSinkObject *self)
+{
+    return self->written < self->buffer->len;
+}
+
+static int
+rendersink_flush(NcRenderSinkObject *self)
+{
+    int ret = 0;
+    int saved_errno = 0;
+
+    if (self->buffer->rendering)
+    {
+        PyErr_SetString(PyExc_BufferError, "NcRenderSink is writing in another thread");
+        return -1;
+    }
+
+    // The buffer is marked as rendering so that no other thread replaces
+    // the frame while it is being written.
+    self->buffer->rendering = true;
+    Py_BEGIN_ALLOW_THREADS;
+    ret = rendersink_write_pending(self);
+    saved_errno = errno;
+    Py_END_ALLOW_THREADS;
+    self->buffer->rendering = false;
+
+    if (ret < 0)
+    {
+        errno = saved_errno;
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    return 0;
+}
+
+// Put back the flags of an fd switched to O_NONBLOCK. They belong to the
+// open file description, shared with every duplicate of the fd.
+static void
+rendersink_restore_flags(int fd, int saved_flags)
+{
+    if (saved_flags >= 0)
+    {
+        fcntl(fd, F_SETFL, saved_flags);
+    }
+}
+
+static PyObject *
+NcRenderSink_new(PyTypeObject *subtype, PyObject *args, PyObject *kwds)
+{
+    PyObject *plane_arg = NULL;
+    int fd = -1;
+    int nonblocking = 0;
+
+    char *keywords[] = {"plane", "fd", "nonblocking", NULL};
+
+    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "O!i|p", keywords,
+                                                  &NcPlane_Type, &plane_arg,
+                                                  &fd, &nonblocking));
+
+    NcPlaneObject *plane = (NcPlaneObject *)plane_arg;
+    CHECK_NCPLANE(plane);
+
+    if (fd < 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "negative file descriptor");
+        return NULL;
+    }
+
+    int saved_flags = -1;
+    if (nonblocking)
+    {
+        int const flags = fcntl(fd, F_GETFL);
+        if (flags < 0)
+        {
+            return PyErr_SetFromErrno(PyExc_OSError);
+        }
+        if (0 == (flags & O_NONBLOCK))
+        {
+            if (fcntl(fd, F_SETFL, flags | O_NONBLOCK) < 0)
+            {
+                return PyErr_SetFromErrno(PyExc_OSError);
+            }
+            saved_flags = flags;
+        }
+    }
+
+    NcRenderBufferObject *buffer = (NcRenderBufferObject *)PyObject_CallObject((PyObject *)&NcRenderBuffer_Type, NULL);
+    if (NULL == buffer)
+    {
+        rendersink_restore_flags(fd, saved_flags);
+        return NULL;
+    }
+
+    NcRenderSinkObject *self = (NcRenderSinkObject *)subtype->tp_alloc(subtype, 0);
+    if (NULL == self)
+    {
+        Py_DECREF(buffer);
+        rendersink_restore_flags(fd, saved_flags);
+        return NULL;
+    }
+
+    Py_INCREF(plane);
+    self->plane = plane;
+    self->buffer = buffer;
+    self->fd = fd;
+    self->saved_flags = saved_flags;
+
+    return (PyObject *)self;
+}
+
+static void
+NcRenderSink_dealloc(NcRenderSinkObject *self)
+{
+    // The fd belongs to the caller and is left open, in blocking mode again
+    // if the sink switched it.
+    rendersink_restore_flags(self->fd, self->saved_flags);
+    Py_XDECREF(self->plane);
+    Py_XDECREF(self->buffer);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcRenderSink_render(NcRenderSinkObject *self, PyObject *Py_UNUSED(args))
+{
+    CHECK_NCPLANE(self->plane);
+
+    if (rendersink_pending_p(self))
+    {
+        GNU_PY_CHECK_INT(rendersink_flush(self));
+        if (rendersink_pending_p(self))
+        {
+            // Peer is slow, the frame is not even rasterized.
+            self->frames_skipped++;
+            Py_RETURN_FALSE;
+        }
+    }
+
+    GNU_PY_CHECK_INT(NcRenderBuffer_render(self->buffer, self->plane));
+    self->written = 0;
+    self->write_start = pync_monotonic();
+
+    GNU_PY_CHECK_INT(rendersink_flush(self));
+    Py_RETURN_TRUE;
+}
+
+static PyObject *
+NcRenderSink_flush(NcRenderSinkObject *self, PyObject *Py_UNUSED(args))
+{
+    if (rendersink_pending_p(self))
+    {
+        GNU_PY_CHECK_INT(rendersink_flush(self));
+    }
+
+    return PyLong_FromSize_t(self->buffer->len - self->written);
+}
+
+static PyObject *
+NcRenderSink_fileno(NcRenderSinkObject *self, PyObject *Py_UNUSED(args))
+{
+    return PyLong_FromLong((long)self->fd);
+}
+
+static PyObject *
+NcRenderSink_stats(NcRenderSinkObject *self, PyObject *Py_UNUSED(args))
+{
+    return Py_BuildValue("{snsdsKsKsKsn}",
+                         "last_bytes", (Py_ssize_t)self->last_bytes,
+                         "last_latency", self->last_latency,
+                         "frames_written", self->frames_written,
+                         "frames_skipped", self->frames_skipped,
+                         "bytes_written", self->bytes_written,
+                         "pending", (Py_ssize_t)(self->buffer->len - self->written));
+}
+
+static PyMethodDef NcRenderSink_methods[] = {
+    {"render", (PyCFunction)NcRenderSink_render, METH_NOARGS, PyDoc_STR("Render and rasterize the pile and write the frame to the fd. If the previous frame is still not written completely, the rest of it is written instead and the new frame is skipped. Returns True if a new frame was rendered. The GIL is released while rendering and writing.")},
+    {"flush", (PyCFunction)NcRenderSink_flush, METH_NOARGS, PyDoc_STR("Write as much of the pending frame as the fd takes. Returns the number of bytes still pending.")},
+    {"fileno", (PyCFunction)NcRenderSink_fileno, METH_NOARGS, PyDoc_STR("Return the file descriptor frames are written to.")},
+    {"stats", (PyCFunction)NcRenderSink_stats, METH_NOARGS, PyDoc_STR("Return a dict with 'last_bytes' and 'last_latency' (seconds from the end of rasterization to the last byte written) of the last complete frame, 'frames_written', 'frames_skipped', 'bytes_written' and 'pending' bytes.")},
+    {NULL, NULL, 0, NULL},
+};
+
+PyTypeObject NcRenderSink_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcRenderSink",
+    .tp_doc = "Long-lived writer of the frames of a pile to a file descriptor, pipe or socket. With 'nonblocking' the fd is switched to O_NONBLOCK until the sink is deleted and frames are skipped while the peer is slow. The fd is never closed by the sink.",
+    .tp_basicsize = sizeof(NcRenderSinkObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcRenderSink_new,
+    .tp_dealloc = (destructor)NcRenderSink_dealloc,
+    .tp_methods = NcRenderSink_methods,
+};
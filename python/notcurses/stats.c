@@ -0,0 +1,162 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+#include <structmember.h>
+
+// A snapshot is the plain C struct, fields are read through member
+// descriptors. Subtracting two snapshots gives the activity between them.
+
+// Cumulative counters, subtracted in deltas.
+#define NCSTATS_COUNTERS(X)                                                        \
+    X(renders, "successful ncpile_render() runs")                                  \
+    X(writeouts, "successful ncpile_rasterize() runs")                             \
+    X(failed_renders, "aborted renders, should be 0")                              \
+    X(failed_writeouts, "aborted writes")                                          \
+    X(raster_bytes, "bytes emitted to the terminal")                               \
+    X(render_ns, "nanoseconds spent rendering")                                    \
+    X(raster_ns, "nanoseconds spent rasterizing")                                  \
+    X(writeout_ns, "nanoseconds spent writing out")                                \
+    X(cellelisions, "cells elided entirely thanks to damage maps")                 \
+    X(cellemissions, "total number of cells emitted to the terminal")              \
+    X(fgelisions, "RGB fg elision count")                                          \
+    X(fgemissions, "RGB fg emissions")                                             \
+    X(bgelisions, "RGB bg elision count")                                          \
+    X(bgemissions, "RGB bg emissions")                                             \
+    X(defaultelisions, "default color elision count")                              \
+    X(defaultemissions, "default color emissions")                                 \
+    X(refreshes, "refresh requests (non-optimized redraw)")                        \
+    X(sprixelemissions, "sprixel draw count")                                      \
+    X(sprixelelisions, "sprixel elision count")                                    \
+    X(sprixelbytes, "sprixel bytes emitted")                                       \
+    X(appsync_updates, "application-synchronized updates")                         \
+    X(input_errors, "errors processing control sequences or utf8")                 \
+    X(input_events, "characters returned to userspace")                            \
+    X(hpa_gratuitous, "unnecessary hpas issued")                                   \
+    X(cell_geo_changes, "cell geometry changes (resizes)")                         \
+    X(pixel_geo_changes, "pixel geometry changes (font resize)")
+
+// Extremes over the sampling period, taken from the newer snapshot.
+#define NCSTATS_EXTREMES(X)                                 \
+    X(raster_max_bytes, "largest frame emitted, in bytes")  \
+    X(raster_min_bytes, "smallest frame emitted, in bytes") \
+    X(render_max_ns, "slowest render, in nanoseconds")      \
+    X(render_min_ns, "fastest render, in nanoseconds")      \
+    X(raster_max_ns, "slowest rasterization")               \
+    X(raster_min_ns, "fastest rasterization")               \
+    X(writeout_max_ns, "slowest write out")                 \
+    X(writeout_min_ns, "fastest write out")
+
+#define NCSTATS_MEMBER(name, type, doc) \
+    {#name, type, offsetof(NcStatsObject, ncstats.name), READONLY, PyDoc_STR(doc)},
+#define NCSTATS_COUNTER_MEMBER(name, doc) NCSTATS_MEMBER(name, T_ULONGLONG, doc)
+#define NCSTATS_EXTREME_MEMBER(name, doc) NCSTATS_MEMBER(name, T_LONGLONG, doc)
+
+static PyMemberDef NcStats_members[] = {
+    NCSTATS_COUNTERS(NCSTATS_COUNTER_MEMBER)
+    NCSTATS_EXTREMES(NCSTATS_EXTREME_MEMBER)
+    // Current state, taken from the newer snapshot.
+    {"fbbytes", T_ULONGLONG, offsetof(NcStatsObject, ncstats.fbbytes), READONLY, PyDoc_STR("total bytes devoted to all active framebuffers")},
+    {"planes", T_UINT, offsetof(NcStatsObject, ncstats.planes), READONLY, PyDoc_STR("number of planes currently in existence")},
+    {NULL, 0, 0, 0, NULL},
+};
+
+PyObject *
+NcStats_from_ncstats(const ncstats *stats)
+{
+    NcStatsObject *self = PyObject_New(NcStatsObject, &NcStats_Type);
+    if (NULL == self)
+    {
+        return NULL;
+    }
+
+    self->ncstats = *stats;
+
+    return (PyObject *)self;
+}
+
+static PyObject *
+NcStats_subtract(PyObject *left, PyObject *right)
+{
+    if (!PyObject_TypeCheck(left, &NcStats_Type) || !PyObject_TypeCheck(right, &NcStats_Type))
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    const ncstats *newer = &((NcStatsObject *)left)->ncstats;
+    const ncstats *older = &((NcStatsObject *)right)->ncstats;
+    ncstats delta = *newer;
+
+    // Counters restart from zero after stats_reset(), a delta across a
+    // reset is the count since the reset.
+#define NCSTATS_DELTA(name, doc) \
+    delta.name = newer->name >= older->name ? newer->name - older->name : newer->name;
+    NCSTATS_COUNTERS(NCSTATS_DELTA)
+#undef NCSTATS_DELTA
+
+    return NcStats_from_ncstats(&delta);
+}
+
+static PyObject *
+NcStats_as_dict(NcStatsObject *self, PyObject *Py_UNUSED(args))
+{
+    PyObject *dict CLEANUP_PY_OBJ = GNU_PY_CHECK(PyDict_New());
+
+    for (PyMemberDef *member = NcStats_members; NULL != member->name; member++)
+    {
+        PyObject *value CLEANUP_PY_OBJ = GNU_PY_CHECK(PyMember_GetOne((const char *)self, member));
+        GNU_PY_CHECK_INT(PyDict_SetItemString(dict, member->name, value));
+    }
+
+    Py_INCREF(dict);
+    return dict;
+}
+
+static PyObject *
+NcStats_repr(NcStatsObject *self)
+{
+    const ncstats *stats = &self->ncstats;
+
+    return PyUnicode_FromFormat("notcurses.NcStats(renders=%llu, failed_renders=%llu, render_ns=%llu, raster_bytes=%llu, failed_writeouts=%llu, fbbytes=%llu, planes=%u)",
+                                (unsigned long long)stats->renders, (unsigned long long)stats->failed_renders,
+                                (unsigned long long)stats->render_ns, (unsigned long long)stats->raster_bytes,
+                                (unsigned long long)stats->failed_writeouts, (unsigned long long)stats->fbbytes,
+                                stats->planes);
+}
+
+static PyMethodDef NcStats_methods[] = {
+    {"as_dict", (PyCFunction)NcStats_as_dict, METH_NOARGS, PyDoc_STR("Return all fields as a dict.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyNumberMethods NcStats_as_number = {
+    .nb_subtract = NcStats_subtract,
+};
+
+PyTypeObject NcStats_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcStats",
+    .tp_doc = "Snapshot of the Notcurses stats. 'newer - older' is an NcStats holding the counters accumulated in between, with the extremes and the current state (fbbytes, planes) of 'newer'.",
+    .tp_basicsize = sizeof(NcStatsObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_repr = (reprfunc)NcStats_repr,
+    .tp_methods = NcStats_methods,
+    .tp_members = NcStats_members,
+    .tp_as_number = &NcStats_as_number,
+};
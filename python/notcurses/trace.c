@@ -0,0 +1,206 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+#include <pythread.h>
+
+// Spans are kept in a ring buffer, the oldest are overwritten once it is
+// full. Rendering a traced frame records its phases: "draw" is the time since
+// the previous frame, spent by the application, "rasterize" is split into
+// "raster" and "write" with the notcurses stats, which time both.
+
+enum
+{
+    TRACE_FRAME,
+    TRACE_DRAW,
+    TRACE_RENDER,
+    TRACE_RASTERIZE,
+    TRACE_RASTER,
+    TRACE_WRITE,
+    TRACE_PHASE_COUNT,
+};
+
+static const char *const trace_phase_strings[TRACE_PHASE_COUNT] = {
+    "frame", "draw", "render", "rasterize", "raster", "write"};
+
+static PyObject *trace_phase_names[TRACE_PHASE_COUNT];
+
+void pync_trace_add(struct pync_trace *t, PyObject *name, double start, double end)
+{
+    if (!t->enabled)
+    {
+        return;
+    }
+
+    struct pync_trace_span *span = &t->spans[t->head];
+    if (t->count == t->capacity)
+    {
+        Py_CLEAR(span->name);
+        t->dropped++;
+    }
+    else
+    {
+        t->count++;
+    }
+
+    Py_INCREF(name);
+    span->name = name;
+    span->start = start;
+    span->duration = end - start;
+    span->thread = PyThread_get_thread_ident();
+    t->head = (t->head + 1) % t->capacity;
+}
+
+void pync_trace_clear(struct pync_trace *t)
+{
+    for (size_t i = 0; i < t->capacity; i++)
+    {
+        Py_CLEAR(t->spans[i].name);
+    }
+    t->head = 0;
+    t->count = 0;
+    t->dropped = 0;
+}
+
+void pync_trace_free(struct pync_trace *t)
+{
+    pync_trace_clear(t);
+    PyMem_Free(t->spans);
+    t->spans = NULL;
+    t->capacity = 0;
+    t->enabled = false;
+}
+
+int pync_trace_start(struct pync_trace *t, size_t capacity)
+{
+    for (int i = 0; i < TRACE_PHASE_COUNT; i++)
+    {
+        if (NULL == trace_phase_names[i])
+        {
+            trace_phase_names[i] = PyUnicode_InternFromString(trace_phase_strings[i]);
+            if (NULL == trace_phase_names[i])
+            {
+                return -1;
+            }
+        }
+    }
+
+    if (capacity != t->capacity)
+    {
+        pync_trace_free(t);
+        t->spans = PyMem_Calloc(capacity, sizeof(struct pync_trace_span));
+        if (NULL == t->spans)
+        {
+            PyErr_NoMemory();
+            return -1;
+        }
+        t->capacity = capacity;
+    }
+
+    t->frame_end = pync_monotonic();
+    t->enabled = true;
+    return 0;
+}
+
+PyObject *
+pync_trace_spans(struct pync_trace *t)
+{
+    PyObject *spans CLEANUP_PY_OBJ = GNU_PY_CHECK(PyList_New((Py_ssize_t)t->count));
+    size_t const first = (t->head + t->capacity - t->count) % (0 == t->capacity ? 1 : t->capacity);
+
+    for (size_t i = 0; i < t->count; i++)
+    {
+        struct pync_trace_span *span = &t->spans[(first + i) % t->capacity];
+        PyObject *item = GNU_PY_CHECK(Py_BuildValue("Oddk", span->name, span->start, span->duration, span->thread));
+        PyList_SET_ITEM(spans, (Py_ssize_t)i, item);
+    }
+
+    Py_INCREF(spans);
+    return spans;
+}
+
+int pync_render_pile(NotcursesObject *nc, struct ncplane *pile, bool render, bool rasterize)
+{
+    struct pync_trace *t = &nc->trace;
+    int ret = 0;
+
+    if (!t->enabled)
+    {
+        Py_BEGIN_ALLOW_THREADS;
+        if (render)
+        {
+            ret = ncpile_render(pile);
+        }
+        if (0 == ret && rasterize)
+        {
+            ret = ncpile_rasterize(pile);
+        }
+        Py_END_ALLOW_THREADS;
+    }
+    else
+    {
+        ncstats before, after;
+        double render_start = 0, render_end = 0, raster_end = 0;
+
+        Py_BEGIN_ALLOW_THREADS;
+        render_start = pync_monotonic();
+        if (render)
+        {
+            ret = ncpile_render(pile);
+        }
+        render_end = pync_monotonic();
+        if (0 == ret && rasterize)
+        {
+            notcurses_stats(nc->notcurses_ptr, &before);
+            ret = ncpile_rasterize(pile);
+            notcurses_stats(nc->notcurses_ptr, &after);
+        }
+        raster_end = pync_monotonic();
+        Py_END_ALLOW_THREADS;
+
+        if (render)
+        {
+            pync_trace_add(t, trace_phase_names[TRACE_DRAW], t->frame_end, render_start);
+            pync_trace_add(t, trace_phase_names[TRACE_RENDER], render_start, render_end);
+        }
+        if (0 == ret && rasterize)
+        {
+            double const raster = (double)(after.raster_ns - before.raster_ns) * 1E-9;
+            double const write = (double)(after.writeout_ns - before.writeout_ns) * 1E-9;
+
+            pync_trace_add(t, trace_phase_names[TRACE_RASTERIZE], render_end, raster_end);
+            if (raster > 0)
+            {
+                pync_trace_add(t, trace_phase_names[TRACE_RASTER], render_end, render_end + raster);
+            }
+            if (write > 0)
+            {
+                pync_trace_add(t, trace_phase_names[TRACE_WRITE], raster_end - write, raster_end);
+            }
+            pync_trace_add(t, trace_phase_names[TRACE_FRAME], t->frame_end, raster_end);
+            t->frame_end = raster_end;
+        }
+    }
+
+    if (ret < 0)
+    {
+        PyErr_Format(PyExc_RuntimeError, "Notcurses returned error %i", ret);
+        return -1;
+    }
+    return 0;
+}
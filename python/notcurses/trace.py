@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Frame timeline spans and Chrome trace export."""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, TextIO, Union
+
+if TYPE_CHECKING:
+    from .notcurses import Notcurses
+
+
+@contextmanager
+def trace_span(nc: Notcurses, name: str) -> Iterator[None]:
+    """Record the body of the with statement as a span called 'name'.
+
+        with trace_span(nc, 'layout'):
+            layout(plane)
+
+    Costs two clock reads while tracing is stopped.
+    """
+    start = monotonic()
+    try:
+        yield
+    finally:
+        nc.trace_add(name, start, monotonic())
+
+
+def chrome_trace(nc: Notcurses) -> Dict[str, Any]:
+    """Recorded spans in the Chrome trace event format.
+
+    The result can be saved as JSON and opened in Perfetto or
+    chrome://tracing.
+    """
+    pid = os.getpid()
+    events: List[Dict[str, Any]] = []
+    for name, start, duration, thread in nc.trace_spans():
+        events.append({
+            'name': name,
+            'cat': 'notcurses',
+            'ph': 'X',
+            'ts': start * 1e6,
+            'dur': duration * 1e6,
+            'pid': pid,
+            'tid': thread,
+        })
+
+    return {
+        'traceEvents': events,
+        'displayTimeUnit': 'ms',
+        'otherData': {'dropped_spans': nc.trace_dropped()},
+    }
+
+
+def dump_chrome_trace(nc: Notcurses, file: Union[str, TextIO]) -> None:
+    """Write the recorded spans as Chrome trace JSON to a path or file."""
+    trace = chrome_trace(nc)
+    if isinstance(file, str):
+        with open(file, 'w') as f:
+            json.dump(trace, f)
+    else:
+        json.dump(trace, file)
@@ -0,0 +1,535 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+#include <pthread.h>
+
+// A decoder thread, which never takes the GIL, streams the media with
+// ncvisual_stream() into a scratch plane and copies every frame into a free
+// slot of a ring of planes, waiting while the ring is full. Each slot plane
+// is the root of its own pile, so the decoder blits while the application
+// renders its piles. update() copies the latest due frame to the target
+// plane and drops the frames due before it.
+//
+// Notcurses.drop_planes() frees those piles as well, so live players are
+// kept in a registry and stopped before it does.
+
+struct player_frame
+{
+    struct ncplane *plane;
+    // Presentation time in seconds since the start of playback, at the
+    // media's own rate scaled by the timescale.
+    double pts;
+};
+
+typedef struct NcVideoPlayerObject
+{
+    PyObject_HEAD;
+    struct NcVideoPlayerObject *registry_prev;
+    struct NcVideoPlayerObject *registry_next;
+    NcPlaneObject *plane;
+    struct notcurses *nc;
+    struct ncvisual *ncv;
+    struct ncplane *scratch;
+    struct ncvisual_options vopts;
+    float timescale;
+    bool loop;
+
+    // Guarded by 'lock'.
+    struct player_frame *frames;
+    size_t capacity;
+    size_t head;
+    size_t count;
+    bool stopping;
+    bool finished;
+    int error;
+    unsigned long long decoded;
+    unsigned long long shown;
+    unsigned long long dropped;
+
+    pthread_mutex_t lock;
+    pthread_cond_t not_full;
+    pthread_t thread;
+    bool sync_initialized;
+    bool thread_started;
+
+    // Only used by the decoder thread.
+    double pass_begin;
+    double pass_offset;
+    double last_end;
+
+    // Monotonic time of pts 0, negative until the first frame is shown.
+    double clock_start;
+} NcVideoPlayerObject;
+
+static NcVideoPlayerObject *player_registry = NULL;
+
+static int
+player_streamcb(struct ncvisual *Py_UNUSED(ncv), struct ncvisual_options *vopts,
+                const struct timespec *tspec, void *curry)
+{
+    NcVideoPlayerObject *self = curry;
+    // tspec is when the frame stops being displayed.
+    double const end = (double)tspec->tv_sec + (double)tspec->tv_nsec * 1E-9 - self->pass_begin + self->pass_offset;
+
+    pthread_mutex_lock(&self->lock);
+    while (self->count == self->capacity && !self->stopping)
+    {
+        pthread_cond_wait(&self->not_full, &self->lock);
+    }
+    bool const stopping = self->stopping;
+    size_t const tail = (self->head + self->count) % self->capacity;
+    pthread_mutex_unlock(&self->lock);
+
+    if (stopping)
+    {
+        return 1;
+    }
+
+    // The slot is not in the queue, update() does not touch it.
+    struct player_frame *frame = &self->frames[tail];
+    ncplane_erase(frame->plane);
+    if (ncplane_mergedown_simple(vopts->n, frame->plane) < 0)
+    {
+        return -1;
+    }
+    frame->pts = self->last_end;
+    self->last_end = end;
+
+    pthread_mutex_lock(&self->lock);
+    self->count++;
+    self->decoded++;
+    pthread_mutex_unlock(&self->lock);
+
+    return 0;
+}
+
+static void *
+player_decode(void *arg)
+{
+    NcVideoPlayerObject *self = arg;
+    int ret = 0;
+
+    for (;;)
+    {
+        self->pass_begin = pync_monotonic();
+        ret = ncvisual_stream(self->nc, self->ncv, self->timescale, player_streamcb, &self->vopts, self);
+        if (0 != ret || !self->loop)
+        {
+            break;
+        }
+        // Rewind to the first frame, timestamps continue from the last one.
+        self->pass_offset = self->last_end;
+        ret = ncvisual_decode_loop(self->ncv);
+        if (ret < 0)
+        {
+            break;
+        }
+    }
+
+    pthread_mutex_lock(&self->lock);
+    self->finished = true;
+    if (ret < 0)
+    {
+        self->error = ret;
+    }
+    pthread_mutex_unlock(&self->lock);
+
+    return NULL;
+}
+
+static void
+player_stop(NcVideoPlayerObject *self)
+{
+    if (!self->thread_started)
+    {
+        return;
+    }
+
+    pthread_mutex_lock(&self->lock);
+    self->stopping = true;
+    pthread_cond_broadcast(&self->not_full);
+    pthread_mutex_unlock(&self->lock);
+
+    // The decoder never takes the GIL, so it is kept while joining. Other
+    // threads can't join the decoder or change the registry meanwhile.
+    pthread_join(self->thread, NULL);
+    self->thread_started = false;
+}
+
+void
+NcVideoPlayer_drop_planes(const struct notcurses *nc)
+{
+    for (NcVideoPlayerObject *self = player_registry; NULL != self; self = self->registry_next)
+    {
+        if (self->nc != nc)
+        {
+            continue;
+        }
+
+        player_stop(self);
+        for (size_t i = 0; NULL != self->frames && i < self->capacity; i++)
+        {
+            self->frames[i].plane = NULL;
+        }
+        self->scratch = NULL;
+        self->vopts.n = NULL;
+
+        pthread_mutex_lock(&self->lock);
+        self->count = 0;
+        self->finished = true;
+        pthread_mutex_unlock(&self->lock);
+    }
+}
+
+static void
+NcVideoPlayer_dealloc(NcVideoPlayerObject *self)
+{
+    player_stop(self);
+
+    if (NULL != self->registry_prev)
+    {
+        self->registry_prev->registry_next = self->registry_next;
+    }
+    else if (player_registry == self)
+    {
+        player_registry = self->registry_next;
+    }
+    if (NULL != self->registry_next)
+    {
+        self->registry_next->registry_prev = self->registry_prev;
+    }
+
+    if (NULL != self->frames)
+    {
+        for (size_t i = 0; i < self->capacity; i++)
+        {
+            ncplane_destroy(self->frames[i].plane);
+        }
+        PyMem_Free(self->frames);
+    }
+    ncplane_destroy(self->scratch);
+    ncvisual_destroy(self->ncv);
+    if (self->sync_initialized)
+    {
+        pthread_cond_destroy(&self->not_full);
+        pthread_mutex_destroy(&self->lock);
+    }
+    Py_XDECREF(self->plane);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcVideoPlayer_new(PyTypeObject *subtype, PyObject *args, PyObject *kwds)
+{
+    PyObject *plane_arg = NULL;
+    PyObject *path_bytes CLEANUP_PY_OBJ = NULL;
+    unsigned blitter = NCBLIT_DEFAULT;
+    unsigned scaling = NCSCALE_SCALE;
+    Py_ssize_t queue = 8;
+    int loop = 0;
+    float timescale = 1.0f;
+
+    char *keywords[] = {"plane", "path", "blitter", "scaling", "queue", "loop", "timescale", NULL};
+
+    GNU_PY_CHECK_BOOL(PyArg_ParseTupleAndKeywords(args, kwds, "O!O&|IInpf", keywords,
+                                                  &NcPlane_Type, &plane_arg,
+                                                  PyUnicode_FSConverter, &path_bytes,
+                                                  &blitter, &scaling, &queue, &loop, &timescale));
+
+    NcPlaneObject *plane = (NcPlaneObject *)plane_arg;
+    CHECK_NCPLANE(plane);
+    if (queue < 1)
+    {
+        PyErr_SetString(PyExc_ValueError, "queue must be at least 1");
+        return NULL;
+    }
+    if (timescale <= 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "timescale must be positive");
+        return NULL;
+    }
+
+    struct notcurses *nc = ncplane_notcurses(plane->ncplane_ptr);
+    if (!notcurses_canopen_videos(nc))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Notcurses was built without video support");
+        return NULL;
+    }
+
+    NcVideoPlayerObject *self = (NcVideoPlayerObject *)subtype->tp_alloc(subtype, 0);
+    if (NULL == self)
+    {
+        return NULL;
+    }
+    self->registry_next = player_registry;
+    if (NULL != player_registry)
+    {
+        player_registry->registry_prev = self;
+    }
+    player_registry = self;
+
+    Py_INCREF(plane);
+    self->plane = plane;
+    self->nc = nc;
+    self->timescale = timescale;
+    self->loop = loop;
+    self->clock_start = -1;
+
+    if (0 != pthread_mutex_init(&self->lock, NULL))
+    {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+    if (0 != pthread_cond_init(&self->not_full, NULL))
+    {
+        pthread_mutex_destroy(&self->lock);
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+    self->sync_initialized = true;
+
+    const char *path = PyBytes_AS_STRING(path_bytes);
+    Py_BEGIN_ALLOW_THREADS;
+    self->ncv = ncvisual_from_file(path);
+    Py_END_ALLOW_THREADS;
+    if (NULL == self->ncv)
+    {
+        Py_DECREF(self);
+        PyErr_Format(PyExc_RuntimeError, "Failed to open media '%s'", path);
+        return NULL;
+    }
+
+    unsigned rows = 0, cols = 0;
+    ncplane_dim_yx(plane->ncplane_ptr, &rows, &cols);
+    struct ncplane_options nopts = {.rows = rows, .cols = cols, .name = "video"};
+
+    self->scratch = ncpile_create(nc, &nopts);
+    self->frames = PyMem_Calloc((size_t)queue, sizeof(struct player_frame));
+    if (NULL == self->scratch || NULL == self->frames)
+    {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+    self->capacity = (size_t)queue;
+    for (size_t i = 0; i < self->capacity; i++)
+    {
+        self->frames[i].plane = ncpile_create(nc, &nopts);
+        if (NULL == self->frames[i].plane)
+        {
+            Py_DECREF(self);
+            PyErr_SetString(PyExc_RuntimeError, "Failed to create frame planes");
+            return NULL;
+        }
+    }
+
+    self->vopts.n = self->scratch;
+    self->vopts.scaling = (ncscale_e)scaling;
+    self->vopts.blitter = (ncblitter_e)blitter;
+
+    ncvgeom geom;
+    if (ncvisual_geom(nc, self->ncv, &self->vopts, &geom) < 0)
+    {
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to get media geometry");
+        return NULL;
+    }
+    if (NCBLIT_PIXEL == geom.blitter)
+    {
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_ValueError, "NCBLIT_PIXEL can't be used, frames are copied as cells");
+        return NULL;
+    }
+
+    if (0 != pthread_create(&self->thread, NULL, player_decode, self))
+    {
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to start the decoder thread");
+        return NULL;
+    }
+    self->thread_started = true;
+
+    return (PyObject *)self;
+}
+
+static PyObject *
+NcVideoPlayer_update(NcVideoPlayerObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs > 1)
+    {
+        PyErr_Format(PyExc_TypeError, "update expected at most 1 argument, got %zd", nargs);
+        return NULL;
+    }
+    CHECK_NCPLANE(self->plane);
+
+    double now = pync_monotonic();
+    if (1 == nargs && Py_None != args[0])
+    {
+        now = PyFloat_AsDouble(args[0]);
+        if (PyErr_Occurred())
+        {
+            return NULL;
+        }
+    }
+
+    struct player_frame *show = NULL;
+
+    pthread_mutex_lock(&self->lock);
+    int const error = self->error;
+    if (self->count > 0 && self->clock_start < 0)
+    {
+        self->clock_start = now - self->frames[self->head].pts;
+    }
+    double const position = now - self->clock_start;
+    unsigned long long const dropped = self->dropped;
+    // A frame is late once the next one is due as well.
+    while (self->count > 1 && self->frames[(self->head + 1) % self->capacity].pts <= position)
+    {
+        self->head = (self->head + 1) % self->capacity;
+        self->count--;
+        self->dropped++;
+    }
+    if (self->count > 0 && self->frames[self->head].pts <= position)
+    {
+        show = &self->frames[self->head];
+    }
+    if (dropped != self->dropped)
+    {
+        pthread_cond_signal(&self->not_full);
+    }
+    pthread_mutex_unlock(&self->lock);
+
+    if (error < 0)
+    {
+        PyErr_Format(PyExc_RuntimeError, "Notcurses returned error %i", error);
+        return NULL;
+    }
+    if (NULL == show)
+    {
+        Py_RETURN_FALSE;
+    }
+
+    ncplane_erase(self->plane->ncplane_ptr);
+    int const ret = ncplane_mergedown_simple(show->plane, self->plane->ncplane_ptr);
+
+    pthread_mutex_lock(&self->lock);
+    self->head = (self->head + 1) % self->capacity;
+    self->count--;
+    self->shown++;
+    pthread_cond_signal(&self->not_full);
+    pthread_mutex_unlock(&self->lock);
+
+    CHECK_NOTCURSES(ret);
+    Py_RETURN_TRUE;
+}
+
+static PyObject *
+NcVideoPlayer_next_due(NcVideoPlayerObject *self, PyObject *Py_UNUSED(args))
+{
+    double const now = pync_monotonic();
+    // While the decoder is behind, check again shortly.
+    double due = now + 0.005;
+    bool over = false;
+
+    pthread_mutex_lock(&self->lock);
+    if (self->count > 0)
+    {
+        // Before the first frame is shown it is due at once.
+        due = self->clock_start < 0 ? now : self->clock_start + self->frames[self->head].pts;
+    }
+    else if (self->finished)
+    {
+        over = true;
+    }
+    pthread_mutex_unlock(&self->lock);
+
+    if (over)
+    {
+        Py_RETURN_NONE;
+    }
+    return PyFloat_FromDouble(due > now ? due - now : 0.0);
+}
+
+static PyObject *
+NcVideoPlayer_stop(NcVideoPlayerObject *self, PyObject *Py_UNUSED(args))
+{
+    player_stop(self);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+NcVideoPlayer_stats(NcVideoPlayerObject *self, PyObject *Py_UNUSED(args))
+{
+    pthread_mutex_lock(&self->lock);
+    unsigned long long const decoded = self->decoded;
+    unsigned long long const shown = self->shown;
+    unsigned long long const dropped = self->dropped;
+    size_t const queued = self->count;
+    pthread_mutex_unlock(&self->lock);
+
+    return Py_BuildValue("{s:K,s:K,s:K,s:n}",
+                         "decoded", decoded,
+                         "shown", shown,
+                         "dropped", dropped,
+                         "queued", (Py_ssize_t)queued);
+}
+
+static PyObject *
+NcVideoPlayer_get_done(NcVideoPlayerObject *self, void *Py_UNUSED(closure))
+{
+    pthread_mutex_lock(&self->lock);
+    bool const done = (self->finished || self->stopping) && 0 == self->count;
+    pthread_mutex_unlock(&self->lock);
+
+    return PyBool_FromLong((long)done);
+}
+
+static PyObject *
+NcVideoPlayer_get_plane(NcVideoPlayerObject *self, void *Py_UNUSED(closure))
+{
+    Py_INCREF(self->plane);
+    return (PyObject *)self->plane;
+}
+
+static PyMethodDef NcVideoPlayer_methods[] = {
+    {"update", (void *)NcVideoPlayer_update, METH_FASTCALL, PyDoc_STR("Copy the frame due at time 'now' (time.monotonic() seconds, default the current time) to the plane, dropping late frames. Returns True if the plane changed and needs a render, it does not render. The clock starts with the first frame shown.")},
+    {"next_due", (PyCFunction)NcVideoPlayer_next_due, METH_NOARGS, PyDoc_STR("Return the seconds until update() should next be called, or None once playback is over, to be used as the deadline of Notcurses.get().")},
+    {"stop", (PyCFunction)NcVideoPlayer_stop, METH_NOARGS, PyDoc_STR("Stop the decoder thread and wait for it to exit. Frames already queued can still be shown.")},
+    {"stats", (PyCFunction)NcVideoPlayer_stats, METH_NOARGS, PyDoc_STR("Return a dict of frames 'decoded', 'shown' and 'dropped' since creation, and frames 'queued' now.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcVideoPlayer_getset[] = {
+    {"done", (getter)NcVideoPlayer_get_done, NULL, PyDoc_STR("True once every decoded frame was shown or dropped and the decoder stopped."), NULL},
+    {"plane", (getter)NcVideoPlayer_get_plane, NULL, PyDoc_STR("The plane frames are copied to."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcVideoPlayer_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcVideoPlayer",
+    .tp_doc = "Player of the media at 'path' on 'plane', advanced by update() once per frame. A thread decodes and scales up to 'queue' frames ahead with 'blitter' and 'scaling', to the size the plane had at creation. 'loop' restarts the media at its end, 'timescale' multiplies frame durations.",
+    .tp_basicsize = sizeof(NcVideoPlayerObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = NcVideoPlayer_new,
+    .tp_dealloc = (destructor)NcVideoPlayer_dealloc,
+    .tp_methods = NcVideoPlayer_methods,
+    .tp_getset = NcVideoPlayer_getset,
+};
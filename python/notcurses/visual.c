@@ -0,0 +1,337 @@
+// SPDX-License-Identifier: Apache-2.0
+/*
+Copyright 2020, 2021 igo95862
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "notcurses-python.h"
+
+// Decoding and scaling are the expensive parts of showing an image, both run
+// with the GIL released. prescale() does the scaling once for a given plane
+// size and blitter, so later blits of the same visual only copy the pixels.
+
+PyObject *
+NcVisual_wrap(struct ncvisual *ncvisual_ptr)
+{
+    NcVisualObject *self = PyObject_New(NcVisualObject, &NcVisual_Type);
+    if (NULL == self)
+    {
+        ncvisual_destroy(ncvisual_ptr);
+        return NULL;
+    }
+    self->ncvisual_ptr = ncvisual_ptr;
+    return (PyObject *)self;
+}
+
+static void
+NcVisual_dealloc(NcVisualObject *self)
+{
+    ncvisual_destroy(self->ncvisual_ptr);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+NcVisual_from_file(PyTypeObject *Py_UNUSED(cls), PyObject *path_arg)
+{
+    PyObject *path_bytes CLEANUP_PY_OBJ = NULL;
+    GNU_PY_CHECK_BOOL(PyUnicode_FSConverter(path_arg, &path_bytes));
+    const char *path = PyBytes_AS_STRING(path_bytes);
+    struct ncvisual *ncv = NULL;
+
+    Py_BEGIN_ALLOW_THREADS;
+    ncv = ncvisual_from_file(path);
+    Py_END_ALLOW_THREADS;
+
+    if (NULL == ncv)
+    {
+        PyErr_Format(PyExc_RuntimeError, "Failed to load visual from '%s'", path);
+        return NULL;
+    }
+
+    return NcVisual_wrap(ncv);
+}
+
+static PyObject *
+NcVisual_from_rgba(PyTypeObject *Py_UNUSED(cls), PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    char *keywords[] = {"data", "rows", "cols", "rowstride", NULL};
+    PyObject *parsed[4];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("from_rgba", args, nargs, kwnames, keywords, 3, parsed));
+
+    int const rows = GNU_PY_ARG_INT(parsed[1]);
+    int const cols = GNU_PY_ARG_INT(parsed[2]);
+    int rowstride = cols * 4;
+    if (NULL != parsed[3] && Py_None != parsed[3])
+    {
+        rowstride = GNU_PY_ARG_INT(parsed[3]);
+    }
+    if (rows <= 0 || cols <= 0 || rowstride < cols * 4)
+    {
+        PyErr_SetString(PyExc_ValueError, "rows and cols must be positive and rowstride at least cols * 4");
+        return NULL;
+    }
+
+    Py_buffer data_buffer __attribute__((cleanup(PyBuffer_Release))) = {0};
+    GNU_PY_CHECK_INT(PyObject_GetBuffer(parsed[0], &data_buffer, PyBUF_SIMPLE));
+    if (data_buffer.len < (Py_ssize_t)rows * rowstride)
+    {
+        PyErr_Format(PyExc_ValueError, "data has %zd bytes, %d rows of %d bytes need %zd",
+                     data_buffer.len, rows, rowstride, (Py_ssize_t)rows * rowstride);
+        return NULL;
+    }
+
+    struct ncvisual *ncv = NULL;
+
+    Py_BEGIN_ALLOW_THREADS;
+    ncv = ncvisual_from_rgba(data_buffer.buf, rows, rowstride, cols);
+    Py_END_ALLOW_THREADS;
+
+    if (NULL == ncv)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to create visual from RGBA data");
+        return NULL;
+    }
+
+    return NcVisual_wrap(ncv);
+}
+
+// Fills 'vopts' from the 'blitter' and 'scaling' arguments. Returns -1 with an
+// exception set on bad arguments.
+static int
+visual_options_parse(PyObject **parsed, struct ncvisual_options *vopts)
+{
+    unsigned value = 0;
+    if (NULL != parsed[0])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_uint(parsed[0], &value));
+        vopts->blitter = (ncblitter_e)value;
+    }
+    if (NULL != parsed[1])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_as_uint(parsed[1], &value));
+        vopts->scaling = (ncscale_e)value;
+    }
+    return 0;
+}
+
+static PyObject *
+NcVisual_blit(NcVisualObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    char *keywords[] = {"plane", "blitter", "scaling", "y", "x", "flags", "transcolor", NULL};
+    PyObject *parsed[7];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("blit", args, nargs, kwnames, keywords, 1, parsed));
+
+    NcPlaneObject *plane = GNU_PY_ARG_TYPE(parsed[0], &NcPlane_Type, NcPlaneObject);
+    CHECK_NCPLANE(plane);
+
+    struct ncvisual_options vopts = {.n = plane->ncplane_ptr};
+    GNU_PY_CHECK_INT(visual_options_parse(parsed + 1, &vopts));
+    if (NULL != parsed[3])
+    {
+        vopts.y = GNU_PY_ARG_INT(parsed[3]);
+    }
+    if (NULL != parsed[4])
+    {
+        vopts.x = GNU_PY_ARG_INT(parsed[4]);
+    }
+    if (NULL != parsed[5])
+    {
+        vopts.flags = GNU_PY_ARG_ULL(parsed[5]);
+    }
+    if (NULL != parsed[6])
+    {
+        vopts.transcolor = GNU_PY_ARG_UINT(parsed[6]);
+    }
+
+    struct notcurses *nc = ncplane_notcurses(plane->ncplane_ptr);
+    struct ncplane *blitted = NULL;
+
+    Py_BEGIN_ALLOW_THREADS;
+    blitted = ncvisual_blit(nc, self->ncvisual_ptr, &vopts);
+    Py_END_ALLOW_THREADS;
+
+    if (NULL == blitted)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to blit visual");
+        return NULL;
+    }
+    if (blitted == plane->ncplane_ptr)
+    {
+        Py_INCREF(plane);
+        return (PyObject *)plane;
+    }
+
+    return NcPlane_wrap(blitted, plane->notcurses_obj);
+}
+
+static PyObject *
+NcVisual_resize(NcVisualObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    char *keywords[] = {"rows", "cols", "interpolate", NULL};
+    PyObject *parsed[3];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("resize", args, nargs, kwnames, keywords, 2, parsed));
+
+    int const rows = GNU_PY_ARG_INT(parsed[0]);
+    int const cols = GNU_PY_ARG_INT(parsed[1]);
+    int interpolate = 1;
+    if (NULL != parsed[2])
+    {
+        interpolate = GNU_PY_ARG_BOOL(parsed[2]);
+    }
+
+    if (interpolate)
+    {
+        CHECK_NOTCURSES_NOGIL(ncvisual_resize(self->ncvisual_ptr, rows, cols));
+    }
+    else
+    {
+        CHECK_NOTCURSES_NOGIL(ncvisual_resize_noninterpolative(self->ncvisual_ptr, rows, cols));
+    }
+
+    Py_RETURN_NONE;
+}
+
+// Geometry of the visual blitted to 'parsed[0]' if it is a plane, otherwise
+// only the pixel size is filled in.
+static int
+visual_geom(NcVisualObject *self, PyObject **parsed, ncscale_e scaling, ncvgeom *geom)
+{
+    struct ncvisual_options vopts = {.scaling = scaling};
+    const struct notcurses *nc = NULL;
+
+    if (NULL != parsed[0] && Py_None != parsed[0])
+    {
+        GNU_PY_CHECK_INT_RET_NEG1(pync_check_type(parsed[0], &NcPlane_Type));
+        NcPlaneObject *plane = (NcPlaneObject *)parsed[0];
+        if (NULL == plane->ncplane_ptr)
+        {
+            PyErr_SetString(PyExc_RuntimeError, "NcPlane is destroyed");
+            return -1;
+        }
+        vopts.n = plane->ncplane_ptr;
+        nc = ncplane_notcurses_const(plane->ncplane_ptr);
+    }
+    GNU_PY_CHECK_INT_RET_NEG1(visual_options_parse(parsed + 1, &vopts));
+
+    int const ret = ncvisual_geom(nc, self->ncvisual_ptr, NULL == nc ? NULL : &vopts, geom);
+    if (ret < 0)
+    {
+        PyErr_Format(PyExc_RuntimeError, "Notcurses returned error %i", ret);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+NcVisual_geom(NcVisualObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    char *keywords[] = {"plane", "blitter", "scaling", NULL};
+    PyObject *parsed[3];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("geom", args, nargs, kwnames, keywords, 0, parsed));
+
+    ncvgeom geom = {0};
+    GNU_PY_CHECK_INT(visual_geom(self, parsed, NCSCALE_NONE, &geom));
+
+    return Py_BuildValue("{s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:I,s:i}",
+                         "pixy", geom.pixy, "pixx", geom.pixx,
+                         "cdimy", geom.cdimy, "cdimx", geom.cdimx,
+                         "rpixy", geom.rpixy, "rpixx", geom.rpixx,
+                         "rcelly", geom.rcelly, "rcellx", geom.rcellx,
+                         "scaley", geom.scaley, "scalex", geom.scalex,
+                         "begy", geom.begy, "begx", geom.begx,
+                         "leny", geom.leny, "lenx", geom.lenx,
+                         "maxpixely", geom.maxpixely, "maxpixelx", geom.maxpixelx,
+                         "blitter", (int)geom.blitter);
+}
+
+static PyObject *
+NcVisual_prescale(NcVisualObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    char *keywords[] = {"plane", "blitter", "scaling", "interpolate", NULL};
+    PyObject *parsed[4];
+    GNU_PY_CHECK_INT(pync_parse_fastcall("prescale", args, nargs, kwnames, keywords, 1, parsed));
+    if (Py_None == parsed[0])
+    {
+        PyErr_SetString(PyExc_TypeError, "prescale() needs the plane the visual will be blitted to");
+        return NULL;
+    }
+
+    ncvgeom geom = {0};
+    GNU_PY_CHECK_INT(visual_geom(self, parsed, NCSCALE_SCALE, &geom));
+    int interpolate = 1;
+    if (NULL != parsed[3])
+    {
+        interpolate = GNU_PY_ARG_BOOL(parsed[3]);
+    }
+
+    if (geom.rpixy != geom.pixy || geom.rpixx != geom.pixx)
+    {
+        int const rows = (int)geom.rpixy, cols = (int)geom.rpixx;
+        if (interpolate)
+        {
+            CHECK_NOTCURSES_NOGIL(ncvisual_resize(self->ncvisual_ptr, rows, cols));
+        }
+        else
+        {
+            CHECK_NOTCURSES_NOGIL(ncvisual_resize_noninterpolative(self->ncvisual_ptr, rows, cols));
+        }
+    }
+
+    return PyLong_FromUnsignedLong((unsigned long)geom.blitter);
+}
+
+static PyObject *
+NcVisual_get_pixel_dim(NcVisualObject *self, void *Py_UNUSED(closure))
+{
+    ncvgeom geom = {0};
+    CHECK_NOTCURSES(ncvisual_geom(NULL, self->ncvisual_ptr, NULL, &geom));
+    return Py_BuildValue("II", geom.pixy, geom.pixx);
+}
+
+static PyObject *
+NcVisual_get_nbytes(NcVisualObject *self, void *Py_UNUSED(closure))
+{
+    ncvgeom geom = {0};
+    CHECK_NOTCURSES(ncvisual_geom(NULL, self->ncvisual_ptr, NULL, &geom));
+    return PyLong_FromSize_t((size_t)geom.pixy * geom.pixx * sizeof(uint32_t));
+}
+
+static PyMethodDef NcVisual_methods[] = {
+    {"from_file", (PyCFunction)NcVisual_from_file, METH_O | METH_CLASS, PyDoc_STR("Open and decode the first frame of the image or video at 'path'. The GIL is released meanwhile.")},
+    {"from_rgba", (void *)NcVisual_from_rgba, METH_FASTCALL | METH_KEYWORDS | METH_CLASS, PyDoc_STR("Create a visual from a buffer of 'rows' lines of 'rowstride' bytes (default cols * 4), each holding 'cols' RGBA pixels. The data is copied.")},
+    {"blit", (void *)NcVisual_blit, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Render the visual to 'plane' with the NCBLIT_* 'blitter', NCSCALE_* 'scaling' and NCVISUAL_OPTION_* 'flags'. Returns the plane drawn to, a new child of 'plane' with NCVISUAL_OPTION_CHILDPLANE. The GIL is released meanwhile.")},
+    {"resize", (void *)NcVisual_resize, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Scale the visual to 'rows' x 'cols' pixels, without interpolation if 'interpolate' is false. The GIL is released meanwhile.")},
+    {"geom", (void *)NcVisual_geom, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Return the geometry of the visual as a dict of the ncvgeom fields. Without 'plane' only pixy and pixx are filled in, with it the geometry of a blit to 'plane' with 'blitter' and 'scaling'.")},
+    {"prescale", (void *)NcVisual_prescale, METH_FASTCALL | METH_KEYWORDS, PyDoc_STR("Resize the visual to the pixel geometry a blit to 'plane' with 'blitter' and 'scaling' (default NCSCALE_SCALE) would scale it to. Returns the blitter that will be used: blitting with it and NCSCALE_NONE afterwards draws the same without scaling again.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef NcVisual_getset[] = {
+    {"pixel_dim", (getter)NcVisual_get_pixel_dim, NULL, PyDoc_STR("Pixel geometry of the decoded frame, a tuple (rows, cols)."), NULL},
+    {"nbytes", (getter)NcVisual_get_nbytes, NULL, PyDoc_STR("Size in bytes of the decoded RGBA frame."), NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+PyTypeObject NcVisual_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses.NcVisual",
+    .tp_doc = "Decoded image or video frame. Created with NcVisual.from_file(), NcVisual.from_rgba() or NcPlane.ncvisual_from_plane().",
+    .tp_basicsize = sizeof(NcVisualObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)NcVisual_dealloc,
+    .tp_methods = NcVisual_methods,
+    .tp_getset = NcVisual_getset,
+};
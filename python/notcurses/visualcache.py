@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Least recently used cache of decoded and scaled visuals."""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from .notcurses import NCSCALE_NONE, NCSCALE_SCALE, NcVisual
+
+if TYPE_CHECKING:
+    from .notcurses import NcPlane
+
+# (path, mtime, plane rows, plane cols, blitter, scaling)
+_Key = Tuple[str, int, int, int, int, int]
+
+
+class NcVisualCache:
+    """Decoded images kept ready to blit, up to 'max_bytes' of pixels.
+
+    Entries are decoded and prescaled for the size of the plane and
+    the blitter they are shown with, so showing the same image again
+    skips both the decode and the scaling:
+
+        cache = NcVisualCache(64 << 20)
+        cache.blit('cover.png', plane)
+
+    Images are keyed by path and modification time, a changed file is
+    decoded again and its stale entries age out. The least recently
+    used entries are dropped once the pixels held exceed 'max_bytes'.
+    An image larger than 'max_bytes' is shown but not kept.
+    """
+
+    def __init__(self, max_bytes: int = 64 << 20):
+        if max_bytes < 0:
+            raise ValueError('max_bytes must not be negative')
+
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[_Key, Tuple[NcVisual, int, int]] = (
+            OrderedDict())
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str, plane: NcPlane, blitter: int = 0,
+            scaling: int = NCSCALE_SCALE) -> Tuple[NcVisual, int]:
+        """Return the visual of 'path' scaled for 'plane'.
+
+        Returns (visual, blitter): blit the visual with that blitter
+        and NCSCALE_NONE. Decodes and scales on a miss.
+        """
+        path = os.fspath(path)
+        rows, cols = plane.dim_yx()
+        key = (path, os.stat(path).st_mtime_ns, rows, cols,
+               blitter, scaling)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], entry[1]
+            self.misses += 1
+
+        # Decoding and scaling release the GIL, so other threads
+        # keep running and may load the same image meanwhile.
+        visual = NcVisual.from_file(path)
+        resolved = visual.prescale(plane, blitter, scaling)
+        nbytes = visual.nbytes
+
+        with self._lock:
+            if nbytes <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (visual, resolved, nbytes)
+                self.nbytes += nbytes
+                self._evict(self.max_bytes)
+
+        return visual, resolved
+
+    def blit(self, path: str, plane: NcPlane, blitter: int = 0,
+             scaling: int = NCSCALE_SCALE, y: int = 0, x: int = 0,
+             flags: int = 0) -> NcPlane:
+        """Show the image at 'path' on 'plane' through the cache.
+
+        Arguments are those of NcVisual.blit(). Returns the plane
+        drawn to.
+        """
+        visual, resolved = self.get(path, plane, blitter, scaling)
+        return visual.blit(plane, resolved, NCSCALE_NONE, y, x, flags)
+
+    def _evict(self, max_bytes: int) -> None:
+        while self.nbytes > max_bytes:
+            _, (_, _, nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= nbytes
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte limit, dropping entries above it."""
+        if max_bytes < 0:
+            raise ValueError('max_bytes must not be negative')
+
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict(max_bytes)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hits, misses, entries, nbytes and max_bytes."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'nbytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+            }
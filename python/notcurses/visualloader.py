@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decoding and scaling of visuals on a thread pool."""
+
+from __future__ import annotations
+
+from asyncio import get_running_loop, wrap_future
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import (TYPE_CHECKING, Awaitable, Deque, Iterable, List,
+                    Optional, Tuple, Type)
+
+from .notcurses import NCSCALE_SCALE, NcVisual
+
+if TYPE_CHECKING:
+    from .notcurses import NcPlane
+    from .visualcache import NcVisualCache
+
+LoadedVisual = Tuple[NcVisual, int]
+
+
+class NcVisualLoader:
+    """Thread pool decoding and prescaling visuals.
+
+    NcVisual.from_file() and NcVisual.prescale() release the GIL, so
+    images load in parallel while the main thread keeps handling input
+    and rendering. Each load results in (visual, blitter), ready for
+    visual.blit(plane, blitter, NCSCALE_NONE) on the render thread:
+
+        with NcVisualLoader() as loader:
+            futures = loader.load_many(paths, plane)
+            while running:
+                for future in loader.drain():
+                    visual, blitter = future.result()
+                    ...
+
+    With 'cache', loads go through that NcVisualCache and images
+    already in it return without decoding. Without 'plane' the visual
+    is only decoded and the blitter is 'blitter'. The plane must be
+    neither resized nor destroyed while its loads are pending.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 cache: Optional[NcVisualCache] = None):
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix='NcVisualLoader')
+        self._cache = cache
+        self._done: Deque[Future[LoadedVisual]] = deque()
+
+    def _load(self, path: str, plane: Optional[NcPlane], blitter: int,
+              scaling: int) -> LoadedVisual:
+        if plane is None:
+            return NcVisual.from_file(path), blitter
+        if self._cache is not None:
+            return self._cache.get(path, plane, blitter, scaling)
+
+        visual = NcVisual.from_file(path)
+        return visual, visual.prescale(plane, blitter, scaling)
+
+    def load(self, path: str, plane: Optional[NcPlane] = None,
+             blitter: int = 0,
+             scaling: int = NCSCALE_SCALE) -> Future[LoadedVisual]:
+        """Decode 'path' and prescale it for 'plane' on the pool.
+
+        Returns a future of (visual, blitter). It is also handed out
+        by drain() once done, so drain() must be called regularly.
+        """
+        future = self._executor.submit(self._load, path, plane,
+                                       blitter, scaling)
+        # deque.append() is atomic, the callback may run on a worker.
+        future.add_done_callback(self._done.append)
+        return future
+
+    def load_many(self, paths: Iterable[str],
+                  plane: Optional[NcPlane] = None, blitter: int = 0,
+                  scaling: int = NCSCALE_SCALE,
+                  ) -> List[Future[LoadedVisual]]:
+        """Queue a load of every path, in order."""
+        return [self.load(path, plane, blitter, scaling) for path in paths]
+
+    def load_async(self, path: str, plane: Optional[NcPlane] = None,
+                   blitter: int = 0,
+                   scaling: int = NCSCALE_SCALE) -> Awaitable[LoadedVisual]:
+        """Like load(), awaitable from the running asyncio loop.
+
+        The result is delivered on the loop's thread and not handed
+        out by drain().
+        """
+        loop = get_running_loop()
+        future = self._executor.submit(self._load, path, plane,
+                                       blitter, scaling)
+        return wrap_future(future, loop=loop)
+
+    def drain(self) -> List[Future[LoadedVisual]]:
+        """Return the loads finished since the last call.
+
+        Meant to be called once per frame from the render loop.
+        Failed loads are included, future.result() raises their error.
+        """
+        done: List[Future[LoadedVisual]] = []
+        while self._done:
+            done.append(self._done.popleft())
+        return done
+
+    def close(self, cancel_pending: bool = True) -> None:
+        """Stop the pool, by default dropping the loads not started."""
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
+
+    def __enter__(self) -> NcVisualLoader:
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
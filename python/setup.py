@@ -44,12 +44,28 @@ setup(
         Extension(
             name='notcurses.notcurses',
             sources=[
+                'notcurses/arguments.c',
+                'notcurses/cell.c',
                 'notcurses/channels.c',
+                'notcurses/channelsarray.c',
+                'notcurses/channelsobject.c',
                 'notcurses/context.c',
+                'notcurses/direct.c',
+                'notcurses/displaylist.c',
+                'notcurses/fade.c',
                 'notcurses/functions.c',
+                'notcurses/input.c',
+                'notcurses/instrument.c',
                 'notcurses/main.c',
                 'notcurses/misc.c',
                 'notcurses/plane.c',
+                'notcurses/plot.c',
+                'notcurses/renderbuffer.c',
+                'notcurses/rendersink.c',
+                'notcurses/stats.c',
+                'notcurses/trace.c',
+                'notcurses/video.c',
+                'notcurses/visual.c',
             ],
             libraries=['notcurses'],
             language='c',
@@ -73,6 +89,7 @@ setup(
     package_data={
         'notcurses': [
             'py.typed',
+            'channels.pyi',
         ],
     }
 )
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests run against the built extension and need no terminal.
+
+Build it in place first:
+
+    python3 setup.py build_ext --inplace
+    setsid python3 -m pytest tests
+
+Tests using the 'nc' fixture run a headless context, which only skips
+terminal queries without a controlling terminal, hence setsid(1).
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import List
+
+import pytest
+
+try:
+    import notcurses  # noqa: F401
+except (ImportError, AttributeError):
+    # The package falls back to its typing stubs without the extension.
+    collect_ignore_glob: List[str] = ['test_*.py']
+
+
+def _has_controlling_terminal() -> bool:
+    try:
+        os.close(os.open('/dev/tty', os.O_RDWR))
+    except OSError:
+        return False
+    return True
+
+
+@pytest.fixture
+def no_tty() -> None:
+    if _has_controlling_terminal():
+        pytest.skip("headless contexts need no controlling terminal, "
+                    "run under setsid")
+
+
+@pytest.fixture
+def nc(no_tty: None) -> notcurses.Notcurses:
+    return notcurses.Notcurses.headless(rows=24, cols=80)
+
+
+@pytest.fixture
+def plane(nc: notcurses.Notcurses) -> notcurses.NcPlane:
+    return nc.stdplane().create(rows=8, cols=16)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return (struct.pack('>I', len(data)) + kind + data +
+            struct.pack('>I', zlib.crc32(kind + data)))
+
+
+def write_png(path: Path, rows: int, cols: int) -> None:
+    """Write an opaque red RGBA image of 'rows' x 'cols' pixels."""
+    pixels = b''.join(b'\x00' + b'\xff\x00\x00\xff' * cols
+                      for _ in range(rows))
+    path.write_bytes(
+        b'\x89PNG\r\n\x1a\n' +
+        _png_chunk(b'IHDR', struct.pack('>IIBBBBB', cols, rows,
+                                        8, 6, 0, 0, 0)) +
+        _png_chunk(b'IDAT', zlib.compress(pixels)) +
+        _png_chunk(b'IEND', b''))
+
+
+@pytest.fixture
+def png_path(nc: notcurses.Notcurses, tmp_path: Path) -> Path:
+    path = tmp_path / 'image.png'
+    write_png(path, 8, 8)
+    try:
+        notcurses.NcVisual.from_file(str(path))
+    except RuntimeError:
+        pytest.skip("Notcurses was built without multimedia support")
+    return path
@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import os
+from asyncio import get_running_loop, run, sleep, wait_for
+from typing import Any, Callable, Dict, List, Optional
+
+from notcurses.aio import NcEventStream, NcRenderClock
+
+
+class FakeInput:
+    """Stands in for a Notcurses object with queued input.
+
+    Like libnotcurses, every read empties the readiness pipe, even
+    when events stay queued.
+    """
+
+    def __init__(self, events: List[int]):
+        self.events = events
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.write(self._write_fd, b'\x01')
+
+    def close(self) -> None:
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+    def inputready_fd(self) -> int:
+        return self._read_fd
+
+    def get_many(self, count: int, timeout: float) -> List[int]:
+        try:
+            os.read(self._read_fd, 64)
+        except BlockingIOError:
+            pass
+        batch, self.events = self.events[:count], self.events[count:]
+        return batch
+
+
+async def collect(stream: NcEventStream, count: int) -> List[Any]:
+    result = []
+    async for event in stream:
+        result.append(event)
+        if len(result) == count:
+            break
+    return result
+
+
+def test_drains_all_events() -> None:
+    nc = FakeInput(list(range(200)))
+    try:
+        stream = NcEventStream(nc)  # type: ignore[arg-type]
+        events = run(wait_for(collect(stream, 200), 5))
+    finally:
+        nc.close()
+
+    assert events == list(range(200))
+
+
+def test_resumes_after_max_pending() -> None:
+    nc = FakeInput(list(range(10)))
+    try:
+        stream = NcEventStream(nc, max_pending=2)  # type: ignore[arg-type]
+        events = run(wait_for(collect(stream, 10), 5))
+    finally:
+        nc.close()
+
+    assert events == list(range(10))
+
+
+def test_pauses_at_max_pending() -> None:
+    nc = FakeInput(list(range(10)))
+
+    async def first() -> Any:
+        stream = NcEventStream(nc, max_pending=3)  # type: ignore[arg-type]
+        async with stream:
+            return await stream.__anext__()
+
+    try:
+        assert run(wait_for(first(), 5)) == 0
+    finally:
+        nc.close()
+
+    # Reading stopped once three events were waiting.
+    assert nc.events == list(range(3, 10))
+
+
+def test_error_is_raised_to_consumer() -> None:
+    class Failing(FakeInput):
+        def get_many(self, count: int, timeout: float) -> List[int]:
+            raise RuntimeError("Notcurses returned error -1")
+
+    nc = Failing([])
+    try:
+        stream = NcEventStream(nc)  # type: ignore[arg-type]
+        try:
+            run(wait_for(collect(stream, 1), 5))
+        except RuntimeError as e:
+            assert "error" in str(e)
+        else:
+            raise AssertionError("error was not raised")
+    finally:
+        nc.close()
+
+
+class FakeRenderer:
+    """Stands in for a Notcurses object whose first renders fail."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.frames = 0
+        self.dirty = True
+
+    def set_render_waker(self, waker: Optional[Callable[[], None]]) -> None:
+        pass
+
+    def render_due(self) -> Optional[float]:
+        return 0.0 if self.dirty else None
+
+    def render_if_due(self) -> bool:
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("Notcurses returned error -1")
+        self.dirty = False
+        self.frames += 1
+        return True
+
+
+def test_render_clock_survives_failed_render() -> None:
+    nc = FakeRenderer(failures=2)
+    errors: List[Dict[str, Any]] = []
+
+    async def main() -> None:
+        get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context))
+        async with NcRenderClock(nc):  # type: ignore[arg-type]
+            while nc.frames == 0:
+                await sleep(0)
+
+    run(wait_for(main(), 5))
+
+    assert nc.frames == 1
+    assert len(errors) == 2
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from notcurses import NcPlane
+
+
+def test_writes_rows_of_one_dimensional_arrays(plane: NcPlane) -> None:
+    codepoints = array('I', map(ord, 'abcdef'))
+    fg = array('I', [0xff0000] * 6)
+
+    assert plane.blit_cells(1, 2, codepoints, fg=fg, cols=3) == 6
+
+    assert plane.at_yx(1, 2)[0] == 'a'
+    assert plane.at_yx(1, 4)[0] == 'c'
+    assert plane.at_yx(2, 2)[0] == 'd'
+    assert plane.at_yx(2, 4)[0] == 'f'
+
+
+def test_two_dimensional_memoryview(plane: NcPlane) -> None:
+    codepoints = memoryview(array('I', map(ord, 'wxyz'))).cast('B') \
+        .cast('I', (2, 2))
+
+    assert plane.blit_cells(0, 0, codepoints) == 4
+    assert plane.at_yx(1, 1)[0] == 'z'
+
+
+def test_zero_codepoint_leaves_cell(plane: NcPlane) -> None:
+    plane.putstr_yx(0, 0, 'q')
+
+    plane.blit_cells(0, 0, array('I', [0, ord('r')]), cols=2)
+
+    assert plane.at_yx(0, 0)[0] == 'q'
+    assert plane.at_yx(0, 1)[0] == 'r'
+
+
+def test_rejects_region_outside_plane(plane: NcPlane) -> None:
+    with pytest.raises(ValueError):
+        plane.blit_cells(7, 0, array('I', map(ord, 'ab')), cols=1)
+
+
+def test_rejects_mismatched_shapes(plane: NcPlane) -> None:
+    with pytest.raises(ValueError):
+        plane.blit_cells(0, 0, array('I', map(ord, 'ab')),
+                         fg=array('I', [0, 0, 0, 0]), cols=2)
+
+
+def test_rejects_wrong_item_size(plane: NcPlane) -> None:
+    with pytest.raises(TypeError):
+        plane.blit_cells(0, 0, array('H', map(ord, 'ab')), cols=2)
+
+
+def test_rejects_invalid_rgb(plane: NcPlane) -> None:
+    with pytest.raises(ValueError):
+        plane.blit_cells(0, 0, array('I', map(ord, 'ab')),
+                         fg=array('I', [0, 0x1000000]), cols=2)
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from threading import Thread
+
+import pytest
+
+from notcurses import NcCell, NcPlane
+
+# Eleven bytes, too long to be kept inline in the gcluster.
+LONG_EGC = '\U0001F468\u200d\U0001F469'
+OTHER_EGC = '\U0001F469\u200d\U0001F468'
+
+
+def test_cell_fields() -> None:
+    cell = NcCell('a', channels=1)
+    assert cell.egc == 'a'
+    assert cell.channels == 1
+    assert cell.cols == 1
+    cell.fg_rgb = 0xff0000
+    assert cell.fg_rgb == 0xff0000
+    with pytest.raises(ValueError):
+        cell.bg_rgb = 0x1000000
+    with pytest.raises(TypeError):
+        del cell.styles
+
+
+def test_cell_egc() -> None:
+    cell = NcCell(LONG_EGC)
+    assert cell.egc == LONG_EGC
+    copy = cell.copy()
+    cell.egc = '字'
+    assert cell.cols == 2
+    assert copy.egc == LONG_EGC
+    with pytest.raises(ValueError):
+        cell.egc = '\n'
+    assert cell.egc == '字'
+
+
+def test_fill_yx(plane: NcPlane) -> None:
+    assert plane.fill_yx(1, 2, 2, 3, NcCell('x')) == 6
+    assert plane.at_yx(2, 4)[0] == 'x'
+    assert plane.at_yx(2, 5)[0] != 'x'
+
+
+def test_fill_yx_long_egc(plane: NcPlane) -> None:
+    cell = NcCell(LONG_EGC)
+    assert plane.fill_yx(0, 0, 1, cell.cols * 2, cell) == 2
+    assert plane.at_yx(0, 0)[0] == LONG_EGC
+
+
+def test_fill_yx_wide_cell(plane: NcPlane) -> None:
+    cell = NcCell('字')
+    assert plane.fill_yx(0, 0, 1, 4, cell) == 2
+    assert plane.at_yx(0, 2)[0] == '字'
+    with pytest.raises(ValueError):
+        plane.fill_yx(1, 0, 1, 3, cell)
+    assert plane.at_yx(1, 0)[0] != '字'
+
+
+def test_fill_yx_while_egc_changes(plane: NcPlane) -> None:
+    cell = NcCell(LONG_EGC)
+    cols = cell.cols * 4
+    done = False
+
+    def change() -> None:
+        while not done:
+            cell.egc = OTHER_EGC
+            cell.egc = LONG_EGC
+
+    thread = Thread(target=change)
+    thread.start()
+    try:
+        for _ in range(100):
+            assert plane.fill_yx(0, 0, 8, cols, cell) == 8 * 4
+    finally:
+        done = True
+        thread.join()
+
+    assert plane.at_yx(7, 0)[0] in (LONG_EGC, OTHER_EGC)
+
+
+def test_polyfill_yx(plane: NcPlane) -> None:
+    plane.putstr_yx(0, 3, 'x')
+    assert plane.polyfill_yx(1, 0, NcCell('o')) == 8 * 16 - 1
+    assert plane.at_yx(7, 15)[0] == 'o'
+    assert plane.at_yx(0, 3)[0] == 'x'
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from array import array
+from typing import List, Union
+
+import pytest
+
+import notcurses
+from notcurses import NcChannelsArray
+from notcurses import channels as nc_channels
+
+CHANNELS = [0, 0x40ff000040000080, 0x400000ff00000000, 0x40102030400a0b0c]
+
+
+def _items(values: Union[array[int], NcChannelsArray]) -> List[int]:
+    return [values[i] for i in range(len(values))]
+
+
+def test_results_match_scalar_functions() -> None:
+    pairs = array('Q', CHANNELS)
+
+    fg = nc_channels.ncchannels_fg_rgb(pairs)
+    assert isinstance(fg, array) and fg.typecode == 'I'
+    assert _items(fg) == [notcurses.ncchannels_fg_rgb(c) for c in CHANNELS]
+
+    red = nc_channels.ncchannel_r(fg)
+    assert red.typecode == 'B'
+    assert _items(red) == [notcurses.ncchannel_r(c) for c in _items(fg)]
+
+    stained = nc_channels.ncchannels_set_fg_rgb(pairs, 0x123456)
+    assert isinstance(stained, NcChannelsArray)
+    assert _items(stained) == \
+        [notcurses.ncchannels_set_fg_rgb(c, 0x123456) for c in CHANNELS]
+
+
+def test_ints_are_broadcast() -> None:
+    greys = array('B', [0, 128, 255])
+
+    combined = nc_channels.ncchannel_rgb_initializer(greys, greys, 7)
+
+    assert _items(combined) == \
+        [notcurses.ncchannel_rgb_initializer(v, v, 7) for v in greys]
+    # Without any buffer the result has a single item.
+    assert _items(nc_channels.ncchannels_combine(1, 2)) == \
+        [notcurses.ncchannels_combine(1, 2)]
+
+
+def test_channel_pair_arrays_are_operands() -> None:
+    pairs = NcChannelsArray(CHANNELS)
+
+    combined = nc_channels.ncchannels_combine(
+        nc_channels.ncchannels_fchannel(pairs),
+        nc_channels.ncchannels_bchannel(pairs))
+
+    assert _items(combined) == CHANNELS
+
+
+def test_rgb8_returns_three_arrays() -> None:
+    r, g, b = nc_channels.ncchannel_rgb8(array('I', [0x102030, 0xffeedd]))
+
+    assert (_items(r), _items(g), _items(b)) == \
+        ([0x10, 0xff], [0x20, 0xee], [0x30, 0xdd])
+
+
+def test_empty_buffers() -> None:
+    empty = nc_channels.ncchannels_set_bg_default(array('Q'))
+
+    assert isinstance(empty, NcChannelsArray)
+    assert len(empty) == 0
+    assert len(nc_channels.ncchannels_bg_rgb(array('Q'))) == 0
+
+
+def test_errors() -> None:
+    with pytest.raises(ValueError, match='argument 2 has length 1'):
+        nc_channels.ncchannels_combine(array('I', [1, 2]), array('I', [3]))
+    with pytest.raises(ValueError, match=r'failed at index 1'):
+        nc_channels.ncchannel_set_rgb8(0, array('I', [255, 256]), 0, 0)
+    with pytest.raises(TypeError):
+        nc_channels.ncchannel_r(array('d', [1.0]))
+
+
+def test_ramp() -> None:
+    ramp = nc_channels.ncchannels_ramp(0x4000000040000000,
+                                       0x40ff00004000ff00, 3)
+
+    assert isinstance(ramp, NcChannelsArray)
+    assert _items(ramp) == [0x4000000040000000,
+                            0x407f000040007f00,
+                            0x40ff00004000ff00]
+    assert len(nc_channels.ncchannels_ramp(0, 0, 0)) == 0
+    with pytest.raises(ValueError):
+        nc_channels.ncchannels_ramp(0, 0, -1)
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from notcurses import NcChannels, NcChannelsArray
+
+RED = 0x40ff0000
+
+
+def test_channels_default() -> None:
+    channels = NcChannels()
+    assert channels == 0
+    assert channels.fg_default and channels.bg_default
+    assert channels.fg_palindex is None
+    assert channels.bg_palindex is None
+
+
+def test_channels_fields() -> None:
+    channels = NcChannels()
+    channels.fg_rgb = 0xff0000
+    channels.set_bg_rgb8(0, 0, 255)
+    assert not channels.fg_default
+    assert channels.fchannel == RED
+    assert channels.bg_rgb8() == (0, 0, 255)
+    assert int(channels) == channels.channels == (RED << 32) | 0x400000ff
+    assert repr(channels) == 'notcurses.NcChannels(0x40ff0000400000ff)'
+
+
+def test_channels_palindex() -> None:
+    channels = NcChannels()
+    channels.bg_palindex = 7
+    assert channels.bg_palindex == 7
+    assert channels.fg_palindex is None
+
+
+def test_channels_invalid_values() -> None:
+    channels = NcChannels()
+    with pytest.raises(ValueError):
+        channels.fg_rgb = 0x1000000
+    with pytest.raises(ValueError):
+        channels.set_fg_rgb8(256, 0, 0)
+    with pytest.raises(TypeError):
+        del channels.fg_rgb
+    assert channels == 0
+
+
+def test_channels_compare_and_hash() -> None:
+    channels = NcChannels(RED << 32)
+    assert channels == NcChannels(RED << 32)
+    assert channels != -1
+    assert channels != 1 << 64
+    with pytest.raises(TypeError):
+        hash(channels)
+
+
+def test_channels_reverse_and_copy() -> None:
+    channels = NcChannels(RED << 32)
+    copy = channels.copy()
+    channels.reverse()
+    assert channels.bchannel == RED
+    assert channels.fg_default
+    assert copy.fchannel == RED
+
+
+def test_array_from_length() -> None:
+    channels = NcChannelsArray(3, fill=RED << 32)
+    assert len(channels) == 3
+    assert list(channels) == [RED << 32] * 3
+    assert channels.nbytes == 24
+    view = memoryview(channels)
+    assert view.format == 'Q'
+    assert view.tolist() == [RED << 32] * 3
+
+
+def test_array_from_buffer_and_iterable() -> None:
+    assert list(NcChannelsArray(array('Q', [1, 2, 3]))) == [1, 2, 3]
+    assert list(NcChannelsArray(iter([4, 5]))) == [4, 5]
+    with pytest.raises(TypeError):
+        NcChannelsArray(array('I', [1]))
+    with pytest.raises(ValueError):
+        NcChannelsArray(-1)
+
+
+def test_array_items() -> None:
+    channels = NcChannelsArray(2)
+    channels[1] = RED << 32
+    assert channels[1] == RED << 32
+    with pytest.raises(IndexError):
+        channels[2]
+    with pytest.raises(TypeError):
+        del channels[0]
+
+
+def test_array_ranged_updates() -> None:
+    channels = NcChannelsArray(4)
+    channels.set_fg_rgb(0xff0000, 1, 3)
+    assert [NcChannels(c).fchannel for c in channels] == [0, RED, RED, 0]
+    channels.set_fg_default(start=-2)
+    assert [NcChannels(c).fg_default for c in channels] == [
+        True, False, True, True]
+    with pytest.raises(ValueError):
+        channels.set_bg_rgb(0x1000000)
+    channels.fill(5)
+    assert list(channels) == [5] * 4
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import pytest
+
+from notcurses import NcDirect
+
+# Foreground channels, marked as not default.
+RED = 0x40ff0000 << 32
+GREEN = 0x4000ff00 << 32
+
+
+@pytest.fixture
+def direct(monkeypatch: pytest.MonkeyPatch,
+           capfd: pytest.CaptureFixture[str]) -> NcDirect:
+    monkeypatch.setenv('COLORTERM', 'truecolor')
+    try:
+        context = NcDirect('xterm-256color')
+    except RuntimeError as e:
+        pytest.skip(str(e))
+    # Drop what initialization wrote. Stopped on garbage collection.
+    context.flush()
+    capfd.readouterr()
+    return context
+
+
+def test_empty_batch_writes_nothing(direct: NcDirect) -> None:
+    assert direct.batch().flush() == 0
+
+
+def test_default_colours_need_no_sgr(direct: NcDirect,
+                                     capfd: pytest.CaptureFixture[str]
+                                     ) -> None:
+    batch = direct.batch()
+    batch.putstr('plain')
+
+    assert batch.flush() == len('plain')
+    assert capfd.readouterr().out.endswith('plain')
+
+
+def test_sgr_only_where_colours_change(direct: NcDirect,
+                                       capfd: pytest.CaptureFixture[str]
+                                       ) -> None:
+    with direct.batch() as batch:
+        batch.putstr('a', RED)
+        batch.putstr('b', RED)
+        batch.putstr('c', GREEN)
+        batch.putstr('d')
+        assert batch.runs == 4
+
+    assert capfd.readouterr().out.endswith(
+        '\x1b[38;2;255;0;0mab\x1b[38;2;0;255;0mc\x1b[39md')
+
+
+def test_colours_reset_at_end(direct: NcDirect,
+                              capfd: pytest.CaptureFixture[str]) -> None:
+    batch = direct.batch()
+    batch.putstr('a', RED)
+    written = batch.flush()
+
+    assert capfd.readouterr().out.endswith('\x1b[38;2;255;0;0ma\x1b[39m')
+    assert written == len('\x1b[38;2;255;0;0ma\x1b[39m')
+    assert batch.nbytes == 0
+
+
+def test_batch_fails_once_stopped(direct: NcDirect) -> None:
+    batch = direct.batch()
+    batch.putstr('a', RED)
+    direct.stop()
+
+    with pytest.raises(RuntimeError):
+        batch.putstr('b')
+    with pytest.raises(RuntimeError):
+        direct.stop()
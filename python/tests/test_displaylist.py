@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import pytest
+
+from notcurses import NCBOXLIGHT, NcCell, NcDisplayList, NcPlane, Notcurses
+
+NCSTYLE_BOLD = 0x0002
+
+
+def _cells(plane: NcPlane) -> List[object]:
+    _, styles, channels = plane.snapshot()
+    return [plane.egcs(), styles.tolist(), channels.tolist()]
+
+
+@pytest.fixture
+def planes(nc: Notcurses) -> Tuple[NcPlane, NcPlane]:
+    std = nc.stdplane()
+    return std.create(rows=8, cols=16), std.create(rows=8, cols=16)
+
+
+def test_execute_matches_direct_drawing(
+        planes: Tuple[NcPlane, NcPlane]) -> None:
+    direct, replayed = planes
+
+    direct.set_fg_rgb(0x102030)
+    direct.set_bg_rgb(0x405060)
+    direct.putstr_yx(0, 0, 'hello')
+    direct.set_styles(NCSTYLE_BOLD)
+    direct.putstr(' 字')
+    direct.set_channels(0x4000000040000000)
+    direct.cursor_move_yx(3, 2)
+    direct.putstr('moved')
+
+    display_list = NcDisplayList()
+    display_list.set_fg_rgb(0x102030)
+    display_list.set_bg_rgb(0x405060)
+    display_list.putstr_yx(0, 0, 'hello')
+    display_list.set_styles(NCSTYLE_BOLD)
+    display_list.putstr(' 字')
+    display_list.set_channels(0x4000000040000000)
+    display_list.cursor_move_yx(3, 2)
+    display_list.putstr('moved')
+
+    assert replayed.execute(display_list) == len(display_list) == 8
+    assert _cells(replayed) == _cells(direct)
+    assert replayed.cursor_yx() == direct.cursor_yx()
+
+
+def test_box_matches_direct_drawing(nc: Notcurses,
+                                    planes: Tuple[NcPlane, NcPlane]) -> None:
+    if not nc.canutf8():
+        pytest.skip("display lists draw ASCII boxes without UTF-8")
+    direct, replayed = planes
+    ul, ur, ll, lr, hline, vline = (NcCell(c) for c in NCBOXLIGHT[:6])
+
+    direct.cursor_move_yx(1, 1)
+    direct.box(ul, ur, ll, lr, hline, vline, 4, 6)
+    direct.cursor_move_yx(5, 8)
+    direct.box(ul, ur, ll, lr, hline, vline, 7, 12)
+
+    display_list = NcDisplayList()
+    display_list.cursor_move_yx(1, 1)
+    display_list.box(4, 6)
+    display_list.cursor_move_yx(5, 8)
+    display_list.box_sized(3, 5)
+
+    replayed.execute(display_list)
+    assert _cells(replayed) == _cells(direct)
+
+
+def test_format_and_stain(plane: NcPlane) -> None:
+    plane.putstr_yx(0, 0, 'abcd')
+
+    display_list = NcDisplayList()
+    display_list.format(0, 1, 1, 2, NCSTYLE_BOLD)
+    display_list.stain(0, 0, 1, 1, *[0x4000000140000002] * 4)
+    plane.execute(display_list)
+
+    _, styles, channels = plane.snapshot(0, 0, 1, 4)
+    assert [styles[0, x] for x in range(4)] == \
+        [0, NCSTYLE_BOLD, NCSTYLE_BOLD, 0]
+    assert channels[0, 0] == 0x4000000140000002
+    assert plane.egcs(0, 0, 1, 4) == [['a', 'b', 'c', 'd']]
+
+
+def test_erase_and_replay_twice(planes: Tuple[NcPlane, NcPlane]) -> None:
+    direct, replayed = planes
+    direct.putstr_yx(2, 2, 'kept')
+
+    display_list = NcDisplayList()
+    display_list.putstr_yx(0, 0, 'gone')
+    display_list.erase()
+    display_list.putstr_yx(2, 2, 'kept')
+
+    replayed.execute(display_list)
+    replayed.execute(display_list)
+    assert _cells(replayed) == _cells(direct)
+
+
+def test_clear_empties_the_list(plane: NcPlane) -> None:
+    display_list = NcDisplayList()
+    display_list.putstr_yx(0, 0, 'x')
+    display_list.clear()
+
+    assert len(display_list) == 0
+    assert plane.execute(display_list) == 0
+    assert plane.egcs(0, 0, 1, 1) == [['']]
+
+
+def test_failing_op_names_its_index(plane: NcPlane) -> None:
+    display_list = NcDisplayList()
+    display_list.putstr_yx(0, 0, 'ok')
+    display_list.cursor_move_yx(100, 100)
+    display_list.putstr_yx(1, 0, 'never')
+
+    with pytest.raises(RuntimeError, match=r'op 1 \(cursor_move_yx\)'):
+        plane.execute(display_list)
+
+    # Ops before the failing one have already been replayed.
+    assert plane.egcs(0, 0, 2, 2) == [['o', 'k'], ['', '']]
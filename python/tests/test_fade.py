@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import List, Optional
+
+import pytest
+
+from notcurses import NcFader, NcPlane, Notcurses
+
+
+@pytest.fixture
+def faded(nc: Notcurses, plane: NcPlane) -> NcPlane:
+    if not nc.canfade():
+        pytest.skip("the headless terminal can't fade")
+    plane.set_fg_rgb(0xff8000)
+    plane.putstr_yx(0, 0, 'fade')
+    return plane
+
+
+def test_fader_steps_to_the_end(faded: NcPlane) -> None:
+    fader = NcFader(faded, 1.0, 'out')
+    assert not fader.done
+    assert fader.plane is faded
+
+    assert fader.step(monotonic() + 0.5)
+    assert not fader.done
+    assert fader.step(monotonic() + 2)
+    assert fader.done
+    assert not fader.step()
+
+
+def test_pulse_runs_until_cancelled(faded: NcPlane) -> None:
+    fader = NcFader(faded, 0.5, 'pulse')
+
+    fader.step(monotonic() + 100)
+    assert not fader.done
+
+    fader.cancel()
+    assert fader.done
+    assert not fader.step()
+
+
+def test_fader_rejects_arguments(faded: NcPlane) -> None:
+    with pytest.raises(ValueError):
+        NcFader(faded, 1.0, 'sideways')
+    with pytest.raises(ValueError):
+        NcFader(faded, -1.0)
+    with pytest.raises(ValueError):
+        NcFader(faded, 0.0, 'pulse')
+
+
+def test_fade_ctx_iterations(faded: NcPlane, plane: NcPlane) -> None:
+    ctx = faded.fade_setup()
+    assert ctx.iterations > 0
+
+    faded.fadeout_iteration(ctx, ctx.iterations)
+    faded.fadein_iteration(ctx, 0)
+    with pytest.raises(ValueError):
+        faded.fadeout_iteration(ctx, ctx.iterations + 1)
+    other = faded.create(rows=1, cols=1)
+    with pytest.raises(ValueError):
+        other.fadein_iteration(ctx, 0)
+
+
+def test_fadeout_calls_fader(faded: NcPlane) -> None:
+    deadlines: List[float] = []
+
+    def fader(plane: NcPlane, deadline: float) -> None:
+        assert plane is faded
+        deadlines.append(deadline)
+
+    assert faded.fadeout(0.05, fader) == 0
+    assert deadlines
+
+
+def test_fader_stops_fade(faded: NcPlane) -> None:
+    calls: List[float] = []
+
+    def fader(plane: NcPlane, deadline: float) -> int:
+        calls.append(deadline)
+        return 7
+
+    assert faded.pulse(0.05, fader) == 7
+    assert len(calls) == 1
+
+
+def test_fader_exception_aborts_fade(faded: NcPlane) -> None:
+    calls: List[float] = []
+
+    def fader(plane: NcPlane, deadline: float) -> Optional[int]:
+        calls.append(deadline)
+        raise KeyError('stop')
+
+    with pytest.raises(KeyError):
+        faded.fadeout(10.0, fader)
+    assert len(calls) == 1
+
+
+def test_fader_must_return_int(faded: NcPlane) -> None:
+    def fader(plane: NcPlane, deadline: float) -> object:
+        return 'done'
+
+    with pytest.raises(TypeError):
+        faded.fadein(10.0, fader)  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        faded.fadein(10.0, lambda plane, deadline: -1)
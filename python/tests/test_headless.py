@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import gc
+import locale
+from typing import Iterator
+
+import pytest
+
+from notcurses import Notcurses
+
+
+@pytest.fixture
+def c_ctype(no_tty: None) -> Iterator[None]:
+    previous = locale.setlocale(locale.LC_CTYPE)
+    locale.setlocale(locale.LC_CTYPE, 'C')
+    try:
+        yield
+    finally:
+        locale.setlocale(locale.LC_CTYPE, previous)
+
+
+def test_fixed_geometry(no_tty: None) -> None:
+    nc = Notcurses.headless(rows=10, cols=33)
+
+    assert nc.term_dim_yx() == (10, 33)
+    assert nc.stdplane().dim_yx() == (10, 33)
+
+
+def test_truecolor_and_utf8(nc: Notcurses) -> None:
+    assert nc.cantruecolor()
+    assert nc.canutf8()
+
+
+def test_locale_is_restored_once_stopped(c_ctype: None) -> None:
+    nc = Notcurses.headless()
+
+    # Kept for the lifetime of the context, EGCs are decoded with it.
+    assert locale.setlocale(locale.LC_CTYPE) == 'C.UTF-8'
+    nc.stdplane().putstr_yx(0, 0, '字')
+
+    del nc
+    gc.collect()
+    assert locale.setlocale(locale.LC_CTYPE) == 'C'
@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import pytest
+
+from notcurses import Notcurses
+
+
+def test_get_many_times_out_empty(nc: Notcurses) -> None:
+    assert nc.get_many(8, 0) == []
+
+
+def test_get_many_rejects_empty_batch(nc: Notcurses) -> None:
+    with pytest.raises(ValueError):
+        nc.get_many(0, 0)
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+import notcurses
+from notcurses import (NcPlane, instrument_disable, instrument_enable,
+                       instrument_enabled, instrument_reset,
+                       instrument_snapshot)
+
+
+@pytest.fixture(autouse=True)
+def instrumentation() -> Iterator[None]:
+    instrument_reset()
+    yield
+    instrument_disable()
+    instrument_reset()
+
+
+def test_counts_wrapped_calls(plane: NcPlane) -> None:
+    instrument_enable()
+    assert instrument_enabled()
+
+    plane.putstr_yx(0, 0, 'a')
+    plane.putstr_yx(1, 0, 'b')
+    notcurses.ncchannels_fg_rgb(0)
+
+    counts = instrument_snapshot()
+    assert counts['NcPlane.putstr_yx']['calls'] == 2
+    assert counts['NcPlane.putstr_yx']['time'] >= \
+        counts['NcPlane.putstr_yx']['max'] >= 0
+    assert counts['ncchannels_fg_rgb']['calls'] == 1
+
+    instrument_reset()
+    assert 'NcPlane.putstr_yx' not in instrument_snapshot()
+
+
+def test_disable_restores_originals(plane: NcPlane) -> None:
+    method = NcPlane.__dict__['putstr_yx']
+    function = notcurses.ncchannels_fg_rgb
+
+    instrument_enable()
+    assert NcPlane.__dict__['putstr_yx'] is not method
+    assert NcPlane.__dict__['putstr_yx'].__wrapped__ is method
+    assert getattr(notcurses.ncchannels_fg_rgb, '__wrapped__') is function
+
+    instrument_disable()
+    assert not instrument_enabled()
+    assert NcPlane.__dict__['putstr_yx'] is method
+    assert notcurses.ncchannels_fg_rgb is function
+
+    plane.putstr_yx(0, 0, 'a')
+    assert 'NcPlane.putstr_yx' not in instrument_snapshot()
+
+
+def test_enable_twice_is_idempotent(plane: NcPlane) -> None:
+    method = NcPlane.__dict__['putstr_yx']
+
+    instrument_enable()
+    instrument_enable()
+
+    assert NcPlane.__dict__['putstr_yx'].__wrapped__ is method
+    plane.putstr_yx(0, 0, 'a')
+    assert instrument_snapshot()['NcPlane.putstr_yx']['calls'] == 1
+
+    instrument_disable()
+    assert NcPlane.__dict__['putstr_yx'] is method
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from notcurses import (NcStatsSampler, Notcurses, prometheus_text,
+                       textfile_writer)
+
+
+def test_delta_counts_renders(nc: Notcurses) -> None:
+    older = nc.stats()
+    nc.render()
+    nc.render()
+    delta = nc.stats() - older
+
+    assert delta.renders == 2
+    assert delta.planes == nc.stats().planes
+
+
+def test_as_dict_has_every_field(nc: Notcurses) -> None:
+    stats = nc.stats()
+    fields = stats.as_dict()
+
+    assert fields['renders'] == stats.renders
+    assert fields['fbbytes'] == stats.fbbytes
+    assert 'render_max_ns' in fields
+
+
+def test_prometheus_text(nc: Notcurses) -> None:
+    nc.render()
+    text = prometheus_text(nc.stats(), labels={'app': 'a"b'})
+    lines = text.splitlines()
+
+    assert '# TYPE notcurses_renders_total counter' in lines
+    assert '# TYPE notcurses_planes gauge' in lines
+    assert 'notcurses_renders_total{app="a\\"b"} 1' in lines
+    assert text.endswith('\n')
+
+
+def test_textfile_writer(tmp_path: Path) -> None:
+    path = tmp_path / 'notcurses.prom'
+    write = textfile_writer(str(path))
+    write('first\n')
+    write('second\n')
+
+    assert path.read_text() == 'second\n'
+    assert [p.name for p in tmp_path.iterdir()] == ['notcurses.prom']
+
+
+def test_sampler_keeps_delta(nc: Notcurses) -> None:
+    emitted: List[str] = []
+    sampler = NcStatsSampler(nc, interval=60.0, emit=emitted.append)
+    with sampler:
+        nc.render()
+        sampler.sample()
+
+    assert len(emitted) == 2
+    assert sampler.text == emitted[-1]
+    assert sampler.delta is not None and sampler.delta.renders == 1
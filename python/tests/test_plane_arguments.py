@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pytest
+
+from notcurses import NcPlane
+
+
+def test_mergedown_simple_requires_destination(plane: NcPlane) -> None:
+    with pytest.raises(TypeError):
+        plane.mergedown_simple()  # type: ignore[call-arg]
+
+
+def test_mergedown_simple_rejects_destroyed_destination(
+        plane: NcPlane) -> None:
+    dst = plane.create(rows=2, cols=2)
+    dst.destroy()
+
+    with pytest.raises(RuntimeError):
+        plane.mergedown_simple(dst)
+
+
+def test_missing_required_argument(plane: NcPlane) -> None:
+    with pytest.raises(TypeError):
+        plane.mergedown(plane, 0, 0)
+
+
+def test_wrong_argument_type(plane: NcPlane) -> None:
+    with pytest.raises(TypeError):
+        plane.putstr_yx('0', 0, 'a')  # type: ignore[arg-type]
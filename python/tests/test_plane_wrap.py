@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from notcurses import NcPlane
+
+
+def test_same_plane_same_wrapper(plane: NcPlane) -> None:
+    child = plane.create(rows=2, cols=2)
+
+    assert child.parent() is plane
+    assert plane.pile_top() is child
+
+
+def test_destroyed_plane_is_not_reused(plane: NcPlane) -> None:
+    child = plane.create(rows=2, cols=2)
+    child.destroy()
+    other = plane.create(rows=2, cols=2)
+
+    assert other is not child
+    assert other.parent() is plane
+
+
+def test_plot_keeps_plane_wrapper(plane: NcPlane) -> None:
+    plot = plane.create(rows=4, cols=8).uplot_create()
+
+    assert plot.plane.parent() is plane
+    assert plane.pile_top() is plot.plane
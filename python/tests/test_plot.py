@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from notcurses import NcPlane
+
+
+def test_add_samples_sums_runs(plane: NcPlane) -> None:
+    plot = plane.uplot_create(rangex=10)
+
+    plot.add_samples(array('Q', [0, 0, 1]), array('Q', [1, 2, 5]))
+
+    assert plot.sample(0) == 3
+    assert plot.sample(1) == 5
+
+
+def test_add_samples_slides_window(plane: NcPlane) -> None:
+    plot = plane.uplot_create(rangex=10)
+
+    plot.add_samples(array('Q', range(20)), array('Q', [1] * 20))
+
+    assert plot.sample(10) == 1
+    assert plot.sample(19) == 1
+    with pytest.raises(RuntimeError):
+        plot.sample(9)
+
+
+def test_add_samples_default_window(plane: NcPlane) -> None:
+    plot = plane.uplot_create()
+
+    plot.add_samples(array('Q', range(100)), array('Q', [2] * 100))
+
+    assert plot.sample(99) == 2
+
+
+def test_add_samples_behind_window_adds_nothing(plane: NcPlane) -> None:
+    plot = plane.uplot_create(rangex=10)
+    plot.add_sample(19, 1)
+
+    with pytest.raises(ValueError):
+        plot.add_samples(array('Q', [15, 5]), array('Q', [1, 1]))
+    with pytest.raises(ValueError):
+        plot.add_samples(array('Q', [2 ** 64 - 1]), array('Q', [1]))
+
+    assert plot.sample(15) == 0
+
+
+def test_add_samples_rejects_bad_buffers(plane: NcPlane) -> None:
+    plot = plane.uplot_create(rangex=10)
+
+    with pytest.raises(ValueError):
+        plot.add_samples(array('Q', [0, 1]), array('Q', [1]))
+    with pytest.raises(TypeError):
+        plot.add_samples(array('I', [0]), array('Q', [1]))
+
+
+def test_dplot_add_samples(plane: NcPlane) -> None:
+    plot = plane.dplot_create(rangex=10)
+
+    plot.add_samples(array('Q', [3, 3, 4]), array('d', [0.5, 0.25, 2.0]))
+
+    assert plot.sample(3) == 0.75
+    assert plot.sample(4) == 2.0
+    with pytest.raises(TypeError):
+        plot.add_samples(array('Q', [5]), array('Q', [1]))
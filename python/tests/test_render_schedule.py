@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from notcurses import Notcurses
+
+
+def test_render_satisfies_request(nc: Notcurses) -> None:
+    nc.request_render()
+    assert nc.render_due() is not None
+
+    nc.render()
+    assert nc.render_due() is None
+
+
+def test_requests_are_coalesced(nc: Notcurses) -> None:
+    nc.set_max_fps(0)
+    nc.request_render()
+    nc.request_render()
+
+    assert nc.render_if_due()
+    assert not nc.render_if_due()
+    stats = nc.render_stats()
+    assert stats['requests'] == 2
+    assert stats['coalesced'] == 1
+    assert stats['frames'] == 1
+
+
+def test_request_from_render_hook_stays_pending(nc: Notcurses) -> None:
+    nc.set_max_fps(0)
+    nc.set_render_hook(lambda stats: nc.request_render())
+    nc.request_render()
+
+    assert nc.render_if_due()
+    assert nc.render_due() is not None
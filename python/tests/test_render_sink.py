@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import fcntl
+import os
+from typing import Iterator, Tuple
+
+import pytest
+
+from notcurses import NcPlane, NcRenderBuffer, NcRenderSink, Notcurses
+
+Pipe = Tuple[int, int]
+
+
+@pytest.fixture
+def pipe() -> Iterator[Pipe]:
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def read_all(fd: int) -> bytes:
+    data = b''
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return data
+        if not chunk:
+            return data
+        data += chunk
+
+
+def test_render_buffer(plane: NcPlane) -> None:
+    buffer = NcRenderBuffer()
+    plane.putstr_yx(0, 0, 'hello')
+
+    length = buffer.render(plane)
+
+    assert length == len(buffer) > 0
+    assert buffer.capacity >= length
+    assert buffer.frames == 1
+    assert b'hello' in bytes(buffer)
+
+    view = memoryview(buffer)
+    with pytest.raises(BufferError):
+        buffer.render(plane)
+    view.release()
+    buffer.render(plane)
+    assert buffer.frames == 2
+
+
+def test_render_to_file(nc: Notcurses, plane: NcPlane, pipe: Pipe) -> None:
+    plane.putstr_yx(0, 0, 'hello')
+    nc.render()
+
+    plane.pile_render_to_file(pipe[1])
+
+    assert b'hello' in read_all(pipe[0])
+
+
+def test_sink_writes_frames(plane: NcPlane, pipe: Pipe) -> None:
+    sink = NcRenderSink(plane, pipe[1])
+    plane.putstr_yx(0, 0, 'hello')
+
+    assert sink.render()
+
+    frame = read_all(pipe[0])
+    assert b'hello' in frame
+    stats = sink.stats()
+    assert stats['frames_written'] == 1
+    assert stats['last_bytes'] == stats['bytes_written'] == len(frame)
+    assert stats['pending'] == 0
+    assert sink.fileno() == pipe[1]
+
+
+def test_sink_skips_while_peer_is_slow(plane: NcPlane, pipe: Pipe) -> None:
+    fcntl.fcntl(pipe[1], fcntl.F_SETPIPE_SZ, 4096)
+    sink = NcRenderSink(plane, pipe[1], nonblocking=True)
+    # Fill the pipe, so that no byte of the frame is taken.
+    while True:
+        try:
+            os.write(pipe[1], b'\0' * 4096)
+        except BlockingIOError:
+            break
+    plane.putstr_yx(0, 0, 'hello')
+
+    assert sink.render()
+    assert sink.stats()['pending'] > 0
+    assert not sink.render()
+    assert sink.stats()['frames_skipped'] == 1
+
+    frame = b''
+    while sink.flush() > 0:
+        frame += read_all(pipe[0])
+    frame += read_all(pipe[0])
+
+    assert b'hello' in frame
+    stats = sink.stats()
+    assert stats['frames_written'] == 1
+    assert stats['pending'] == 0
+
+
+def test_sink_restores_blocking_mode(plane: NcPlane, pipe: Pipe) -> None:
+    sink = NcRenderSink(plane, pipe[1], nonblocking=True)
+    assert not os.get_blocking(pipe[1])
+
+    del sink
+
+    assert os.get_blocking(pipe[1])
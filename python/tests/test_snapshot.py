@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from notcurses import NCPLANE_SNAPSHOT_CLUSTER, NcCell, NcPlane
+
+# Eleven bytes, kept in the egcpool of the plane rather than inline.
+LONG_EGC = '\U0001F468\u200d\U0001F469'
+
+
+def test_snapshot_shape(plane: NcPlane) -> None:
+    codepoints, styles, channels = plane.snapshot()
+
+    assert codepoints.shape == styles.shape == channels.shape == (8, 16)
+    assert codepoints.readonly
+    assert codepoints[0, 0] == 0
+
+
+def test_wide_glyphs(plane: NcPlane) -> None:
+    plane.set_fg_rgb(0xff0000)
+    plane.putstr_yx(0, 0, 'a字b')
+
+    codepoints, _, channels = plane.snapshot(0, 0, 1, 4)
+
+    assert [codepoints[0, x] for x in range(4)] == \
+        [ord('a'), ord('字'), 0, ord('b')]
+    assert channels[0, 2] == channels[0, 1] != 0
+    assert plane.egcs(0, 0, 1, 4) == [['a', '字', '', 'b']]
+    # A region starting on a right half still tells it apart.
+    assert plane.egcs(0, 2, 1, 2) == [['', 'b']]
+    assert plane.snapshot(0, 2, 1, 1)[0][0, 0] == 0
+
+
+def test_extended_egcs(plane: NcPlane) -> None:
+    cols = NcCell(LONG_EGC).cols
+    plane.putstr_yx(1, 0, LONG_EGC + 'z')
+
+    codepoints = plane.snapshot(1, 0, 1, cols + 1)[0]
+
+    assert codepoints[0, 0] == 0x1F468 | NCPLANE_SNAPSHOT_CLUSTER
+    assert codepoints[0, cols] == ord('z')
+    assert plane.egcs(1, 0, 1, cols + 1)[0] == \
+        [LONG_EGC] + [''] * (cols - 1) + ['z']
+
+
+def test_egcs_match_contents(plane: NcPlane) -> None:
+    plane.putstr_yx(2, 1, 'x字y')
+
+    row = plane.egcs(2, 0, 1, 6)[0]
+
+    assert ''.join(row) == plane.contents(2, 0, 1, 6)
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import io
+import json
+from time import monotonic
+
+from notcurses import Notcurses, chrome_trace, dump_chrome_trace, trace_span
+
+
+def test_nothing_recorded_while_stopped(nc: Notcurses) -> None:
+    nc.trace_add('idle', 1.0, 2.0)
+    nc.render()
+
+    assert nc.trace_spans() == []
+
+
+def test_render_records_frame_phases(nc: Notcurses) -> None:
+    nc.trace_start()
+    nc.render()
+    nc.trace_stop()
+
+    names = {name for name, _, _, _ in nc.trace_spans()}
+    assert {'frame', 'render', 'rasterize'} <= names
+
+
+def test_ring_buffer_drops_oldest(nc: Notcurses) -> None:
+    nc.trace_start(capacity=3)
+    for i in range(5):
+        nc.trace_add(f'span{i}', float(i), float(i) + 0.5)
+
+    spans = nc.trace_spans()
+    assert [name for name, _, _, _ in spans] == ['span2', 'span3', 'span4']
+    assert spans[0][1:3] == (2.0, 0.5)
+    assert nc.trace_dropped() == 2
+
+    nc.trace_clear()
+    assert nc.trace_spans() == []
+
+
+def test_trace_span(nc: Notcurses) -> None:
+    nc.trace_start()
+    before = monotonic()
+    with trace_span(nc, 'layout'):
+        pass
+
+    [(name, start, duration, _)] = nc.trace_spans()
+    assert name == 'layout'
+    assert start >= before
+    assert duration >= 0
+
+
+def test_chrome_trace(nc: Notcurses) -> None:
+    nc.trace_start()
+    nc.trace_add('layout', 1.0, 1.25)
+
+    trace = chrome_trace(nc)
+    [event] = trace['traceEvents']
+    assert event['name'] == 'layout'
+    assert event['ph'] == 'X'
+    assert event['ts'] == 1e6
+    assert event['dur'] == 0.25e6
+    assert trace['otherData'] == {'dropped_spans': 0}
+
+    file = io.StringIO()
+    dump_chrome_trace(nc, file)
+    assert json.loads(file.getvalue()) == trace
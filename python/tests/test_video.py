@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from notcurses import NcVideoPlayer, Notcurses
+
+
+def test_drop_planes_stops_player(nc: Notcurses, png_path: Path) -> None:
+    try:
+        player = NcVideoPlayer(nc.stdplane(), str(png_path), queue=2,
+                               loop=True)
+    except RuntimeError as e:
+        pytest.skip(str(e))
+
+    nc.drop_planes()
+
+    assert player.done
+    assert player.next_due() is None
+    assert not player.update()
+    player.stop()
+    del player
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from notcurses import NcPlane, NcVisualCache
+
+
+def test_second_get_hits(plane: NcPlane, png_path: Path) -> None:
+    cache = NcVisualCache()
+    visual, blitter = cache.get(str(png_path), plane)
+
+    assert cache.get(str(png_path), plane) == (visual, blitter)
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+    assert stats['nbytes'] == visual.nbytes
+
+
+def test_plane_size_is_part_of_key(plane: NcPlane, png_path: Path) -> None:
+    cache = NcVisualCache()
+    cache.get(str(png_path), plane)
+    cache.get(str(png_path), plane.create(rows=2, cols=2))
+
+    assert cache.stats()['misses'] == 2
+    assert len(cache) == 2
+
+
+def test_changed_file_is_decoded_again(plane: NcPlane,
+                                       png_path: Path) -> None:
+    cache = NcVisualCache()
+    cache.get(str(png_path), plane)
+    stat = png_path.stat()
+    os.utime(png_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.get(str(png_path), plane)
+
+    assert cache.stats()['misses'] == 2
+
+
+def test_oversized_image_is_not_kept(plane: NcPlane, png_path: Path) -> None:
+    cache = NcVisualCache(max_bytes=1)
+    cache.blit(str(png_path), plane)
+
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_resize_evicts(plane: NcPlane, png_path: Path) -> None:
+    cache = NcVisualCache()
+    cache.get(str(png_path), plane)
+    cache.resize(0)
+
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_negative_limit() -> None:
+    with pytest.raises(ValueError):
+        NcVisualCache(-1)
+    with pytest.raises(ValueError):
+        NcVisualCache().resize(-1)
@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020, 2021 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from asyncio import run
+from pathlib import Path
+
+import pytest
+
+from notcurses import NcPlane, NcVisualCache, NcVisualLoader
+
+
+def test_drain_hands_out_finished_loads(tmp_path: Path) -> None:
+    with NcVisualLoader(max_workers=2) as loader:
+        futures = loader.load_many(
+            [str(tmp_path / f'missing{i}.png') for i in range(3)])
+        for future in futures:
+            assert future.exception() is not None
+
+    drained = loader.drain()
+    assert sorted(map(id, drained)) == sorted(map(id, futures))
+    assert loader.drain() == []
+
+
+def test_awaited_loads_are_not_drained(tmp_path: Path) -> None:
+    async def load() -> None:
+        await loader.load_async(str(tmp_path / 'missing.png'))
+
+    with NcVisualLoader() as loader:
+        with pytest.raises(RuntimeError):
+            run(load())
+
+    assert loader.drain() == []
+
+
+def test_load_prescales_for_plane(plane: NcPlane, png_path: Path) -> None:
+    cache = NcVisualCache()
+    with NcVisualLoader(cache=cache) as loader:
+        visual, blitter = loader.load(str(png_path), plane).result()
+        assert loader.load(str(png_path), plane).result() == (visual,
+                                                              blitter)
+
+    assert cache.stats()['hits'] == 1
+    visual.blit(plane, blitter)